@@ -5,34 +5,62 @@
 # SPDX-FileContributor: luto
 
 import contextlib
+import hashlib
+import itertools
+import json
 import logging
 import re
 import shutil
+import time
 import urllib.parse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from django.conf import settings
+from django.db import connection
+from django.db.models import Count, Max
 from django.utils.timezone import override as override_timezone
 from django_scopes import scope
 
+from pretalx import __version__
 from pretalx.common.models.transaction import rolledback_transaction
 from pretalx.common.signals import register_data_exporters
+from pretalx.event.models import Event
+from pretalx.person.models import SpeakerProfile
 from pretalx.schedule.domain.queries.schedule import published_schedules
+from pretalx.submission.models import Submission
+from pretalx.submission.models.submission import SpeakerRole
 
 logger = logging.getLogger(__name__)
 
 SERVER_NAME = settings.SITE_URL.split("://")[1]
 
 
+def _needs_export_changes(event):
+    """Whether the stored event has to be changed to render its export."""
+    stored = type(event).objects.get(pk=event.pk)
+    return (
+        not stored.is_public
+        or bool(stored.custom_domain)
+        or not stored.get_feature_flag("show_schedule")
+    )
+
+
 @contextlib.contextmanager
 def fake_admin(event):
     from django.test import Client  # noqa: PLC0415 -- slow import
 
     with rolledback_transaction():
+        needs_changes = _needs_export_changes(event)
         event.is_public = True
         event.custom_domain = None
         event.feature_flags["show_schedule"] = True
-        event.save()
+        # Saving locks the event until the rollback, so it is skipped when
+        # nothing changes, and parallel exports do not wait for each other.
+        if needs_changes:
+            event.save()
         client = Client()
 
         def get(url):
@@ -140,10 +168,8 @@ def get_content(response):
     )
 
 
-def dump_content(destination, path, getter):
+def get_file_path(destination, path):
     destination = Path(destination)
-    logger.debug(path)
-
     # We need to urldecode the file path, as otherwise we will end up with a file name
     # that won't be found when the export is served by a web server.
     file_path = urllib.parse.unquote(path)
@@ -152,6 +178,12 @@ def dump_content(destination, path, getter):
     file_path = (destination / file_path.lstrip("/")).resolve()
     if destination not in file_path.parents:
         raise ValueError("Path traversal detected, aborting.")
+    return file_path
+
+
+def dump_content(destination, path, getter):
+    logger.debug(path)
+    file_path = get_file_path(destination, path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
     content = getter(path)
@@ -183,30 +215,287 @@ def get_mediastatic_content(url):
         return media_file.read()
 
 
-def export_event(event, destination):
-    with override_timezone(event.timezone), fake_admin(event) as get:
+def _fingerprint(*values):
+    return hashlib.sha256(repr(values).encode()).hexdigest()
+
+
+def _summary(queryset):
+    """The latest update and the number of rows, so that both edits and
+    deletions change the fingerprint."""
+    result = queryset.aggregate(latest=Max("updated"), count=Count("pk"))
+    return result["latest"], result["count"]
+
+
+def get_layout_fingerprint(event):
+    """Hash of the data shown on every page, like the event settings, rooms
+    and tracks. When it changes, an incremental export renders all pages."""
+    return _fingerprint(
+        __version__,
+        event.plugins,
+        # fake_admin() leaves its changes on the event instance, so the
+        # timestamp has to come from the database.
+        _summary(type(event).objects.filter(pk=event.pk)),
+        list(
+            Event._meta.get_field("_settings_objects")
+            .related_model.objects.filter(object=event)
+            .order_by("key")
+            .values_list("key", "value")
+        ),
+        event.cfp.updated,
+        event.current_schedule.pk if event.current_schedule else None,
+        _summary(event.rooms.all()),
+        _summary(event.tracks.all()),
+        _summary(event.submission_types.all()),
+        _summary(event.questions.all()),
+        _summary(event.extra_links.all()),
+    )
+
+
+def get_talk_contexts(slots):
+    """Map submission IDs to the sessions shown around them on their talk
+    page, that is, their room neighbours and parallel sessions.
+
+    ``slots`` are tuples of submission ID, start, end, room ID and submission
+    update time, sorted by start. Room neighbours on other days are included
+    too, which only means that a page is rendered once too often.
+    """
+    context = defaultdict(set)
+    slots = [slot for slot in slots if slot[2]]
+    for index, (submission_id, start, end, _room, updated) in enumerate(slots):
+        for other_id, other_start, _end, _room, other_updated in slots[index + 1 :]:
+            if other_start >= end:
+                break
+            if other_id != submission_id:
+                context[submission_id].add((other_id, other_start, other_updated))
+                context[other_id].add((submission_id, start, updated))
+    by_room = defaultdict(list)
+    for submission_id, start, _end, room_id, updated in slots:
+        by_room[room_id].append((submission_id, start, updated))
+    for room_slots in by_room.values():
+        starts = [
+            list(group)
+            for _start, group in itertools.groupby(room_slots, key=lambda s: s[1])
+        ]
+        for previous, following in itertools.pairwise(starts):
+            for first, second in itertools.product(previous, following):
+                context[first[0]].add(second)
+                context[second[0]].add(first)
+    return {submission_id: sorted(values) for submission_id, values in context.items()}
+
+
+def get_page_fingerprints(event):
+    """Map the paths of all talk and speaker pages to a hash of the data
+    shown on them.
+
+    Talk pages show their speakers, and speaker pages show their talks, so
+    both fingerprints include the data of the other side. Talk pages also
+    show the sessions around them, see :func:`get_talk_contexts`.
+    """
+    if not event.current_schedule:
+        return {}
+    talks = {
+        pk: [code, _fingerprint(*values)]
+        for pk, code, *values in event.talks.prefetch_related(None)
+        .annotate(
+            resources_updated=Max("resources__updated"),
+            answers_updated=Max("answers__updated"),
+        )
+        .values_list("pk", "code", "updated", "resources_updated", "answers_updated")
+    }
+    slots = list(
+        event.current_schedule.scheduled_talks.order_by("start", "pk").values_list(
+            "submission_id", "start", "end", "room_id", "submission__updated"
+        )
+    )
+    for submission_id, *values, _updated in slots:
+        if submission_id in talks:
+            talks[submission_id][1] = _fingerprint(talks[submission_id][1], *values)
+    contexts = get_talk_contexts(slots)
+    talks_by_speaker = defaultdict(list)
+    speakers_by_talk = defaultdict(list)
+    for submission_id, speaker_id in SpeakerRole.objects.filter(
+        submission_id__in=talks
+    ).values_list("submission_id", "speaker_id"):
+        talks_by_speaker[speaker_id].append(submission_id)
+        speakers_by_talk[submission_id].append(speaker_id)
+    speakers = {}
+    for pk, code, *values in (
+        event.speakers.annotate(answers_updated=Max("answers__updated"))
+        .order_by()
+        .values_list(
+            "pk",
+            "code",
+            "updated",
+            "name",
+            "user__name",
+            "profile_picture__updated",
+            "answers_updated",
+        )
+    ):
+        talk_fingerprints = sorted(
+            talks[submission_id][1] for submission_id in talks_by_speaker[pk]
+        )
+        speakers[pk] = [code, _fingerprint(*values, talk_fingerprints)]
+
+    result = {}
+    for pk, (code, own_fingerprint) in talks.items():
+        speaker_fingerprints = sorted(
+            speakers[speaker_id][1]
+            for speaker_id in speakers_by_talk[pk]
+            if speaker_id in speakers
+        )
+        fingerprint = _fingerprint(
+            own_fingerprint, speaker_fingerprints, contexts.get(pk)
+        )
+        submission = Submission(event=event, code=code)
+        result[get_path(submission.urls.public)] = fingerprint
+        result[get_path(submission.urls.ical)] = fingerprint
+    for code, fingerprint in speakers.values():
+        speaker = SpeakerProfile(event=event, code=code)
+        result[get_path(speaker.urls.public)] = fingerprint
+        result[get_path(speaker.urls.talks_ical)] = fingerprint
+    return result
+
+
+def _dump_mediastatic_content(destination, path):
+    # Runs in worker threads, so it must not touch the database.
+    try:
+        return path, dump_content(destination, path, get_mediastatic_content)
+    except FileNotFoundError:
+        return path, None
+
+
+def _render_pages(event_pk, destination, urls):
+    # Runs in worker threads, so it needs its own database connection, and
+    # with it its own scope and rolled back transaction.
+    try:
+        event = Event.objects.get(pk=event_pk)
+        with (
+            scope(event=event),
+            override_timezone(event.timezone),
+            fake_admin(event) as get,
+        ):
+            return [(url, dump_content(destination, url, get)) for url in urls]
+    finally:
+        connection.close()
+
+
+def export_event(event, destination, *, previous=None, workers=1):
+    """Render the agenda site of ``event`` to ``destination`` and return a
+    manifest of the rendered pages.
+
+    ``previous`` is a tuple of the directory and manifest of an earlier
+    export. Talk and speaker pages whose data has not changed since are
+    copied from there instead of being rendered again, and pages with
+    unchanged content keep their old file, including its modification time.
+
+    Pages and static and media files are handled by ``workers`` threads.
+    Events that have to be made public for the export are locked while a
+    thread renders, so their pages are rendered one by one.
+    """
+    started = time.perf_counter()
+    previous_dir, previous_manifest = previous or (None, {})
+    previous_pages = previous_manifest.get("pages", {})
+    # The fingerprints have to be taken before fake_admin() saves the event.
+    layout = get_layout_fingerprint(event)
+    fingerprints = get_page_fingerprints(event)
+    reuse_pages = previous_manifest.get("layout") == layout
+    render_workers = 1 if _needs_export_changes(event) else workers
+    with (
+        override_timezone(event.timezone),
+        fake_admin(event) as get,
+        ThreadPoolExecutor(max_workers=workers) as executor,
+    ):
         logger.info("Collecting URLs for export")
         urls = list(event_urls(event))
-        assets = set()
+        logger.info(
+            "Collected %d URLs in %.2fs", len(urls), time.perf_counter() - started
+        )
 
-        logger.info("Exporting %d pages", len(urls))
+        pages_started = time.perf_counter()
+        pages = {}
+        assets = set()
+        kept = 0
+        render_urls = []
         for url in map(get_path, urls):
-            content = dump_content(destination, url, get)
+            previous_page = previous_pages.get(url) or {}
+            previous_path = previous_dir and get_file_path(previous_dir, url)
+            if (
+                reuse_pages
+                and fingerprints.get(url)
+                and previous_page.get("fingerprint") == fingerprints[url]
+                and previous_path.exists()
+            ):
+                file_path = get_file_path(destination, url)
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(previous_path, file_path)
+                pages[url] = previous_page
+                assets.update(previous_page["assets"])
+                kept += 1
+            else:
+                render_urls.append(url)
+
+        if render_workers > 1:
+            rendered = itertools.chain.from_iterable(
+                executor.map(
+                    partial(_render_pages, event.pk, destination),
+                    [render_urls[i::render_workers] for i in range(render_workers)],
+                )
+            )
+        else:
+            rendered = (
+                (url, dump_content(destination, url, get)) for url in render_urls
+            )
+        for url, content in rendered:
+            previous_page = previous_pages.get(url) or {}
+            previous_path = previous_dir and get_file_path(previous_dir, url)
+            content_hash = hashlib.sha256(content).hexdigest()
+            if previous_page.get("hash") == content_hash and previous_path.exists():
+                shutil.copy2(previous_path, get_file_path(destination, url))
+            page_assets = []
             if not url.startswith("/media/") and not url.startswith("/static/"):
-                assets |= set(map(get_path, find_assets(content)))
+                page_assets = sorted(set(map(get_path, find_assets(content))))
+                assets.update(page_assets)
+            pages[url] = {
+                "fingerprint": fingerprints.get(url),
+                "hash": content_hash,
+                "assets": page_assets,
+            }
+        logger.info(
+            "Exported %d pages (%d unchanged) in %.2fs",
+            len(pages),
+            kept,
+            time.perf_counter() - pages_started,
+        )
 
-        css_assets = set()
+        assets_started = time.perf_counter()
 
-        logger.info("Exporting %d static files from HTML links", len(assets))
-        for url in assets:
-            content = dump_content(destination, url, get)
+        def dump_assets(urls):
+            # Files that are not on disk are rendered by views, which need
+            # the main thread's database connection.
+            for url, content in executor.map(
+                lambda url: _dump_mediastatic_content(destination, url), urls
+            ):
+                if content is None:
+                    yield url, dump_content(destination, url, get)
+                else:
+                    yield url, content
 
+        css_assets = set()
+        for url, content in dump_assets(assets):
             if url.endswith(".css"):
                 css_assets |= set(find_urls(content))
-
-        logger.info("Exporting %d files from CSS links", len(css_assets))
-        for url_path in (get_path(urllib.parse.unquote(url)) for url in css_assets):
-            dump_content(destination, url_path, get)
+        css_paths = {get_path(urllib.parse.unquote(url)) for url in css_assets}
+        list(dump_assets(css_paths))
+        logger.info(
+            "Exported %d static files from HTML links and %d files from CSS links "
+            "in %.2fs",
+            len(assets),
+            len(css_paths),
+            time.perf_counter() - assets_started,
+        )
+    logger.info("Export finished in %.2fs", time.perf_counter() - started)
+    return {"layout": layout, "pages": pages}
 
 
 def delete_directory(path):
@@ -222,29 +511,52 @@ def get_export_zip_path(event):
     return get_export_path(event).with_suffix(".zip")
 
 
-def export_event_html(event, *, as_zip=False):
+def get_export_manifest_path(event):
+    return get_export_path(event).with_suffix(".json")
+
+
+def load_previous_export(event):
+    """Return the directory and manifest of the last export of ``event``,
+    or None if there is no usable previous export."""
+    export_dir = get_export_path(event)
+    try:
+        manifest = json.loads(get_export_manifest_path(event).read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+    if not export_dir.is_dir():
+        return None
+    return export_dir, manifest
+
+
+def export_event_html(event, *, as_zip=False, incremental=False, workers=1):
     """Atomically render the event's agenda site to its default location.
 
     Writes to a sibling temp directory and renames into place on success;
     with ``as_zip=True`` the resulting directory is archived and removed.
+    With ``incremental=True``, unchanged pages are taken from the previous
+    export instead of being rendered again.
     Returns the path to the final artifact.
     """
     export_dir = get_export_path(event)
     tmp_dir = export_dir.with_name(export_dir.name + "-new")
+    manifest_path = get_export_manifest_path(event)
 
     with scope(event=event):
+        previous = load_previous_export(event) if incremental else None
         delete_directory(tmp_dir)
         tmp_dir.mkdir()
         try:
-            export_event(event, tmp_dir)
+            manifest = export_event(event, tmp_dir, previous=previous, workers=workers)
             delete_directory(export_dir)
             tmp_dir.rename(export_dir)
         finally:
             delete_directory(tmp_dir)
 
         if not as_zip:
+            manifest_path.write_text(json.dumps(manifest))
             return export_dir
 
+        manifest_path.unlink(missing_ok=True)
         zip_path = get_export_zip_path(event)
         shutil.make_archive(
             root_dir=settings.HTMLEXPORT_ROOT,
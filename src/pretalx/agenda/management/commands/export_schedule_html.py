@@ -20,6 +20,17 @@ def add_arguments(self, parser):
         super().add_arguments(parser)
         parser.add_argument("event", type=str)
         parser.add_argument("--zip", action="store_true")
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only re-render pages that changed since the last export.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of threads used to render pages and copy static and media files.",
+        )
 
     def handle(self, *args, **options):
         event_slug = options["event"]
@@ -33,7 +44,12 @@ def handle(self, *args, **options):
 
         logger.info("Exporting %s", event.name)
         try:
-            destination = export_event_html(event, as_zip=options["zip"])
+            destination = export_event_html(
+                event,
+                as_zip=options["zip"],
+                incremental=options["incremental"],
+                workers=options["workers"],
+            )
         except Exception as exc:
             logger.exception("Export failed")
             raise CommandError(f"Export failed: {exc}") from exc
@@ -43,7 +43,7 @@
 
 class TalkMixin(PermissionRequired):
     permission_required = "submission.view_public_submission"
-    prefetches = ("slots", "resources")
+    prefetches = ("resources",)
 
     def get_queryset(self):
         queryset = (
@@ -235,7 +235,7 @@ def hide_speaker_links(self):
 
 
 class SingleICalView(EventPageMixin, TalkMixin, View):
-    prefetches = ("slots",)
+    prefetches = ()
 
     def get(self, request, event, **kwargs):
         code = self.submission.code
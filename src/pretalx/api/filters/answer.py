@@ -3,10 +3,11 @@
 
 import django_filters
 
+from pretalx.api.filters.sync import UpdatedSinceFilterSet
 from pretalx.submission.models import Answer
 
 
-class AnswerFilterSet(django_filters.FilterSet):
+class AnswerFilterSet(UpdatedSinceFilterSet):
     question = django_filters.NumberFilter(field_name="question_id")
     submission = django_filters.CharFilter(
         field_name="submission__code", lookup_expr="iexact"
@@ -18,4 +19,4 @@ class AnswerFilterSet(django_filters.FilterSet):
 
     class Meta:
         model = Answer
-        fields = ("question", "submission", "speaker", "review")
+        fields = ("question", "submission", "speaker", "review", "updated_since")
@@ -4,6 +4,7 @@
 import django_filters
 from django_scopes import scopes_disabled
 
+from pretalx.api.filters.sync import UpdatedSinceFilterSet
 from pretalx.person.models import SpeakerProfile, User
 from pretalx.submission.models import (
     Review,
@@ -15,7 +16,7 @@
 
 with scopes_disabled():
 
-    class ReviewFilter(django_filters.FilterSet):
+    class ReviewFilter(UpdatedSinceFilterSet):
         submission = django_filters.ModelChoiceFilter(
             queryset=Submission.objects.none(),
             field_name="submission",
@@ -90,4 +91,5 @@ class Meta:
                 "submission__track",
                 "submission__submission_type",
                 "submission__content_locale",
+                "updated_since",
             )
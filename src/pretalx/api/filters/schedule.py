@@ -4,25 +4,29 @@
 import django_filters
 from django_scopes import scopes_disabled
 
+from pretalx.api.filters.sync import UpdatedSinceFilterSet
 from pretalx.person.models import User
 from pretalx.schedule.models import Room, Schedule, TalkSlot
 from pretalx.submission.models import Submission
 
 with scopes_disabled():
 
-    class TalkSlotFilter(django_filters.FilterSet):
+    class TalkSlotFilter(UpdatedSinceFilterSet):
         submission = django_filters.ModelChoiceFilter(
             queryset=Submission.objects.none(),
             field_name="submission",
             to_field_name="code",
         )
         schedule = django_filters.ModelChoiceFilter(
-            queryset=Schedule.objects.none(), field_name="schedule"
+            queryset=Schedule.objects.none(),
+            field_name="schedule",
+            method="filter_schedule",
         )
         schedule_version = django_filters.ModelChoiceFilter(
             queryset=Schedule.objects.none(),
             field_name="schedule__version",
             lookup_expr="iexact",
+            method="filter_schedule",
         )
         speaker = django_filters.ModelChoiceFilter(
             queryset=User.objects.none(),
@@ -42,8 +46,14 @@ def __init__(self, *args, event=None, **kwargs):
                 self.filters["submission"].queryset = event.submissions.all()
                 self.filters["room"].queryset = event.rooms.all()
 
+        def filter_schedule(self, queryset, name, value):
+            # Unchanged slots are shared between schedule versions.
+            return queryset.in_schedule(value)
+
         class Meta:
             model = TalkSlot
+            # Not listing updated_since, so that syncing clients still get
+            # the current schedule by default, see TalkSlotViewSet.
             fields = [
                 "submission",
                 "schedule",
@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+from django_scopes import scopes_disabled
+
+from pretalx.api.filters.sync import UpdatedSinceFilterSet
+from pretalx.person.models import SpeakerProfile
+
+with scopes_disabled():
+
+    class SpeakerFilter(UpdatedSinceFilterSet):
+        class Meta:
+            model = SpeakerProfile
+            fields = ("updated_since",)
@@ -7,11 +7,12 @@
 import django_filters
 from django_scopes import scopes_disabled
 
+from pretalx.api.filters.sync import UpdatedSinceFilterSet
 from pretalx.submission.models import Submission, SubmissionStates
 
 with scopes_disabled():
 
-    class SubmissionFilter(django_filters.FilterSet):
+    class SubmissionFilter(UpdatedSinceFilterSet):
         state = django_filters.MultipleChoiceFilter(choices=SubmissionStates.choices)
         pending_state = django_filters.MultipleChoiceFilter(
             choices=SubmissionStates.choices
@@ -26,4 +27,5 @@ class Meta:
                 "submission_type",
                 "track",
                 "is_featured",
+                "updated_since",
             )
@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+import django_filters
+
+
+class UpdatedSinceFilterSet(django_filters.FilterSet):
+    updated_since = django_filters.IsoDateTimeFilter(
+        field_name="updated",
+        lookup_expr="gte",
+        help_text="Only return objects changed at or after this time (ISO 8601). "
+        "Switches the list to cursor pagination, and lists deleted objects "
+        "for organisers.",
+    )
@@ -1,10 +1,104 @@
 # SPDX-FileCopyrightText: 2025-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+from base64 import b64decode, b64encode
+from urllib import parse
+
 from django.conf import settings
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
 
 
 class PageNumberPagination(pagination.PageNumberPagination):
     page_size_query_param = "page_size"
     max_page_size = settings.MAX_PAGINATION_LIMIT
+
+
+class UpdatedCursorPagination(pagination.BasePagination):
+    """Paginates by (``updated``, ``pk``) without counting or skipping rows.
+
+    Every page continues after the last object of the previous page, so
+    objects that change while a client pages through the list are moved to
+    the end and returned again, instead of shifting the following pages.
+    Objects without an ``updated`` timestamp come first.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = settings.MAX_PAGINATION_LIMIT
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(F("updated").asc(nulls_first=True), "pk")
+        if position := self.decode_cursor(request):
+            updated, pk = position
+            if updated is None:
+                after = Q(updated__isnull=True, pk__gt=pk) | Q(updated__isnull=False)
+            else:
+                after = Q(updated__gt=updated) | Q(updated=updated, pk__gt=pk)
+            queryset = queryset.filter(after)
+        page = list(queryset[: page_size + 1])
+        self.has_next = len(page) > page_size
+        self.page = page[:page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size or page_size)
+
+    def decode_cursor(self, request):
+        if not (encoded := request.query_params.get(self.cursor_query_param)):
+            return None
+        try:
+            tokens = parse.parse_qs(
+                b64decode(encoded.encode("ascii")).decode("ascii"),
+                keep_blank_values=True,
+            )
+            updated = tokens["u"][0]
+            pk = int(tokens["p"][0])
+            position = (parse_datetime(updated) if updated else None, pk)
+        except (KeyError, ValueError):
+            raise NotFound(self.invalid_cursor_message) from None
+        if updated and position[0] is None:
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def encode_cursor(self, instance):
+        updated = instance.updated.isoformat() if instance.updated else ""
+        querystring = parse.urlencode({"u": updated, "p": instance.pk})
+        return b64encode(querystring.encode("ascii")).decode("ascii")
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(self.page[-1]),
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -15,8 +15,8 @@
 from pretalx.api.documentation import extend_schema_field
 from pretalx.api.serializers.mixins import PretalxSerializer
 from pretalx.api.versions import register_serializer
+from pretalx.schedule.domain.changes import queue_unreleased_schedule_changes_update
 from pretalx.schedule.models import Schedule, TalkSlot
-from pretalx.schedule.tasks import task_update_unreleased_schedule_changes
 from pretalx.schedule.validators.schedule import validate_unique_version
 
 
@@ -39,7 +39,7 @@ def get_slots(self, obj):
         if only_visible_slots and not obj.version:
             # This should never happen, but better safe than sorry.
             return []
-        qs = obj.talks.all()
+        qs = obj.version_talks.all()
         if only_visible_slots:
             qs = qs.filter(is_visible=True)
         if serializer := self.get_extra_flex_field("slots", qs):
@@ -132,8 +132,6 @@ def validate_description(self, value):
     def update(self, instance, validated_data):
         result = super().update(instance, validated_data)
         transaction.on_commit(
-            lambda: task_update_unreleased_schedule_changes.apply_async(
-                kwargs={"event": instance.event.slug}
-            )
+            lambda: queue_unreleased_schedule_changes_update(instance.event)
         )
         return result
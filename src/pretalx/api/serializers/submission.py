@@ -256,7 +256,9 @@ def get_slots(self, obj):
         if not schedule:
             return []
         public_slots = self.context.get("public_slots", True)
-        # Use prefetched slots, filter in Python to avoid busting prefetch cache
+        # The API views prefetch only the slots of the schedule in context
+        # (see schedule_slots_prefetch), so filtering here is just a safeguard
+        # for submissions that were loaded without that prefetch.
         slots = [s for s in obj.slots.all() if s.schedule_id == schedule.pk]
         if public_slots:
             slots = [s for s in slots if s.is_visible]
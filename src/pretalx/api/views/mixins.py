@@ -3,12 +3,15 @@
 
 from django.db import transaction
 from django.utils.functional import cached_property
+from django_filters.fields import IsoDateTimeField
 from rest_framework import exceptions
 from rest_framework.decorators import action
 
 from pretalx.api.documentation import extend_schema
+from pretalx.api.pagination import UpdatedCursorPagination
 from pretalx.api.serializers.log import ActivityLogSerializer
 from pretalx.api.versions import get_api_version_from_request, get_serializer_by_version
+from pretalx.common.domain.queries.deletion import deleted_objects_since
 from pretalx.event.models import Event
 
 
@@ -113,3 +116,52 @@ def log(self, request, **kwargs):
             page, many=True, context=self.get_serializer_context()
         )
         return self.get_paginated_response(serializer.data)
+
+
+class DeltaSyncMixin:
+    """Lets API clients sync a list incrementally.
+
+    Lists requested with ``updated_since`` or ``cursor`` are paginated with
+    :class:`UpdatedCursorPagination`. For organisers, the first page also
+    lists the objects deleted since ``updated_since``, identified by
+    ``deleted_field``.
+    """
+
+    deleted_field = "object_id"
+
+    @cached_property
+    def is_delta_sync(self):
+        params = self.request.query_params
+        return self.action == "list" and bool(
+            {"updated_since", "cursor"} & params.keys()
+        )
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and self.is_delta_sync:
+            self._paginator = UpdatedCursorPagination()
+        return super().paginator
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if (deleted := self.get_deleted_objects()) is not None:
+            response.data["deleted"] = deleted
+        return response
+
+    def get_deleted_objects(self):
+        params = self.request.query_params
+        if (
+            not self.is_delta_sync
+            or params.get("cursor")
+            or not params.get("updated_since")
+            or self.request.user.is_anonymous
+            or not self.request.user.has_perm(Event.get_perm("orga_access"), self.event)
+        ):
+            return None
+        # The filter backend has rejected invalid values already.
+        since = IsoDateTimeField().clean(params["updated_since"])
+        return list(
+            deleted_objects_since(self.event, self.queryset.model, since).values_list(
+                self.deleted_field, flat=True
+            )
+        )
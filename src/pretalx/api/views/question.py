@@ -25,7 +25,11 @@
     QuestionOrgaSerializer,
     QuestionSerializer,
 )
-from pretalx.api.views.mixins import ActivityLogMixin, PretalxViewSetMixin
+from pretalx.api.views.mixins import (
+    ActivityLogMixin,
+    DeltaSyncMixin,
+    PretalxViewSetMixin,
+)
 from pretalx.person.models import SpeakerProfile
 from pretalx.submission.domain.queries.question import (
     answers_for_user,
@@ -235,7 +239,9 @@ def perform_destroy(self, instance):
     ),
     destroy=extend_schema(summary="Delete Answer"),
 )
-class AnswerViewSet(ActivityLogMixin, PretalxViewSetMixin, viewsets.ModelViewSet):
+class AnswerViewSet(
+    DeltaSyncMixin, ActivityLogMixin, PretalxViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Answer.objects.none()
     serializer_class = AnswerSerializer
     filterset_class = AnswerFilterSet
@@ -14,7 +14,11 @@
 )
 from pretalx.api.filters.review import ReviewFilter
 from pretalx.api.serializers.review import ReviewSerializer, ReviewWriteSerializer
-from pretalx.api.views.mixins import ActivityLogMixin, PretalxViewSetMixin
+from pretalx.api.views.mixins import (
+    ActivityLogMixin,
+    DeltaSyncMixin,
+    PretalxViewSetMixin,
+)
 from pretalx.submission.domain.queries.submission import submissions_for_user
 from pretalx.submission.enums import SubmissionContext
 from pretalx.submission.models import Review, Submission
@@ -64,7 +68,9 @@ def get_search_fields(self, view, request):
     ),
     destroy=extend_schema(summary="Delete Reviews"),
 )
-class ReviewViewSet(ActivityLogMixin, PretalxViewSetMixin, viewsets.ModelViewSet):
+class ReviewViewSet(
+    DeltaSyncMixin, ActivityLogMixin, PretalxViewSetMixin, viewsets.ModelViewSet
+):
     serializer_class = ReviewSerializer
     queryset = Review.objects.none()
     filter_backends = (ReviewSearchFilter, filters.OrderingFilter, DjangoFilterBackend)
@@ -5,6 +5,7 @@
 from django.http import Http404, HttpResponse
 from django.urls import reverse
 from django.utils.functional import cached_property
+from django_filters.fields import IsoDateTimeField
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -25,7 +26,7 @@
     TalkSlotOrgaSerializer,
     TalkSlotSerializer,
 )
-from pretalx.api.views.mixins import PretalxViewSetMixin
+from pretalx.api.views.mixins import DeltaSyncMixin, PretalxViewSetMixin
 from pretalx.common.exporter import get_schedule_exporter_content
 from pretalx.schedule.domain.ical import get_slot_ical
 from pretalx.schedule.domain.queries.schedule import get_schedule, public_talk_slots
@@ -222,7 +223,7 @@ def get_exporter(self, request, event, pk=None, name=None):
 @extend_schema_view(
     list=extend_schema(
         summary="List Talk Slots",
-        description="This endpoint always returns a filtered list. If you don’t provide any filters of your own, it will be filtered to show only talk slots in the latest published schedule.",
+        description="This endpoint always returns a filtered list. If you don’t provide any filters of your own, it will be filtered to show only talk slots in the latest published schedule. When syncing this list with ``updated_since``, the ``deleted`` field of organisers also lists the talk slots that have left the latest published schedule since then.",
         parameters=[
             build_search_docs("submission.title", "submission.speakers.name"),
             build_expand_docs(
@@ -265,6 +266,7 @@ def get_exporter(self, request, event, pk=None, name=None):
     ical=extend_schema(summary="Export Talk Slot as iCalendar file"),
 )
 class TalkSlotViewSet(
+    DeltaSyncMixin,
     PretalxViewSetMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
@@ -339,16 +341,42 @@ def get_queryset(self):
         # In the list view, fall back to filtering by current schedule if there is no
         # other filter present.
         # If there is no current schedule, that means an empty response.
-        filter_params = self.filterset_class.get_fields().keys()
-        is_any_filter_active = any(
-            param in self.request.query_params for param in filter_params
-        )
-
-        if not is_any_filter_active:
+        if not self.is_any_filter_active:
             queryset = queryset.filter(schedule=self.event.current_schedule)
 
         return queryset
 
+    @cached_property
+    def is_any_filter_active(self):
+        filter_params = self.filterset_class.get_fields().keys()
+        return any(param in self.request.query_params for param in filter_params)
+
+    def get_deleted_objects(self):
+        deleted = super().get_deleted_objects()
+        if deleted is None or self.is_any_filter_active:
+            return deleted
+        # Releasing a schedule keeps the slots of older versions, so slots
+        # that left the current schedule are never deleted. Instead, list
+        # the slots of the schedule that was current at updated_since which
+        # are missing from the current schedule.
+        since = IsoDateTimeField().clean(self.request.query_params["updated_since"])
+        current = self.event.current_schedule
+        previous = (
+            self.event.schedules.filter(published__lte=since)
+            .order_by("-published")
+            .first()
+        )
+        if not current or not previous or previous == current:
+            return deleted
+        dropped = (
+            TalkSlot.objects.in_schedule(previous)
+            .exclude(pk__in=TalkSlot.objects.in_schedule(current).values("pk"))
+            .exclude(pk__in=deleted)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        return deleted + list(dropped)
+
     @action(detail=True, methods=["get"])
     def ical(self, request, event, pk=None):
         """Export a single talk slot as an iCalendar file."""
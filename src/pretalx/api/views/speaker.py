@@ -14,13 +14,14 @@
     extend_schema,
     extend_schema_view,
 )
+from pretalx.api.filters.speaker import SpeakerFilter
 from pretalx.api.serializers.speaker import (
     SpeakerCreateSerializer,
     SpeakerOrgaSerializer,
     SpeakerSerializer,
     SpeakerUpdateSerializer,
 )
-from pretalx.api.views.mixins import PretalxViewSetMixin
+from pretalx.api.views.mixins import DeltaSyncMixin, PretalxViewSetMixin
 from pretalx.person.models import SpeakerProfile
 from pretalx.submission.domain.queries.question import questions_for_user
 from pretalx.submission.domain.queries.speaker import speakers_for_user
@@ -70,6 +71,7 @@ def get_search_fields(self, view, request):
     ),
 )
 class SpeakerViewSet(
+    DeltaSyncMixin,
     PretalxViewSetMixin,
     mixins.CreateModelMixin,
     mixins.RetrieveModelMixin,
@@ -83,7 +85,9 @@ class SpeakerViewSet(
     ordering_fields = ("code", "name")
     ordering = ("code",)
     endpoint = "speakers"
+    deleted_field = "code"
     filter_backends = (SpeakerSearchFilter, DjangoFilterBackend)
+    filterset_class = SpeakerFilter
     permission_map = {"create": "submission.orga_update_submission"}
 
     @cached_property
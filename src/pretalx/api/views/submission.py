@@ -38,7 +38,11 @@
     TrackSerializer,
 )
 from pretalx.api.versions import CURRENT_VERSION, DEV_PREVIEW, V1, register_serializer
-from pretalx.api.views.mixins import ActivityLogMixin, PretalxViewSetMixin
+from pretalx.api.views.mixins import (
+    ActivityLogMixin,
+    DeltaSyncMixin,
+    PretalxViewSetMixin,
+)
 from pretalx.common.exceptions import SubmissionError
 from pretalx.person.domain.profile import create_speaker_profile
 from pretalx.person.domain.queries.profile import speaker_by_email
@@ -50,6 +54,7 @@
 from pretalx.submission.domain.queries.speaker import speakers_for_user
 from pretalx.submission.domain.queries.submission import (
     annotate_submission_signup_status,
+    schedule_slots_prefetch,
     signed_up_submission_codes,
     submissions_for_user,
 )
@@ -185,7 +190,9 @@ class RemoveSpeakerSerializer(serializers.Serializer):
         responses={200: AttendeeSignupSerializer(many=True)},
     ),
 )
-class SubmissionViewSet(ActivityLogMixin, PretalxViewSetMixin, viewsets.ModelViewSet):
+class SubmissionViewSet(
+    DeltaSyncMixin, ActivityLogMixin, PretalxViewSetMixin, viewsets.ModelViewSet
+):
     serializer_class = SubmissionSerializer
     queryset = Submission.objects.none()
     lookup_field = "code__iexact"
@@ -208,6 +215,7 @@ class SubmissionViewSet(ActivityLogMixin, PretalxViewSetMixin, viewsets.ModelVie
         "attendees": "submission.orga_update_submission",
     }
     endpoint = "submissions"
+    deleted_field = "code"
 
     def get_unversioned_serializer_class(self):
         if self.can_change_submissions:
@@ -256,7 +264,9 @@ def get_queryset(self):
         prefetches = [
             Prefetch("speakers", queryset=speakers_qs),
             Prefetch("answers", queryset=Answer.objects.select_related("question")),
-            "slots",
+            schedule_slots_prefetch(
+                self.event.current_schedule, visible_only=not self.has_perm("delete")
+            ),
             "tags",
             "resources",
         ]
@@ -1,11 +1,15 @@
 # SPDX-FileCopyrightText: 2025-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
-from django.db import connection
+import logging
+
+from django.db import connection, migrations
 from django.db.models import Aggregate, FloatField
 from django.db.models.lookups import Transform
 from django.utils import translation
 
+logger = logging.getLogger(__name__)
+
 
 class Median(Aggregate):
     """Custom median aggregate that works with both PostgreSQL and SQLite."""
@@ -66,3 +70,104 @@ def template(self):
         # Lazy template eval in order to get the actual current language
         current_locale = translation.get_language()
         return self.base_template.format(locale=current_locale)
+
+
+class TrigramIndex:
+    """Migration operation helper creating trigram indexes on PostgreSQL.
+
+    Django compiles ``icontains`` and ``iexact`` lookups to
+    ``UPPER("column"::text)``, so the indexes are built over that
+    expression and serve these lookups without changes to the queries.
+    Other databases keep scanning the table, so this is a no-op there.
+
+    The indexes are built concurrently, so that the tables stay writable
+    while they are built. This is not possible in a transaction, so the
+    migration has to set ``atomic = False``. If the ``pg_trgm`` extension
+    is not installed and the database user cannot install it, the indexes
+    are skipped with a warning, and searches run without them.
+    """
+
+    def __init__(self, table, columns):
+        self.table = table
+        self.columns = columns
+
+    def get_name(self, column):
+        return f"{self.table}_{column}_trgm"
+
+    def _can_use_extension(self, schema_editor):
+        """Whether ``pg_trgm`` is installed, or can be installed by the
+        database user: superusers can install any available extension, other
+        users only trusted extensions (PostgreSQL 13 and newer) in databases
+        they may create objects in."""
+        connection = schema_editor.connection
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            if cursor.fetchone():
+                return True
+            cursor.execute(
+                "SELECT rolsuper FROM pg_roles, pg_available_extensions "
+                "WHERE rolname = current_user AND name = 'pg_trgm'"
+            )
+            row = cursor.fetchone()
+            if not row:
+                return False
+            if row[0]:
+                return True
+            if connection.pg_version < 130000:
+                return False
+            cursor.execute(
+                "SELECT trusted AND has_database_privilege(current_database(), 'CREATE') "
+                "FROM pg_available_extension_versions versions "
+                "JOIN pg_available_extensions extensions "
+                "ON extensions.name = versions.name "
+                "AND extensions.default_version = versions.version "
+                "WHERE versions.name = 'pg_trgm'"
+            )
+            row = cursor.fetchone()
+            return bool(row and row[0])
+
+    def _drop_invalid_index(self, schema_editor, name):
+        # An interrupted concurrent build leaves an invalid index behind,
+        # which CREATE INDEX IF NOT EXISTS would keep.
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_index "
+                "WHERE indexrelid = to_regclass(%s) AND NOT indisvalid",
+                [name],
+            )
+            invalid = cursor.fetchone()
+        if invalid:
+            schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    def create(self, apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        if not self._can_use_extension(schema_editor):
+            logger.warning(
+                "Skipping the search indexes on %s: the pg_trgm extension is not "
+                "installed, and the database user cannot install it. Searches "
+                "work without them, but are slower on large installations. To "
+                "add them, install pg_trgm as a database superuser and run this "
+                "migration again.",
+                self.table,
+            )
+            return
+        quote = schema_editor.quote_name
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for column in self.columns:
+            name = quote(self.get_name(column))
+            self._drop_invalid_index(schema_editor, name)
+            schema_editor.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {quote(self.table)} "
+                f"USING gin ((UPPER({quote(column)}::text)) gin_trgm_ops)"
+            )
+
+    def drop(self, apps, schema_editor):
+        if schema_editor.connection.vendor == "postgresql":
+            for column in self.columns:
+                name = schema_editor.quote_name(self.get_name(column))
+                schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    def operation(self):
+        return migrations.RunPython(self.create, self.drop)
@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+from django.contrib.contenttypes.models import ContentType
+
+from pretalx.common.models import DeletedObject
+
+
+def deleted_objects_since(event, model, since):
+    return DeletedObject.objects.filter(
+        event=event,
+        content_type=ContentType.objects.get_for_model(model),
+        deleted__gte=since,
+    ).order_by("deleted", "pk")
@@ -3,20 +3,24 @@
 
 import hashlib
 import logging
+from collections.abc import Iterator
 from contextlib import suppress
 from io import StringIO
 from urllib.parse import quote
 
 from defusedcsv import csv
-from django.http import HttpResponse, HttpResponseNotModified
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
 from django.utils.functional import cached_property
 from django.utils.safestring import mark_safe
 from django.utils.timezone import now
-from django.utils.translation import activate
+from django.utils.translation import activate, get_language, override
+from django_scopes import scope
 
 from pretalx.common.signals import register_data_exporters
 from pretalx.common.text.path import safe_filename
 from pretalx.common.urls import EventUrls
+from pretalx.common.views.cache import get_requested_etag
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +131,29 @@ def show_public(self) -> bool:
         """
         return self.public
 
+    @property
+    def cacheable(self) -> bool:
+        """Return True if this exporter's output depends only on the schedule
+        and event data, never on the request or the current user.
+
+        Exports of released schedules by cacheable exporters are rendered once
+        per schedule version and language, when the schedule is released or
+        on first access, and are then served from the cache until event data
+        changes.
+        """
+        return False
+
+    @property
+    def streaming(self) -> bool:
+        """Return True if this exporter implements ``stream_data``, which
+        is then used to send large exports in chunks instead of rendering
+        them to a single string first.
+
+        Streamed responses have no ETag, as the content is only known once
+        the response has been sent.
+        """
+        return False
+
     @property
     def cors(self) -> str:
         """If you want to let this exporter be accessed with JavaScript, set
@@ -164,6 +191,11 @@ def get_data(self, request, **kwargs) -> str:
         """Return the file contents that ``render`` should return."""
         raise NotImplementedError
 
+    def stream_data(self, request, **kwargs) -> Iterator[str]:
+        """Yield the file contents that ``get_data`` would return in chunks.
+        Only used if ``streaming`` is True."""
+        raise NotImplementedError
+
     def render(self, request, **kwargs) -> tuple[str, str, str]:
         return (
             self.filename,
@@ -202,6 +234,22 @@ def render_csv(*, fieldnames, rows) -> str:
     return output.getvalue()
 
 
+class _Echo:
+    # csv writers write to a file and return its return value, so writing
+    # to this "file" gives us each rendered line.
+    def write(self, value):
+        return value
+
+
+def stream_csv(*, fieldnames, rows) -> Iterator[str]:
+    """Like ``render_csv``, but yields the CSV line by line, so that rows can
+    be generated while the response is being sent."""
+    writer = csv.DictWriter(_Echo(), fieldnames=list(fieldnames))
+    yield "\ufeff" + writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
 class CSVExporterMixin:
     extension = "csv"
     content_type = "text/plain"
@@ -244,6 +292,13 @@ def find_schedule_exporter(request, name, *, schedule, public=False):
     return None
 
 
+def stream_in_scope(event, language, chunks):
+    # Streamed content is only rendered after the view has returned, so we
+    # need to restore the event scope and language while iterating.
+    with scope(event=event), override(language):
+        yield from chunks
+
+
 def get_schedule_exporter_content(request, exporter_name, schedule):
     is_organiser = request.user.has_perm("schedule.export_schedule", request.event)
     exporter = find_schedule_exporter(
@@ -256,21 +311,52 @@ def get_schedule_exporter_content(request, exporter_name, schedule):
         activate(lang_code)
     elif "lang" in request.GET:
         activate(request.event.locale)
+    artifact = None
     try:
-        file_name, file_type, data = exporter.render(request=request)
-        etag = hashlib.sha1(str(data).encode()).hexdigest()  # noqa: S324 -- used for etag, not vulnerable to collision attacks
+        if schedule.version and exporter.cacheable:
+            from pretalx.schedule.domain.artifacts import (  # noqa: PLC0415 -- circular import
+                get_artifact_content,
+                get_artifact_encoding,
+                get_artifact_etag,
+                get_export_artifact,
+            )
+
+            artifact = get_export_artifact(exporter, get_language())
+            file_name = artifact["file_name"]
+            file_type = artifact["content_type"]
+            encoding = get_artifact_encoding(request.headers.get("Accept-Encoding"))
+            etag = get_artifact_etag(artifact, encoding)
+        elif exporter.streaming:
+            file_name, file_type = exporter.filename, exporter.content_type
+            data = stream_in_scope(
+                request.event, get_language(), exporter.stream_data(request=request)
+            )
+            etag = None
+        else:
+            file_name, file_type, data = exporter.render(request=request)
+            etag = hashlib.sha1(str(data).encode()).hexdigest()  # noqa: S324 -- used for etag, not vulnerable to collision attacks
     except Exception:
         logger.exception(
             "Failed to use %s for %s", exporter.identifier, request.event.slug
         )
         return None
-    if request.headers.get("If-None-Match") == etag:
+    if etag and get_requested_etag(request) == etag:
         return HttpResponseNotModified()
-    headers = {"ETag": f'"{etag}"'}
+    headers = {"ETag": f'"{etag}"'} if etag else {}
     if file_type not in ("application/json", "text/xml"):
         headers["Content-Disposition"] = (
             f'attachment; filename="{safe_filename(file_name)}"'
         )
     if exporter.cors:
         headers["Access-Control-Allow-Origin"] = exporter.cors
-    return HttpResponse(data, content_type=file_type, headers=headers)
+    if not etag:
+        return StreamingHttpResponse(data, content_type=file_type, headers=headers)
+    if artifact is None:
+        return HttpResponse(data, content_type=file_type, headers=headers)
+
+    data = get_artifact_content(artifact, encoding)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    response = HttpResponse(data, content_type=file_type, headers=headers)
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
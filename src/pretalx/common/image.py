@@ -214,17 +214,31 @@ def create_thumbnail(image, size, processed_img=None):
 
 
 def queue_thumbnail_regeneration(image):
-    instance = getattr(image, "instance", None)
-    if not instance or not getattr(instance, "pk", None):
+    queue_thumbnail_regenerations([image])
+
+
+def queue_thumbnail_regenerations(images):
+    """Queue thumbnail generation for each of ``images``, at most once a
+    minute per image, looking up the locks of all images in one go."""
+    pending = {}
+    for image in images:
+        instance = getattr(image, "instance", None)
+        if not instance or not getattr(instance, "pk", None):
+            continue
+        model_name = instance._meta.model_name.capitalize()
+        lock_key = f"thumbnail_regen:{model_name}:{instance.pk}:{image.field.name}"
+        pending[lock_key] = {
+            "field": image.field.name,
+            "model": model_name,
+            "pk": instance.pk,
+        }
+    if not pending:
         return
-    model_name = instance._meta.model_name.capitalize()
-    lock_key = f"thumbnail_regen:{model_name}:{instance.pk}:{image.field.name}"
-    if not cache.add(lock_key, True, timeout=60):
-        return
-
-    task_generate_thumbnails.apply_async(
-        kwargs={"field": image.field.name, "model": model_name, "pk": instance.pk}
-    )
+    locked = cache.get_many(list(pending))
+    for lock_key, kwargs in pending.items():
+        if lock_key in locked or not cache.add(lock_key, True, timeout=60):
+            continue
+        task_generate_thumbnails.apply_async(kwargs=kwargs)
 
 
 def get_image_for_model(*, model: str, pk: int, field: str):
@@ -245,8 +259,10 @@ def get_thumbnail(image, size):
     except FieldDoesNotExist:
         return image
 
+    # Thumbnails are only stored once they are written, so we can trust the
+    # field instead of checking the storage on every render.
     thumbnail_field = getattr(image.instance, thumbnail_field_name, None)
-    if thumbnail_field and thumbnail_field.storage.exists(thumbnail_field.path):
+    if thumbnail_field:
         return thumbnail_field
     queue_thumbnail_regeneration(image)
     return image
@@ -3,17 +3,20 @@
 
 import zoneinfo
 from contextlib import suppress
+from functools import partial
+from operator import itemgetter
 from urllib.parse import urljoin, urlparse
 
 from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import DisallowedHost
-from django.db.models import Exists, OuterRef, Subquery
+from django.db.models import Exists, OuterRef
 from django.http import Http404
 from django.http.request import split_domain_port
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import Resolver404, resolve
 from django.utils import timezone, translation
+from django.utils.functional import SimpleLazyObject
 from django_scopes import scope, scopes_disabled
 
 from pretalx.common.middleware.locale import (
@@ -25,9 +28,9 @@
 )
 from pretalx.common.views.redirect import get_login_redirect
 from pretalx.event.domain.queries.event import events_for_custom_domain
+from pretalx.event.domain.resolution import resolve_custom_domain, resolve_event
 from pretalx.event.models import Event, Organiser
 from pretalx.person.models import SpeakerProfile
-from pretalx.schedule.models import Schedule
 from pretalx.submission.models import Submission
 
 LOCAL_HOST_NAMES = ("testserver", "localhost", "127.0.0.1")
@@ -40,6 +43,23 @@
 )
 
 
+@scopes_disabled()
+def _get_speaker_info(event, user):
+    """The name of the user's speaker profile for ``event``, and whether they
+    have submitted anything to it."""
+    info = (
+        SpeakerProfile.objects.filter(event=event, user=user)
+        .annotate(
+            has_submissions=Exists(
+                Submission.all_objects.filter(event=event, speakers=OuterRef("pk"))
+            )
+        )
+        .values_list("name", "has_submissions")
+        .first()
+    )
+    return info or (None, False)
+
+
 class EventMiddleware:
     """Resolves the request's host, organiser and event, and everything that depends on them:
 
@@ -157,37 +177,28 @@ def _attach_event(self, request, url):
             )
         if not event_slug:
             return None
-        with scopes_disabled():
-            queryset = Event.objects.prefetch_related("extra_links").select_related(
-                "organiser", "cfp"
+        try:
+            request.event = resolve_event(event_slug)
+        except (
+            ValueError
+        ):  # pragma: no cover -- url regex should prevent malformed slugs
+            raise Http404 from None
+        if not request.event:
+            raise Http404
+        request.organiser = request.event.organiser
+        if request.user.is_authenticated:
+            # Per-user values are only looked up if a page uses them.
+            info = SimpleLazyObject(
+                partial(_get_speaker_info, request.event, request.user)
             )
-            latest_schedule_subquery = (
-                Schedule.objects.filter(event=OuterRef("pk"), published__isnull=False)
-                .order_by("-published")
-                .values("pk")[:1]
+            request.event.request_speaker_name = SimpleLazyObject(
+                partial(itemgetter(0), info)
             )
-            annotations = {"_current_schedule_pk": Subquery(latest_schedule_subquery)}
-            if request.user.is_authenticated:
-                annotations["request_speaker_name"] = Subquery(
-                    SpeakerProfile.objects.filter(
-                        event=OuterRef("pk"), user=request.user
-                    ).values("name")[:1]
+            if "orga" not in url.namespaces:
+                request.event.has_cfp_submissions = SimpleLazyObject(
+                    partial(itemgetter(1), info)
                 )
-                if "orga" not in url.namespaces:
-                    annotations["has_cfp_submissions"] = Exists(
-                        Submission.all_objects.filter(
-                            event=OuterRef("pk"), speakers__user=request.user
-                        )
-                    )
-            queryset = queryset.annotate(**annotations)
-            try:
-                request.event = get_object_or_404(queryset, slug__iexact=event_slug)
-                request.organiser = request.event.organiser
-            except (
-                ValueError
-            ):  # pragma: no cover -- url regex should prevent malformed slugs
-                raise Http404 from None
-            return request.event
+        return request.event
 
     def _handle_domain(self, request, url, host):
         if url.url_name in ANY_DOMAIN_ALLOWED or request.path.startswith("/api/"):
@@ -215,14 +226,16 @@ def _handle_domain(self, request, url, host):
             # Non-event orga pages belong on the main domain.
             return redirect(urljoin(settings.SITE_URL, request.get_full_path()))
 
-        if events := events_for_custom_domain(
+        has_events, public_url = resolve_custom_domain(
             request.scheme, host, domain=request.host
-        ):
+        )
+        if has_events:
             # Non-event page on custom domain is redirected to most recent event if possible
-            request.custom_domain_events = events
-            public_event = events.filter(is_public=True).first()
-            if public_event:
-                return redirect(public_event.urls.base.full())
+            request.custom_domain_events = events_for_custom_domain(
+                request.scheme, host, domain=request.host
+            )
+            if public_url:
+                return redirect(public_url)
             # Events exist, but no public ones. We accept leaking the domain (which
             # we do anyways by serving a cert) and show the start page instead of
             # confusing organisers with a 404.
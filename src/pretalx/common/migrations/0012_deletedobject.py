@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+# Generated by Django 6.0.9 on 2026-10-17 11:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("common", "0011_activitylog_profile_email_rename"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("event", "0045_event_event_slug_upper_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeletedObject",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False
+                    ),
+                ),
+                ("object_id", models.PositiveIntegerField()),
+                ("code", models.CharField(max_length=16, null=True)),
+                ("deleted", models.DateTimeField(auto_now_add=True)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deleted_objects",
+                        to="event.event",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["event", "content_type", "deleted"],
+                        name="common_dele_event_i_c37af6_idx",
+                    )
+                ]
+            },
+        )
+    ]
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django_scopes import ScopedManager, scopes_disabled
+
+DELETED_OBJECT_RETENTION_DAYS = 30
+_record_deletions = ContextVar("record_deletions", default=True)
+
+
+class DeletedObject(models.Model):
+    """
+    Records that an object was deleted, so that API clients syncing only
+    recent changes (with ``updated_since``) learn to drop it, too.
+    Removed again after ``DELETED_OBJECT_RETENTION_DAYS``.
+    """
+
+    event = models.ForeignKey(
+        to="event.Event", on_delete=models.CASCADE, related_name="deleted_objects"
+    )
+    content_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    code = models.CharField(max_length=16, null=True, blank=True)
+    deleted = models.DateTimeField(auto_now_add=True)
+
+    objects = ScopedManager(event="event")
+
+    class Meta:
+        indexes = [models.Index(fields=["event", "content_type", "deleted"])]
+
+    def __str__(self):
+        return f"DeletedObject(content_type={self.content_type_id}, object_id={self.object_id})"
+
+
+@contextmanager
+def unrecorded_deletions():
+    """Do not record objects deleted in this block, e.g. because their
+    event is deleted, too."""
+    token = _record_deletions.set(False)
+    try:
+        yield
+    finally:
+        _record_deletions.reset(token)
+
+
+def deletions_recorded():
+    """Receivers check this before loading anything needed to record a
+    deletion, so that bulk deletions without recording stay cheap."""
+    return _record_deletions.get()
+
+
+def record_deletion(instance, *, event_id):
+    if not event_id or not _record_deletions.get():
+        return
+    with scopes_disabled():
+        DeletedObject.objects.create(
+            event_id=event_id,
+            content_type=ContentType.objects.get_for_model(type(instance)),
+            object_id=instance.pk,
+            code=getattr(instance, "code", None),
+        )
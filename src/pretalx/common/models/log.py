@@ -2,12 +2,14 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 from django.utils.functional import cached_property
-from django_scopes import ScopedManager
+from django_scopes import ScopedManager, scopes_disabled
 
 from pretalx.common.models.fields import StaleTolerantGenericForeignKey
 from pretalx.common.signals import activitylog_display, activitylog_object_link
@@ -101,3 +103,41 @@ def changes(self):
         )
 
         return resolve_log_changes(self)
+
+
+_log_buffer = ContextVar("activity_log_buffer", default=None)
+LOG_BUFFER_BATCH_SIZE = 500
+
+
+def get_log_buffer():
+    """The list that ``log_action`` collects entries in, or ``None`` when
+    entries are written right away."""
+    return _log_buffer.get()
+
+
+@contextmanager
+def buffered_activity_logs():
+    """Collect the log entries created by ``log_action`` in this block, and
+    write them with a single ``bulk_create`` when the block ends.
+
+    Use this around bulk operations that log once per object. Inside a
+    transaction, the entries are committed or rolled back with it. Nested
+    blocks write their entries with the outermost one.
+    """
+    if get_log_buffer() is not None:
+        yield
+        return
+    buffer = []
+    token = _log_buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _log_buffer.reset(token)
+        # Changes made before an exception are kept outside of transactions,
+        # so their log entries are, too. In a transaction that is already
+        # marked for rollback, they would be lost anyway.
+        if buffer and not transaction.get_connection().needs_rollback:
+            with scopes_disabled():
+                ActivityLog.objects.bulk_create(
+                    buffer, batch_size=LOG_BUFFER_BATCH_SIZE
+                )
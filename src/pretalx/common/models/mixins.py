@@ -14,7 +14,7 @@
 from i18nfield.strings import LazyI18nString
 from rules.contrib.models import RulesModelBase, RulesModelMixin
 
-from pretalx.common.models.log import ActivityLog
+from pretalx.common.models.log import ActivityLog, get_log_buffer
 from pretalx.common.tasks import task_cleanup_file, task_process_image
 from pretalx.common.text.serialize import json_roundtrip
 
@@ -79,14 +79,26 @@ def log_action(
                     data[key] = "********" if data[key] else data[key]
             data = json_roundtrip(data)
 
-        return ActivityLog.objects.create(
-            event=getattr(self, "event", None),
-            person=person,
-            content_object=content_object or self,
-            action_type=action,
-            data=data,
-            is_orga_action=orga,
-        )
+        content_object = content_object or self
+        entry = {
+            "event": getattr(self, "event", None),
+            "person": person,
+            "action_type": action,
+            "data": data,
+            "is_orga_action": orga,
+        }
+        if (log_buffer := get_log_buffer()) is not None:
+            # Buffered entries only keep the object's ID, as the object may
+            # be deleted before the buffer is written.
+            log_buffer.append(
+                ActivityLog(
+                    content_type=ContentType.objects.get_for_model(content_object),
+                    object_id=content_object.pk,
+                    **entry,
+                )
+            )
+            return log_buffer[-1]
+        return ActivityLog.objects.create(content_object=content_object, **entry)
 
     def get_instance_data(self):
         """Get a dictionary of field values for this instance.
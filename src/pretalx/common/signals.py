@@ -3,6 +3,7 @@
 
 import logging
 import uuid
+import weakref
 from collections.abc import Callable
 from functools import wraps
 from typing import Any
@@ -10,6 +11,7 @@
 import django.dispatch
 from django.apps import apps
 from django.conf import settings
+from django.core import signals as core_signals
 from django.core.cache import cache
 from django.dispatch.dispatcher import NO_RECEIVERS
 from django.utils.html import conditional_escape
@@ -25,13 +27,40 @@ def _populate_app_cache():
         app_cache[app_config.name] = app_config
 
 
+def _receiver_sort_key(receiver):
+    return (receiver.__module__, receiver.__name__)
+
+
 class EventPluginSignal(django.dispatch.Signal):
     """An extension to Django's built-in signals.
 
     It sends out it's events only to receivers which belong to plugins
     that are enabled for the given Event.
+
+    Which receivers are active only depends on the ``plugins`` value of the
+    event, so for each ``plugins`` value and set of live receivers, the
+    active receivers and the order of their responses are compiled into a
+    dispatch table. Tables are dropped whenever receivers are connected or
+    disconnected.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dispatch_tables = {}
+        _plugin_signals.add(self)
+
+    def connect(self, *args, **kwargs):
+        super().connect(*args, **kwargs)
+        self.clear_dispatch_tables()
+
+    def disconnect(self, *args, **kwargs):
+        disconnected = super().disconnect(*args, **kwargs)
+        self.clear_dispatch_tables()
+        return disconnected
+
+    def clear_dispatch_tables(self):
+        self._dispatch_tables.clear()
+
     def get_live_receivers(self, sender):
         receivers = self._live_receivers(sender)
         return receivers[0]
@@ -57,6 +86,32 @@ def _is_active(sender, receiver):
             return app and app.name in sender.plugin_list
         return False
 
+    def _get_dispatch_table(self, sender):
+        """Return the live receivers that are active for ``sender`` in
+        connection order, and the order of their responses, which is
+        sorted by module and name."""
+        receivers = self.get_live_receivers(sender)
+        # Receivers connected to a single event, and receivers that were
+        # garbage collected, change the set of live receivers. Their ids are
+        # only reused by newly connected receivers, which drop all tables.
+        key = (sender.plugins if sender else None, tuple(map(id, receivers)))
+        table = self._dispatch_tables.get(key)
+        if table is None:
+            if not app_cache:
+                _populate_app_cache()
+            active = [
+                index
+                for index, receiver in enumerate(receivers)
+                if self._is_active(sender, receiver)
+            ]
+            order = sorted(
+                range(len(active)),
+                key=lambda position: _receiver_sort_key(receivers[active[position]]),
+            )
+            table = self._dispatch_tables[key] = (active, order)
+        active, order = table
+        return [receivers[index] for index in active], order
+
     def send(self, sender, **named) -> list[tuple[Callable, Any]]:
         """Send signal from sender to all connected receivers that belong to
         plugins enabled for the given Event.
@@ -69,24 +124,18 @@ def send(self, sender, **named) -> list[tuple[Callable, Any]]:
         if sender and not isinstance(sender, Event):
             raise ValueError("Sender needs to be an event.")
 
-        responses = []
         if (
             not self.receivers
             or self.sender_receivers_cache.get(sender) is NO_RECEIVERS
         ):
-            return responses
-
-        if not app_cache:
-            _populate_app_cache()
+            return []
 
-        for receiver in self.get_live_receivers(sender):
-            if self._is_active(sender, receiver):
-                response = receiver(signal=self, sender=sender, **named)
-                responses.append((receiver, response))
-        return sorted(
-            responses,
-            key=lambda response: (response[0].__module__, response[0].__name__),
-        )
+        receivers, order = self._get_dispatch_table(sender)
+        responses = [
+            (receiver, receiver(signal=self, sender=sender, **named))
+            for receiver in receivers
+        ]
+        return [responses[position] for position in order]
 
     def send_robust(self, sender, **named) -> list[tuple[Callable, Any]]:
         """Send signal from sender to all connected receivers that belong to
@@ -108,21 +157,15 @@ def send_robust(self, sender, **named) -> list[tuple[Callable, Any]]:
         ):
             return []
 
-        if not app_cache:
-            _populate_app_cache()
-
-        for receiver in self.get_live_receivers(sender):
-            if self._is_active(sender, receiver):
-                try:
-                    response = receiver(signal=self, sender=sender, **named)
-                except Exception as err:  # noqa: BLE001 -- signal handlers must not propagate unexpected exceptions
-                    responses.append((receiver, err))
-                else:
-                    responses.append((receiver, response))
-        return sorted(
-            responses,
-            key=lambda response: (response[0].__module__, response[0].__name__),
-        )
+        receivers, order = self._get_dispatch_table(sender)
+        for receiver in receivers:
+            try:
+                response = receiver(signal=self, sender=sender, **named)
+            except Exception as err:  # noqa: BLE001 -- signal handlers must not propagate unexpected exceptions
+                responses.append((receiver, err))
+            else:
+                responses.append((receiver, response))
+        return [responses[position] for position in order]
 
     def send_chained(
         self, sender, chain_kwarg_name, **named
@@ -147,16 +190,22 @@ def send_chained(
         ):
             return response
 
-        if not app_cache:
-            _populate_app_cache()
-
-        for receiver in self.get_live_receivers(sender):
-            if self._is_active(sender, receiver):
-                named[chain_kwarg_name] = response
-                response = receiver(signal=self, sender=sender, **named)
+        for receiver in self._get_dispatch_table(sender)[0]:
+            named[chain_kwarg_name] = response
+            response = receiver(signal=self, sender=sender, **named)
         return response
 
 
+_plugin_signals = weakref.WeakSet()
+
+
+@django.dispatch.receiver(core_signals.setting_changed)
+def _clear_dispatch_tables(setting, **kwargs):
+    if setting == "CORE_MODULES":
+        for signal in _plugin_signals:
+            signal.clear_dispatch_tables()
+
+
 def join_html_responses(responses):
     """Join responses to a signal into a single SafeString.
 
@@ -12,6 +12,21 @@
 logger = logging.getLogger(__name__)
 
 
+def progress_callback(task, current, total):
+    # Every update is a write to the result backend, so only report when
+    # the displayed percentage changes.
+    if current != total and current * 100 // total == (current - 1) * 100 // total:
+        return
+    task.update_state(
+        state="PROGRESS",
+        meta={
+            "value": round(current / total * 100),
+            "current": current,
+            "total": total,
+        },
+    )
+
+
 @app.task(name="pretalx.process_image")
 def task_process_image(*, model: str, pk: int, field: str, generate_thumbnail: bool):
     from pretalx.common.image import (  # noqa: PLC0415 -- leaf
@@ -346,8 +346,13 @@ def order_handler(self, request, *args, **kwargs):
         order = request.POST.get("order")
         if order:
             reorder_queryset(self.get_queryset(), order.split(","))
+            self.order_changed()
         return self.list(request, *args, **kwargs)
 
+    def order_changed(self):
+        """Called after the objects were reordered. The new positions are
+        written in bulk, which sends no ``post_save`` signals."""
+
 
 def _get_celery_async_result(async_id):
     """Return a Celery AsyncResult for the given task ID.
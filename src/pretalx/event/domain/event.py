@@ -13,12 +13,16 @@
 from django_scopes import scopes_disabled
 
 from pretalx.common.models import ActivityLog
+from pretalx.common.models.deletion import unrecorded_deletions
 from pretalx.event.models import Event
 from pretalx.mail.domain.template import mail_template_by_role
 from pretalx.mail.enums import MailTemplateRoles
 from pretalx.orga.signals import activate_event as activate_event_signal
 from pretalx.orga.signals import event_copy_data
 from pretalx.person.models import SpeakerProfile
+from pretalx.schedule.domain.artifacts import invalidate_export_data
+from pretalx.schedule.domain.feed import publish_slot_changes
+from pretalx.schedule.domain.warnings import invalidate_event_overlap_indexes
 from pretalx.schedule.models import Availability, Schedule, TalkSlot
 from pretalx.submission.models import (
     Answer,
@@ -340,6 +344,10 @@ def _move_slots(event, delta, *, past=False):
         update = {key: F(key) + delta}
         talk_queryset.filter(**filt).update(**update)
         Availability.objects.filter(event=event).filter(**filt).update(**update)
+    invalidate_event_overlap_indexes(event.pk)
+    if past:
+        invalidate_export_data(event.pk)
+    publish_slot_changes(event.wip_schedule.pk, reset=True)
 
 
 def apply_date_edit(event, old_event):
@@ -465,7 +473,7 @@ def shred_event(event, person=None):
             "organiser": str(event.organiser.name),
         },
     )
-    with transaction.atomic():
+    with transaction.atomic(), unrecorded_deletions():
         deletion_order = [
             (event.logged_actions(), False),
             (event.mail_templates.all(), False),
@@ -3,9 +3,11 @@
 
 import datetime as dt
 
+from django.db.models import Exists, OuterRef, Q
 from django.utils.timezone import now
 
 from pretalx.event.domain.mail import send_orga_mail
+from pretalx.event.models import Event
 from pretalx.mail.template_phrases import CFP_CLOSED_TEXT, EVENT_OVER_TEXT
 
 
@@ -38,3 +40,28 @@ def send_lifecycle_notifications(event):
     ):
         send_orga_mail(event, EVENT_OVER_TEXT, stats=True)
         event.settings.sent_mail_event_over = True
+
+
+def _setting_is_set(key):
+    settings_model = Event._meta.get_field("_settings_objects").related_model
+    return Exists(
+        settings_model.objects.filter(object=OuterRef("pk"), key=key, value="True")
+    )
+
+
+def lifecycle_notifications_due(_now=None):
+    """A filter for events that may need a notification from
+    ``send_lifecycle_notifications``, evaluated in the database.
+
+    The filter may match events that ``send_lifecycle_notifications`` ends
+    up skipping, but never misses one that it would notify about.
+    """
+    _now = _now or now()
+    cfp_closed = Q(
+        cfp__deadline__gte=_now - dt.timedelta(days=1), cfp__deadline__lte=_now
+    ) & ~_setting_is_set("sent_mail_cfp_closed")
+    event_over = Q(
+        date_to__gte=_now.date() - dt.timedelta(days=3),
+        date_to__lte=_now.date() - dt.timedelta(days=1),
+    ) & ~_setting_is_set("sent_mail_event_over")
+    return cfp_closed | event_over
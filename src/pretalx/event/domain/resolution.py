@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+import hashlib
+import pickle
+import uuid
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django_scopes import scopes_disabled
+
+from pretalx.event.domain.queries.event import events_for_custom_domain
+from pretalx.event.models import Event
+from pretalx.schedule.models import Schedule
+
+# Resolved events are kept as pickled snapshots, both in the shared cache and
+# in process. Every snapshot is tagged with the generation of its event that
+# was current before the event was loaded from the database. Invalidating an
+# event starts a new generation, so that older snapshots are ignored in all
+# processes, including snapshots of data read while the change was being
+# committed. Requests fetch only the small generation key from the shared
+# cache when the in-process snapshot is still current. Generations expire like
+# snapshots, and a missing generation is replaced by a new one, so that all
+# snapshots are loaded again.
+EVENT_RESOLUTION_TIMEOUT = 60 * 60
+_local_snapshots = {}
+
+
+def _resolution_key(slug):
+    return f"event_resolution_{slug.lower()}"
+
+
+def _domains_key():
+    return "event_resolution_domains"
+
+
+def _generation_key(key):
+    return f"{key}_generation"
+
+
+def _get_generation(key):
+    return cache.get_or_set(
+        _generation_key(key), lambda: uuid.uuid4().hex, timeout=EVENT_RESOLUTION_TIMEOUT
+    )
+
+
+def _bump_generation(key):
+    cache.set(_generation_key(key), uuid.uuid4().hex, EVENT_RESOLUTION_TIMEOUT)
+
+
+def _load_event(slug):
+    latest_schedule = (
+        Schedule.objects.filter(event=OuterRef("pk"), published__isnull=False)
+        .order_by("-published")
+        .values("pk")[:1]
+    )
+    return (
+        Event.objects.prefetch_related("extra_links")
+        .select_related("organiser", "cfp")
+        .annotate(_current_schedule_pk=Subquery(latest_schedule))
+        .filter(slug__iexact=slug)
+        .first()
+    )
+
+
+@scopes_disabled()
+def resolve_event(slug):
+    """The event with the slug ``slug`` (case-insensitive), with its organiser,
+    CfP, extra links and current schedule ID, or ``None``.
+
+    Every call returns a new instance, so callers can modify it freely.
+    """
+    key = _resolution_key(slug)
+    generation = cache.get(_generation_key(key))
+    if generation is None:
+        # Requests for unknown slugs must not leave generations behind. The
+        # event is read before its generation starts, so it is not kept.
+        event = _load_event(slug)
+        if event:
+            _get_generation(key)
+        return event
+    snapshot = _local_snapshots.get(key)
+    if not snapshot or snapshot[0] != generation:
+        snapshot = cache.get(key)
+        if snapshot and snapshot[0] == generation:
+            _local_snapshots[key] = snapshot
+    if snapshot and snapshot[0] == generation:
+        return pickle.loads(snapshot[1])  # noqa: S301 -- our own snapshot, see above
+
+    event = _load_event(slug)
+    if event:
+        snapshot = (generation, pickle.dumps(event))
+        cache.set(key, snapshot, EVENT_RESOLUTION_TIMEOUT)
+        _local_snapshots[key] = snapshot
+    return event
+
+
+@scopes_disabled()
+def resolve_custom_domain(scheme, host, domain=None):
+    """Whether any events use the given custom domain (see
+    ``events_for_custom_domain``), and the URL of the most recent public one,
+    if there is one."""
+    key = _domains_key()
+    generation = _get_generation(key)
+    domain_key = hashlib.sha1(f"{scheme}://{host}|{domain}".encode()).hexdigest()  # noqa: S324 -- used as cache key, not vulnerable to collision attacks
+    entry_key = f"{key}_{domain_key}"
+    if (entry := cache.get(entry_key)) and entry[0] == generation:
+        return entry[1], entry[2]
+
+    events = events_for_custom_domain(scheme, host, domain=domain)
+    public_event = events.filter(is_public=True).first()
+    result = (
+        public_event is not None or events.exists(),
+        public_event.urls.base.full() if public_event else None,
+    )
+    cache.set(entry_key, (generation, *result), EVENT_RESOLUTION_TIMEOUT)
+    return result
+
+
+def _invalidate(slugs, domains):
+    for slug in slugs:
+        key = _resolution_key(slug)
+        _bump_generation(key)
+        _local_snapshots.pop(key, None)
+    if domains:
+        _bump_generation(_domains_key())
+
+
+def invalidate_event_resolution(*slugs, domains=False):
+    """Drop the cached resolution of the events with the given slugs, and of
+    all custom domains if ``domains`` is set.
+
+    This happens right away, and again once the current transaction is
+    committed, so that snapshots of data read before the commit are
+    discarded, too.
+    """
+    _invalidate(slugs, domains)
+    transaction.on_commit(partial(_invalidate, slugs, domains))
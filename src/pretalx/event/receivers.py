@@ -3,30 +3,39 @@
 
 import datetime as dt
 
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils.timezone import now
-from django_scopes import scope
+from django_scopes import scopes_disabled
 
 from pretalx.common.signals import minimum_interval, periodic_task
 
 
 @receiver(periodic_task)
 def periodic_event_services(sender, **kwargs):
+    from pretalx.event.domain.lifecycle import (  # noqa: PLC0415 -- receiver
+        lifecycle_notifications_due,
+    )
     from pretalx.event.models import Event  # noqa: PLC0415 -- receiver
     from pretalx.event.tasks import (  # noqa: PLC0415 -- receiver
         task_periodic_event_services,
     )
     from pretalx.submission.domain.review import (  # noqa: PLC0415 -- receiver
-        update_review_phase,
+        review_phase_update_due,
     )
 
-    cutoff = now() - dt.timedelta(days=3)
-    for event in Event.objects.filter(date_to__gte=cutoff.date()):
-        with scope(event=event):
-            task_periodic_event_services.apply_async(
-                args=(event.slug,), ignore_result=True
-            )
-            update_review_phase(event)
+    # Only events with something to do get a task, so that the sweep stays
+    # cheap on instances with many events.
+    _now = now()
+    cutoff = _now - dt.timedelta(days=3)
+    with scopes_disabled():
+        slugs = list(
+            Event.objects.filter(date_to__gte=cutoff.date())
+            .filter(lifecycle_notifications_due(_now) | review_phase_update_due(_now))
+            .values_list("slug", flat=True)
+        )
+    for slug in slugs:
+        task_periodic_event_services.apply_async(args=(slug,), ignore_result=True)
 
 
 @receiver(signal=periodic_task)
@@ -36,3 +45,100 @@ def clean_cached_files(sender, **kwargs):
 
     for cf in CachedFile.objects.filter(expires__lt=now()):
         cf.delete()
+
+
+@receiver(signal=periodic_task)
+@minimum_interval(minutes_after_success=60 * 24)
+def clean_deleted_objects(sender, **kwargs):
+    from pretalx.common.models.deletion import (  # noqa: PLC0415 -- receiver
+        DELETED_OBJECT_RETENTION_DAYS,
+        DeletedObject,
+    )
+
+    cutoff = now() - dt.timedelta(days=DELETED_OBJECT_RETENTION_DAYS)
+    with scopes_disabled():
+        DeletedObject.objects.filter(deleted__lt=cutoff).delete()
+
+
+def _invalidate_event_resolution(event_id):
+    from pretalx.event.domain.resolution import (  # noqa: PLC0415 -- receiver
+        invalidate_event_resolution,
+    )
+    from pretalx.event.models import Event  # noqa: PLC0415 -- receiver
+
+    with scopes_disabled():
+        slug = Event.objects.filter(pk=event_id).values_list("slug", flat=True).first()
+    if slug:
+        invalidate_event_resolution(slug)
+
+
+@receiver(post_save, sender="event.Event", dispatch_uid="event_resolution_event_save")
+@receiver(
+    post_delete, sender="event.Event", dispatch_uid="event_resolution_event_delete"
+)
+def invalidate_event(sender, instance, raw=False, **kwargs):
+    from pretalx.event.domain.resolution import (  # noqa: PLC0415 -- receiver
+        invalidate_event_resolution,
+    )
+
+    if not raw:
+        invalidate_event_resolution(instance.slug, domains=True)
+
+
+@receiver(pre_save, sender="event.Event", dispatch_uid="event_resolution_event_slug")
+def invalidate_previous_event_slug(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    """The snapshot of an event whose slug changes is cached under its
+    previous slug, so it has to be dropped before the slug is gone."""
+    from pretalx.event.domain.resolution import (  # noqa: PLC0415 -- receiver
+        invalidate_event_resolution,
+    )
+
+    if raw or not instance.pk or (update_fields and "slug" not in update_fields):
+        return
+    with scopes_disabled():
+        previous_slug = (
+            sender.objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+        )
+    if previous_slug and previous_slug.lower() != instance.slug.lower():
+        invalidate_event_resolution(previous_slug)
+
+
+@receiver(
+    post_save, sender="event.Organiser", dispatch_uid="event_resolution_organiser"
+)
+def invalidate_organiser_events(sender, instance, created=False, raw=False, **kwargs):
+    from pretalx.event.domain.resolution import (  # noqa: PLC0415 -- receiver
+        invalidate_event_resolution,
+    )
+
+    if raw or created:
+        return
+    with scopes_disabled():
+        slugs = instance.events.values_list("slug", flat=True)
+        invalidate_event_resolution(*slugs)
+
+
+@receiver(post_save, sender="submission.CfP", dispatch_uid="event_resolution_cfp")
+@receiver(
+    post_save,
+    sender="event.EventExtraLink",
+    dispatch_uid="event_resolution_extra_link_save",
+)
+@receiver(
+    post_delete,
+    sender="event.EventExtraLink",
+    dispatch_uid="event_resolution_extra_link_delete",
+)
+@receiver(
+    post_save, sender="schedule.Schedule", dispatch_uid="event_resolution_schedule"
+)
+@receiver(
+    post_delete,
+    sender="schedule.Schedule",
+    dispatch_uid="event_resolution_schedule_delete",
+)
+def invalidate_related_event(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _invalidate_event_resolution(instance.event_id)
@@ -12,22 +12,20 @@ def task_periodic_event_services(event_slug):
         send_lifecycle_notifications,
     )
     from pretalx.event.models import Event  # noqa: PLC0415 -- leaf
+    from pretalx.submission.domain.review import (  # noqa: PLC0415 -- leaf
+        update_review_phase,
+    )
 
     with scopes_disabled():
         event = (
             Event.objects.filter(slug=event_slug)
             .select_related("cfp")
-            .prefetch_related(
-                "_settings_objects",
-                "submissions__slots",
-                "schedules",
-                "review_phases",
-                "score_categories",
-            )
+            .prefetch_related("_settings_objects", "review_phases")
             .first()
         )
     if not event:
         return
 
     with scope(event=event):
+        update_review_phase(event)
         send_lifecycle_notifications(event)
@@ -66,6 +66,17 @@ const api = {
 		}
 		return api.http('GET', url, null)
 	},
+	fetchChanges (cursor) {
+		// Resolves without a value if nothing changed after the cursor
+		let url = `/orga/event/${api.eventSlug}/schedule/api/talks/feed/`
+		if (window.location.search) {
+			url += window.location.search + '&'
+		} else {
+			url += '?'
+		}
+		url += `cursor=${cursor}`
+		return api.http('GET', url, null)
+	},
 	fetchAvailabilities () {
 		const url = `/orga/event/${api.eventSlug}/schedule/api/availabilities/`
 		return api.http('GET', url, null)
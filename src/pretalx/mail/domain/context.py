@@ -33,11 +33,12 @@
 )
 
 
-def get_mail_context(*, safe_extra_context=None, **kwargs):
+def get_mail_context(*, safe_extra_context=None, identifiers=None, **kwargs):
     """Resolve registered mail placeholders satisfied by ``kwargs`` and return
     a ``{identifier: value}`` dict, merged with ``safe_extra_context``.
     ``safe_extra_context`` values must be pre-sanitised. Only ``SafeString``,
     ``EmailAlternativeString``, ``UrlString``, and numeric types are permitted.
+    If ``identifiers`` is given, only these placeholders are resolved.
     """
     _validate_safe_extra_context(safe_extra_context)
     if safe_extra_context:
@@ -62,6 +63,8 @@ def get_mail_context(*, safe_extra_context=None, **kwargs):
             placeholders if isinstance(placeholders, (list, tuple)) else [placeholders]
         )
         for placeholder in placeholder_list:
+            if identifiers is not None and placeholder.identifier not in identifiers:
+                continue
             if all(required in kwargs for required in placeholder.required_context):
                 if placeholder.account_required and degrade_account_links:
                     context[placeholder.identifier] = ""
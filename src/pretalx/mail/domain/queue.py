@@ -10,9 +10,10 @@
 from django_scopes import scopes_disabled
 
 from pretalx.common.exceptions import SendMailException
+from pretalx.common.models.log import buffered_activity_logs
 from pretalx.mail.domain.recipient import Recipient
 from pretalx.mail.domain.render import render_template_to_mail
-from pretalx.mail.domain.send import send_draft
+from pretalx.mail.domain.send import send_drafts
 from pretalx.mail.enums import QueuedMailStates
 from pretalx.mail.models import QueuedMail
 from pretalx.person.models import SpeakerProfile
@@ -60,6 +61,8 @@ def bulk_create_drafts(template, recipients, *, progress=None):
     identical (speaker, subject, text) tuples and saving unique
     emails as draft.
 
+    The drafts are saved with :func:`save_drafts`.
+
     Returns (saved_mails, render_failures).
     """
     event = template.event
@@ -129,14 +132,53 @@ def bulk_create_drafts(template, recipients, *, progress=None):
         if submission := context.get("submission"):
             submissions.append(submission)
 
-    saved_mails = []
-    with transaction.atomic():
-        for (speaker, _, _), (mail, submissions) in dedup_groups.items():
-            if save_draft(mail, to_speakers=[speaker], submissions=submissions):
-                saved_mails.append(mail)
+    saved_mails = save_drafts(
+        (mail, speaker, submissions)
+        for (speaker, _, _), (mail, submissions) in dedup_groups.items()
+    )
     return saved_mails, render_failures
 
 
+def save_drafts(drafts):
+    """Persist ``(mail, speaker, submissions)`` tuples of rendered mails as
+    DRAFT rows in the outbox, like :func:`save_draft`.
+
+    The drafts and their recipient and submission relations are written
+    with one bulk insert each. Returns the saved mails.
+    """
+    with transaction.atomic(), buffered_activity_logs():
+        reachable = []
+        for mail, speaker, submissions in drafts:
+            if not speaker.effective_email:
+                speaker.log_action(
+                    "pretalx.mail.skipped",
+                    orga=True,
+                    data={"subject": str(mail.subject)},
+                )
+                logger.warning(
+                    "Dropping mail recipient %s: no effective email", speaker.code
+                )
+                continue
+            reachable.append((mail, speaker, submissions))
+
+        saved_mails = [mail for mail, _, _ in reachable]
+        QueuedMail.objects.bulk_create(saved_mails)
+        QueuedMail.to_speakers.through.objects.bulk_create(
+            QueuedMail.to_speakers.through(
+                queuedmail_id=mail.pk, speakerprofile_id=speaker.pk
+            )
+            for mail, speaker, _ in reachable
+        )
+        QueuedMail.submissions.through.objects.bulk_create(
+            QueuedMail.submissions.through(
+                queuedmail_id=mail.pk, submission_id=submission.pk
+            )
+            for mail, _, submissions in reachable
+            for submission in dict.fromkeys(submissions)
+        )
+    return saved_mails
+
+
 def copy_to_draft(mail):
     """Duplicate a sent (or failed) QueuedMail as a fresh DRAFT so an
     organiser can edit and resend it. Recipient M2Ms (to_speakers,
@@ -157,7 +199,8 @@ def copy_to_draft(mail):
 
 
 def send_outbox_mails(*, event, mail_pks, requestor=None, progress=None):
-    """Send each DRAFT mail in ``mail_pks``.
+    """Send each DRAFT mail in ``mail_pks``, sharing SMTP connections
+    between them (see :func:`~pretalx.mail.domain.send.send_drafts`).
     ``progress`` is an optional ``(current, total)`` callback.
     """
     mails = list(
@@ -165,17 +208,8 @@ def send_outbox_mails(*, event, mail_pks, requestor=None, progress=None):
             pk__in=mail_pks, state=QueuedMailStates.DRAFT
         ).select_related("event")
     )
-    total = len(mails)
-
-    for i, mail in enumerate(mails):
-        try:
-            send_draft(mail, requestor=requestor)
-        except Exception:
-            logger.exception("Failed to send mail %d", mail.pk)
-        if progress:
-            progress(i + 1, total)
-
-    return {"count": total}
+    send_drafts(mails, requestor=requestor, progress=progress)
+    return {"count": len(mails)}
 
 
 def expire_stale_queued_mails():
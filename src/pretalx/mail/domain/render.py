@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: 2017-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+import re
+
 from django.conf import settings
 from django.template.loader import get_template
 from django.utils.safestring import SafeString, mark_safe
@@ -18,6 +20,7 @@
     format_map,
 )
 from pretalx.mail.domain.context import get_mail_context
+from pretalx.mail.domain.placeholders import get_used_placeholders
 from pretalx.mail.models import QueuedMail
 
 
@@ -75,8 +78,14 @@ def render_to_mail(
     """
     context_kwargs = {**(context_kwargs or {}), "event": event}
     with override(locale):
+        # Placeholders can be expensive, so we only resolve the ones in use.
+        used = get_used_placeholders(str(subject_template)) | get_used_placeholders(
+            str(text_template)
+        )
         context = get_mail_context(
-            safe_extra_context=safe_extra_context, **context_kwargs
+            safe_extra_context=safe_extra_context,
+            identifiers={re.split(r"[.\[]", name, maxsplit=1)[0] for name in used},
+            **context_kwargs,
         )
         try:
             subject = format_map(subject_template, context, mode=MODE_PLAIN)
@@ -31,10 +31,13 @@
     queuedmail_pre_send,
     request_pre_send,
 )
-from pretalx.mail.tasks import task_send_draft
+from pretalx.mail.tasks import task_send_draft, task_send_drafts
 
 logger = logging.getLogger(__name__)
 
+# Number of mails delivered by one worker task over a shared SMTP connection.
+MAIL_BATCH_SIZE = 100
+
 
 def get_send_mail_exceptions(request):
     exceptions = [
@@ -50,10 +53,11 @@ def get_send_mail_exceptions(request):
     return None
 
 
-def send_draft(mail, *, requestor=None, orga: bool = True) -> None:
-    """Hand a saved DRAFT :class:`QueuedMail` to the worker for delivery.
+def _claim_draft(mail) -> bool:
+    """Move a saved DRAFT :class:`QueuedMail` to SENDING.
 
-    Requires ``mail.pk``; for unsaved mails see :func:`send_transient`.
+    Returns ``False`` if a pre_send signal handler already sent the mail,
+    in which case there is nothing left to deliver.
     """
     if mail._state.adding:
         raise RuntimeError("send_draft requires a persisted mail")
@@ -73,22 +77,16 @@ def send_draft(mail, *, requestor=None, orga: bool = True) -> None:
             # A pre_send signal handler did the sending; nothing left to do.
             mail.state = QueuedMailStates.SENT
             mail.save(update_fields=["state", "sent"])
-            return
+            return False
 
         mail.state = QueuedMailStates.SENDING
         mail.error_data = None
         mail.error_timestamp = None
         mail.save(update_fields=["state", "error_data", "error_timestamp"])
+    return True
 
-    # Dispatch outside the atomic block so the worker observes the
-    # SENDING row instead of racing the commit. Do not move this back
-    # inside the transaction.
-    try:
-        task_send_draft.apply_async(args=[mail.pk], ignore_result=True)
-    except (OSError, OperationalError) as exc:
-        mail.mark_failed(exc)
-        return
 
+def _log_sent(mail, *, requestor, orga):
     mail.log_action(
         "pretalx.mail.sent",
         person=requestor,
@@ -100,8 +98,64 @@ def send_draft(mail, *, requestor=None, orga: bool = True) -> None:
             ]
         },
     )
-    if event:
-        queuedmail_post_send.send_robust(sender=event, mail=mail)
+    if mail.event:
+        queuedmail_post_send.send_robust(sender=mail.event, mail=mail)
+
+
+def send_draft(mail, *, requestor=None, orga: bool = True) -> None:
+    """Hand a saved DRAFT :class:`QueuedMail` to the worker for delivery.
+
+    Requires ``mail.pk``; for unsaved mails see :func:`send_transient`.
+    """
+    if not _claim_draft(mail):
+        return
+
+    # Dispatch outside the atomic block so the worker observes the
+    # SENDING row instead of racing the commit. Do not move this back
+    # inside the transaction.
+    try:
+        task_send_draft.apply_async(args=[mail.pk], ignore_result=True)
+    except (OSError, OperationalError) as exc:
+        mail.mark_failed(exc)
+        return
+
+    _log_sent(mail, requestor=requestor, orga=orga)
+
+
+def send_drafts(mails, *, requestor=None, orga: bool = True, progress=None) -> None:
+    """Like :func:`send_draft` for many mails at once.
+
+    The mails are handed to the worker in chunks of
+    ``MAIL_BATCH_SIZE``, and each chunk is delivered over one SMTP
+    connection per backend instead of one connection per mail. Mails
+    that cannot be sent (e.g. because they were sent already) are
+    logged and skipped. ``progress`` is an optional ``(current, total)``
+    callback.
+    """
+    mails = list(mails)
+    total = len(mails)
+    claimed = []
+    for i, mail in enumerate(mails):
+        try:
+            if _claim_draft(mail):
+                claimed.append(mail)
+        except Exception:
+            logger.exception("Failed to send mail %d", mail.pk)
+        if progress:
+            progress(i + 1, total)
+
+    for start in range(0, len(claimed), MAIL_BATCH_SIZE):
+        chunk = claimed[start : start + MAIL_BATCH_SIZE]
+        try:
+            task_send_drafts.apply_async(
+                args=[[mail.pk for mail in chunk]], ignore_result=True
+            )
+        except (OSError, OperationalError) as exc:
+            for mail in chunk:
+                mail.mark_failed(exc)
+            continue
+        for mail in chunk:
+            _log_sent(mail, requestor=requestor, orga=orga)
 
 
 def send_transient(mail, *, force_global_backend: bool = False) -> None:
@@ -17,6 +17,7 @@
 
 import logging
 import re
+import smtplib
 from contextlib import suppress
 from email.utils import formataddr, parseaddr
 
@@ -182,12 +183,14 @@ def deliver_payload(
     cc=None,
     bcc=None,
     attachments=None,
+    connection=None,
 ):
     """Synchronously deliver a fully-rendered payload over SMTP.
 
     ``to`` may be a string or list. After debug-domain filtering an
     empty list is a successful no-op. Routes through ``event``'s SMTP
-    backend, or the global one when ``event`` is ``None``.
+    backend, or the global one when ``event`` is ``None``, unless an
+    already opened ``connection`` to that backend is passed in.
 
     Raises whatever the SMTP backend raises; the caller decides whether
     to retry or mark a row failed.
@@ -207,14 +210,15 @@ def deliver_payload(
         bcc=bcc,
         attachments=attachments,
     )
-    backend.send_messages([email])
+    (connection or backend).send_messages([email])
 
 
-def deliver_persisted(mail):
+def deliver_persisted(mail, *, connection=None):
     """Synchronously deliver a saved :class:`QueuedMail` over SMTP.
 
     No DB writes, no signals, no logging. Renders the body and pushes it
-    via the event's SMTP backend (or the global one for eventless mails).
+    via the event's SMTP backend (or the global one for eventless mails),
+    or via ``connection`` if given.
     Raises :class:`SendMailException` when no reachable recipient is
     left, and otherwise whatever the SMTP backend raises.
     """
@@ -243,4 +247,52 @@ def deliver_persisted(mail):
         cc=to_recipients(mail.cc),
         bcc=to_recipients(mail.bcc),
         attachments=mail.attachments,
+        connection=connection,
     )
+
+
+def _close_backend(backend):
+    with suppress(smtplib.SMTPException, OSError):
+        backend.close()
+
+
+def deliver_persisted_batch(mails):
+    """Deliver saved :class:`QueuedMail` rows over one connection per
+    backend, instead of opening a new connection for every mail.
+
+    Yields ``(mail, exception)`` pairs, with ``exception`` being ``None``
+    for delivered mails; like :func:`deliver_persisted`, this leaves all
+    state changes to the caller. A connection that the server dropped
+    (e.g. after an idle timeout) is reopened and the mail is sent again
+    once. After any other error, the connection is closed and reopened
+    for the next mail, so that one failure cannot break the rest of the
+    batch.
+    """
+    backends = {}
+    try:
+        for mail in mails:
+            backend = backends.get(mail.event_id)
+            try:
+                if backend is None:
+                    # Broken event mail settings fail only this event's mails.
+                    backend = backends[mail.event_id] = (
+                        mail_backend_for_event(mail.event)
+                        if mail.event
+                        else get_connection(fail_silently=False)
+                    )
+                try:
+                    backend.open()
+                    deliver_persisted(mail, connection=backend)
+                except smtplib.SMTPServerDisconnected:
+                    _close_backend(backend)
+                    backend.open()
+                    deliver_persisted(mail, connection=backend)
+            except Exception as exception:  # noqa: BLE001 -- handed to the caller, which marks the row failed
+                if backend is not None:
+                    _close_backend(backend)
+                yield mail, exception
+            else:
+                yield mail, None
+    finally:
+        for backend in backends.values():
+            _close_backend(backend)
@@ -14,6 +14,7 @@
 
 from pretalx.celery_app import app
 from pretalx.common.exceptions import SendMailException
+from pretalx.common.tasks import progress_callback
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +87,39 @@ def task_send_draft(self, queued_mail_id):
             mail.mark_sent()
 
 
+@app.task(bind=True, name="pretalx.mail.send_drafts")
+def task_send_drafts(self, queued_mail_ids):
+    """Worker entry point for delivering a chunk of persisted
+    ``QueuedMail`` rows, sharing one SMTP connection per backend.
+
+    Rows end up in the same states as with :func:`task_send_draft`:
+    success → ``mark_sent``; retryable SMTP error → handed to
+    :func:`task_send_draft`, which retries that row on its own; any other
+    failure → ``mark_failed``.
+    """
+    from pretalx.mail.domain import smtp  # noqa: PLC0415 -- leaf
+    from pretalx.mail.enums import QueuedMailStates  # noqa: PLC0415 -- leaf
+    from pretalx.mail.models import QueuedMail  # noqa: PLC0415 -- leaf
+
+    with scopes_disabled():
+        mails = QueuedMail.objects.select_related("event").filter(
+            pk__in=queued_mail_ids, state=QueuedMailStates.SENDING
+        )
+        for mail, exception in smtp.deliver_persisted_batch(mails):
+            if exception is None:
+                mail.mark_sent()
+            elif (
+                isinstance(exception, SMTPResponseException)
+                and exception.smtp_code in _RETRYABLE_SMTP_CODES
+            ):
+                task_send_draft.apply_async(
+                    args=[mail.pk], countdown=1, ignore_result=True
+                )
+            else:
+                logger.error("Error sending email %d: %s", mail.pk, exception)
+                mail.mark_failed(exception)
+
+
 @app.task(bind=True, name="pretalx.mail.send_transient")
 def task_send_transient(
     self,
@@ -131,17 +165,6 @@ def task_send_transient(
         ) from exception
 
 
-def progress_callback(task, current, total):
-    task.update_state(
-        state="PROGRESS",
-        meta={
-            "value": round(current / total * 100),
-            "current": current,
-            "total": total,
-        },
-    )
-
-
 @app.task(bind=True, name="pretalx.mail.generate_mails")
 def task_create_mails_for_template(
     self, *, template_id, recipients, skip_queue=False, **kwargs
@@ -152,7 +175,7 @@ def task_create_mails_for_template(
     older deploys (notably ``event_id``); drop in 2027.
     """
     from pretalx.mail.domain.queue import bulk_create_drafts  # noqa: PLC0415 -- leaf
-    from pretalx.mail.domain.send import send_draft  # noqa: PLC0415 -- leaf
+    from pretalx.mail.domain.send import send_drafts  # noqa: PLC0415 -- leaf
     from pretalx.mail.models import MailTemplate  # noqa: PLC0415 -- leaf
 
     with scopes_disabled():
@@ -163,11 +186,7 @@ def task_create_mails_for_template(
             template, recipients, progress=partial(progress_callback, self)
         )
         if skip_queue:
-            for mail in saved_mails:
-                try:
-                    send_draft(mail)
-                except Exception:
-                    logger.exception("Failed to send mail %d", mail.pk)
+            send_drafts(saved_mails)
 
     return {
         "count": len(saved_mails),
@@ -1,17 +1,19 @@
 # SPDX-FileCopyrightText: 2017-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+import itertools
 import json
+import textwrap
 
 from django import forms
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.utils.functional import cached_property
+from django.utils.translation import get_language, pgettext_lazy
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext as _n
-from django.utils.translation import pgettext_lazy
 from i18nfield.utils import I18nJSONEncoder
 
-from pretalx.common.exporter import render_csv
+from pretalx.common.exporter import stream_csv, stream_in_scope
 from pretalx.common.forms.widgets import EnhancedSelectMultiple, SegmentedRadioSelect
 from pretalx.common.text.phrases import phrases
 from pretalx.person.domain.queries.profile import submitters_for_event
@@ -24,12 +26,17 @@
     submissions_for_user,
 )
 from pretalx.submission.models import (
+    Answer,
     QuestionTarget,
     Review,
     Submission,
     SubmissionStates,
 )
 
+# Exports are streamed, and objects are loaded (and their answers looked up)
+# in chunks of this size, so memory use does not grow with the event size.
+EXPORT_CHUNK_SIZE = 500
+
 
 class ExportForm(forms.Form):
     export_format = forms.ChoiceField(
@@ -114,33 +121,73 @@ def get_object_attribute(self, obj, attribute):
             return method(obj)
         return getattr(obj, attribute, None)
 
-    def get_data(self, queryset, fields, questions):
-        data = []
-
-        for obj in queryset:
-            object_data = {}
-            code = getattr(obj, "code", None)
-            if code:
-                object_data["ID"] = code
-            prepare_method = getattr(self, "_prepare_object_data", None)
-            if prepare_method:
-                obj = prepare_method(obj)  # noqa: PLW2901 -- intentional reassignment of loop variable
-            for field in fields:
-                object_data[str(self.fields[field].label)] = self.get_object_attribute(
-                    obj, field
-                )
+    def get_answers(self, questions, objects):
+        """Map ``(question ID, object ID)`` to the answers to ``questions``
+        given for ``objects``, in one query.
+
+        Subclasses that still override ``get_answer`` get their answers
+        from it instead, one call per question and object."""
+        if not questions or not objects:
+            return {}
+        if type(self).get_answer is not ExportForm.get_answer:
+            return {
+                (question.pk, obj.pk): answer
+                for question in questions
+                for obj in objects
+                if (answer := self.get_answer(question, obj))
+            }
+        return self._query_answers(questions, objects)
+
+    def _query_answers(self, questions, objects):
+        field = f"{self.answer_target}_id"
+        answers = (
+            Answer.objects.filter(
+                question__in=questions, **{f"{field}__in": [obj.pk for obj in objects]}
+            )
+            .select_related("question")
+            .prefetch_related("options")
+            .order_by("-pk")
+        )
+        # Ordered by descending ID, so that the oldest answer wins if there
+        # are duplicates.
+        return {
+            (answer.question_id, getattr(answer, field)): answer for answer in answers
+        }
 
-            for question in questions:
-                answer = self.get_answer(question, obj)
-                if answer:
-                    object_data[str(question.question)] = answer.answer_string
-                else:
-                    object_data[str(question.question)] = None
+    def get_answer(self, question, obj):
+        return self._query_answers([question], [obj]).get((question.pk, obj.pk))
 
-            if hasattr(self, "get_additional_data"):
-                object_data.update(**self.get_additional_data(obj))
-            data.append(object_data)
-        return data
+    def get_data(self, queryset, fields, questions):
+        """Yield the export data, one dictionary per object.
+
+        The queryset is iterated in chunks, and answers are looked up once
+        per chunk."""
+        objects = queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        while chunk := list(itertools.islice(objects, EXPORT_CHUNK_SIZE)):
+            answers = self.get_answers(questions, chunk)
+            for obj in chunk:
+                pk = obj.pk
+                object_data = {}
+                code = getattr(obj, "code", None)
+                if code:
+                    object_data["ID"] = code
+                prepare_method = getattr(self, "_prepare_object_data", None)
+                if prepare_method:
+                    obj = prepare_method(obj)  # noqa: PLW2901 -- intentional reassignment of loop variable
+                for field in fields:
+                    object_data[str(self.fields[field].label)] = (
+                        self.get_object_attribute(obj, field)
+                    )
+
+                for question in questions:
+                    answer = answers.get((question.pk, pk))
+                    object_data[str(question.question)] = (
+                        answer.answer_string if answer else None
+                    )
+
+                if hasattr(self, "get_additional_data"):
+                    object_data.update(**self.get_additional_data(obj))
+                yield object_data
 
     def export_data(self):
         fields = [
@@ -154,40 +201,54 @@ def export_data(self):
             if self.cleaned_data.get(f"question_{question.pk}")
         ]
         data = self.get_data(self.get_queryset(), fields, questions)
-        if not data:
+        first_row = next(data, None)
+        if first_row is None:
             return
+        data = itertools.chain([first_row], data)
         if self.cleaned_data.get("export_format") == "csv":
-            return self.csv_export(data)
+            return self.csv_export(data, fieldnames=list(first_row))
         return self.json_export(data)
 
-    def csv_export(self, data):
-        delimiters = {"newline": "\n", "comma": ", "}
-        delimiter = delimiters[self.cleaned_data.get("data_delimiter") or "newline"]
-
-        for row in data:
-            for key, value in row.items():
-                if isinstance(value, list):
-                    row[key] = delimiter.join(value)
-
-        content = render_csv(fieldnames=data[0].keys(), rows=data)
-        return HttpResponse(
-            content,
-            content_type="text/plain; charset=utf-8",
+    def _stream_response(self, content, content_type, extension):
+        return StreamingHttpResponse(
+            stream_in_scope(self.event, get_language(), content),
+            content_type=content_type,
             headers={
-                "Content-Disposition": f'attachment; filename="{self.filename}.csv"',
+                "Content-Disposition": f'attachment; filename="{self.filename}.{extension}"',
                 "Access-Control-Allow-Origin": "*",
             },
         )
 
+    def csv_export(self, data, fieldnames):
+        delimiters = {"newline": "\n", "comma": ", "}
+        delimiter = delimiters[self.cleaned_data.get("data_delimiter") or "newline"]
+        rows = (
+            {
+                key: delimiter.join(value) if isinstance(value, list) else value
+                for key, value in row.items()
+            }
+            for row in data
+        )
+        return self._stream_response(
+            stream_csv(fieldnames=fieldnames, rows=rows),
+            "text/plain; charset=utf-8",
+            "csv",
+        )
+
+    def _stream_json(self, data):
+        # Renders the same document as json.dumps(list(data), indent=2),
+        # one array element at a time.
+        yield "["
+        separator = "\n"
+        for row in data:
+            element = json.dumps(row, cls=I18nJSONEncoder, indent=2)
+            yield separator + textwrap.indent(element, "  ")
+            separator = ",\n"
+        yield "\n]"
+
     def json_export(self, data):
-        content = json.dumps(data, cls=I18nJSONEncoder, indent=2)
-        return HttpResponse(
-            content,
-            content_type="application/json; charset=utf-8",
-            headers={
-                "Content-Disposition": f'attachment; filename="{self.filename}.json"',
-                "Access-Control-Allow-Origin": "*",
-            },
+        return self._stream_response(
+            self._stream_json(data), "application/json; charset=utf-8", "json"
         )
 
     class Media:
@@ -195,6 +256,7 @@ class Media:
 
 
 class ReviewExportForm(ExportForm):
+    answer_target = "review"
     data_delimiter = None
     target = forms.ChoiceField(
         required=True,
@@ -277,7 +339,14 @@ def _build_score_fields(self):
 
     def get_additional_data(self, obj):
         return {
-            str(sc.name): getattr(obj.scores.filter(category=sc).first(), "value", None)
+            str(sc.name): next(
+                (
+                    score.value
+                    for score in obj.scores.all()
+                    if score.category_id == sc.pk
+                ),
+                None,
+            )
             for sc in self.score_categories
         }
 
@@ -289,9 +358,7 @@ def get_queryset(self):
                 submission__in=self.event.submissions.filter(state=target)
             ).distinct()
         queryset = queryset.exclude(submission__speakers__user=self.user).distinct()
-        return queryset.select_related("submission", "user").prefetch_related(
-            "answers", "answers__question", "scores", "scores__category"
-        )
+        return queryset.select_related("submission", "user").prefetch_related("scores")
 
     def _get_submission_id_value(self, obj):
         return obj.submission.code
@@ -305,11 +372,9 @@ def _get_user_name_value(self, obj):
     def _get_user_email_value(self, obj):
         return obj.user.email
 
-    def get_answer(self, question, obj):
-        return question.answers.filter(review=obj).first()
-
 
 class ScheduleExportForm(ExportForm):
+    answer_target = "submission"
     target = forms.MultipleChoiceField(
         required=True,
         label=_("Target group"),
@@ -431,9 +496,7 @@ def questions(self):
         return (
             questions_for_user(self.event, self.user)
             .filter(target=QuestionTarget.SUBMISSION)
-            .prefetch_related(
-                "answers", "answers__submission", "options", "answers__options"
-            )
+            .prefetch_related("options")
         )
 
     @cached_property
@@ -479,9 +542,6 @@ def get_queryset(self):
             )
         return queryset
 
-    def get_answer(self, question, obj):
-        return question.answers.filter(submission=obj).first()
-
     def _get_speaker_ids_value(self, obj):
         return list(obj.sorted_speakers.values_list("code", flat=True))
 
@@ -553,6 +613,7 @@ def _get_attendee_signup_count_value(self, obj):
 
 
 class SpeakerExportForm(ExportForm):
+    answer_target = "speaker"
     target = forms.ChoiceField(
         required=True,
         label=_("Target group"),
@@ -589,7 +650,7 @@ def __init__(self, *args, **kwargs):
     def questions(self):
         return self.event.questions.filter(
             target="speaker", active=True
-        ).prefetch_related("answers", "answers__speaker", "options")
+        ).prefetch_related("options")
 
     @cached_property
     def filename(self):
@@ -630,6 +691,3 @@ def _get_submission_ids_value(self, obj):
 
     def _get_submission_titles_value(self, obj):
         return list(obj.submissions.values_list("title", flat=True))
-
-    def get_answer(self, question, obj):
-        return question.answers.filter(speaker=obj).first()
@@ -670,6 +670,16 @@
                     schedule.TalkList.as_view(),
                     name="schedule.api.talks",
                 ),
+                path(
+                    "schedule/api/talks/bulk/",
+                    schedule.TalkBulkUpdate.as_view(),
+                    name="schedule.api.bulk_update",
+                ),
+                path(
+                    "schedule/api/talks/feed/",
+                    schedule.TalkFeed.as_view(),
+                    name="schedule.api.feed",
+                ),
                 path(
                     "schedule/api/availabilities/",
                     schedule.ScheduleAvailabilities.as_view(),
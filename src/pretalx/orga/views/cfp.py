@@ -55,6 +55,7 @@
     TrackTable,
 )
 from pretalx.person.interfaces.forms import SpeakerProfileForm
+from pretalx.schedule.domain.artifacts import invalidate_export_data
 from pretalx.submission.domain.access_code import (
     can_delete_access_code,
     send_access_code,
@@ -710,6 +711,9 @@ def form_valid(self, form):
         notify_signup_pinned_submissions(self.request, form)
         return result
 
+    def order_changed(self):
+        invalidate_export_data(self.request.event.pk)
+
     def get_generic_title(self, instance=None):
         if instance:
             return (
@@ -12,6 +12,7 @@
 from django_context_decorator import context
 
 from pretalx.common.language import language
+from pretalx.common.models.log import buffered_activity_logs
 from pretalx.common.text.phrases import phrases
 from pretalx.common.ui import Button, delete_link, send_button
 from pretalx.common.views.generic import (
@@ -269,9 +270,12 @@ def post(self, request, *args, **kwargs):
                 ),
             )
             return redirect(self.request.event.orga_urls.outbox)
-        for mail in mails:
-            mail.log_action("pretalx.mail.delete", person=self.request.user, orga=True)
-            mail.delete()
+        with buffered_activity_logs():
+            for mail in mails:
+                mail.log_action(
+                    "pretalx.mail.delete", person=self.request.user, orga=True
+                )
+                mail.delete()
 
         messages.success(
             request,
@@ -16,6 +16,7 @@
 from django_context_decorator import context
 
 from pretalx.common.forms.renderers import InlineFormRenderer
+from pretalx.common.models.log import buffered_activity_logs
 from pretalx.common.text.phrases import phrases
 from pretalx.common.ui import Button, api_buttons
 from pretalx.common.views.generic import CreateOrUpdateView, OrgaTableMixin
@@ -239,6 +240,7 @@ def get_pending(self, request):
         return form.cleaned_data.get("pending")
 
     @transaction.atomic
+    @buffered_activity_logs()
     def post(self, request, *args, **kwargs):
         total = {"accept": 0, "reject": 0, "error": 0}
         pending = self.get_pending(request)
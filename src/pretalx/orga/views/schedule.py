@@ -13,7 +13,7 @@
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.models.deletion import ProtectedError
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.utils.decorators import method_decorator
 from django.utils.functional import cached_property
@@ -36,6 +36,7 @@
 from pretalx.common.views.mixins import (
     ActionConfirmMixin,
     AsyncFileDownloadMixin,
+    AsyncTaskProgressMixin,
     EventPermissionRequired,
     OrderActionMixin,
     PermissionRequired,
@@ -49,11 +50,11 @@
 from pretalx.mail.enums import MailTemplateRoles
 from pretalx.orga.forms.export import ScheduleExportForm
 from pretalx.orga.tables.schedule import RoomTable
+from pretalx.schedule.domain.artifacts import invalidate_export_data
 from pretalx.schedule.domain.availability import merged_speaker_availabilities
-from pretalx.schedule.domain.notifications import (
-    count_pending_notifications,
-    generate_notifications,
-)
+from pretalx.schedule.domain.changes import queue_unreleased_schedule_changes_update
+from pretalx.schedule.domain.feed import get_feed_cursor, get_slot_changes
+from pretalx.schedule.domain.notifications import count_pending_notifications
 from pretalx.schedule.domain.release import freeze_schedule
 from pretalx.schedule.domain.room import (
     ROOM_IN_USE_ERROR,
@@ -62,9 +63,17 @@
     hide_room,
     unhide_room,
 )
-from pretalx.schedule.domain.slot import create_slot, move_slot, unschedule_slot
+from pretalx.schedule.domain.slot import (
+    SlotMove,
+    create_slot,
+    delete_slot,
+    move_slot,
+    move_slots,
+    unschedule_slot,
+)
 from pretalx.schedule.domain.warnings import (
     get_all_talk_warnings,
+    get_overlap_maps,
     get_talk_warnings,
     overbooked_slots_for_room,
 )
@@ -75,7 +84,7 @@
 )
 from pretalx.schedule.interfaces.widget import build_widget_data
 from pretalx.schedule.models import Room
-from pretalx.schedule.tasks import task_update_unreleased_schedule_changes
+from pretalx.schedule.tasks import task_generate_notifications
 
 
 @method_decorator(csp_update(settings.VITE_CSP_UPDATE), name="dispatch")
@@ -193,7 +202,29 @@ def get(self, request, event):
         return self.handle_async_download(request)
 
 
-class ScheduleReleaseView(EventPermissionRequired, FormView):
+class NotificationTaskMixin(AsyncTaskProgressMixin):
+    """Generates the speaker notifications of a schedule in the background,
+    as there is one mail with calendar attachments per speaker."""
+
+    def get_task_progress_title(self):
+        return _("Generating emails")
+
+    def get_task_success_url(self, result):
+        return self.request.event.orga_urls.schedule
+
+    def get_task_error_url(self):
+        return self.request.event.orga_urls.schedule
+
+    def get_task_success_message(self, result):
+        return phrases.orga.mails_in_outbox.format(count=result["count"])
+
+    def generate_notifications(self, schedule):
+        return self.dispatch_async_task(
+            self.request, task_generate_notifications, schedule_id=schedule.pk
+        )
+
+
+class ScheduleReleaseView(NotificationTaskMixin, EventPermissionRequired, FormView):
     form_class = ScheduleReleaseForm
     permission_required = "schedule.release_schedule"
     template_name = "orga/schedule/release.html"
@@ -278,17 +309,19 @@ def form_invalid(self, form):
         )
         return super().form_invalid(form)
 
-    @transaction.atomic
     def form_valid(self, form):
-        form.apply_expand_capacity(user=self.request.user)
-        freeze_schedule(
-            self.request.event.wip_schedule,
-            name=form.cleaned_data["version"],
-            user=self.request.user,
-            notify_speakers=form.cleaned_data["notify_speakers"],
-            comment=form.cleaned_data["comment"],
-        )
+        with transaction.atomic():
+            form.apply_expand_capacity(user=self.request.user)
+            schedule, _wip_schedule = freeze_schedule(
+                self.request.event.wip_schedule,
+                name=form.cleaned_data["version"],
+                user=self.request.user,
+                notify_speakers=False,
+                comment=form.cleaned_data["comment"],
+            )
         messages.success(self.request, _("Nice, your schedule has been released!"))
+        if form.cleaned_data["notify_speakers"]:
+            return self.generate_notifications(schedule)
         return redirect(self.request.event.orga_urls.schedule)
 
 
@@ -303,22 +336,22 @@ def post(self, request, event):
         return redirect(self.request.event.orga_urls.schedule)
 
 
-class ScheduleResendMailsView(EventPermissionRequired, View):
+class ScheduleResendMailsView(NotificationTaskMixin, EventPermissionRequired, View):
     permission_required = "schedule.release_schedule"
 
+    def get(self, request, *args, **kwargs):
+        # Only the progress page of the background task can be fetched.
+        if "async_id" not in request.GET:
+            return self.http_method_not_allowed(request, *args, **kwargs)
+        return super().get(request, *args, **kwargs)
+
     def post(self, request, event):
         if self.request.event.current_schedule:
-            mails = generate_notifications(self.request.event.current_schedule)
-            messages.success(
-                self.request, phrases.orga.mails_in_outbox.format(count=len(mails))
-            )
-        else:
-            messages.warning(
-                self.request,
-                _(
-                    "You can only regenerate emails after the first schedule was released."
-                ),
-            )
+            return self.generate_notifications(self.request.event.current_schedule)
+        messages.warning(
+            self.request,
+            _("You can only regenerate emails after the first schedule was released."),
+        )
         return redirect(self.request.event.orga_urls.schedule)
 
 
@@ -373,16 +406,24 @@ def serialize_slot(slot, warnings=None):
     return base_data
 
 
+def get_requested_schedule(request):
+    """The schedule version named in the ``version`` parameter, or the WIP
+    schedule."""
+    if version := request.GET.get("version"):
+        schedule = request.event.schedules.filter(version=version).first()
+        if schedule:
+            return schedule
+    return request.event.wip_schedule
+
+
 class TalkList(EventPermissionRequired, View):
     permission_required = "schedule.release_schedule"
 
     def get(self, request, event):
-        version = self.request.GET.get("version")
-        schedule = None
-        if version:
-            schedule = request.event.schedules.filter(version=version).first()
-        if not schedule:
-            schedule = request.event.wip_schedule
+        schedule = get_requested_schedule(request)
+        # Read before the slots, so that clients following the change feed
+        # from this cursor see every change made after the slots were loaded.
+        cursor = get_feed_cursor(schedule)
 
         filter_updated = request.GET.get("since")
         result = build_widget_data(
@@ -401,6 +442,7 @@ def get(self, request, event):
                 ).items()
             }
         result["now"] = now().strftime("%Y-%m-%d %H:%M:%S%z")
+        result["cursor"] = cursor
         result["locales"] = request.event.locales
         return JsonResponse(result, encoder=I18nJSONEncoder)
 
@@ -428,9 +470,7 @@ def post(self, request, event):
             duration=duration,
             description=LazyI18nString(data.get("title")),
         )
-        task_update_unreleased_schedule_changes.apply_async(
-            kwargs={"event": request.event.slug}
-        )
+        queue_unreleased_schedule_changes_update(request.event)
         return JsonResponse(serialize_break(slot))
 
 
@@ -504,10 +544,17 @@ def patch(self, request, event, pk):
             unschedule_slot(talk)
 
         with_speakers = self.request.event.cfp.request_availabilities
-        warnings = get_talk_warnings(talk.schedule, talk, with_speakers=with_speakers)
-        task_update_unreleased_schedule_changes.apply_async(
-            kwargs={"event": request.event.slug}
+        room_overlap_ids, speaker_overlaps_by_talk = get_overlap_maps(
+            talk.schedule, subset_pks={talk.pk}
         )
+        warnings = get_talk_warnings(
+            talk.schedule,
+            talk,
+            with_speakers=with_speakers,
+            room_overlap_ids=room_overlap_ids,
+            speaker_overlaps_by_talk=speaker_overlaps_by_talk,
+        )
+        queue_unreleased_schedule_changes_update(request.event)
 
         return JsonResponse(serialize_slot(talk, warnings=warnings))
 
@@ -515,13 +562,137 @@ def delete(self, request, event, pk):
         talk = self.get_object()
         if talk.submission:
             return JsonResponse({"error": "Cannot delete talk."})
-        talk.delete()
-        task_update_unreleased_schedule_changes.apply_async(
-            kwargs={"event": request.event.slug}
-        )
+        delete_slot(talk)
+        queue_unreleased_schedule_changes_update(request.event)
         return JsonResponse({"success": True})
 
 
+class TalkBulkUpdate(PermissionRequired, View):
+    """Move or unschedule many slots of the WIP schedule in one request.
+
+    Takes ``{"talks": [...]}``, where each entry has the ``id`` of a slot
+    and the same fields as a ``TalkUpdate`` patch. Either all changes are
+    applied or, if any entry is invalid, none.
+    """
+
+    permission_required = "schedule.update_talkslot"
+
+    def get_permission_object(self):
+        return self.request.event.wip_schedule
+
+    @staticmethod
+    def parse_id(value):
+        # JSON clients may send ids as strings, but never as booleans or floats.
+        if isinstance(value, bool) or not isinstance(value, int | str):
+            raise TypeError("Invalid ID.")
+        return int(value)
+
+    def get_moves(self, entries):
+        if not isinstance(entries, list) or not all(
+            isinstance(entry, dict) for entry in entries
+        ):
+            raise ValueError("Invalid talk list.")
+        entries = [
+            {
+                **entry,
+                "id": self.parse_id(entry.get("id")),
+                "room": self.parse_id(entry["room"]) if entry.get("room") else None,
+            }
+            for entry in entries
+        ]
+        schedule = self.request.event.wip_schedule
+        slots = schedule.talks.select_related(
+            "submission", "submission__submission_type", "room"
+        ).in_bulk([entry["id"] for entry in entries])
+        if len(slots) != len({entry["id"] for entry in entries}):
+            raise ValueError("Talk not found.")
+        room_ids = {entry["room"] or slots[entry["id"]].room_id for entry in entries}
+        rooms = self.request.event.rooms.visible().in_bulk(room_ids - {None})
+        moves = []
+        for entry in entries:
+            slot = slots[entry["id"]]
+            if not entry.get("start"):
+                moves.append(SlotMove(slot))
+                continue
+            room = rooms.get(entry["room"] or slot.room_id)
+            if not room:
+                raise ValueError("Room unavailable.")
+            moves.append(
+                SlotMove(
+                    slot,
+                    start=dt.datetime.fromisoformat(entry["start"]),
+                    room=room,
+                    end=(
+                        dt.datetime.fromisoformat(entry["end"])
+                        if entry.get("end")
+                        else None
+                    ),
+                    duration=int(entry["duration"]) if entry.get("duration") else None,
+                    description=LazyI18nString(entry.get("title", "")),
+                )
+            )
+        return moves
+
+    def post(self, request, event):
+        schedule = request.event.wip_schedule
+        try:
+            data = json.loads(request.body.decode())
+            moves = self.get_moves(data.get("talks"))
+        except (AttributeError, TypeError, ValueError) as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        with transaction.atomic():
+            move_slots(schedule, moves)
+        pks = [move.slot.pk for move in moves]
+        warnings = {
+            talk.pk: talk_warnings
+            for talk, talk_warnings in get_all_talk_warnings(schedule, ids=pks).items()
+        }
+        talks = (
+            schedule.talks.filter(pk__in=pks)
+            .select_related(
+                "submission",
+                "submission__submission_type",
+                "submission__track",
+                "submission__event",
+                "room",
+            )
+            .with_sorted_speakers()
+        )
+        queue_unreleased_schedule_changes_update(request.event)
+        return JsonResponse(
+            {
+                "results": [
+                    serialize_slot(talk, warnings=warnings.get(talk.pk))
+                    for talk in talks
+                ]
+            },
+            encoder=I18nJSONEncoder,
+        )
+
+
+class TalkFeed(EventPermissionRequired, View):
+    """Return the IDs of the slots that were changed or deleted after the
+    ``cursor`` returned by ``TalkList`` or by an earlier request, for the
+    same schedule version.
+
+    Editors poll this view, so it only reads the feed counter from the cache
+    and responds without content while nothing changed. Clients load the
+    changed slots with a ``since`` request."""
+
+    permission_required = "schedule.release_schedule"
+
+    def get(self, request, event):
+        schedule = get_requested_schedule(request)
+        try:
+            cursor = int(request.GET.get("cursor"))
+        except (TypeError, ValueError):
+            return JsonResponse({"error": "Invalid cursor."}, status=400)
+        cursor, changes = get_slot_changes(schedule, cursor)
+        if not changes:
+            return HttpResponse(status=204)
+        return JsonResponse({"cursor": cursor, **changes})
+
+
 class QuickScheduleView(PermissionRequired, UpdateView):
     permission_required = "schedule.update_talkslot"
     form_class = QuickScheduleForm
@@ -540,9 +711,7 @@ def get_object(self):
     def form_valid(self, form):
         form.save()
         messages.success(self.request, _("The session has been scheduled."))
-        task_update_unreleased_schedule_changes.apply_async(
-            kwargs={"event": self.request.event.slug}
-        )
+        queue_unreleased_schedule_changes_update(self.request.event)
         return super().form_valid(form)
 
     def get_success_url(self):
@@ -566,6 +735,9 @@ def get_permission_required(self):
         permission = permission_map.get(self.action, self.action)
         return self.model.get_perm(permission)
 
+    def order_changed(self):
+        invalidate_export_data(self.request.event.pk)
+
     def get_generic_title(self, instance=None):
         if instance:
             return (
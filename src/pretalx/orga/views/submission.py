@@ -28,6 +28,7 @@
 from pretalx.common.forms.fields import SizeFileInput
 from pretalx.common.log import group_activity_log
 from pretalx.common.models import ActivityLog
+from pretalx.common.models.log import buffered_activity_logs
 from pretalx.common.text.phrases import phrases
 from pretalx.common.text.serialize import json_roundtrip
 from pretalx.common.ui import Button, back_button, delete_link
@@ -117,14 +118,12 @@ def _get_submission_queryset(self):
             .select_related(
                 "event__cfp", "event__organiser", "track", "submission_type"
             )
-            .prefetch_related(
-                "speakers", "tags", "slots", "answers", "answers__question"
-            )
+            .prefetch_related("speakers", "tags", "answers", "answers__question")
         )
 
     def _get_lightweight_submission_queryset(self):
         """select_related only, no prefetches. Use this in sub-views that
-        don't render speakers, tags, slots or answers (FeedbackList,
+        don't render speakers, tags or answers (FeedbackList,
         CommentList) – the full queryset is the default because
         SubmissionContent needs all those relations for the main edit form."""
         return self._annotate_for_signup(
@@ -1337,11 +1336,12 @@ def submission_count(self):
 
     def post(self, request, *args, **kwargs):
         errors = []
-        for submission in self.submissions:
-            try:
-                apply_pending_state(submission, person=self.request.user)
-            except SubmissionError as e:
-                errors.append(f"{submission.title}: {e}")
+        with buffered_activity_logs():
+            for submission in self.submissions:
+                try:
+                    apply_pending_state(submission, person=self.request.user)
+                except SubmissionError as e:
+                    errors.append(f"{submission.title}: {e}")
         if errors:
             for error in errors:
                 messages.error(self.request, error)
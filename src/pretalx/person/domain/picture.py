@@ -1,8 +1,18 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+from urllib.parse import urljoin
+
+from django.conf import settings
+
+from pretalx.common.image import queue_thumbnail_regenerations
 from pretalx.person.models import ProfilePicture, User
 
+AVATAR_THUMBNAIL_FIELDS = {
+    "default": "avatar_thumbnail",
+    "tiny": "avatar_thumbnail_tiny",
+}
+
 
 def assign_avatar(instance, user, new_picture):
     """Assign ``new_picture`` to ``instance.profile_picture`` (``None`` clears).
@@ -30,3 +40,34 @@ def set_avatar(instance, file):
     new_picture.process_image("avatar", generate_thumbnail=True)
     assign_avatar(instance, user, new_picture)
     return new_picture
+
+
+def get_avatar_urls(pictures, *, event=None):
+    """Map picture IDs to their absolute avatar URLs by thumbnail size, with
+    ``None`` as the size of the original image.
+
+    Gives the same URLs as ``ProfilePicture.get_avatar_url``, built from the
+    stored file names only. Pictures with missing thumbnails fall back to the
+    original image, and are queued for regeneration in a single batch.
+    """
+    base_url = (
+        event.custom_domain if event and event.custom_domain else settings.SITE_URL
+    )
+    urls = {}
+    missing_thumbnails = []
+    for picture in pictures:
+        if not picture.avatar_url:
+            continue
+        avatar_url = urljoin(base_url, picture.avatar_url)
+        urls[picture.pk] = {None: avatar_url}
+        for size, field in AVATAR_THUMBNAIL_FIELDS.items():
+            thumbnail = getattr(picture, field)
+            urls[picture.pk][size] = (
+                urljoin(base_url, thumbnail.url) if thumbnail else avatar_url
+            )
+        if not all(
+            getattr(picture, field) for field in AVATAR_THUMBNAIL_FIELDS.values()
+        ):
+            missing_thumbnails.append(picture.avatar)
+    queue_thumbnail_regenerations(missing_thumbnails)
+    return urls
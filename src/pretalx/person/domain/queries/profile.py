@@ -47,7 +47,7 @@ def visible_talk_slots(speaker, schedule=None):
     if not schedule:
         return TalkSlot.objects.none()
     queryset = (
-        schedule.talks.filter(submission__speakers=speaker, is_visible=True)
+        schedule.version_talks.filter(submission__speakers=speaker, is_visible=True)
         .select_related(
             "submission",
             "room",
@@ -22,6 +22,7 @@
 from pretalx.person.enums import EmailVerificationState
 from pretalx.person.models import User
 from pretalx.person.signals import delete_user as delete_user_signal
+from pretalx.schedule.domain.artifacts import invalidate_export_data
 from pretalx.submission.models import Answer, Submission
 
 
@@ -68,6 +69,8 @@ def deactivate_user(user):
     user.profile_picture = None
     user.save()
     user.profiles.update(biography="")
+    for event_id in user.profiles.values_list("event_id", flat=True):
+        invalidate_export_data(event_id)
     for answer in Answer.objects.filter(
         models.Q(speaker__user=user) | models.Q(submission__speakers__user=user),
         question__contains_personal_data=True,
@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+from django.db import migrations
+
+from pretalx.common.db import TrigramIndex
+
+
+class Migration(migrations.Migration):
+    # The indexes are built concurrently, which needs autocommit.
+    atomic = False
+
+    dependencies = [("person", "0048_user_verification_state_legacy_backfill")]
+
+    operations = [
+        TrigramIndex("person_user", ("name", "email")).operation(),
+        TrigramIndex("person_speakerprofile", ("name",)).operation(),
+    ]
@@ -3,15 +3,17 @@
 
 import datetime as dt
 
+from django.db.models.signals import post_delete
 from django.dispatch import receiver
 from django.utils.timezone import now
 
+from pretalx.common.models.deletion import record_deletion
 from pretalx.common.signals import (
     minimum_interval,
     periodic_task,
     register_data_exporters,
 )
-from pretalx.person.models import ProfilePicture, UserApiToken
+from pretalx.person.models import ProfilePicture, SpeakerProfile, UserApiToken
 
 
 @receiver(register_data_exporters, dispatch_uid="exporter_builtin_csv_speaker")
@@ -39,3 +41,8 @@ def clean_orphaned_profile_pictures(sender, **kwargs):
     for picture in pictures:
         # Object-level delete to trigger file cleanup
         picture.delete()
+
+
+@receiver(post_delete, sender=SpeakerProfile, dispatch_uid="deleted_object_speaker")
+def record_speaker_deletion(sender, instance, **kwargs):
+    record_deletion(instance, event_id=instance.event_id)
@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+import gzip
+import hashlib
+import logging
+import time
+import zlib
+
+import brotli
+from django.core.cache import cache
+from django.utils.translation import override
+
+from pretalx.common.signals import register_data_exporters
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_TIMEOUT = 7 * 24 * 60 * 60
+ARTIFACT_ENCODINGS = ("br", "gzip")
+# The best brotli compression is too slow for requests, so artifacts that
+# are rendered on demand are compressed faster, and only the artifacts built
+# in the background on release get the smallest size.
+ARTIFACT_BROTLI_QUALITY = 5
+ARTIFACT_BUILD_BROTLI_QUALITY = 11
+
+
+def _export_data_counter_key(event_pk):
+    return f"event_{event_pk}_export_data_counter"
+
+
+def _get_export_data_counter(event_pk):
+    key = _export_data_counter_key(event_pk)
+    counter = cache.get(key)
+    if counter is None:
+        counter = time.time_ns()
+        cache.set(key, counter, ARTIFACT_TIMEOUT)
+    return counter
+
+
+def invalidate_export_data(event_pk):
+    """Change the export data version of all schedules of an event. Called
+    whenever data shown in the schedule exports changes, mostly from the
+    receivers in ``pretalx.schedule.receivers``."""
+    key = _export_data_counter_key(event_pk)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), ARTIFACT_TIMEOUT)
+
+
+def get_export_data_version(schedule) -> str:
+    """A version that changes whenever data shown in the exports of
+    ``schedule`` changes, even without a new schedule release, e.g. when a
+    talk title or a speaker biography is edited, or a room is deleted.
+
+    This is a counter in the cache that ``invalidate_export_data`` bumps,
+    so export requests do not have to look at the event data at all.
+    """
+    return str(_get_export_data_counter(schedule.event_id))
+
+
+def _artifact_key(schedule, identifier, locale):
+    return f"export_artifact_{schedule.pk}_{identifier}_{locale}"
+
+
+def _compress_chunks(chunks, brotli_quality):
+    """Compress ``chunks`` of text as they come in, so that the whole
+    document is never held in memory uncompressed. Returns the ETag and the
+    brotli and gzip variants."""
+    etag = hashlib.sha1()  # noqa: S324 -- used for etag, not vulnerable to collision attacks
+    br = brotli.Compressor(quality=brotli_quality)
+    gz = zlib.compressobj(level=9, wbits=31)  # 31 writes a gzip container
+    br_parts = []
+    gz_parts = []
+    for chunk in chunks:
+        content = chunk.encode() if isinstance(chunk, str) else chunk
+        etag.update(str(chunk).encode())
+        br_parts.append(br.process(content))
+        gz_parts.append(gz.compress(content))
+    br_parts.append(br.finish())
+    gz_parts.append(gz.flush())
+    return etag.hexdigest(), b"".join(br_parts), b"".join(gz_parts)
+
+
+def render_export_artifact(
+    exporter, data_version, *, brotli_quality=ARTIFACT_BROTLI_QUALITY
+) -> dict:
+    """Render ``exporter`` once, and keep the result alongside its ETag as
+    pre-compressed variants.
+
+    The uncompressed content is not kept, as nearly all clients accept one
+    of the compressed variants, see ``get_artifact_encoding``."""
+    if exporter.streaming:
+        file_name, content_type = exporter.filename, exporter.content_type
+        chunks = exporter.stream_data(request=None)
+    else:
+        file_name, content_type, data = exporter.render(request=None)
+        chunks = [data]
+    etag, br, gz = _compress_chunks(chunks, brotli_quality)
+    return {
+        "data_version": data_version,
+        "file_name": file_name,
+        "content_type": content_type,
+        "etag": etag,
+        "br": br,
+        "gzip": gz,
+    }
+
+
+def get_export_artifact(
+    exporter, locale, data_version=None, *, brotli_quality=ARTIFACT_BROTLI_QUALITY
+) -> dict:
+    """Return the stored artifact for ``exporter`` in ``locale``, rendering
+    and storing it if it is missing or the event data changed since."""
+    schedule = exporter.schedule
+    data_version = data_version or get_export_data_version(schedule)
+    key = _artifact_key(schedule, exporter.identifier, locale)
+    artifact = schedule.event.cache.get(key)
+    if not artifact or artifact["data_version"] != data_version:
+        artifact = render_export_artifact(
+            exporter, data_version, brotli_quality=brotli_quality
+        )
+        schedule.event.cache.set(key, artifact, ARTIFACT_TIMEOUT)
+    return artifact
+
+
+def _parse_quality(params):
+    for param in params:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0
+    return 1
+
+
+def get_artifact_encoding(accept_encoding=""):
+    """Pick the best stored variant for the given ``Accept-Encoding`` header,
+    by the client's quality values first and our preference second.
+    Returns its encoding, or None for uncompressed content."""
+    qualities = {}
+    for value in (accept_encoding or "").split(","):
+        encoding, *params = value.split(";")
+        qualities[encoding.strip().lower()] = _parse_quality(params)
+    accepted = [
+        encoding for encoding in ARTIFACT_ENCODINGS if qualities.get(encoding, 0) > 0
+    ]
+    if not accepted:
+        return None
+    return max(accepted, key=lambda encoding: qualities[encoding])
+
+
+def get_artifact_etag(artifact, encoding):
+    """Every encoding is a representation of its own, and needs its own
+    ETag, so that caches never answer with the wrong encoding."""
+    return f"{artifact['etag']}-{encoding}" if encoding else artifact["etag"]
+
+
+def get_artifact_content(artifact, encoding):
+    """Return the stored variant in ``encoding``. Uncompressed content is
+    decompressed from the gzip variant."""
+    if encoding:
+        return artifact[encoding]
+    return gzip.decompress(artifact["gzip"])
+
+
+def build_export_artifacts(schedule) -> list:
+    """Render the artifacts of all cacheable exporters of a released
+    ``schedule`` in all event languages, so that the first requests after
+    a release do not have to. Returns the list of (identifier, locale)
+    pairs that were built."""
+    if not schedule.version:
+        return []
+    event = schedule.event
+    data_version = get_export_data_version(schedule)
+    built = []
+    for _, exporter_class in register_data_exporters.send_robust(event):
+        if isinstance(exporter_class, Exception):
+            continue
+        for locale in event.locales:
+            # Exporters cache their data, which includes localised strings,
+            # so every language needs its own exporter instance.
+            exporter = exporter_class(schedule)
+            if not exporter.cacheable or not exporter.is_available:
+                break
+            try:
+                with override(locale):
+                    get_export_artifact(
+                        exporter,
+                        locale,
+                        data_version=data_version,
+                        brotli_quality=ARTIFACT_BUILD_BROTLI_QUALITY,
+                    )
+            except Exception:
+                logger.exception(
+                    "Failed to build %s for %s", exporter.identifier, event.slug
+                )
+                break
+            built.append((exporter.identifier, locale))
+    return built
@@ -34,7 +34,7 @@ def merged_speaker_availabilities(schedule):
 
     result = {}
     talks = (
-        schedule.talks.filter(submission__isnull=False)
+        schedule.version_talks.filter(submission__isnull=False)
         .select_related("submission")
         .with_sorted_speakers()
     )
@@ -1,8 +1,12 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+import copy
 from collections import defaultdict
 
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
+
 from pretalx.schedule.domain.queries.schedule import published_schedules
 from pretalx.schedule.models import Room, TalkSlot
 from pretalx.submission.models import Submission
@@ -23,13 +27,25 @@ def build_changelog(event, limit=None):
             schedules[i + 1] if i + 1 < len(schedules) else None
         )
 
+    # Unchanged slots are shared between versions, see slot_in_schedule_q.
+    published = [s.published for s in schedules]
     slots = list(
         TalkSlot.objects.filter(
-            schedule_id__in=[s.pk for s in schedules],
+            Q(schedule__in=schedules)
+            | Q(
+                schedule__event=event,
+                first_schedule__published__lte=max(published),
+                schedule__published__gt=min(published),
+            ),
             room__isnull=False,
             start__isnull=False,
             is_visible=True,
             submission__isnull=False,
+        ).annotate(
+            first_published=Coalesce(
+                "first_schedule__published", "schedule__published"
+            ),
+            last_published=F("schedule__published"),
         )
     )
 
@@ -48,14 +64,16 @@ def build_changelog(event, limit=None):
     }
     for submission in submissions.values():
         submission.event = event
-    schedules_by_id = {schedule.pk: schedule for schedule in schedules}
 
     slots_by_schedule = defaultdict(list)
     for slot in slots:
         slot.room = rooms[slot.room_id]
         slot.submission = submissions[slot.submission_id]
-        slot.schedule = schedules_by_id[slot.schedule_id]
-        slots_by_schedule[slot.schedule_id].append(slot)
+        for schedule in schedules:
+            if slot.first_published <= schedule.published <= slot.last_published:
+                schedule_slot = copy.copy(slot)
+                schedule_slot.schedule = schedule
+                slots_by_schedule[schedule.pk].append(schedule_slot)
     for schedule in schedules:
         schedule.__dict__["scheduled_talks"] = slots_by_schedule.get(schedule.pk, [])
 
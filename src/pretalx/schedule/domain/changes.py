@@ -2,14 +2,16 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
 import json
+import time
 from collections import defaultdict
 from contextlib import suppress
-from typing import NamedTuple
 
+from django.core.cache import cache
 from django.utils.dateparse import parse_datetime
 from django_scopes import scope
 
 from pretalx.schedule.models import Room, TalkSlot
+from pretalx.schedule.tasks import task_update_unreleased_schedule_changes
 from pretalx.submission.models import Submission
 
 
@@ -137,6 +139,8 @@ def _deserialize_changes(serialized: dict, event) -> dict:
         new_slot = slots_by_id.get(item["new_slot_id"]) if item["new_slot_id"] else None
 
         if submission:
+            if new_slot:
+                new_slot.submission = submission
             old_room = None
             new_room = None
             if item.get("new_room"):
@@ -163,7 +167,21 @@ def _deserialize_changes(serialized: dict, event) -> dict:
     return changes
 
 
+def _group_slots_by_submission(slots) -> dict:
+    """Index slots by submission, and each submission's slots by room and
+    start. Slots sharing submission, room and start count only once."""
+    grouped = defaultdict(dict)
+    for slot in slots:
+        grouped[slot.submission][(slot.room_id, slot.start)] = slot
+    return grouped
+
+
 def calculate_schedule_changes(schedule) -> dict:
+    """Compare ``schedule`` to its previous schedule.
+
+    Slots are indexed by submission once, so the diff takes linear time
+    in the size of both schedules.
+    """
     result = {
         "count": 0,
         "action": "update",
@@ -176,63 +194,23 @@ def calculate_schedule_changes(schedule) -> dict:
         result["action"] = "create"
         return result
 
-    class Slot(NamedTuple):
-        submission: object
-        room: object
-        local_start: object
-
-    old_slots = {
-        Slot(slot.submission, slot.room, slot.local_start): slot
-        for slot in schedule.previous_schedule.scheduled_talks
-    }
-    new_slots = {
-        Slot(slot.submission, slot.room, slot.local_start): slot
-        for slot in schedule.scheduled_talks
-    }
-
-    old_slot_set = set(old_slots.keys())
-    new_slot_set = set(new_slots.keys())
-    old_submissions = {slot.submission for slot in old_slots}
-    new_submissions = {slot.submission for slot in new_slots}
-    handled_submissions = set()
-    new_by_submission = defaultdict(list)
-    old_by_submission = defaultdict(list)
-
-    for slot in new_slot_set:
-        new_by_submission[slot.submission].append(new_slots[slot])
-    for slot in old_slot_set:
-        old_by_submission[slot.submission].append(old_slots[slot])
-
-    moved_or_missing = old_slot_set - new_slot_set - {None}
-    moved_or_new = new_slot_set - old_slot_set - {None}
-
-    for entry in moved_or_missing:
-        if entry.submission in handled_submissions:
-            continue
-        if entry.submission not in new_submissions:
-            result["canceled_talks"] += old_by_submission[entry.submission]
-        else:
-            new, canceled, moved = _handle_submission_move(
-                entry.submission, old_slots, new_slots
-            )
-            result["new_talks"] += new
-            result["canceled_talks"] += canceled
-            result["moved_talks"] += moved
-        handled_submissions.add(entry.submission)
+    old_by_submission = _group_slots_by_submission(
+        schedule.previous_schedule.scheduled_talks
+    )
+    new_by_submission = _group_slots_by_submission(schedule.scheduled_talks)
 
-    for entry in moved_or_new:
-        if entry.submission in handled_submissions:
+    for submission, old_slots in old_by_submission.items():
+        new_slots = new_by_submission.get(submission)
+        if not new_slots:
+            result["canceled_talks"] += old_slots.values()
             continue
-        if entry.submission not in old_submissions:
-            result["new_talks"] += new_by_submission[entry.submission]
-        else:
-            new, canceled, moved = _handle_submission_move(
-                entry.submission, old_slots, new_slots
-            )
-            result["new_talks"] += new
-            result["canceled_talks"] += canceled
-            result["moved_talks"] += moved
-        handled_submissions.add(entry.submission)
+        new, canceled, moved = _diff_submission_slots(old_slots, new_slots)
+        result["new_talks"] += new
+        result["canceled_talks"] += canceled
+        result["moved_talks"] += moved
+    for submission, new_slots in new_by_submission.items():
+        if submission not in old_by_submission:
+            result["new_talks"] += new_slots.values()
 
     result["count"] = (
         len(result["new_talks"])
@@ -243,23 +221,19 @@ class Slot(NamedTuple):
     return result
 
 
-def _handle_submission_move(submission, old_slots, new_slots):
+def _diff_submission_slots(old_slots, new_slots):
+    """Diff the slots of one submission, as indexed by
+    ``_group_slots_by_submission``. Slots that did not change are skipped,
+    the others are paired up as moves, and any surplus counts as new or
+    canceled."""
     new = []
     canceled = []
     moved = []
-    all_old_slots = [
-        slot for slot in old_slots.values() if slot.submission_id == submission.pk
-    ]
-    all_new_slots = [
-        slot for slot in new_slots.values() if slot.submission_id == submission.pk
-    ]
-    old_sigs = {(slot.room_id, slot.start) for slot in all_old_slots}
-    new_sigs = {(slot.room_id, slot.start) for slot in all_new_slots}
     old_slots_filtered = [
-        slot for slot in all_old_slots if (slot.room_id, slot.start) not in new_sigs
+        slot for key, slot in old_slots.items() if key not in new_slots
     ]
     new_slots_filtered = [
-        slot for slot in all_new_slots if (slot.room_id, slot.start) not in old_sigs
+        slot for key, slot in new_slots.items() if key not in old_slots
     ]
     diff = len(old_slots_filtered) - len(new_slots_filtered)
 
@@ -349,3 +323,60 @@ def update_unreleased_schedule_changes(event, value=None):
         invalidate_cached_schedule_changes(event.wip_schedule)
         value = _get_boolean_changes(event.wip_schedule)
     event.cache.set(cache_key, value, 24 * 60 * 60)
+
+
+# Schedule edits come in bursts, e.g. while organisers drag sessions around
+# in the editor. Instead of recomputing the unreleased changes after every
+# edit, the recomputation waits until the event's schedule has been quiet
+# for the quiet period, but never for longer than the maximum delay after
+# the first edit of a burst.
+SCHEDULE_CHANGES_QUIET_PERIOD = 5
+SCHEDULE_CHANGES_MAX_DELAY = 30
+# Expiry of the coalescing state, so that a lost task does not block
+# later updates for good.
+SCHEDULE_CHANGES_STATE_TIMEOUT = 4 * SCHEDULE_CHANGES_MAX_DELAY
+
+
+def _get_update_keys(event):
+    prefix = f"unreleased_schedule_changes_update_{event.pk}"
+    return f"{prefix}_first", f"{prefix}_last", f"{prefix}_queued"
+
+
+def queue_unreleased_schedule_changes_update(event):
+    """Recompute the unreleased schedule changes once the current burst of
+    schedule edits is over.
+
+    Only the first call of a burst enqueues a task; later calls just
+    extend the quiet period.
+    """
+    first_key, last_key, queued_key = _get_update_keys(event)
+    timestamp = time.time()
+    cache.add(first_key, timestamp, SCHEDULE_CHANGES_STATE_TIMEOUT)
+    cache.set(last_key, timestamp, SCHEDULE_CHANGES_STATE_TIMEOUT)
+    if cache.add(queued_key, True, SCHEDULE_CHANGES_STATE_TIMEOUT):
+        task_update_unreleased_schedule_changes.apply_async(
+            kwargs={"event": event.slug},
+            countdown=SCHEDULE_CHANGES_QUIET_PERIOD,
+            ignore_result=True,
+        )
+
+
+def get_unreleased_schedule_changes_delay(event) -> float:
+    """Seconds until the pending recomputation for ``event`` is due, or 0
+    if it is due now."""
+    first_key, last_key, _ = _get_update_keys(event)
+    first, last = cache.get(first_key), cache.get(last_key)
+    if first is None or last is None:
+        return 0
+    timestamp = time.time()
+    delay = min(
+        last + SCHEDULE_CHANGES_QUIET_PERIOD - timestamp,
+        first + SCHEDULE_CHANGES_MAX_DELAY - timestamp,
+    )
+    return max(delay, 0)
+
+
+def reset_unreleased_schedule_changes_update(event):
+    """Close the current burst of edits. Called right before recomputing,
+    so that edits made during the recomputation start a new burst."""
+    cache.delete_many(_get_update_keys(event))
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+from contextlib import suppress
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+
+# The change feed of a schedule is a log in the cache: a counter, the
+# cursor, and one entry per change, stored under the cursor value it was
+# published with. Readers only poll the counter, so idle schedule editors
+# do not touch the database at all.
+SCHEDULE_FEED_ENTRY_TIMEOUT = 60 * 60
+
+
+def _get_feed_key(schedule_pk):
+    return f"schedule_{schedule_pk}_feed"
+
+
+def get_feed_cursor(schedule) -> int:
+    """The position of the latest change in the feed of ``schedule``."""
+    return cache.get(f"{_get_feed_key(schedule.pk)}_cursor") or 0
+
+
+def _publish_slot_changes(schedule_pk, changed, deleted, reset):
+    key = _get_feed_key(schedule_pk)
+    cache.add(f"{key}_cursor", 0, timeout=None)
+    # Without a cache to count in, there is no feed to publish to.
+    with suppress(ValueError):
+        cursor = cache.incr(f"{key}_cursor")
+        cache.set(
+            f"{key}_{cursor}",
+            {"changed": changed, "deleted": deleted, "reset": reset},
+            SCHEDULE_FEED_ENTRY_TIMEOUT,
+        )
+
+
+def publish_slot_changes(schedule_pk, *, changed=(), deleted=(), reset=False):
+    """Append changed and deleted slot IDs to the change feed of the
+    schedule, once the current transaction is committed.
+
+    ``reset`` tells clients to reload all slots, e.g. because the schedule
+    was released and is no longer the WIP schedule.
+    """
+    transaction.on_commit(
+        partial(_publish_slot_changes, schedule_pk, list(changed), list(deleted), reset)
+    )
+
+
+def get_slot_changes(schedule, cursor):
+    """All changes to ``schedule`` after ``cursor``, merged into one.
+
+    Returns the new cursor and the changes, or ``None`` if there are no
+    new changes. If entries between the cursors are missing, because they
+    expired or are still being written, the changes are marked as
+    ``reset``, and clients have to reload the slots they show.
+    """
+    latest = get_feed_cursor(schedule)
+    if latest == cursor:
+        return cursor, None
+    if latest < cursor:
+        # The feed was lost from the cache and started again.
+        return latest, {"reset": True, "changed": [], "deleted": []}
+    key = _get_feed_key(schedule.pk)
+    keys = [f"{key}_{position}" for position in range(cursor + 1, latest + 1)]
+    entries = cache.get_many(keys)
+    changed, deleted = set(), set()
+    reset = len(entries) < len(keys)
+    for entry in entries.values():
+        changed.update(entry["changed"])
+        deleted.update(entry["deleted"])
+        reset = reset or entry["reset"]
+    return latest, {
+        "reset": reset,
+        "changed": sorted(changed - deleted),
+        "deleted": sorted(deleted),
+    }
@@ -2,10 +2,12 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
 import datetime as dt
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from pretalx.common.text.xml import strip_control_characters
 from pretalx.common.urls import get_netloc
+from pretalx.submission.models import Submission
 
 
 def get_calendar(event, prodid):
@@ -70,26 +72,157 @@ def serialize_calendar(calendar):
     return calendar.to_ical().decode()
 
 
-def get_slots_ical(event, slots, prodid_suffix=None):
+def _escape_text(value):
+    """Escape a TEXT value like icalendar does, see RFC 5545 section 3.3.11."""
+    return (
+        str(value)
+        .replace("\\N", "\n")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold_line(line, limit=75):
+    """Fold a content line to at most 75 octets per line, like icalendar does."""
+    if line.isascii():
+        return "\r\n ".join(
+            line[index : index + limit - 1] for index in range(0, len(line), limit - 1)
+        )
+    result = []
+    byte_count = 0
+    for char in line:
+        char_length = len(char.encode())
+        byte_count += char_length
+        if byte_count >= limit:
+            result.append("\r\n ")
+            byte_count = char_length
+        result.append(char)
+    return "".join(result)
+
+
+def _format_datetime(name, value, tzid):
+    timestamp = value.strftime("%Y%m%dT%H%M%S")
+    if tzid == "UTC":
+        return f"{name}:{timestamp}Z"
+    return f"{name};TZID={tzid}:{timestamp}"
+
+
+@lru_cache(maxsize=128)
+def get_vtimezone(tzid, first_date, last_date):
+    """Return the serialised VTIMEZONE block for *tzid*, or an empty string
+    for unknown timezones.
+
+    Generating timezone transitions is by far the most expensive part of
+    building a calendar, and the result only depends on these arguments, so
+    it is computed once per process.
+    """
+    import icalendar  # noqa: PLC0415 -- slow import
+
+    try:
+        timezone = icalendar.Timezone.from_tzid(
+            tzid, first_date=first_date, last_date=last_date
+        )
+    except ValueError:
+        return ""
+    # Drop useless comment
+    timezone.pop("comment", None)
+    return timezone.to_ical().decode()
+
+
+def _get_tzid(value):
+    import icalendar  # noqa: PLC0415 -- slow import
+
+    return icalendar.vDatetime(value).params.get("TZID") or "UTC"
+
+
+def _render_calendar(event, slots, prodid):
+    netloc = get_netloc(event)
+    # Build the talk URL once, and fill in the code of each talk.
+    placeholder = "CODE"
+    talk_url_prefix, talk_url_suffix = (
+        Submission(event=event, code=placeholder)
+        .urls.public.full()
+        .rsplit(placeholder, 1)
+    )
+    dtstamp = dt.datetime.now(ZoneInfo("UTC")).strftime("%Y%m%dT%H%M%SZ")
+    tzids = {}
+    first_start = last_end = None
+    lines = []
+    for slot in slots:
+        if not slot.start or not slot.local_end or not slot.room or not slot.submission:
+            continue
+        submission = slot.submission
+        start, end = slot.local_start, slot.local_end
+        if start.tzinfo not in tzids:
+            tzids[start.tzinfo] = _get_tzid(start)
+        if end.tzinfo not in tzids:
+            tzids[end.tzinfo] = _get_tzid(end)
+        first_start = min(first_start or start, start)
+        last_end = max(last_end or end, end)
+        lines += (
+            "BEGIN:VEVENT",
+            "SUMMARY:"
+            + _escape_text(
+                strip_control_characters(
+                    f"{submission.title} - {submission.display_speaker_names}"
+                )
+            ),
+            _format_datetime("DTSTART", start, tzids[start.tzinfo]),
+            _format_datetime("DTEND", end, tzids[end.tzinfo]),
+            f"DTSTAMP:{dtstamp}",
+            "UID:"
+            + _escape_text(
+                f"pretalx-{submission.event.slug}-{submission.code}{slot.id_suffix}@{netloc}"
+            ),
+            "DESCRIPTION:"
+            + _escape_text(strip_control_characters(submission.abstract)),
+            "LOCATION:" + _escape_text(strip_control_characters(slot.room.name)),
+            f"URL:{talk_url_prefix}{submission.code}{talk_url_suffix}",
+            "END:VEVENT",
+        )
+
+    header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//pretalx//{netloc}//{prodid}",
+    ]
+    result = "".join(f"{_fold_line(line)}\r\n" for line in header)
+    if lines:
+        # icalendar includes 1970-2038 tz data by default, which is
+        # *slightly* overkill for non-repeating event data
+        timezone_range_padding = dt.timedelta(days=365)
+        first_date = (first_start - timezone_range_padding).date()
+        last_date = (last_end + timezone_range_padding).date()
+        for tzid in sorted(set(tzids.values()) - {"UTC"}):
+            result += get_vtimezone(tzid, first_date, last_date)
+    result += "".join(f"{_fold_line(line)}\r\n" for line in lines)
+    return result + "END:VCALENDAR\r\n"
+
+
+def render_slots_ical(event, slots, prodid_suffix=None):
+    """Serialise *slots* as an iCalendar document.
+
+    This writes the content lines directly instead of building icalendar
+    objects for every slot, and produces the same output as serialising a
+    calendar with a :func:`build_slot_vevent` for every slot.
+    """
     prodid = event.slug
     if prodid_suffix:
         prodid = f"{prodid}//{prodid_suffix}"
-    cal = get_calendar(event, prodid)
-    creation_time = dt.datetime.now(ZoneInfo("UTC"))
-    netloc = get_netloc(event)
-    for slot in slots:
-        build_slot_vevent(slot, cal, creation_time=creation_time, netloc=netloc)
-    return cal
+    return _render_calendar(event, slots, prodid)
 
 
 def get_speaker_ical(event, speaker):
-    return get_slots_ical(
+    return render_slots_ical(
         event, speaker.current_talk_slots, prodid_suffix=f"speaker//{speaker.code}"
     )
 
 
 def get_submission_ical(submission, slots):
-    return get_slots_ical(
+    return render_slots_ical(
         submission.event, slots, prodid_suffix=f"talk//{submission.code}"
     )
 
@@ -98,3 +231,9 @@ def get_slot_ical(slot):
     cal = get_calendar(slot.event, slot.submission.code or slot.pk)
     build_slot_vevent(slot, cal)
     return cal
+
+
+def render_slot_ical(slot):
+    """Serialise a single slot like ``serialize_calendar(get_slot_ical(slot))``,
+    see :func:`render_slots_ical`."""
+    return _render_calendar(slot.event, [slot], slot.submission.code or slot.pk)
@@ -10,8 +10,8 @@
 from pretalx.common.language import get_day_month_date_format, language
 from pretalx.mail.domain.template import mail_template_by_role
 from pretalx.mail.enums import MailTemplateRoles
-from pretalx.person.models import SpeakerProfile
-from pretalx.schedule.domain.ical import get_slot_ical, serialize_calendar
+from pretalx.schedule.domain.ical import render_slot_ical
+from pretalx.submission.domain.queries.submission import sorted_speakers_prefetch
 
 
 def get_notification_date_format():
@@ -50,11 +50,7 @@ def get_current_notifications(speaker, event):
     empty_result = {"create": [], "update": []}
     if not event.current_schedule or speaker is None:
         return empty_result
-    concerned = event.current_schedule.speakers_concerned
-    for concerned_speaker, data in concerned.items():
-        if concerned_speaker.pk == speaker.pk:
-            return data
-    return empty_result
+    return event.current_schedule.speakers_concerned.get(speaker, empty_result)
 
 
 def compute_speakers_concerned(schedule):
@@ -64,22 +60,23 @@ def compute_speakers_concerned(schedule):
     Each speaker is assigned a dictionary with ``create`` and
     ``update`` fields, each containing a list of submissions.
     """
-    result = {}
+    speakers = defaultdict(lambda: {"create": [], "update": []})
     if schedule.changes["action"] == "create":
-        for speaker in SpeakerProfile.objects.filter(
-            submissions__slots__schedule=schedule
-        ):
-            talks = schedule.talks.filter(
-                submission__speakers=speaker, room__isnull=False, start__isnull=False
+        talks = (
+            schedule.version_talks.filter(
+                submission__isnull=False, room__isnull=False, start__isnull=False
             )
-            if talks:
-                result[speaker] = {"create": talks, "update": []}
-        return result
+            .select_related("submission", "submission__event", "room", "schedule")
+            .prefetch_related(sorted_speakers_prefetch("submission__"))
+        )
+        for talk in talks:
+            for speaker in talk.submission.sorted_speakers:
+                speakers[speaker]["create"].append(talk)
+        return speakers
 
     if schedule.changes["count"] == len(schedule.changes["canceled_talks"]):
-        return result
+        return {}
 
-    speakers = defaultdict(lambda: {"create": [], "update": []})
     for new_talk in schedule.changes["new_talks"]:
         for speaker in new_talk.submission.sorted_speakers:
             speakers[speaker]["create"].append(new_talk)
@@ -95,10 +92,12 @@ def count_pending_notifications(schedule):
     return len(schedule.speakers_concerned)
 
 
-def generate_notifications(schedule):
+def generate_notifications(schedule, *, progress=None):
     """Render the per-speaker schedule-change notifications and persist
-    each as a DRAFT in the outbox. Returns the list of saved mails."""
-    from pretalx.mail.domain.queue import save_draft  # noqa: PLC0415 -- circular import
+    them as DRAFTs in the outbox. Returns the list of saved mails.
+
+    ``progress`` is called with the number of rendered and total mails."""
+    from pretalx.mail.domain.queue import save_drafts  # noqa: PLC0415 -- circular import
     from pretalx.mail.domain.recipient import (  # noqa: PLC0415 -- circular import
         Recipient,
     )
@@ -106,34 +105,41 @@ def generate_notifications(schedule):
         render_template_to_mail,
     )
 
-    mails = []
+    event = schedule.event
+    if event.current_schedule == schedule:
+        # The notification placeholders read from the current schedule, so
+        # they have to share the speakers we compute here.
+        event.current_schedule = schedule
+    template = mail_template_by_role(event, MailTemplateRoles.NEW_SCHEDULE)
+    # Co-speakers with the same locale share calendar attachments.
+    attachments = {}
+    drafts = []
     # Read via the model so the cached_property is shared with other readers
     # of this schedule instance (e.g. get_current_notifications).
-    for speaker, data in schedule.speakers_concerned.items():
+    concerned = schedule.speakers_concerned
+    for index, (speaker, data) in enumerate(concerned.items(), start=1):
+        if progress:
+            progress(index, len(concerned))
         locale = speaker.effective_locale
-        slots = list(data.get("create") or []) + [
-            talk["new_slot"] for talk in (data.get("update") or [])
-        ]
-        submissions = [slot.submission for slot in slots if slot]
-        with language(locale):
-            attachments = [
-                {
-                    "name": f"{slot.frab_slug[:200]}.ics",
-                    "content": serialize_calendar(get_slot_ical(slot)),
-                    "content_type": "text/calendar",
-                }
-                for slot in slots
+        slots = [
+            slot
+            for slot in [
+                *data["create"],
+                *(talk["new_slot"] for talk in data["update"]),
             ]
+            if slot
+        ]
+        for slot in slots:
+            if (slot.pk, locale) not in attachments:
+                with language(locale):
+                    attachments[slot.pk, locale] = {
+                        "name": f"{slot.frab_slug[:200]}.ics",
+                        "content": render_slot_ical(slot),
+                        "content_type": "text/calendar",
+                    }
         mail = render_template_to_mail(
-            mail_template_by_role(schedule.event, MailTemplateRoles.NEW_SCHEDULE),
-            context_kwargs={"user": Recipient(speaker)},
-            locale=locale,
+            template, context_kwargs={"user": Recipient(speaker)}, locale=locale
         )
-        if save_draft(
-            mail,
-            to_speakers=[speaker],
-            submissions=submissions,
-            attachments=attachments,
-        ):
-            mails.append(mail)
-    return mails
+        mail.attachments = [attachments[slot.pk, locale] for slot in slots]
+        drafts.append((mail, speaker, [slot.submission for slot in slots]))
+    return save_drafts(drafts)
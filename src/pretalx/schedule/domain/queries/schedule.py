@@ -59,7 +59,7 @@ def schedule_day_start(slot):
 
 
 def _visible_slots(schedule):
-    return schedule.talks.filter(
+    return schedule.version_talks.filter(
         is_visible=True,
         room__isnull=False,
         start__isnull=False,
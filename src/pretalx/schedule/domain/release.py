@@ -1,18 +1,28 @@
 # SPDX-FileCopyrightText: 2025-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+from collections import defaultdict
 from contextlib import suppress
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import models, transaction
-from django.db.models import Min, Q
+from django.db.models import Min, Q, Value
+from django.db.models.functions import Coalesce
 from django.db.utils import DatabaseError
 from django.utils.timezone import now
+from i18nfield.strings import LazyI18nString
 
+from pretalx.common.models.deletion import unrecorded_deletions
 from pretalx.common.models.log import ActivityLog
-from pretalx.schedule.domain.changes import update_unreleased_schedule_changes
+from pretalx.schedule.domain.artifacts import invalidate_export_data
+from pretalx.schedule.domain.changes import (
+    invalidate_cached_schedule_changes,
+    update_unreleased_schedule_changes,
+)
+from pretalx.schedule.domain.feed import publish_slot_changes
 from pretalx.schedule.domain.notifications import generate_notifications
 from pretalx.schedule.domain.slot import copy_slot
+from pretalx.schedule.domain.warnings import invalidate_overlap_index
 from pretalx.schedule.enums import SlotType
 from pretalx.schedule.models import TalkSlot
 from pretalx.schedule.signals import schedule_release
@@ -62,7 +72,9 @@ def freeze_schedule(schedule, name, user=None, notify_speakers=True, comment=Non
         schedule.log_action("pretalx.schedule.release", person=user, orga=True)
 
         # Confirmed submissions and breaks are visible; blockers stay hidden.
-        schedule.talks.update(is_visible=False)
+        # The released slots are new to API clients syncing the current
+        # schedule, so they count as updated at release time.
+        schedule.talks.update(is_visible=False, updated=schedule.published)
         schedule.talks.filter(
             models.Q(submission__state=SubmissionStates.CONFIRMED)
             | models.Q(slot_type=SlotType.BREAK),
@@ -76,7 +88,12 @@ def freeze_schedule(schedule, name, user=None, notify_speakers=True, comment=Non
         TalkSlot.objects.bulk_create(talks)
 
         # Blockers should only exist in WIP, never in a released schedule.
-        schedule.talks.filter(slot_type=SlotType.BLOCKER).delete()
+        with unrecorded_deletions():
+            schedule.talks.filter(slot_type=SlotType.BLOCKER).delete()
+
+        with suppress(AttributeError):
+            del schedule.previous_schedule
+        share_unchanged_slots(schedule, schedule.previous_schedule)
 
         apply_signup_capacity_defaults(schedule, user=user)
 
@@ -92,10 +109,87 @@ def freeze_schedule(schedule, name, user=None, notify_speakers=True, comment=Non
     schedule_release.send_robust(schedule.event, schedule=schedule, user=user)
 
     update_unreleased_schedule_changes(schedule.event, False)
+    # Editors following the old WIP schedule have to switch to the new one.
+    publish_slot_changes(schedule.pk, reset=True)
 
     return schedule, wip_schedule
 
 
+# Fields that do not tell slots apart when comparing schedule versions.
+SLOT_VERSION_FIELDS = ("id", "created", "updated", "schedule", "first_schedule")
+
+
+def _comparable(value):
+    if isinstance(value, LazyI18nString):
+        value = value.data
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+
+def share_unchanged_slots(schedule, previous_schedule):
+    """Store the slots of ``schedule`` that did not change since
+    ``previous_schedule`` only once.
+
+    Unchanged slots of ``schedule`` are deleted, and the matching slots of
+    ``previous_schedule`` are extended to ``schedule`` instead.
+    ``previous_schedule`` has to be the version released right before
+    ``schedule``. Returns the number of shared slots.
+    """
+    if (
+        not previous_schedule
+        or not previous_schedule.published
+        or not schedule.published
+        or previous_schedule.published > schedule.published
+    ):
+        return 0
+    fields = [
+        field.attname
+        for field in TalkSlot._meta.concrete_fields
+        if field.name not in SLOT_VERSION_FIELDS
+    ]
+    previous_slots = defaultdict(list)
+    for pk, *values in TalkSlot.objects.filter(schedule=previous_schedule).values_list(
+        "pk", *fields
+    ):
+        previous_slots[tuple(map(_comparable, values))].append(pk)
+    shared = []
+    duplicates = []
+    for pk, *values in TalkSlot.objects.filter(
+        schedule=schedule, first_schedule__isnull=True
+    ).values_list("pk", *fields):
+        if candidates := previous_slots.get(tuple(map(_comparable, values))):
+            shared.append(candidates.pop())
+            duplicates.append(pk)
+    if not shared:
+        return 0
+    with unrecorded_deletions():
+        TalkSlot.objects.filter(pk__in=duplicates).delete()
+    TalkSlot.objects.filter(pk__in=shared).update(
+        schedule=schedule,
+        first_schedule=Coalesce("first_schedule", Value(previous_schedule.pk)),
+        updated=now(),
+    )
+    invalidate_cached_schedule_changes(schedule)
+    invalidate_overlap_index(schedule)
+    return len(shared)
+
+
+def share_unchanged_event_slots(event):
+    """Run :func:`share_unchanged_slots` on all released versions of
+    ``event``, e.g. for schedules released before slots were shared.
+    Returns the number of shared slots."""
+    shared = 0
+    previous_schedule = None
+    for schedule in event.schedules.filter(version__isnull=False).order_by("published"):
+        with transaction.atomic():
+            shared += share_unchanged_slots(schedule, previous_schedule)
+        # Cached changes of the next version point to removed slots, too.
+        invalidate_cached_schedule_changes(schedule)
+        previous_schedule = schedule
+    return shared
+
+
 def apply_signup_capacity_defaults(schedule, user=None):
     """Set the session capacity to the room capacity.
 
@@ -160,6 +254,7 @@ def apply_signup_capacity_changes(event, updates, user=None):
         return
     Submission.objects.bulk_update(to_update, ["attendee_signup_capacity", "updated"])
     ActivityLog.objects.bulk_create(log_entries)
+    invalidate_export_data(event.pk)
 
 
 def unfreeze_schedule(schedule, user=None):
@@ -167,13 +262,13 @@ def unfreeze_schedule(schedule, user=None):
     if not schedule.version:
         raise ValueError("Cannot unfreeze schedule version: not released yet.")
 
-    submission_ids = schedule.talks.values_list("submission_id", flat=True)
+    submission_ids = schedule.version_talks.values_list("submission_id", flat=True)
     talks = schedule.event.wip_schedule.talks.exclude(submission_id__in=submission_ids)
     try:
         # Force evaluation to catch the DatabaseError early.
-        talks = list(talks.union(schedule.talks.all()))
+        talks = list(talks.union(schedule.version_talks.all()))
     except DatabaseError:  # pragma: no cover -- vendor-specific SQLite workaround
-        talks = set(talks) | set(schedule.talks.all())
+        talks = set(talks) | set(schedule.version_talks.all())
 
     with transaction.atomic():
         wip_schedule = schedule.event.schedules.create()
@@ -182,8 +277,12 @@ def unfreeze_schedule(schedule, user=None):
         ]
         TalkSlot.objects.bulk_create(new_talks)
 
+        old_wip_pk = schedule.event.wip_schedule.pk
         schedule.event.wip_schedule.talks.all().delete()
         schedule.event.wip_schedule.delete()
+        # The new WIP schedule was written in bulk, so editors following the
+        # old one have to reload all slots.
+        publish_slot_changes(old_wip_pk, reset=True)
 
     update_unreleased_schedule_changes(schedule.event, False)
 
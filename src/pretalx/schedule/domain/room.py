@@ -7,6 +7,7 @@
 
 from pretalx.schedule.models import TalkSlot
 from pretalx.schedule.models.room import ROOM_IN_USE_ERROR
+from pretalx.schedule.models.slot import slot_in_schedule_q
 
 __all__ = [
     "ROOM_IN_USE_ERROR",
@@ -56,7 +57,7 @@ def annotate_room_usage(queryset, event):
 
 def rooms_for_schedule(schedule):
     return schedule.event.rooms.filter(
-        Q(hidden=False) | Q(talks__schedule=schedule)
+        Q(hidden=False) | slot_in_schedule_q(schedule, prefix="talks__")
     ).distinct()
 
 
@@ -2,9 +2,15 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
 import datetime as dt
+from typing import NamedTuple
 
+from django.utils.timezone import now
+from i18nfield.strings import LazyI18nString
+
+from pretalx.schedule.domain.feed import publish_slot_changes
+from pretalx.schedule.domain.warnings import update_overlap_index_for_slots
 from pretalx.schedule.enums import SlotType
-from pretalx.schedule.models import TalkSlot
+from pretalx.schedule.models import Room, TalkSlot
 
 DEFAULT_SLOT_MINUTES = 30
 
@@ -30,14 +36,7 @@ def create_slot(
     )
 
 
-def move_slot(slot, start, *, room=None, end=None, duration=None):
-    """Place ``slot`` at ``start`` (and consequently at ``end``).
-
-    ``end`` is determined in this priority order: an explicit ``end``
-    argument, then ``duration`` in minutes, then the slot's submission
-    duration, then the slot's own current duration, finally a default
-    fallback for slots without a submission.
-    """
+def _place_slot(slot, start, *, room=None, end=None, duration=None):
     if end is None:
         if duration is not None:
             minutes = duration
@@ -50,6 +49,17 @@ def move_slot(slot, start, *, room=None, end=None, duration=None):
     slot.end = end
     if room is not None:
         slot.room = room
+
+
+def move_slot(slot, start, *, room=None, end=None, duration=None):
+    """Place ``slot`` at ``start`` (and consequently at ``end``).
+
+    ``end`` is determined in this priority order: an explicit ``end``
+    argument, then ``duration`` in minutes, then the slot's submission
+    duration, then the slot's own current duration, finally a default
+    fallback for slots without a submission.
+    """
+    _place_slot(slot, start, room=room, end=end, duration=duration)
     slot.save(update_fields=["start", "end", "room", "updated"])
     return slot
 
@@ -63,11 +73,58 @@ def unschedule_slot(slot):
     return slot
 
 
+class SlotMove(NamedTuple):
+    """One change in ``move_slots``. A move without ``start`` unschedules
+    the slot, and a ``description`` is only applied to slots without a
+    submission."""
+
+    slot: TalkSlot
+    start: dt.datetime | None = None
+    room: Room | None = None
+    end: dt.datetime | None = None
+    duration: int | None = None
+    description: LazyI18nString | None = None
+
+
+def move_slots(schedule, moves):
+    """Apply many ``SlotMove`` changes to slots of ``schedule`` at once.
+
+    Placement follows the rules of ``move_slot`` and ``unschedule_slot``,
+    but all slots are written with a single ``bulk_update``. As that sends
+    no signals, the overlap index and the change feed are updated here.
+    """
+    updated = now()
+    slots = []
+    for move in moves:
+        slot = move.slot
+        if move.start:
+            _place_slot(
+                slot, move.start, room=move.room, end=move.end, duration=move.duration
+            )
+            if not slot.submission and move.description and str(move.description):
+                slot.description = move.description
+        else:
+            slot.start = slot.end = slot.room = None
+        slot.updated = updated
+        slots.append(slot)
+    TalkSlot.objects.bulk_update(
+        slots, ["start", "end", "room", "description", "updated"], batch_size=500
+    )
+    update_overlap_index_for_slots(schedule, slots)
+    publish_slot_changes(schedule.pk, changed=[slot.pk for slot in slots])
+    return slots
+
+
+def delete_slot(slot):
+    """Delete a non-submission slot (break or blocker)."""
+    slot.delete()
+
+
 def copy_slot(slot, *, schedule, save=True):
     """Create a new slot in ``schedule`` cloning every field of ``slot``."""
     new_slot = TalkSlot(schedule=schedule)
     for field in slot._meta.fields:
-        if field.name in ("id", "schedule"):
+        if field.name in ("id", "schedule", "first_schedule"):
             continue
         setattr(new_slot, field.name, getattr(slot, field.name))
     if save:
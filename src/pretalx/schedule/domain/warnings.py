@@ -2,19 +2,25 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
 import datetime as dt
+import time
 from collections import defaultdict
+from functools import partial
 
+from django.core.cache import cache
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
 from pretalx.common.text.phrases import phrases
-from pretalx.schedule.models import TalkSlot
+from pretalx.schedule.models.slot import slot_in_schedule_q
 from pretalx.submission.domain.queries.submission import (
     annotate_confirmed_signup_count,
     annotate_slot_confirmed_signup_count,
     annotate_slot_requires_signup,
 )
 from pretalx.submission.enums import SubmissionStates
-from pretalx.submission.models import Submission
+from pretalx.submission.models import SpeakerRole, Submission
+
+OVERLAP_INDEX_TIMEOUT = 24 * 60 * 60
 
 
 def get_talk_warnings(
@@ -62,11 +68,8 @@ def get_talk_warnings(
         overlaps = talk.pk in room_overlap_ids
     else:
         overlaps = (
-            TalkSlot.objects.filter(
-                schedule=schedule,
-                room=talk.room,
-                start__lt=talk.real_end,
-                end__gt=talk.start,
+            schedule.version_talks.filter(
+                room=talk.room, start__lt=talk.real_end, end__gt=talk.start
             )
             .exclude(pk=talk.pk)
             .exists()
@@ -106,8 +109,7 @@ def get_talk_warnings(
             overlaps = speaker.pk in speaker_overlaps_by_talk.get(talk.pk, ())
         else:
             overlaps = (
-                TalkSlot.objects.filter(
-                    schedule=schedule,
+                schedule.version_talks.filter(
                     submission__speakers=speaker,
                     start__lt=talk.real_end,
                     end__gt=talk.start,
@@ -171,7 +173,7 @@ def _signup_capacity_warnings(talk):
 def get_all_talk_warnings(schedule, ids=None, filter_updated=None):
     show_signup_warnings = schedule.event.get_feature_flag("attendee_signup")
     talks = (
-        schedule.talks.filter(
+        schedule.version_talks.filter(
             submission__isnull=False, start__isnull=False, room__isnull=False
         )
         .select_related(
@@ -187,6 +189,8 @@ def get_all_talk_warnings(schedule, ids=None, filter_updated=None):
     )
     if show_signup_warnings:
         talks = annotate_slot_requires_signup(talks)
+    if ids is not None:
+        talks = talks.filter(pk__in=ids)
     if filter_updated:
         talks = talks.filter(updated__gte=filter_updated)
     with_speakers = schedule.event.cfp.request_availabilities
@@ -201,23 +205,11 @@ def get_all_talk_warnings(schedule, ids=None, filter_updated=None):
     )
     talk_list = list(talks)
     if talk_list:
-        is_full_scan = not filter_updated
-        subset_pks = None if is_full_scan else {t.pk for t in talk_list}
-        # Pull extra slots so overlaps against them are detected: breaks
-        # (no submission, excluded from ``talks``) for the full scan, every
-        # other scheduled slot for subset mode.
-        extra_slots_qs = (
-            schedule.talks.filter(start__isnull=False, room__isnull=False)
-            .select_related("submission", "submission__submission_type")
-            .with_sorted_speakers()
+        subset_pks = (
+            {t.pk for t in talk_list} if filter_updated or ids is not None else None
         )
-        if is_full_scan:
-            extra_slots_qs = extra_slots_qs.filter(submission__isnull=True)
-        else:
-            extra_slots_qs = extra_slots_qs.exclude(pk__in=subset_pks)
-        scan_set = talk_list + list(extra_slots_qs)
-        room_overlap_ids, speaker_overlaps_by_talk = _compute_overlap_maps(
-            scan_set, subset_pks=subset_pks
+        room_overlap_ids, speaker_overlaps_by_talk = get_overlap_maps(
+            schedule, subset_pks=subset_pks
         )
     else:
         room_overlap_ids, speaker_overlaps_by_talk = set(), {}
@@ -237,28 +229,26 @@ def get_all_talk_warnings(schedule, ids=None, filter_updated=None):
 
 
 def _overlapping_pks(entries, subset_pks):
-    """Yield pks from ``entries`` that overlap another entry.
+    """The set of pks from ``entries`` that overlap another entry.
 
-    With ``subset_pks=None``, yields both pks of every overlapping pair
-    (full pairwise scan). With a ``subset_pks`` set, yields only those pks
-    in the subset that overlap anything — each yielded at most once.
+    Sweeps over the entries sorted by start time, keeping track of the
+    entry that reaches furthest to the right so far. Any entry starting
+    before that end overlaps it, and vice versa, which finds every
+    overlapping entry in O(n log n) rather than comparing all pairs.
+    With a ``subset_pks`` set, only pks in the subset are returned, but
+    overlaps are still detected against all entries.
     """
-    if subset_pks is None:
-        for i, (pk_a, start_a, end_a) in enumerate(entries):
-            for pk_b, start_b, end_b in entries[i + 1 :]:
-                if start_a < end_b and start_b < end_a:
-                    yield pk_a
-                    yield pk_b
-        return
-    for pk_a, start_a, end_a in entries:
-        if pk_a not in subset_pks:
-            continue
-        for pk_b, start_b, end_b in entries:
-            if pk_b == pk_a:
-                continue
-            if start_a < end_b and start_b < end_a:
-                yield pk_a
-                break
+    result = set()
+    reach_pk = reach_end = None
+    for pk, start, end in sorted(entries, key=lambda entry: entry[1]):
+        if reach_end is not None and start < reach_end:
+            result.add(pk)
+            result.add(reach_pk)
+        if reach_end is None or end > reach_end:
+            reach_pk, reach_end = pk, end
+    if subset_pks is not None:
+        result &= subset_pks
+    return result
 
 
 def _slot_end(talk):
@@ -292,7 +282,10 @@ def _compute_overlap_maps(talks, subset_pks=None):
         if talk.submission_id:
             for speaker in talk.submission.sorted_speakers:
                 by_speaker[speaker.pk].append(entry)
+    return _overlap_maps_from_buckets(by_room, by_speaker, subset_pks)
+
 
+def _overlap_maps_from_buckets(by_room, by_speaker, subset_pks=None):
     room_overlap_ids = set()
     for entries in by_room.values():
         room_overlap_ids.update(_overlapping_pks(entries, subset_pks))
@@ -305,6 +298,221 @@ def _compute_overlap_maps(talks, subset_pks=None):
     return room_overlap_ids, speaker_overlaps_by_talk
 
 
+# The overlap index of a schedule is cached under the current version of
+# the schedule, and records the version of the event it was built at. Slot
+# writes bump the schedule version and store a patched copy of the previous
+# index under the new one, while speaker changes bump the event version, so
+# that the next read rebuilds. No writer ever replaces an index another
+# writer may still be patching.
+def _overlap_version_key(schedule_pk):
+    return f"schedule_{schedule_pk}_overlap_version"
+
+
+def _event_overlap_version_key(event_pk):
+    return f"event_{event_pk}_overlap_version"
+
+
+def _overlap_index_key(schedule_pk, version):
+    return f"schedule_{schedule_pk}_overlap_index_{version}"
+
+
+def _get_overlap_versions(schedule):
+    keys = [
+        _overlap_version_key(schedule.pk),
+        _event_overlap_version_key(schedule.event_id),
+    ]
+    versions = cache.get_many(keys)
+    # Versions start at the current time, so that an expired version never
+    # brings an outdated index back.
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, OVERLAP_INDEX_TIMEOUT)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def _bump_overlap_version(key):
+    """Increment the version stored in ``key`` and return the new value, or
+    ``None`` if there was no version to increment."""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), OVERLAP_INDEX_TIMEOUT)
+        return None
+
+
+def _index_slot(index, pk, room_id, start, end, speaker_pks):
+    if end is None or end <= start:
+        return
+    index["slots"][pk] = (room_id, tuple(speaker_pks))
+    index["rooms"].setdefault(room_id, {})[pk] = (start, end)
+    for speaker_pk in speaker_pks:
+        index["speakers"].setdefault(speaker_pk, {})[pk] = (start, end)
+
+
+def _unindex_slot(index, pk):
+    room_id, speaker_pks = index["slots"].pop(pk, (None, ()))
+    index["rooms"].get(room_id, {}).pop(pk, None)
+    for speaker_pk in speaker_pks:
+        index["speakers"].get(speaker_pk, {}).pop(pk, None)
+
+
+def build_overlap_index(schedule, event_version=None):
+    """Build the interval index that room and speaker overlap warnings are
+    computed from, without loading any model instances.
+
+    The index maps rooms and speakers to the ``(start, end)`` intervals of
+    their scheduled slots, so that warnings for a handful of changed slots
+    only need to look at the rooms and speakers involved.
+    """
+    index = {"event_version": event_version, "slots": {}, "rooms": {}, "speakers": {}}
+    rows = schedule.version_talks.filter(
+        start__isnull=False, room__isnull=False
+    ).values_list(
+        "pk",
+        "room_id",
+        "start",
+        "end",
+        "submission_id",
+        "submission__duration",
+        "submission__submission_type__default_duration",
+    )
+    speakers_by_submission = defaultdict(list)
+    for submission_id, speaker_id in SpeakerRole.objects.filter(
+        slot_in_schedule_q(schedule, prefix="submission__slots__")
+    ).values_list("submission_id", "speaker_id"):
+        speakers_by_submission[submission_id].append(speaker_id)
+    for pk, room_id, start, end, submission_id, duration, default_duration in rows:
+        if end is None and submission_id:
+            slot_end = start + dt.timedelta(minutes=duration or default_duration)
+        else:
+            slot_end = end
+        _index_slot(
+            index, pk, room_id, start, slot_end, speakers_by_submission[submission_id]
+        )
+    return index
+
+
+def get_overlap_index(schedule):
+    """The overlap index of ``schedule``, from the cache if it is still
+    current, otherwise rebuilt and cached."""
+    version, event_version = _get_overlap_versions(schedule)
+    key = _overlap_index_key(schedule.pk, version)
+    index = cache.get(key)
+    if index is None or index["event_version"] != event_version:
+        index = build_overlap_index(schedule, event_version=event_version)
+        cache.set(key, index, OVERLAP_INDEX_TIMEOUT)
+    return index
+
+
+def _patch_overlap_index(schedule_pk, entries, removed):
+    version = _bump_overlap_version(_overlap_version_key(schedule_pk))
+    if version is None:
+        return
+    # Only the index of the version right before ours contains every change
+    # but our own. If it is missing, the next read rebuilds the index.
+    index = cache.get(_overlap_index_key(schedule_pk, version - 1))
+    if index is None:
+        return
+    for pk in removed:
+        _unindex_slot(index, pk)
+    submission_ids = {entry[4] for entry in entries if entry[4]}
+    speakers_by_submission = defaultdict(list)
+    if submission_ids:
+        for submission_id, speaker_id in SpeakerRole.objects.filter(
+            submission_id__in=submission_ids
+        ).values_list("submission_id", "speaker_id"):
+            speakers_by_submission[submission_id].append(speaker_id)
+    for pk, room_id, start, end, submission_id in entries:
+        _unindex_slot(index, pk)
+        _index_slot(
+            index, pk, room_id, start, end, speakers_by_submission[submission_id]
+        )
+    cache.set(_overlap_index_key(schedule_pk, version), index, OVERLAP_INDEX_TIMEOUT)
+
+
+def _queue_overlap_index_patch(schedule_pk, slots):
+    entries, removed = [], []
+    for slot in slots:
+        if slot.start and slot.room_id:
+            entries.append(
+                (slot.pk, slot.room_id, slot.start, _slot_end(slot), slot.submission_id)
+            )
+        else:
+            removed.append(slot.pk)
+    transaction.on_commit(partial(_patch_overlap_index, schedule_pk, entries, removed))
+
+
+def update_overlap_index_for_slots(schedule, slots):
+    """Patch the cached overlap index of ``schedule`` after ``slots`` were
+    saved, once the current transaction is committed.
+
+    Slot saves are handled by a receiver, so this is only needed after bulk
+    updates, which do not send signals.
+    """
+    _queue_overlap_index_patch(schedule.pk, slots)
+
+
+def update_overlap_index(slot):
+    """Patch the cached overlap index after ``slot`` was saved."""
+    if slot.first_schedule_id:
+        # Released slots are shared by several schedules.
+        invalidate_event_overlap_indexes(slot.schedule.event_id)
+    else:
+        _queue_overlap_index_patch(slot.schedule_id, [slot])
+
+
+def remove_from_overlap_index(slot):
+    """Drop a deleted slot from the cached overlap index."""
+    # Released slots are only deleted along with their schedule, or when
+    # they are replaced by an identical slot on release.
+    if not slot.first_schedule_id:
+        transaction.on_commit(
+            partial(_patch_overlap_index, slot.schedule_id, [], [slot.pk])
+        )
+
+
+def invalidate_overlap_index(schedule):
+    _bump_overlap_version(_overlap_version_key(schedule.pk))
+
+
+def invalidate_event_overlap_indexes(event_pk):
+    """Make the overlap indexes of all schedules of an event stale, e.g.
+    after its speakers changed."""
+    _bump_overlap_version(_event_overlap_version_key(event_pk))
+
+
+def get_overlap_maps(schedule, subset_pks=None):
+    """Room- and speaker-overlap sets for ``schedule``, see
+    ``_compute_overlap_maps``.
+
+    Reads from the overlap index, so with ``subset_pks`` only the rooms and
+    speakers of the given slots are examined.
+    """
+    index = get_overlap_index(schedule)
+    if subset_pks is None:
+        rooms, speakers = index["rooms"], index["speakers"]
+    else:
+        room_ids, speaker_pks = set(), set()
+        for pk in subset_pks:
+            room_id, slot_speaker_pks = index["slots"].get(pk, (None, ()))
+            room_ids.add(room_id)
+            speaker_pks.update(slot_speaker_pks)
+        rooms = {key: index["rooms"][key] for key in room_ids if key in index["rooms"]}
+        speakers = {key: index["speakers"][key] for key in speaker_pks}
+    return _overlap_maps_from_buckets(
+        {
+            key: [(pk, start, end) for pk, (start, end) in entries.items()]
+            for key, entries in rooms.items()
+        },
+        {
+            key: [(pk, start, end) for pk, (start, end) in entries.items()]
+            for key, entries in speakers.items()
+        },
+        subset_pks,
+    )
+
+
 def compute_warnings(schedule) -> dict:
     """A dictionary of warnings to be acknowledged before a release.
 
@@ -314,7 +522,7 @@ def compute_warnings(schedule) -> dict:
     visible due to their unconfirmed status, and ``no_track`` are
     submissions without a track in a conference that uses tracks.
     """
-    talks = schedule.talks.filter(submission__isnull=False)
+    talks = schedule.version_talks.filter(submission__isnull=False)
     talk_warnings = [
         {"talk": key, "warnings": value}
         for key, value in get_all_talk_warnings(schedule).items()
@@ -355,7 +563,7 @@ def compute_signup_warnings(schedule) -> dict:
         "signup_overfull": [],
         "signup_dropped_with_attendees": [],
     }
-    no_capacity_slots = schedule.talks.filter(
+    no_capacity_slots = schedule.version_talks.filter(
         submission__isnull=False,
         submission__attendee_signup_capacity__isnull=True,
         room__isnull=False,
@@ -375,7 +583,7 @@ def compute_signup_warnings(schedule) -> dict:
         result["signup_no_capacity"].append(
             {"submission": slot.submission, "slot": slot}
         )
-    scheduled_slots = schedule.talks.filter(
+    scheduled_slots = schedule.version_talks.filter(
         submission__isnull=False,
         room__isnull=False,
         start__isnull=False,
@@ -424,7 +632,7 @@ def compute_signup_warnings(schedule) -> dict:
             previous.scheduled_talks.values_list("submission_id", flat=True)
         )
         current_submission_ids = set(
-            schedule.talks.filter(
+            schedule.version_talks.filter(
                 submission__isnull=False,
                 submission__state=SubmissionStates.CONFIRMED,
                 room__isnull=False,
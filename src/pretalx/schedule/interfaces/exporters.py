@@ -17,11 +17,23 @@
 from pretalx.common.exporter import BaseExporter
 from pretalx.common.text.xml import strip_control_characters_deep
 from pretalx.common.urls import get_base_url, get_netloc
-from pretalx.schedule.domain.ical import get_slots_ical, serialize_calendar
+from pretalx.schedule.domain.ical import render_slots_ical
 from pretalx.schedule.domain.queries.schedule import DAY_START_HOUR
 from pretalx.schedule.domain.room import rooms_for_schedule
 from pretalx.submission.domain.queries.submission import annotate_slot_signup_status
 
+# Placeholder for the parts of an export that are streamed in chunks.
+STREAM_MARKER = "\ue000stream\ue000"
+
+
+def _dumps(data):
+    return json.dumps(strip_control_characters_deep(data), cls=I18nJSONEncoder)
+
+
+def _split_at_marker(document):
+    head, _, tail = document.partition(_dumps(STREAM_MARKER))
+    return head, tail
+
 
 class ScheduleData(BaseExporter):
     requires_released_schedule = True
@@ -58,9 +70,9 @@ def data(self):
         schedule = self.schedule
 
         base_qs = (
-            schedule.talks.all()
+            schedule.version_talks.all()
             if self.with_accepted
-            else schedule.talks.filter(is_visible=True)
+            else schedule.version_talks.filter(is_visible=True)
         ).filter(self.talks_filter or Q())
         talks = (
             base_qs.select_related(
@@ -137,6 +149,8 @@ def data(self):
 class FrabXmlExporter(ScheduleData):
     verbose_name = "XML (frab compatible)"
     public = True
+    cacheable = True
+    streaming = True
     show_qrcode = True
     icon = "fa-code"
     cors = "*"
@@ -144,8 +158,8 @@ class FrabXmlExporter(ScheduleData):
     filename_identifier = "schedule"
     content_type = "text/xml"
 
-    def get_data(self, **kwargs):
-        context = {
+    def get_context(self):
+        return {
             "data": self.data,
             "metadata": self.metadata,
             "schedule": self.schedule,
@@ -153,12 +167,31 @@ def get_data(self, **kwargs):
             "version": __version__,
             "base_url": get_base_url(self.event),
         }
-        return get_template("agenda/schedule.xml").render(context=context)
+
+    def get_data(self, **kwargs):
+        return get_template("agenda/schedule.xml").render(context=self.get_context())
+
+    def stream_data(self, **kwargs):
+        """Yield the same document as ``get_data``, one day at a time."""
+        context = self.get_context()
+        head, _, tail = (
+            get_template("agenda/schedule.xml")
+            .render(context={**context, "stream_marker": STREAM_MARKER})
+            .partition(STREAM_MARKER)
+        )
+        yield head
+        day_template = get_template("agenda/schedule_day.xml")
+        for day in self.data:
+            # The indentation in front of the next day is part of the loop in
+            # schedule.xml, so we have to add it here.
+            yield day_template.render(context={**context, "day": day}) + "    "
+        yield tail
 
 
 class FrabXCalExporter(ScheduleData):
     verbose_name = "XCal (frab compatible)"
     public = True
+    cacheable = True
     icon = "fa-calendar"
     cors = "*"
     filename_identifier = "schedule"
@@ -174,14 +207,92 @@ def get_data(self, **kwargs):
 class FrabJsonExporter(ScheduleData):
     verbose_name = "JSON (frab compatible)"
     public = True
+    cacheable = True
+    streaming = True
     icon = "{ }"
     cors = "*"
     filename_identifier = "schedule"
     extension = "json"
     content_type = "application/json"
 
-    def _get_data(self, **kwargs):
+    def _get_talk_data(self, talk, room_name):
+        submission = talk.submission
+        return {
+            "guid": talk.uuid,
+            "code": submission.code,
+            "id": submission.id,
+            "logo": submission.urls.image.full() if submission.image else None,
+            "date": talk.local_start.isoformat(),
+            "start": talk.local_start.strftime("%H:%M"),
+            "end": talk.local_end.isoformat(),
+            "duration": talk.export_duration,
+            "room": room_name,
+            "slug": talk.frab_slug,
+            "url": submission.urls.public.full(),
+            "title": submission.title,
+            "subtitle": "",
+            "track": str(submission.track.name) if submission.track else None,
+            "type": str(submission.submission_type.name),
+            "language": submission.content_locale,
+            "abstract": submission.abstract,
+            "description": submission.description,
+            "recording_license": "",
+            "do_not_record": submission.do_not_record,
+            "persons": [
+                {
+                    "code": person.code,
+                    "name": person.get_display_name(),
+                    "avatar": (
+                        person.profile_picture.get_avatar_url(event=self.event)
+                        if person.profile_picture_id and self.event.cfp.request_avatar
+                        else None
+                    ),
+                    "biography": person.biography,
+                    "public_name": person.get_display_name(),  # deprecated
+                    "guid": person.guid,
+                    "url": person.urls.public.full(),
+                }
+                for person in submission.sorted_speakers
+            ],
+            "links": [
+                {"title": resource.description, "url": resource.link, "type": "related"}
+                for resource in submission.public_resources.all()
+                if resource.link
+            ],
+            "feedback_url": submission.urls.feedback.full(),
+            "origin_url": submission.urls.public.full(),
+            "attachments": [
+                {
+                    "title": resource.description,
+                    "url": resource.resource.url,
+                    "type": "related",
+                }
+                for resource in submission.public_resources.all()
+                if not resource.link
+            ],
+        }
+
+    def _get_day_data(self, day, rooms=None):
+        if rooms is None:
+            rooms = {
+                str(room["name"]): [
+                    self._get_talk_data(talk, str(room["name"]))
+                    for talk in room["talks"]
+                ]
+                for room in day["rooms"]
+            }
+        return {
+            "index": day["index"],
+            "date": day["start"].strftime("%Y-%m-%d"),
+            "day_start": day["start"].astimezone(self.event.tz).isoformat(),
+            "day_end": day["end"].astimezone(self.event.tz).isoformat(),
+            "rooms": rooms,
+        }
+
+    def _get_data(self, days=None, **kwargs):
         schedule = self.schedule
+        if days is None:
+            days = [self._get_day_data(day) for day in self.data]
         return {
             "url": self.metadata["url"],
             "version": schedule.version,
@@ -209,112 +320,53 @@ def _get_data(self, **kwargs):
                     {"name": str(track.name), "slug": track.slug, "color": track.color}
                     for track in self.event.tracks.all()
                 ],
-                "days": [
-                    {
-                        "index": day["index"],
-                        "date": day["start"].strftime("%Y-%m-%d"),
-                        "day_start": day["start"].astimezone(self.event.tz).isoformat(),
-                        "day_end": day["end"].astimezone(self.event.tz).isoformat(),
-                        "rooms": {
-                            str(room["name"]): [
-                                {
-                                    "guid": talk.uuid,
-                                    "code": talk.submission.code,
-                                    "id": talk.submission.id,
-                                    "logo": (
-                                        talk.submission.urls.image.full()
-                                        if talk.submission.image
-                                        else None
-                                    ),
-                                    "date": talk.local_start.isoformat(),
-                                    "start": talk.local_start.strftime("%H:%M"),
-                                    "end": talk.local_end.isoformat(),
-                                    "duration": talk.export_duration,
-                                    "room": str(room["name"]),
-                                    "slug": talk.frab_slug,
-                                    "url": talk.submission.urls.public.full(),
-                                    "title": talk.submission.title,
-                                    "subtitle": "",
-                                    "track": (
-                                        str(talk.submission.track.name)
-                                        if talk.submission.track
-                                        else None
-                                    ),
-                                    "type": str(talk.submission.submission_type.name),
-                                    "language": talk.submission.content_locale,
-                                    "abstract": talk.submission.abstract,
-                                    "description": talk.submission.description,
-                                    "recording_license": "",
-                                    "do_not_record": talk.submission.do_not_record,
-                                    "persons": [
-                                        {
-                                            "code": person.code,
-                                            "name": person.get_display_name(),
-                                            "avatar": (
-                                                person.profile_picture.get_avatar_url(
-                                                    event=self.event
-                                                )
-                                                if person.profile_picture_id
-                                                and self.event.cfp.request_avatar
-                                                else None
-                                            ),
-                                            "biography": person.biography,
-                                            "public_name": person.get_display_name(),  # deprecated
-                                            "guid": person.guid,
-                                            "url": person.urls.public.full(),
-                                        }
-                                        for person in talk.submission.sorted_speakers
-                                    ],
-                                    "links": [
-                                        {
-                                            "title": resource.description,
-                                            "url": resource.link,
-                                            "type": "related",
-                                        }
-                                        for resource in talk.submission.public_resources.all()
-                                        if resource.link
-                                    ],
-                                    "feedback_url": talk.submission.urls.feedback.full(),
-                                    "origin_url": talk.submission.urls.public.full(),
-                                    "attachments": [
-                                        {
-                                            "title": resource.description,
-                                            "url": resource.resource.url,
-                                            "type": "related",
-                                        }
-                                        for resource in talk.submission.public_resources.all()
-                                        if not resource.link
-                                    ],
-                                }
-                                for talk in room["talks"]
-                            ]
-                            for room in day["rooms"]
-                        },
-                    }
-                    for day in self.data
-                ],
+                "days": days,
             },
         }
 
-    def get_data(self, **kwargs):
-        return json.dumps(
-            {
-                "$schema": "https://c3voc.de/schedule/schema.json",
-                "generator": {
-                    "name": "pretalx",
-                    "version": __version__,
-                    "url": self.metadata["base_url"],
-                },
-                "schedule": strip_control_characters_deep(self._get_data(**kwargs)),
+    def _get_document(self, days=None, **kwargs):
+        return {
+            "$schema": "https://c3voc.de/schedule/schema.json",
+            "generator": {
+                "name": "pretalx",
+                "version": __version__,
+                "url": self.metadata["base_url"],
             },
-            cls=I18nJSONEncoder,
+            "schedule": self._get_data(days=days, **kwargs),
+        }
+
+    def get_data(self, **kwargs):
+        return _dumps(self._get_document(**kwargs))
+
+    def stream_data(self, **kwargs):
+        """Yield the same document as ``get_data``, one talk at a time, so that
+        the full schedule never has to be held in memory."""
+        head, tail = _split_at_marker(
+            _dumps(self._get_document(days=STREAM_MARKER, **kwargs))
         )
+        yield head + "["
+        for day_index, day in enumerate(self.data):
+            day_head, day_tail = _split_at_marker(
+                _dumps(self._get_day_data(day, rooms=STREAM_MARKER))
+            )
+            yield (", " if day_index else "") + day_head + "{"
+            for room_index, room in enumerate(day["rooms"]):
+                room_name = str(room["name"])
+                yield (", " if room_index else "") + _dumps(room_name) + ": ["
+                for talk_index, talk in enumerate(room["talks"]):
+                    yield (", " if talk_index else "") + _dumps(
+                        self._get_talk_data(talk, room_name)
+                    )
+                yield "]"
+            yield "}" + day_tail
+        yield "]" + tail
 
 
 class ICalExporter(BaseExporter):
     requires_released_schedule = True
     verbose_name = _("iCal (full event)")
     public = True
+    cacheable = True
     show_public = False
     show_qrcode = True
     icon = "fa-calendar"
@@ -325,12 +377,12 @@ class ICalExporter(BaseExporter):
 
     def get_data(self, **kwargs):
         talks = (
-            self.schedule.talks.filter(is_visible=True)
+            self.schedule.version_talks.filter(is_visible=True)
             .with_sorted_speakers()
             .select_related("submission", "room", "submission__event")
             .order_by("start")
         )
-        return serialize_calendar(get_slots_ical(self.schedule.event, talks))
+        return render_slots_ical(self.schedule.event, talks)
 
 
 class FavedICalExporter(BaseExporter):
@@ -359,6 +411,4 @@ def get_data(self, request, **kwargs):
         slots = request.event.current_schedule.scheduled_talks.filter(
             submission__favourites__user__in=[request.user]
         )
-        return serialize_calendar(
-            get_slots_ical(request.event, slots, prodid_suffix="faved")
-        )
+        return render_slots_ical(request.event, slots, prodid_suffix="faved")
@@ -9,8 +9,12 @@
 
 class CalendarResponse(HttpResponse):
     def __init__(self, calendar, filename, **kwargs):
+        """``calendar`` is either an icalendar Calendar or an already
+        serialised calendar, as returned by ``render_slots_ical``."""
         kwargs.setdefault("content_type", "text/calendar")
-        super().__init__(serialize_calendar(calendar), **kwargs)
+        if not isinstance(calendar, str):
+            calendar = serialize_calendar(calendar)
+        super().__init__(calendar, **kwargs)
         self["Content-Disposition"] = (
             f'attachment; filename="{safe_filename(filename)}.ics"'
         )
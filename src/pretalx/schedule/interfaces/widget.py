@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+from pretalx.person.domain.picture import get_avatar_urls
 from pretalx.schedule.domain.room import rooms_for_schedule
 from pretalx.schedule.enums import SlotType
 from pretalx.submission.domain.queries.submission import annotate_slot_signup_status
@@ -14,7 +15,9 @@ def build_widget_data(
     include_blockers=False,
 ):
     talks = (
-        schedule.talks.all() if all_talks else schedule.talks.filter(is_visible=True)
+        schedule.version_talks.all()
+        if all_talks
+        else schedule.version_talks.filter(is_visible=True)
     )
     if not include_blockers:
         talks = talks.exclude(slot_type=SlotType.BLOCKER)
@@ -102,31 +105,28 @@ def build_widget_data(
         for room in all_event_rooms
         if room in rooms
     ]
-    include_avatar = schedule.event.cfp.request_avatar
-    result["speakers"] = [
-        {
-            "code": speaker.code,
-            "name": speaker.get_display_name(),
-            "avatar": (
-                speaker.get_avatar_url(event=schedule.event) or None
-                if include_avatar
-                else None
-            ),
-            "avatar_thumbnail_default": (
-                speaker.profile_picture.get_avatar_url(
-                    event=schedule.event, thumbnail="default"
-                )
-                if include_avatar and speaker.profile_picture_id
-                else None
-            ),
-            "avatar_thumbnail_tiny": (
-                speaker.profile_picture.get_avatar_url(
-                    event=schedule.event, thumbnail="tiny"
-                )
-                if include_avatar and speaker.profile_picture_id
-                else None
-            ),
-        }
-        for speaker in speakers
-    ]
+    avatar_urls = (
+        get_avatar_urls(
+            {
+                speaker.profile_picture
+                for speaker in speakers
+                if speaker.profile_picture_id
+            },
+            event=schedule.event,
+        )
+        if schedule.event.cfp.request_avatar
+        else {}
+    )
+    result["speakers"] = []
+    for speaker in speakers:
+        urls = avatar_urls.get(speaker.profile_picture_id, {})
+        result["speakers"].append(
+            {
+                "code": speaker.code,
+                "name": speaker.get_display_name(),
+                "avatar": urls.get(None),
+                "avatar_thumbnail_default": urls.get("default"),
+                "avatar_thumbnail_tiny": urls.get("tiny"),
+            }
+        )
     return result
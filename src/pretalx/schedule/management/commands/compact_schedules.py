@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+from django.core.management.base import BaseCommand, CommandError
+from django_scopes import scope, scopes_disabled
+
+from pretalx.event.models import Event
+from pretalx.schedule.domain.release import share_unchanged_event_slots
+
+
+class Command(BaseCommand):
+    help = "Store slots that did not change between schedule releases only once"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--event", type=str, help="Slug of the event. Default: all events"
+        )
+
+    def handle(self, *args, **options):
+        with scopes_disabled():
+            events = Event.objects.all().order_by("pk")
+            if event_slug := options.get("event"):
+                events = events.filter(slug__iexact=event_slug)
+                if not events.exists():
+                    raise CommandError(
+                        f'Could not find event with slug "{event_slug}".'
+                    )
+            events = list(events)
+
+        for event in events:
+            with scope(event=event):
+                shared = share_unchanged_event_slots(event)
+            if shared:
+                self.stdout.write(f"{event.slug}: shared {shared} slots")
@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+# Generated by Django 6.0.9 on 2026-10-17 12:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("schedule", "0019_room_hidden")]
+
+    operations = [
+        migrations.AddField(
+            model_name="talkslot",
+            name="first_schedule",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="schedule.schedule",
+            ),
+        )
+    ]
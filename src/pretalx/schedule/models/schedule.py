@@ -19,6 +19,7 @@
 from pretalx.person.rules import is_reviewer
 from pretalx.schedule.enums import SlotType
 from pretalx.schedule.models.availability import Availability
+from pretalx.schedule.models.slot import TalkSlot
 from pretalx.schedule.validators.schedule import validate_unique_version
 from pretalx.submission.models import Submission
 from pretalx.submission.rules import is_wip, orga_can_change_submissions
@@ -75,13 +76,22 @@ class urls(EventUrls):
         nojs = "{public}nojs"
         changelog_entry = "{self.event.urls.changelog}{self.url_version}/"
 
+    @property
+    def version_talks(self):
+        """Returns all :class:`~pretalx.schedule.models.slot.TalkSlot` objects
+        in this schedule, including the ones shared with older versions.
+
+        ``talks`` only contains the slots whose latest version is this
+        schedule, which is the same for the WIP and the current schedule."""
+        return TalkSlot.objects.in_schedule(self)
+
     @cached_property
     def scheduled_talks(self):
         """Returns all :class:`~pretalx.schedule.models.slot.TalkSlot` objects
         that have been scheduled and are visible in the schedule (that is, have
         been confirmed at the time of release)."""
         return (
-            self.talks.select_related("submission", "submission__event", "room")
+            self.version_talks.select_related("submission", "submission__event", "room")
             .with_sorted_speakers()
             .filter(
                 room__isnull=False,
@@ -93,11 +103,15 @@ def scheduled_talks(self):
 
     @cached_property
     def breaks(self):
-        return self.talks.select_related("room").filter(slot_type=SlotType.BREAK)
+        return self.version_talks.select_related("room").filter(
+            slot_type=SlotType.BREAK
+        )
 
     @cached_property
     def blockers(self):
-        return self.talks.select_related("room").filter(slot_type=SlotType.BLOCKER)
+        return self.version_talks.select_related("room").filter(
+            slot_type=SlotType.BLOCKER
+        )
 
     @cached_property
     def slots(self):
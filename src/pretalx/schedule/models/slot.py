@@ -12,6 +12,8 @@
 
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Q
+from django.db.models.query import ModelIterable
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django_scopes import ScopedManager
@@ -38,7 +40,59 @@
 FRAB_SLUG_REGEX = re.compile(f"[^{string.ascii_letters + string.digits + '-'}]")
 
 
+def slot_in_schedule_q(schedule, prefix=""):
+    """Matches the slots of ``schedule``.
+
+    Slots that did not change between releases are stored once and shared
+    by all versions from ``first_schedule`` up to ``schedule``, which is the
+    latest version containing them. Versions are ordered by their release
+    time. WIP schedules never share their slots.
+    Use prefix="slots__" when filtering submissions.
+    """
+    lookup = Q(**{f"{prefix}schedule": schedule})
+    if not schedule.version or not schedule.published:
+        return lookup
+    return lookup | Q(
+        **{
+            f"{prefix}schedule__event_id": schedule.event_id,
+            f"{prefix}first_schedule__published__lte": schedule.published,
+            f"{prefix}schedule__published__gt": schedule.published,
+        }
+    )
+
+
+class ScheduleSlotIterable(ModelIterable):
+    """Points ``slot.schedule`` of shared slots to the schedule they were
+    loaded from instead of the latest version containing them."""
+
+    def __iter__(self):
+        schedule = self.queryset._schedule  # noqa: SLF001 -- set by in_schedule
+        for slot in super().__iter__():
+            slot.schedule = schedule
+            yield slot
+
+
 class TalkSlotQuerySet(models.QuerySet):
+    _schedule = None
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._schedule = self._schedule  # noqa: SLF001 -- same-class copy
+        return clone
+
+    def in_schedule(self, schedule):
+        queryset = self.filter(slot_in_schedule_q(schedule))
+        queryset._schedule = schedule  # noqa: SLF001 -- same-class copy
+        # Keep the iterable of values() and values_list() querysets.
+        if queryset._iterable_class is ModelIterable:  # noqa: SLF001 -- Django QuerySet internal
+            queryset._iterable_class = ScheduleSlotIterable  # noqa: SLF001 -- Django QuerySet internal
+        return queryset
+
+    def create(self, **kwargs):
+        if self._schedule is not None:
+            kwargs.setdefault("schedule", self._schedule)
+        return super().create(**kwargs)
+
     def with_sorted_speakers(self):
         from pretalx.submission.domain.queries.submission import (  # noqa: PLC0415 -- thin method
             sorted_speakers_prefetch,
@@ -56,7 +110,10 @@ class TalkSlot(PretalxModel):
 
     :class:`~pretalx.submission.models.submission.Submission`.
 
-    TalkSlots always belong to one submission and one :class:`~pretalx.schedule.models.schedule.Schedule`.
+    TalkSlots always belong to one submission. They belong to one
+    :class:`~pretalx.schedule.models.schedule.Schedule`, or, if they did not
+    change between releases, to all versions from ``first_schedule`` to
+    ``schedule``.
 
     :param is_visible: This parameter is set on schedule release. Only confirmed talks will be visible.
     :param slot_type: For non-submission slots, distinguishes breaks (visible) from blockers (hidden).
@@ -78,9 +135,19 @@ class TalkSlot(PretalxModel):
         null=True,
         blank=True,
     )
+    # The latest schedule version containing this slot. Released versions
+    # share unchanged slots, so use Schedule.version_talks to find all slots
+    # of an older version.
     schedule = models.ForeignKey(
         to="schedule.Schedule", on_delete=models.PROTECT, related_name="talks"
     )
+    first_schedule = models.ForeignKey(
+        to="schedule.Schedule",
+        on_delete=models.PROTECT,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
     is_visible = models.BooleanField(default=False)
     slot_type = models.CharField(
         max_length=10,
@@ -214,9 +281,9 @@ def id_suffix(self):
         if not self.event.get_feature_flag("present_multiple_times"):
             return ""
         all_slots = list(
-            TalkSlot.objects.filter(
-                submission_id=self.submission_id, schedule_id=self.schedule_id
-            ).order_by("start")
+            TalkSlot.objects.in_schedule(self.schedule)
+            .filter(submission_id=self.submission_id)
+            .order_by("start")
         )
         if len(all_slots) == 1:
             return ""
@@ -1,9 +1,33 @@
 # SPDX-FileCopyrightText: 2018-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
+from django_scopes import scopes_disabled
 
+from pretalx.common.models.deletion import deletions_recorded, record_deletion
 from pretalx.common.signals import register_data_exporters
+from pretalx.event.models import Event
+from pretalx.person.models import ProfilePicture, SpeakerProfile, User
+from pretalx.schedule.domain.artifacts import invalidate_export_data
+from pretalx.schedule.domain.feed import publish_slot_changes
+from pretalx.schedule.domain.warnings import (
+    invalidate_event_overlap_indexes,
+    remove_from_overlap_index,
+    update_overlap_index,
+)
+from pretalx.schedule.models import Room, Schedule, TalkSlot
+from pretalx.schedule.signals import schedule_release
+from pretalx.submission.models import (
+    CfP,
+    Resource,
+    SpeakerRole,
+    Submission,
+    SubmissionType,
+    Track,
+)
 
 
 @receiver(register_data_exporters, dispatch_uid="exporter_builtin_ical")
@@ -49,3 +73,178 @@ def register_json_exporter(sender, **kwargs):
     )
 
     return FrabJsonExporter
+
+
+@receiver(schedule_release, dispatch_uid="schedule_build_export_artifacts")
+def build_export_artifacts_on_release(sender, schedule, **kwargs):
+    from pretalx.schedule.tasks import (  # noqa: PLC0415 -- receiver
+        task_build_export_artifacts,
+    )
+
+    transaction.on_commit(
+        lambda: task_build_export_artifacts.apply_async(
+            kwargs={"schedule_id": schedule.pk}, ignore_result=True
+        )
+    )
+
+
+def _released_slot_event_id(slot):
+    """The event of ``slot`` if it belongs to a released schedule. Slots of
+    the WIP schedule are neither exported nor sent to syncing clients."""
+    if TalkSlot.schedule.is_cached(slot):
+        schedule = slot.schedule
+        return schedule.event_id if schedule.version else None
+    with scopes_disabled():
+        return (
+            Schedule.objects.filter(pk=slot.schedule_id, version__isnull=False)
+            .values_list("event_id", flat=True)
+            .first()
+        )
+
+
+def _submission_event_id(instance):
+    """The event of the submission that ``instance`` belongs to."""
+    if type(instance).submission.is_cached(instance):
+        return instance.submission.event_id
+    with scopes_disabled():
+        return (
+            Submission.all_objects.filter(pk=instance.submission_id)
+            .values_list("event_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_delete, sender=TalkSlot, dispatch_uid="deleted_object_talkslot")
+def record_talkslot_deletion(sender, instance, **kwargs):
+    if not deletions_recorded():
+        return
+    event_id = _released_slot_event_id(instance)
+    record_deletion(instance, event_id=event_id)
+    if event_id:
+        invalidate_export_data(event_id)
+
+
+@receiver(post_save, sender=TalkSlot, dispatch_uid="schedule_feed_talkslot_save")
+def publish_slot_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        publish_slot_changes(instance.schedule_id, changed=[instance.pk])
+
+
+@receiver(post_delete, sender=TalkSlot, dispatch_uid="schedule_feed_talkslot_delete")
+def publish_slot_deletion(sender, instance, **kwargs):
+    publish_slot_changes(instance.schedule_id, deleted=[instance.pk])
+
+
+@receiver(post_save, sender=TalkSlot, dispatch_uid="overlap_index_talkslot_save")
+def update_overlap_index_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        update_overlap_index(instance)
+
+
+@receiver(post_delete, sender=TalkSlot, dispatch_uid="overlap_index_talkslot_delete")
+def update_overlap_index_on_delete(sender, instance, **kwargs):
+    remove_from_overlap_index(instance)
+
+
+@receiver(post_save, sender=SpeakerRole, dispatch_uid="speaker_caches_role_save")
+@receiver(post_delete, sender=SpeakerRole, dispatch_uid="speaker_caches_role_delete")
+def invalidate_speaker_caches_on_role_change(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if event_id := _submission_event_id(instance):
+        invalidate_event_overlap_indexes(event_id)
+        invalidate_export_data(event_id)
+
+
+@receiver(
+    m2m_changed,
+    sender=Submission.speakers.through,
+    dispatch_uid="speaker_caches_speakers_changed",
+)
+def invalidate_speaker_caches_on_speakers_change(sender, instance, action, **kwargs):
+    # ``speakers.add()`` bulk-creates roles without post_save signals.
+    # Submissions and speakers both belong to the event that is affected.
+    if action == "post_add":
+        invalidate_event_overlap_indexes(instance.event_id)
+        invalidate_export_data(instance.event_id)
+
+
+@receiver(post_save, sender=User, dispatch_uid="export_data_user_save")
+@scopes_disabled()
+def invalidate_export_data_on_user_save(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    # Speakers without a name of their own are exported with their user's
+    # name, which is not tracked by the export data version.
+    if raw or (update_fields is not None and "name" not in update_fields):
+        return
+    profiles = SpeakerProfile.objects.filter(user=instance).filter(
+        Q(name__isnull=True) | Q(name="")
+    )
+    for event_id in profiles.values_list("event_id", flat=True):
+        invalidate_export_data(event_id)
+
+
+def _skip_export_data(signal, raw):
+    """Fixture loading needs no invalidation, and neither do unrecorded
+    deletions, which remove whole events or slots that were never exported.
+    Skipping them keeps those bulk deletions cheap."""
+    return raw or (signal in (pre_delete, post_delete) and not deletions_recorded())
+
+
+@receiver(post_save, sender=Event, dispatch_uid="export_data_event_save")
+def invalidate_export_data_on_event_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_export_data(instance.pk)
+
+
+@receiver(post_save, sender=Submission, dispatch_uid="export_data_submission_save")
+@receiver(post_delete, sender=Submission, dispatch_uid="export_data_submission_delete")
+@receiver(post_save, sender=SpeakerProfile, dispatch_uid="export_data_speaker_save")
+@receiver(post_delete, sender=SpeakerProfile, dispatch_uid="export_data_speaker_delete")
+@receiver(post_save, sender=Room, dispatch_uid="export_data_room_save")
+@receiver(post_delete, sender=Room, dispatch_uid="export_data_room_delete")
+@receiver(post_save, sender=Track, dispatch_uid="export_data_track_save")
+@receiver(post_delete, sender=Track, dispatch_uid="export_data_track_delete")
+@receiver(post_save, sender=SubmissionType, dispatch_uid="export_data_type_save")
+@receiver(post_delete, sender=SubmissionType, dispatch_uid="export_data_type_delete")
+@receiver(post_save, sender=CfP, dispatch_uid="export_data_cfp_save")
+def invalidate_export_data_on_event_data_change(
+    sender, instance, signal, raw=False, **kwargs
+):
+    if not _skip_export_data(signal, raw):
+        invalidate_export_data(instance.event_id)
+
+
+# Deleted slots are handled by record_talkslot_deletion.
+@receiver(post_save, sender=TalkSlot, dispatch_uid="export_data_talkslot_save")
+def invalidate_export_data_on_slot_save(sender, instance, raw=False, **kwargs):
+    if not raw and (event_id := _released_slot_event_id(instance)):
+        invalidate_export_data(event_id)
+
+
+@receiver(post_save, sender=Resource, dispatch_uid="export_data_resource_save")
+@receiver(post_delete, sender=Resource, dispatch_uid="export_data_resource_delete")
+def invalidate_export_data_on_resource_change(
+    sender, instance, signal, raw=False, **kwargs
+):
+    if _skip_export_data(signal, raw):
+        return
+    if event_id := _submission_event_id(instance):
+        invalidate_export_data(event_id)
+
+
+@receiver(post_save, sender=ProfilePicture, dispatch_uid="export_data_picture_save")
+# Deleting a picture unsets it on its speakers without saving them, so they
+# have to be looked up before.
+@receiver(pre_delete, sender=ProfilePicture, dispatch_uid="export_data_picture_delete")
+@scopes_disabled()
+def invalidate_export_data_on_picture_change(
+    sender, instance, signal, raw=False, **kwargs
+):
+    if _skip_export_data(signal, raw):
+        return
+    for event_id in (
+        instance.speakers.order_by().values_list("event_id", flat=True).distinct()
+    ):
+        invalidate_export_data(event_id)
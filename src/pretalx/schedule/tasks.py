@@ -1,18 +1,66 @@
 # SPDX-FileCopyrightText: 2025-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
-from django_scopes import scope
+from functools import partial
+
+from django_scopes import scope, scopes_disabled
 
 from pretalx.celery_app import app
+from pretalx.common.tasks import progress_callback
 
 
-@app.task(name="pretalx.schedule.update_unreleased_schedule_changes")
-def task_update_unreleased_schedule_changes(event=None, value=None):
+@app.task(bind=True, name="pretalx.schedule.update_unreleased_schedule_changes")
+def task_update_unreleased_schedule_changes(self, event=None, value=None):
     from pretalx.event.models import Event  # noqa: PLC0415 -- leaf
     from pretalx.schedule.domain.changes import (  # noqa: PLC0415 -- leaf
+        get_unreleased_schedule_changes_delay,
+        reset_unreleased_schedule_changes_update,
         update_unreleased_schedule_changes,
     )
 
     event = Event.objects.get(slug=event)
+    if value is None:
+        # Edits arrived since this task was queued: wait for the quiet
+        # period to pass. Eager tasks cannot be delayed and run right away.
+        delay = get_unreleased_schedule_changes_delay(event)
+        if delay and not self.request.is_eager:
+            self.apply_async(
+                kwargs={"event": event.slug}, countdown=delay, ignore_result=True
+            )
+            return
+        reset_unreleased_schedule_changes_update(event)
     with scope(event=event):
         update_unreleased_schedule_changes(event=event, value=value)
+
+
+@app.task(name="pretalx.schedule.build_export_artifacts")
+def task_build_export_artifacts(*, schedule_id):
+    from pretalx.schedule.domain.artifacts import (  # noqa: PLC0415 -- leaf
+        build_export_artifacts,
+    )
+    from pretalx.schedule.models import Schedule  # noqa: PLC0415 -- leaf
+
+    with scopes_disabled():
+        schedule = (
+            Schedule.objects.filter(pk=schedule_id).select_related("event").first()
+        )
+    if not schedule:
+        return None
+    with scope(event=schedule.event):
+        return build_export_artifacts(schedule)
+
+
+@app.task(bind=True, name="pretalx.schedule.generate_notifications")
+def task_generate_notifications(self, *, schedule_id):
+    from pretalx.schedule.domain.notifications import (  # noqa: PLC0415 -- leaf
+        generate_notifications,
+    )
+    from pretalx.schedule.models import Schedule  # noqa: PLC0415 -- leaf
+
+    with scopes_disabled():
+        schedule = Schedule.objects.select_related("event").get(pk=schedule_id)
+    with scope(event=schedule.event):
+        mails = generate_notifications(
+            schedule, progress=partial(progress_callback, self)
+        )
+    return {"count": len(mails)}
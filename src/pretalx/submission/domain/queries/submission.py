@@ -43,6 +43,20 @@ def sorted_speakers_prefetch(prefix=""):
     )
 
 
+def schedule_slots_prefetch(schedule, *, visible_only=False):
+    """Prefetch for the slots of a single schedule version.
+
+    Prefetching plain ``slots`` loads the slots of every schedule release
+    and of the WIP schedule.
+    """
+    if not schedule:
+        return Prefetch("slots", queryset=TalkSlot.objects.none())
+    queryset = TalkSlot.objects.in_schedule(schedule)
+    if visible_only:
+        queryset = queryset.filter(is_visible=True)
+    return Prefetch("slots", queryset=queryset)
+
+
 def filter_submissions_by_state(qs, state_filter):
     """Filter by an iterable of state values.
 
@@ -78,46 +92,33 @@ def speaker_search_q(query, prefix="", include_email=True):
 def search_submissions(qs, query, *, can_view_speakers, fulltext=False):
     """Free-text search over submissions.
 
-    With ``can_view_speakers=False`` the search honours anonymisation: redacted
-    fields are matched against the anonymised value instead of the original.
+    Searches the submissions' search documents (see
+    :mod:`pretalx.submission.domain.search`) instead of joining the
+    speaker tables. With ``can_view_speakers=False`` the search honours
+    anonymisation: redacted fields are matched against the anonymised value
+    instead of the original, and speaker names are not searched.
     With ``fulltext=True`` the search expands to abstract/description/notes/
     internal_notes in addition to the per-permission default fields.
     """
     if not query:
         return qs
-    fields = ["code__icontains", "title__icontains"]
-    if fulltext:
-        fields += [
-            "description__icontains",
-            "abstract__icontains",
-            "notes__icontains",
-            "internal_notes__icontains",
-        ]
-    if not can_view_speakers:
-        return _anonymised_search(qs, query, fields)
-    filters = speaker_search_q(query, prefix="speakers__", include_email=False)
-    for field in fields:
-        filters |= Q(**{field: query})
-    return qs.filter(filters)
-
-
-def _anonymised_search(qs, query, fields):
-    # Fields where the anonymised value should be searched instead of the
-    # original when the reviewer cannot see speaker names.
-    anonymisable = {"title", "description", "abstract", "notes"}
-    redacted = Q(anonymised___anonymised=True)
+    if can_view_speakers:
+        fields = ["text", "speakers"] + (["content"] if fulltext else [])
+        fallback_fields = ["code", "title"] + (
+            ["description", "abstract", "notes", "internal_notes"] if fulltext else []
+        )
+    else:
+        fields = ["anonymised_text"] + (["anonymised_content"] if fulltext else [])
+        fallback_fields = ["code"]
     filters = Q()
     for field in fields:
-        match = Q(**{field: query})
-        base = field.split("__")[0]
-        if base not in anonymisable:
-            filters |= match
-            continue
-        # The original value matches unless this field was redacted; the
-        # anonymised value is searched only when the field was redacted.
-        filters |= match & (~redacted | ~Q(anonymised__has_key=base))
-        filters |= redacted & Q(**{f"anonymised__{field}": query})
-    return qs.filter(filters)
+        filters |= Q(**{f"search_document__{field}__icontains": query})
+    # Submissions created with bulk_create have no search document, so
+    # they are matched on their own fields.
+    fallback = Q()
+    for field in fallback_fields:
+        fallback |= Q(**{f"{field}__icontains": query})
+    return qs.filter(filters | (Q(search_document__isnull=True) & fallback))
 
 
 # ``set_submission_state`` clears ``is_featured`` on transitions into these
@@ -2,11 +2,15 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
 import itertools
+from collections import defaultdict
 
 from django.core.exceptions import ValidationError
+from django.db.models import DecimalField, Exists, F, OuterRef, Q, Sum
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
+from pretalx.submission.models import Review, ReviewPhase
+
 
 def create_or_update_review(*, submission, user, text, scores=()):
     review, created = submission.reviews.get_or_create(
@@ -35,14 +39,85 @@ def update_review_score(review):
     review.save()
 
 
-def recalculate_event_scores(event):
-    for review in event.reviews.all():
-        update_review_score(review)
+def get_score_configurations(event):
+    """Group the event's tracks by the score categories that apply to
+    their submissions, mirroring ``Submission.score_categories``.
+
+    Returns a ``{category_ids: track_ids}`` dict, where a track ID of
+    ``None`` stands for submissions without a track.
+    """
+    categories = list(
+        event.score_categories.filter(active=True).prefetch_related("limit_tracks")
+    )
+    configurations = defaultdict(list)
+    for track_id in (None, *event.tracks.values_list("pk", flat=True)):
+        category_ids = frozenset(
+            category.pk
+            for category in categories
+            if not category.limit_tracks.all()
+            or any(track.pk == track_id for track in category.limit_tracks.all())
+        )
+        configurations[category_ids].append(track_id)
+    return configurations
+
+
+def recalculate_scores(event, reviews, *, progress=None):
+    """Recompute ``score`` for all ``reviews`` of ``event`` in bulk.
+
+    Runs one aggregate query per score configuration (see
+    :func:`get_score_configurations`) instead of one query per review, and
+    writes changed scores back with ``bulk_update``. ``progress`` is an
+    optional ``(current, total)`` callback, called once per configuration.
+    Returns the number of changed reviews.
+    """
+    configurations = get_score_configurations(event)
+    track_configurations = {
+        track_id: category_ids
+        for category_ids, track_ids in configurations.items()
+        for track_id in track_ids
+    }
+    reviews_by_configuration = defaultdict(dict)
+    for review in reviews.select_related("submission").only(
+        "pk", "score", "submission__track_id"
+    ):
+        category_ids = track_configurations[review.submission.track_id]
+        reviews_by_configuration[category_ids][review.pk] = review
+
+    changed = []
+    timestamp = now()
+    for index, category_ids in enumerate(configurations, start=1):
+        if group := reviews_by_configuration.get(category_ids):
+            totals = dict(
+                Review.scores.through.objects.filter(
+                    review_id__in=group, reviewscore__category_id__in=category_ids
+                )
+                .values("review_id")
+                .annotate(
+                    total=Sum(
+                        F("reviewscore__value") * F("reviewscore__category__weight"),
+                        output_field=DecimalField(max_digits=10, decimal_places=2),
+                    )
+                )
+                .values_list("review_id", "total")
+            )
+            for review in group.values():
+                score = totals.get(review.pk)
+                if review.score != score:
+                    review.score = score
+                    review.updated = timestamp
+                    changed.append(review)
+        if progress:
+            progress(index, len(configurations))
+    Review.objects.bulk_update(changed, ["score", "updated"], batch_size=500)
+    return len(changed)
+
+
+def recalculate_event_scores(event, *, progress=None):
+    return recalculate_scores(event, event.reviews.all(), progress=progress)
 
 
 def recalculate_submission_scores(submission):
-    for review in submission.reviews.all():
-        update_review_score(review)
+    return recalculate_scores(submission.event, submission.reviews.all())
 
 
 def validate_review_phases(event):
@@ -78,6 +153,20 @@ def _is_within_window(phase, _now):
     )
 
 
+def review_phase_update_due(_now=None):
+    """A filter for events on which ``update_review_phase`` would change the
+    active review phase, evaluated in the database."""
+    _now = _now or now()
+    phases = ReviewPhase.objects.filter(event=OuterRef("pk"))
+    active = phases.filter(is_active=True)
+    within_window = (Q(start__isnull=True) | Q(start__lte=_now)) & (
+        Q(end__isnull=True) | Q(end__gte=_now)
+    )
+    return Exists(active.filter(Q(start__gt=_now) | Q(end__lt=_now))) | (
+        ~Exists(active) & Exists(phases.filter(within_window))
+    )
+
+
 def update_review_phase(event):
     """Advance ``event`` to the next review phase if the current one has
     ended (or has not started yet).
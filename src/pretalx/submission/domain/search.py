@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+import itertools
+from collections import defaultdict
+
+from django_scopes import scopes_disabled
+
+from pretalx.submission.models import SpeakerRole, SubmissionSearchDocument
+
+# Fields whose anonymised value replaces the original in the anonymised
+# columns, if the submission was redacted. ``internal_notes`` is never
+# shown to speakers and is therefore never anonymised.
+ANONYMISABLE_FIELDS = ("title", "description", "abstract", "notes")
+CONTENT_FIELDS = ("description", "abstract", "notes", "internal_notes")
+# Submission fields that end up in the search document; saves that touch
+# none of them leave the document alone.
+INDEXED_FIELDS = frozenset(("code", "title", "anonymised", *CONTENT_FIELDS))
+DOCUMENT_FIELDS = (
+    "text",
+    "anonymised_text",
+    "speakers",
+    "content",
+    "anonymised_content",
+)
+SEARCH_INDEX_BATCH_SIZE = 500
+
+
+def _join(values):
+    # Values are separated by newlines, which search queries never
+    # contain, so a match cannot span two fields.
+    return "\n".join(str(value) for value in values if value)
+
+
+def _anonymised_value(submission, field):
+    anonymised = submission.anonymised or {}
+    if (
+        field in ANONYMISABLE_FIELDS
+        and anonymised.get("_anonymised")
+        and field in anonymised
+    ):
+        return anonymised[field]
+    return getattr(submission, field)
+
+
+def get_search_document_values(submission, speaker_names=()):
+    """Compute the search document columns for a submission."""
+    return {
+        "text": _join((submission.code, submission.title)),
+        "anonymised_text": _join(
+            (submission.code, _anonymised_value(submission, "title"))
+        ),
+        "speakers": _join(speaker_names),
+        "content": _join(getattr(submission, field) for field in CONTENT_FIELDS),
+        "anonymised_content": _join(
+            _anonymised_value(submission, field) for field in CONTENT_FIELDS
+        ),
+    }
+
+
+def get_speaker_names(submission_ids):
+    """Map submission IDs to the speaker profile and user names of their
+    speakers, in one query."""
+    names = defaultdict(list)
+    roles = SpeakerRole.objects.filter(submission_id__in=submission_ids).values_list(
+        "submission_id", "speaker__name", "speaker__user__name"
+    )
+    for submission_id, *speaker_names in roles:
+        names[submission_id].extend(speaker_names)
+    return names
+
+
+def update_search_documents(submissions):
+    """Create or refresh the search documents of the given submissions.
+
+    Accepts any iterable of submissions, including querysets, which are
+    processed in batches.
+    """
+    with scopes_disabled():
+        submissions = iter(submissions)
+        updated = 0
+        while batch := list(itertools.islice(submissions, SEARCH_INDEX_BATCH_SIZE)):
+            speaker_names = get_speaker_names([submission.pk for submission in batch])
+            SubmissionSearchDocument.objects.bulk_create(
+                [
+                    SubmissionSearchDocument(
+                        submission_id=submission.pk,
+                        **get_search_document_values(
+                            submission, speaker_names[submission.pk]
+                        ),
+                    )
+                    for submission in batch
+                ],
+                update_conflicts=True,
+                unique_fields=["submission"],
+                update_fields=DOCUMENT_FIELDS,
+            )
+            updated += len(batch)
+    return updated
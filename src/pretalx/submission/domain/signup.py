@@ -1,13 +1,19 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
-from django.db import transaction
+import logging
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from pretalx.common.exceptions import SubmissionError
 from pretalx.person.models import AttendeeProfile
 from pretalx.submission.enums import AttendeeSignupStates
-from pretalx.submission.models import AttendeeSignup, Submission
+from pretalx.submission.models import AttendeeSignup, AttendeeSignupCount
+
+logger = logging.getLogger(__name__)
 
 
 def email_domain_allowed(event, email):
@@ -44,6 +50,26 @@ def get_confirmed_signup_for_user(submission, user):
     return None
 
 
+def _claim_seat(submission, capacity):
+    """Count one more confirmed signup on ``submission``, unless it already
+    has ``capacity`` of them. The check and the increment are a single
+    conditional UPDATE, so that concurrent signups never need to count.
+    The counter row is created on the first signup."""
+    AttendeeSignupCount.objects.bulk_create(
+        [AttendeeSignupCount(submission=submission)], ignore_conflicts=True
+    )
+    seats = AttendeeSignupCount.objects.filter(submission=submission)
+    if capacity is not None:
+        seats = seats.filter(count__lt=capacity)
+    return bool(seats.update(count=F("count") + 1))
+
+
+def release_seat(submission_id):
+    AttendeeSignupCount.objects.filter(submission_id=submission_id, count__gt=0).update(
+        count=F("count") - 1
+    )
+
+
 def create_signup(submission, *, user):
     event = submission.event
     if not event.get_feature_flag("attendee_signup"):
@@ -54,41 +80,88 @@ def create_signup(submission, *, user):
         # Not revealing email domain config
         raise SubmissionError(_("You cannot sign up for this session."))
 
+    capacity = submission.effective_signup_capacity
     with transaction.atomic():
-        locked = Submission.objects.select_for_update().get(pk=submission.pk)
         profile, _created = AttendeeProfile.objects.get_or_create(
             event=event, user=user
         )
-        signup = locked.attendee_signups.filter(attendee=profile).first()
-        if signup and signup.state == AttendeeSignupStates.CONFIRMED:
-            return signup
-        capacity = locked.effective_signup_capacity
-        if capacity is not None:
-            current = locked.attendee_signups.filter(
-                state=AttendeeSignupStates.CONFIRMED
-            ).count()
-            if current >= capacity:
-                raise SubmissionError(_("This session is currently full."))
+        signup = submission.attendee_signups.filter(attendee=profile).first()
         if signup is None:
-            signup = AttendeeSignup.objects.create(
-                submission=locked,
-                attendee=profile,
-                state=AttendeeSignupStates.CONFIRMED,
-            )
-        else:
-            signup.state = AttendeeSignupStates.CONFIRMED
-            signup.save(update_fields=["state"])
+            try:
+                with transaction.atomic():
+                    signup = AttendeeSignup.objects.create(
+                        submission=submission,
+                        attendee=profile,
+                        state=AttendeeSignupStates.CONFIRMED,
+                    )
+            except IntegrityError:
+                # A concurrent request of the same user was faster.
+                return submission.attendee_signups.get(attendee=profile)
+        elif signup.state == AttendeeSignupStates.CONFIRMED:
+            return signup
+        elif not submission.attendee_signups.filter(
+            pk=signup.pk, state=AttendeeSignupStates.CANCELED
+        ).update(state=AttendeeSignupStates.CONFIRMED):
+            # Confirmed by a concurrent request of the same user
+            signup.refresh_from_db()
+            return signup
+        signup.state = AttendeeSignupStates.CONFIRMED
         signup.log_action(".signup", person=user)
+        # Claiming the seat locks the submission row until the commit, so
+        # it comes last.
+        if not _claim_seat(submission, capacity):
+            raise SubmissionError(_("This session is currently full."))
     return signup
 
 
 def cancel_signup(submission, *, user):
+    signup = get_confirmed_signup_for_user(submission, user)
+    if not signup:
+        return None
     with transaction.atomic():
-        locked = Submission.objects.select_for_update().get(pk=submission.pk)
-        signup = get_confirmed_signup_for_user(locked, user)
-        if not signup:
+        if not submission.attendee_signups.filter(
+            pk=signup.pk, state=AttendeeSignupStates.CONFIRMED
+        ).update(state=AttendeeSignupStates.CANCELED):
+            # Cancelled by a concurrent request
             return None
         signup.state = AttendeeSignupStates.CANCELED
-        signup.save(update_fields=["state"])
         signup.log_action(".cancel", person=user)
+        release_seat(submission.pk)
     return signup
+
+
+def reconcile_signup_counts(submissions):
+    """Reset the confirmed signup counter of all ``submissions`` whose counter
+    does not match their confirmed :class:`AttendeeSignup` rows, and return
+    how many were off."""
+    confirmed = Coalesce(
+        Subquery(
+            AttendeeSignup._base_manager.filter(
+                submission=OuterRef("pk"), state=AttendeeSignupStates.CONFIRMED
+            )
+            .order_by()
+            .values("submission")
+            .annotate(count=Count("pk"))
+            .values("count")
+        ),
+        0,
+    )
+    drifted = list(
+        submissions.annotate(
+            _confirmed=confirmed, _counted=Coalesce("signup_count__count", 0)
+        )
+        .exclude(_counted=F("_confirmed"))
+        .values_list("pk", flat=True)
+    )
+    if drifted:
+        with transaction.atomic():
+            AttendeeSignupCount.objects.bulk_create(
+                [AttendeeSignupCount(submission_id=pk) for pk in drifted],
+                ignore_conflicts=True,
+            )
+            # Wait for running signups, so that the recount includes them.
+            seats = AttendeeSignupCount.objects.filter(submission_id__in=drifted)
+            list(seats.select_for_update().values_list("pk", flat=True))
+            seats.update(count=confirmed)
+        logger.warning("Reconciled signup counts of %s sessions.", len(drifted))
+    return len(drifted)
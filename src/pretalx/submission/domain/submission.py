@@ -18,8 +18,9 @@
 from pretalx.mail.domain.send import send_draft, send_transient
 from pretalx.mail.domain.template import mail_template_by_role
 from pretalx.mail.enums import MailTemplateRoles
+from pretalx.schedule.domain.artifacts import invalidate_export_data
+from pretalx.schedule.domain.changes import queue_unreleased_schedule_changes_update
 from pretalx.schedule.domain.slot import move_slot
-from pretalx.schedule.tasks import task_update_unreleased_schedule_changes
 from pretalx.submission.domain.access_code import redeem_access_code
 from pretalx.submission.domain.invitation import send_invitation
 from pretalx.submission.domain.review import recalculate_submission_scores
@@ -317,6 +318,8 @@ def pin_signup_required(submissions):
         Submission._base_manager.filter(pk__in=[s.pk for s in affected]).update(
             attendee_signup_required=True
         )
+        for event_id in {submission.event_id for submission in affected}:
+            invalidate_export_data(event_id)
     return affected
 
 
@@ -359,9 +362,7 @@ def set_wip_slot(submission, *, room, start, end):
         if slot is None:  # accepted submission with no wip slot — should not happen
             return
         move_slot(slot, start, room=room, end=end)
-    task_update_unreleased_schedule_changes.apply_async(
-        kwargs={"event": submission.event.slug}
-    )
+    queue_unreleased_schedule_changes_update(submission.event)
 
 
 def send_state_mail(submission):
@@ -491,6 +492,7 @@ def add_speaker(submission, speaker, *, log_user=None):
     submission.speaker_roles.filter(speaker=speaker).update(
         position=(max_position or 0) + 1
     )
+    invalidate_export_data(submission.event_id)
     if log_user:
         submission.log_action(
             "pretalx.submission.speakers.add",
@@ -515,6 +517,7 @@ def reorder_speakers(submission, *, role_ids, person=None, orga=True):
             raise ValueError(f"Unknown speaker role: {pk!r}")
         role_map[pk].position = index
     SpeakerRole.objects.bulk_update(role_map.values(), ["position"])
+    invalidate_export_data(submission.event_id)
 
     new_order = "\n".join(
         f"- {role_map[pk].speaker.get_display_name()}"
@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+import itertools
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+ANONYMISABLE_FIELDS = ("title", "description", "abstract", "notes")
+CONTENT_FIELDS = ("description", "abstract", "notes", "internal_notes")
+
+
+def _join(values):
+    return "\n".join(str(value) for value in values if value)
+
+
+def _anonymised_value(submission, field):
+    anonymised = submission.anonymised or {}
+    if (
+        field in ANONYMISABLE_FIELDS
+        and anonymised.get("_anonymised")
+        and field in anonymised
+    ):
+        return anonymised[field]
+    return getattr(submission, field)
+
+
+def build_search_documents(apps, schema_editor):
+    Submission = apps.get_model("submission", "Submission")
+    SpeakerRole = apps.get_model("submission", "SpeakerRole")
+    SubmissionSearchDocument = apps.get_model("submission", "SubmissionSearchDocument")
+    submissions = Submission.objects.order_by("pk").iterator(chunk_size=BATCH_SIZE)
+    while batch := list(itertools.islice(submissions, BATCH_SIZE)):
+        speaker_names = defaultdict(list)
+        for submission_id, *names in SpeakerRole.objects.filter(
+            submission_id__in=[submission.pk for submission in batch]
+        ).values_list("submission_id", "speaker__name", "speaker__user__name"):
+            speaker_names[submission_id].extend(names)
+        SubmissionSearchDocument.objects.bulk_create(
+            SubmissionSearchDocument(
+                submission_id=submission.pk,
+                text=_join((submission.code, submission.title)),
+                anonymised_text=_join(
+                    (submission.code, _anonymised_value(submission, "title"))
+                ),
+                speakers=_join(speaker_names[submission.pk]),
+                content=_join(getattr(submission, field) for field in CONTENT_FIELDS),
+                anonymised_content=_join(
+                    _anonymised_value(submission, field) for field in CONTENT_FIELDS
+                ),
+            )
+            for submission in batch
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("person", "0048_user_verification_state_legacy_backfill"),
+        ("submission", "0110_question_option_limits"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SubmissionSearchDocument",
+            fields=[
+                (
+                    "submission",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="submission.submission",
+                    ),
+                ),
+                ("text", models.TextField(default="")),
+                ("anonymised_text", models.TextField(default="")),
+                ("speakers", models.TextField(default="")),
+                ("content", models.TextField(default="")),
+                ("anonymised_content", models.TextField(default="")),
+            ],
+        ),
+        migrations.RunPython(build_search_documents, migrations.RunPython.noop),
+    ]
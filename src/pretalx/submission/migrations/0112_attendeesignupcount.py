@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def count_signups(apps, schema_editor):
+    AttendeeSignup = apps.get_model("submission", "AttendeeSignup")
+    AttendeeSignupCount = apps.get_model("submission", "AttendeeSignupCount")
+    counts = (
+        AttendeeSignup.objects.filter(state="confirmed")
+        .order_by()
+        .values("submission")
+        .annotate(count=Count("pk"))
+        .values_list("submission", "count")
+    )
+    AttendeeSignupCount.objects.bulk_create(
+        (
+            AttendeeSignupCount(submission_id=submission_id, count=count)
+            for submission_id, count in counts
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [("submission", "0111_submissionsearchdocument")]
+
+    operations = [
+        migrations.CreateModel(
+            name="AttendeeSignupCount",
+            fields=[
+                (
+                    "submission",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="signup_count",
+                        serialize=False,
+                        to="submission.submission",
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(count_signups, migrations.RunPython.noop),
+    ]
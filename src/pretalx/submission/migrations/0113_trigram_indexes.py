@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+from django.db import migrations
+
+from pretalx.common.db import TrigramIndex
+
+
+class Migration(migrations.Migration):
+    # The indexes are built concurrently, which needs autocommit.
+    atomic = False
+
+    dependencies = [("submission", "0112_attendeesignupcount")]
+
+    operations = [
+        TrigramIndex("submission_submission", ("title",)).operation(),
+        TrigramIndex(
+            "submission_submissionsearchdocument",
+            ("text", "anonymised_text", "speakers", "content", "anonymised_content"),
+        ).operation(),
+    ]
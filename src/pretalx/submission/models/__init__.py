@@ -8,7 +8,8 @@
 from .question import Answer, AnswerOption, Question, QuestionTarget, QuestionVariant
 from .resource import Resource
 from .review import Review, ReviewPhase, ReviewScore, ReviewScoreCategory
-from .signup import AttendeeSignup
+from .search import SubmissionSearchDocument
+from .signup import AttendeeSignup, AttendeeSignupCount
 from .submission import SpeakerRole, Submission, SubmissionInvitation, SubmissionStates
 from .tag import Tag
 from .track import Track
@@ -18,6 +19,7 @@
     "Answer",
     "AnswerOption",
     "AttendeeSignup",
+    "AttendeeSignupCount",
     "CfP",
     "Feedback",
     "Question",
@@ -32,6 +34,7 @@
     "Submission",
     "SubmissionComment",
     "SubmissionInvitation",
+    "SubmissionSearchDocument",
     "SubmissionStates",
     "SubmissionType",
     "SubmitterAccessCode",
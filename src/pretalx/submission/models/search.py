@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+
+from django.db import models
+
+
+class SubmissionSearchDocument(models.Model):
+    """Denormalised search text of a
+    :class:`~pretalx.submission.models.submission.Submission`.
+
+    Searching a single row per submission avoids joining the speaker and
+    user tables. On PostgreSQL, all columns carry trigram indexes, so
+    ``icontains`` lookups do not scan the table. Rows are kept up to date
+    by the receivers in :mod:`pretalx.submission.receivers`; see
+    :mod:`pretalx.submission.domain.search`.
+    """
+
+    submission = models.OneToOneField(
+        to="submission.Submission",
+        on_delete=models.CASCADE,
+        related_name="search_document",
+        primary_key=True,
+    )
+    text = models.TextField(default="")
+    anonymised_text = models.TextField(default="")
+    speakers = models.TextField(default="")
+    content = models.TextField(default="")
+    anonymised_content = models.TextField(default="")
+
+    def __str__(self):
+        return f"SubmissionSearchDocument(submission={self.submission_id})"
@@ -76,3 +76,27 @@ def logged_actions(self):
             .select_related("event", "person")
             .prefetch_related("content_object")
         )
+
+
+class AttendeeSignupCount(models.Model):
+    """The number of confirmed :class:`AttendeeSignup` rows of a
+    :class:`~pretalx.submission.models.submission.Submission`.
+
+    The count lives in its own table so that signups can claim a seat with
+    a single conditional UPDATE, and so that saving a stale submission
+    instance cannot overwrite it. Rows are only ever changed by the
+    functions in :mod:`pretalx.submission.domain.signup`.
+    """
+
+    submission = models.OneToOneField(
+        to="submission.Submission",
+        on_delete=models.CASCADE,
+        related_name="signup_count",
+        primary_key=True,
+    )
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return (
+            f"AttendeeSignupCount(submission={self.submission_id}, count={self.count})"
+        )
@@ -1,9 +1,31 @@
 # SPDX-FileCopyrightText: 2018-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+import datetime as dt
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
+from django.utils.timezone import now
+from django_scopes import scopes_disabled
 
-from pretalx.common.signals import register_data_exporters
+from pretalx.common.models.deletion import deletions_recorded, record_deletion
+from pretalx.common.signals import (
+    minimum_interval,
+    periodic_task,
+    register_data_exporters,
+)
+from pretalx.person.models import SpeakerProfile, User
+from pretalx.submission.enums import AttendeeSignupStates
+from pretalx.submission.models import (
+    Answer,
+    AttendeeSignup,
+    Question,
+    Review,
+    SpeakerRole,
+    Submission,
+)
 
 
 @receiver(register_data_exporters, dispatch_uid="exporter_builtin_speaker_question")
@@ -22,3 +44,150 @@ def register_submission_question_exporter(sender, **kwargs):
     )
 
     return SubmissionQuestionData
+
+
+def _update_search_documents(submissions):
+    from pretalx.submission.domain.search import (  # noqa: PLC0415 -- receiver
+        update_search_documents,
+    )
+
+    update_search_documents(submissions)
+
+
+def _touches(update_fields, fields):
+    return update_fields is None or bool(set(update_fields) & set(fields))
+
+
+@receiver(post_save, sender=Submission, dispatch_uid="search_document_submission")
+def update_submission_search_document(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    from pretalx.submission.domain.search import (  # noqa: PLC0415 -- receiver
+        INDEXED_FIELDS,
+    )
+
+    if raw or not _touches(update_fields, INDEXED_FIELDS):
+        return
+    _update_search_documents([instance])
+
+
+@receiver(post_save, sender=SpeakerProfile, dispatch_uid="search_document_speaker")
+@scopes_disabled()
+def update_speaker_search_documents(
+    sender, instance, created=False, raw=False, update_fields=None, **kwargs
+):
+    if raw or created or not _touches(update_fields, ("name",)):
+        return
+    _update_search_documents(Submission.all_objects.filter(speakers=instance))
+
+
+@receiver(post_save, sender=User, dispatch_uid="search_document_user")
+@scopes_disabled()
+def update_user_search_documents(
+    sender, instance, created=False, raw=False, update_fields=None, **kwargs
+):
+    if raw or created or not _touches(update_fields, ("name",)):
+        return
+    _update_search_documents(
+        Submission.all_objects.filter(speakers__user=instance).distinct()
+    )
+
+
+@receiver(post_save, sender=SpeakerRole, dispatch_uid="search_document_role_save")
+@scopes_disabled()
+def update_role_search_document(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _update_search_documents(
+            Submission.all_objects.filter(pk=instance.submission_id)
+        )
+
+
+@receiver(post_delete, sender=SpeakerRole, dispatch_uid="search_document_role_delete")
+@scopes_disabled()
+def update_role_search_document_on_delete(sender, instance, **kwargs):
+    # Roles are also deleted when their submission is, so the update waits
+    # for the commit, when a deleted submission is no longer found.
+    submissions = Submission.all_objects.filter(pk=instance.submission_id)
+    transaction.on_commit(partial(_update_search_documents, submissions))
+
+
+@receiver(
+    m2m_changed,
+    sender=Submission.speakers.through,
+    dispatch_uid="search_document_speakers_changed",
+)
+@scopes_disabled()
+def update_speakers_search_documents(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    # ``speakers.add()`` bulk-creates roles without post_save signals, while
+    # ``remove()`` and ``clear()`` delete them one by one and are handled
+    # by the post_delete receiver above.
+    if action != "post_add":
+        return
+    if reverse:
+        _update_search_documents(Submission.all_objects.filter(pk__in=pk_set))
+    else:
+        _update_search_documents([instance])
+
+
+@receiver(post_delete, sender=AttendeeSignup, dispatch_uid="signup_count_delete")
+def release_signup_seat(sender, instance, **kwargs):
+    from pretalx.submission.domain.signup import (  # noqa: PLC0415 -- receiver
+        release_seat,
+    )
+
+    if instance.state == AttendeeSignupStates.CONFIRMED:
+        release_seat(instance.submission_id)
+
+
+@receiver(periodic_task, dispatch_uid="signup_count_reconciliation")
+@minimum_interval(minutes_after_success=60)
+@scopes_disabled()
+def reconcile_signup_counts_periodically(sender, **kwargs):
+    from pretalx.submission.domain.signup import (  # noqa: PLC0415 -- receiver
+        reconcile_signup_counts,
+    )
+
+    # Signups only happen until shortly after an event.
+    cutoff = now() - dt.timedelta(days=3)
+    reconcile_signup_counts(
+        Submission.all_objects.filter(event__date_to__gte=cutoff.date())
+    )
+
+
+@receiver(post_delete, sender=Submission, dispatch_uid="deleted_object_submission")
+def record_submission_deletion(sender, instance, **kwargs):
+    record_deletion(instance, event_id=instance.event_id)
+
+
+@receiver(post_delete, sender=Review, dispatch_uid="deleted_object_review")
+def record_review_deletion(sender, instance, **kwargs):
+    if not deletions_recorded():
+        return
+    if Review.submission.is_cached(instance):
+        event_id = instance.submission.event_id
+    else:
+        with scopes_disabled():
+            event_id = (
+                Submission.all_objects.filter(pk=instance.submission_id)
+                .values_list("event_id", flat=True)
+                .first()
+            )
+    record_deletion(instance, event_id=event_id)
+
+
+@receiver(post_delete, sender=Answer, dispatch_uid="deleted_object_answer")
+def record_answer_deletion(sender, instance, **kwargs):
+    if not deletions_recorded():
+        return
+    if Answer.question.is_cached(instance):
+        event_id = instance.question.event_id
+    else:
+        with scopes_disabled():
+            event_id = (
+                Question.all_objects.filter(pk=instance.question_id)
+                .values_list("event_id", flat=True)
+                .first()
+            )
+    record_deletion(instance, event_id=event_id)
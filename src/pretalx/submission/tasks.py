@@ -2,17 +2,19 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
 import logging
+from functools import partial
 
 from django_scopes import scope, scopes_disabled
 
 from pretalx.celery_app import app
 from pretalx.common.exceptions import SendMailException
+from pretalx.common.tasks import progress_callback
 
 LOGGER = logging.getLogger(__name__)
 
 
-@app.task(name="pretalx.submission.recalculate_review_scores")
-def task_recalculate_review_scores(*, event_id: int):
+@app.task(bind=True, name="pretalx.submission.recalculate_review_scores")
+def task_recalculate_review_scores(self, *, event_id: int):
     from pretalx.event.models import Event  # noqa: PLC0415 -- leaf
     from pretalx.submission.domain.review import (  # noqa: PLC0415 -- leaf
         recalculate_event_scores,
@@ -25,7 +27,9 @@ def task_recalculate_review_scores(*, event_id: int):
         return
 
     with scope(event=event):
-        recalculate_event_scores(event)
+        return recalculate_event_scores(
+            event, progress=partial(progress_callback, self)
+        )
 
 
 @app.task(name="pretalx.submission.export_question_files")
@@ -1,6 +1,10 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+import datetime as dt
+import os
+from unittest.mock import patch
+
 import pytest
 from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -8,8 +12,10 @@
 from django.core.management.base import CommandError
 from django.http import HttpResponse, StreamingHttpResponse
 from django.test import override_settings
+from django_scopes import scope
 
 from pretalx.agenda.html_export import (
+    _render_pages,
     delete_directory,
     dump_content,
     event_exporter_urls,
@@ -22,8 +28,12 @@
     find_assets,
     find_urls,
     get_content,
+    get_export_manifest_path,
+    get_layout_fingerprint,
     get_mediastatic_content,
+    get_page_fingerprints,
     get_path,
+    load_previous_export,
     schedule_version_urls,
 )
 from pretalx.common.exporter import BaseExporter
@@ -34,6 +44,7 @@
 from tests.factories import (
     EventFactory,
     ResourceFactory,
+    RoomFactory,
     SpeakerFactory,
     SubmissionFactory,
     TalkSlotFactory,
@@ -473,16 +484,256 @@ def test_export_event_html_creates_directory_and_zip():
     assert result == zip_path
     assert zip_path.exists()
     assert not export_dir.exists()
+    assert not get_export_manifest_path(event).exists()
     zip_path.unlink()
 
 
+def _published_event_with_talks(same_room=False):
+    """Two talks that are neither parallel nor, unless ``same_room`` is set,
+    room neighbours."""
+    event = EventFactory()
+    room = RoomFactory(event=event) if same_room else None
+    submissions = []
+    for index in range(2):
+        submission = SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED)
+        submission.speakers.add(SpeakerFactory(event=event))
+        start = event.datetime_from + dt.timedelta(hours=2 * index)
+        TalkSlotFactory(
+            submission=submission,
+            is_visible=True,
+            start=start,
+            end=start + dt.timedelta(hours=1),
+            **({"room": room} if room else {}),
+        )
+        submissions.append(submission)
+    freeze_schedule(event.wip_schedule, "v1", notify_speakers=False)
+    return Event.objects.get(pk=event.pk), submissions
+
+
+@pytest.mark.django_db
+def test_get_page_fingerprints_changes_only_for_affected_pages():
+    event, (changed, unchanged) = _published_event_with_talks()
+    with scope(event=event):
+        speaker = changed.speakers.first()
+        before = get_page_fingerprints(event)
+        changed.title = "A new title"
+        changed.save()
+        after = get_page_fingerprints(event)
+
+    assert len(before) == 8
+    assert after[get_path(changed.urls.public)] != before[get_path(changed.urls.public)]
+    assert after[get_path(speaker.urls.public)] != before[get_path(speaker.urls.public)]
+    assert (
+        after[get_path(unchanged.urls.public)]
+        == before[get_path(unchanged.urls.public)]
+    )
+
+
+@pytest.mark.django_db
+def test_get_page_fingerprints_change_for_parallel_talks():
+    event = EventFactory()
+    submissions = []
+    for _ in range(2):
+        submission = SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED)
+        TalkSlotFactory(submission=submission, is_visible=True)
+        submissions.append(submission)
+    freeze_schedule(event.wip_schedule, "v1", notify_speakers=False)
+    changed, parallel = submissions
+    with scope(event=event):
+        before = get_page_fingerprints(event)
+        changed.title = "A new title"
+        changed.save()
+        after = get_page_fingerprints(event)
+
+    assert (
+        after[get_path(parallel.urls.public)] != before[get_path(parallel.urls.public)]
+    )
+
+
+@pytest.mark.django_db
+def test_get_page_fingerprints_without_schedule():
+    event = EventFactory()
+    with scope(event=event):
+        assert get_page_fingerprints(event) == {}
+
+
+@pytest.mark.django_db
+def test_get_layout_fingerprint_changes_on_room_edit():
+    event = EventFactory()
+    with scope(event=event):
+        room = RoomFactory(event=event)
+        before = get_layout_fingerprint(event)
+        room.name = "Renamed room"
+        room.save()
+
+        assert get_layout_fingerprint(event) != before
+
+
+@pytest.mark.django_db
+def test_get_layout_fingerprint_changes_on_room_deletion():
+    event = EventFactory()
+    with scope(event=event):
+        room = RoomFactory(event=event)
+        RoomFactory(event=event)
+        before = get_layout_fingerprint(event)
+        room.delete()
+
+        assert get_layout_fingerprint(event) != before
+
+
+@pytest.mark.django_db
+def test_get_layout_fingerprint_changes_on_settings_change():
+    event = EventFactory()
+    with scope(event=event):
+        before = get_layout_fingerprint(event)
+        event.settings.set("imprint_url", "https://example.com/imprint")
+
+        assert get_layout_fingerprint(event) != before
+
+
+@pytest.mark.django_db
+def test_get_page_fingerprints_changes_on_speaker_removal():
+    event, (changed, unchanged) = _published_event_with_talks()
+    with scope(event=event):
+        before = get_page_fingerprints(event)
+        changed.speakers.remove(changed.speakers.first())
+        after = get_page_fingerprints(event)
+
+    assert after[get_path(changed.urls.public)] != before[get_path(changed.urls.public)]
+    assert (
+        after[get_path(unchanged.urls.public)]
+        == before[get_path(unchanged.urls.public)]
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.filterwarnings(
+    "ignore:It looks like you're using an HTML parser to parse an XML document"
+)
+def test_export_event_renders_pages_in_worker_threads(tmp_path):
+    event, (submission, _) = _published_event_with_talks()
+
+    with patch(
+        "pretalx.agenda.html_export._render_pages", wraps=_render_pages
+    ) as render_pages:
+        manifest = export_event(event, tmp_path, workers=2)
+
+    assert render_pages.call_count == 2
+    assert get_path(submission.urls.public) in manifest["pages"]
+    page = tmp_path / submission.urls.public.lstrip("/") / "index.html"
+    assert submission.title in page.read_text()
+
+
+@pytest.mark.django_db
+@pytest.mark.filterwarnings(
+    "ignore:It looks like you're using an HTML parser to parse an XML document"
+)
+def test_export_event_renders_serially_when_event_is_not_public(tmp_path):
+    event, (submission, _) = _published_event_with_talks()
+    event.is_public = False
+    event.save()
+
+    with patch("pretalx.agenda.html_export._render_pages") as render_pages:
+        manifest = export_event(event, tmp_path, workers=2)
+
+    render_pages.assert_not_called()
+    assert get_path(submission.urls.public) in manifest["pages"]
+    event.refresh_from_db()
+    assert event.is_public is False
+
+
+# Pages are rendered by worker threads, which only see committed data.
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.filterwarnings(
+    "ignore:It looks like you're using an HTML parser to parse an XML document"
+)
+def test_export_event_html_incremental_reuses_unchanged_pages():
+    event, (changed, unchanged) = _published_event_with_talks()
+    export_dir = settings.HTMLEXPORT_ROOT / event.slug
+    export_event_html(event)
+    assert get_export_manifest_path(event).exists()
+    changed_path = export_dir / changed.urls.public.lstrip("/") / "index.html"
+    unchanged_path = export_dir / unchanged.urls.public.lstrip("/") / "index.html"
+    for path in (changed_path, unchanged_path):
+        os.utime(path, (0, 0))
+    with scope(event=event):
+        changed.title = "A new title"
+        changed.save()
+
+    export_event_html(event, incremental=True, workers=2)
+
+    assert "A new title" in changed_path.read_text()
+    assert changed_path.stat().st_mtime != 0
+    assert unchanged_path.stat().st_mtime == 0
+    delete_directory(export_dir)
+    get_export_manifest_path(event).unlink()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.filterwarnings(
+    "ignore:It looks like you're using an HTML parser to parse an XML document"
+)
+def test_export_event_html_incremental_renders_room_neighbours():
+    event, (changed, neighbour) = _published_event_with_talks(same_room=True)
+    with scope(event=event):
+        changed.title = "An old title"
+        changed.save()
+    export_dir = settings.HTMLEXPORT_ROOT / event.slug
+    export_event_html(event)
+    neighbour_path = export_dir / neighbour.urls.public.lstrip("/") / "index.html"
+    assert "An old title" in neighbour_path.read_text()
+    with scope(event=event):
+        changed.title = "A new title"
+        changed.save()
+
+    export_event_html(event, incremental=True)
+
+    assert "A new title" in neighbour_path.read_text()
+    delete_directory(export_dir)
+    get_export_manifest_path(event).unlink()
+
+
+@pytest.mark.django_db
+@pytest.mark.filterwarnings(
+    "ignore:It looks like you're using an HTML parser to parse an XML document"
+)
+def test_export_event_keeps_files_with_unchanged_content(tmp_path):
+    event = EventFactory()
+    first = tmp_path / "first"
+    first.mkdir()
+    manifest = export_event(event, first)
+    schedule_path = first / event.slug / "schedule" / "index.html"
+    os.utime(schedule_path, (0, 0))
+    manifest["layout"] = "outdated"
+    second = tmp_path / "second"
+    second.mkdir()
+
+    export_event(event, second, previous=(first, manifest))
+
+    assert (second / event.slug / "schedule" / "index.html").stat().st_mtime == 0
+
+
+@pytest.mark.django_db
+def test_load_previous_export(tmp_path):
+    event = EventFactory()
+
+    with override_settings(HTMLEXPORT_ROOT=tmp_path):
+        assert load_previous_export(event) is None
+        get_export_manifest_path(event).write_text("not json")
+        assert load_previous_export(event) is None
+        get_export_manifest_path(event).write_text('{"pages": {}}')
+        assert load_previous_export(event) is None
+        (tmp_path / event.slug).mkdir()
+        assert load_previous_export(event) == (tmp_path / event.slug, {"pages": {}})
+
+
 @pytest.mark.django_db
 def test_export_event_html_cleans_tmp_dir_on_failure(monkeypatch):
     event = EventFactory()
     export_dir = settings.HTMLEXPORT_ROOT / event.slug
     tmp_dir = export_dir.with_name(export_dir.name + "-new")
 
-    def failing_export(_event, _destination):
+    def failing_export(_event, _destination, **kwargs):
         raise RuntimeError("disk full")
 
     monkeypatch.setattr("pretalx.agenda.html_export.export_event", failing_export)
@@ -497,7 +748,10 @@ def test_export_schedule_html_command_logs_destination_on_success(caplog):
     event = EventFactory()
     expected = settings.HTMLEXPORT_ROOT / event.slug
 
-    def fake_export_event_html(_event, as_zip=False):
+    calls = []
+
+    def fake_export_event_html(_event, **kwargs):
+        calls.append(kwargs)
         return expected
 
     with pytest.MonkeyPatch.context() as mp:
@@ -506,16 +760,19 @@ def fake_export_event_html(_event, as_zip=False):
             fake_export_event_html,
         )
         with caplog.at_level("INFO"):
-            call_command("export_schedule_html", event.slug)
+            call_command(
+                "export_schedule_html", event.slug, "--incremental", "--workers=4"
+            )
 
     assert any(str(expected) in record.message for record in caplog.records)
+    assert calls == [{"as_zip": False, "incremental": True, "workers": 4}]
 
 
 @pytest.mark.django_db
 def test_export_schedule_html_command_wraps_failure_in_command_error():
     event = EventFactory()
 
-    def failing_export(_event, _destination):
+    def failing_export(_event, _destination, **kwargs):
         raise RuntimeError("disk full")
 
     with pytest.MonkeyPatch.context() as mp:
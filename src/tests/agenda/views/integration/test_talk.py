@@ -77,7 +77,7 @@ def test_talk_view_default_rendering(
         submission.description = "Test description for the talk"
         submission.save()
 
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(14):
         response = client.get(submission.urls.public, follow=True)
 
     assert response.status_code == 200
@@ -178,7 +178,7 @@ def test_talk_view_shows_room_neighbours_and_parallel_sessions(
 ):
     submission = neighbourhood["Main session"]
 
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(14):
         response = client.get(submission.urls.public, follow=True)
 
     content = response.content.decode()
@@ -279,7 +279,7 @@ def test_talk_view_404_for_nonpublic_event(client, django_assert_num_queries):
         TalkSlotFactory(submission=submission, is_visible=True)
         freeze_schedule(event.wip_schedule, "v1", notify_speakers=False)
 
-    with django_assert_num_queries(6):
+    with django_assert_num_queries(5):
         response = client.get(submission.urls.public, follow=True)
 
     assert response.status_code == 404
@@ -335,7 +335,7 @@ def test_talk_view_visibility_by_state_returns_404(
             is_visible=False
         )
 
-    with django_assert_num_queries(9):
+    with django_assert_num_queries(8):
         response = client.get(submission.urls.public, follow=True)
 
     assert response.status_code == 404
@@ -364,7 +364,7 @@ def test_talk_view_shows_do_not_record_indicator(
         slot.submission.do_not_record = True
         slot.submission.save()
 
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(14):
         response = client.get(slot.submission.urls.public, follow=True)
 
     assert response.status_code == 200
@@ -374,7 +374,7 @@ def test_talk_view_shows_do_not_record_indicator(
 def test_talk_view_feedback_link_shown_for_past_talk(
     client, django_assert_num_queries, feedback_submission
 ):
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(14):
         response = client.get(feedback_submission.urls.public, follow=True)
 
     assert response.status_code == 200
@@ -397,7 +397,7 @@ def handler(signal, sender, **kwargs):
 
     register_signal_handler(register_recording_provider, handler)
 
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(14):
         response = client.get(slot.submission.urls.public, follow=True)
 
     assert response.status_code == 200
@@ -427,7 +427,7 @@ def test_talk_view_shows_public_resources_only(
             is_public=False,
         )
 
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(14):
         response = client.get(submission.urls.public, follow=True)
 
     assert response.status_code == 200
@@ -493,7 +493,7 @@ def test_talk_view_speaker_query_count(
         TalkSlotFactory(submission=submission, is_visible=True)
         freeze_schedule(event.wip_schedule, "v1", notify_speakers=False)
 
-    with django_assert_num_queries(15):
+    with django_assert_num_queries(14):
         response = client.get(submission.urls.public, follow=True)
 
     assert response.status_code == 200
@@ -508,7 +508,7 @@ def test_talk_social_media_card_404_without_image(
 ):
     slot = published_talk_slot
 
-    with django_assert_num_queries(9):
+    with django_assert_num_queries(8):
         response = client.get(slot.submission.urls.social_image, follow=True)
 
     assert response.status_code == 404
@@ -547,7 +547,7 @@ def test_single_ical_view_returns_calendar(
     slot = published_talk_slot
     submission = slot.submission
 
-    with django_assert_num_queries(8):
+    with django_assert_num_queries(7):
         response = client.get(submission.urls.ical, follow=True)
 
     assert response.status_code == 200
@@ -561,7 +561,7 @@ def test_single_ical_view_returns_calendar(
 def test_feedback_view_accessible_for_past_talk(
     client, django_assert_num_queries, feedback_submission
 ):
-    with django_assert_num_queries(9):
+    with django_assert_num_queries(8):
         response = client.get(feedback_submission.urls.feedback, follow=True)
 
     assert response.status_code == 200
@@ -571,7 +571,7 @@ def test_feedback_view_accessible_for_past_talk(
 def test_feedback_view_submit_creates_feedback(
     client, django_assert_num_queries, feedback_submission
 ):
-    with django_assert_num_queries(32):
+    with django_assert_num_queries(30):
         response = client.post(
             feedback_submission.urls.feedback, {"review": "Great talk!"}, follow=True
         )
@@ -587,7 +587,7 @@ def test_feedback_view_submit_creates_feedback(
 def test_feedback_view_submit_creates_feedback_for_managed_speaker(
     client, django_assert_num_queries, managed_feedback_submission
 ):
-    with django_assert_num_queries(32):
+    with django_assert_num_queries(30):
         response = client.post(
             managed_feedback_submission.urls.feedback,
             {"review": "Great talk!"},
@@ -608,7 +608,7 @@ def test_feedback_view_does_not_show_managed_speaker_feedback_to_anonymous_users
     with scopes_disabled():
         FeedbackFactory(talk=managed_feedback_submission, review="Loved it!")
 
-    with django_assert_num_queries(9):
+    with django_assert_num_queries(8):
         response = client.get(managed_feedback_submission.urls.feedback, follow=True)
 
     assert response.status_code == 200
@@ -623,7 +623,7 @@ def test_feedback_view_submit_multiple_speakers_no_auto_assign(
         speaker2 = SpeakerFactory(event=feedback_submission.event)
         feedback_submission.speakers.add(speaker2)
 
-    with django_assert_num_queries(32):
+    with django_assert_num_queries(30):
         response = client.post(
             feedback_submission.urls.feedback, {"review": "Great talks!"}, follow=True
         )
@@ -651,7 +651,7 @@ def test_feedback_view_rejects_post_before_talk_starts(
         )
         freeze_schedule(event.wip_schedule, "v1", notify_speakers=False)
 
-    with django_assert_num_queries(9):
+    with django_assert_num_queries(8):
         response = client.post(
             submission.urls.feedback, {"review": "Time traveler!"}, follow=True
         )
@@ -664,7 +664,7 @@ def test_feedback_view_rejects_post_before_talk_starts(
 def test_feedback_view_honeypot_rejects_spam(
     client, django_assert_num_queries, feedback_submission
 ):
-    with django_assert_num_queries(9):
+    with django_assert_num_queries(8):
         response = client.post(
             feedback_submission.urls.feedback,
             {"review": "Buy my stuff!", "subject": "on"},
@@ -694,7 +694,7 @@ def test_feedback_view_speaker_sees_feedback(
 def test_feedback_view_redirects_to_talk_after_submit(
     client, django_assert_num_queries, feedback_submission
 ):
-    with django_assert_num_queries(13):
+    with django_assert_num_queries(12):
         response = client.post(
             feedback_submission.urls.feedback, {"review": "Nice!"}, follow=False
         )
@@ -718,7 +718,7 @@ def test_feedback_view_accessible_before_talk_starts(
         )
         freeze_schedule(event.wip_schedule, "v1", notify_speakers=False)
 
-    with django_assert_num_queries(9):
+    with django_assert_num_queries(8):
         response = client.get(submission.urls.feedback, follow=True)
 
     assert response.status_code == 200
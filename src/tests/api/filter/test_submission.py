@@ -1,6 +1,10 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+import datetime as dt
+
 import pytest
+from django.utils.timezone import now
+from django_scopes import scopes_disabled
 
 from pretalx.api.filters.submission import SubmissionFilter
 from pretalx.submission.models import Submission, SubmissionStates
@@ -66,3 +70,20 @@ def test_submission_filter_filters_by_submission_type(event):
     )
 
     assert list(fs.qs) == [sub]
+
+
+def test_submission_filter_filters_by_updated_since(event):
+    old = SubmissionFactory(event=event)
+    recent = SubmissionFactory(event=event)
+    with scopes_disabled():
+        Submission.all_objects.filter(pk=old.pk).update(
+            updated=now() - dt.timedelta(days=2)
+        )
+    since = (now() - dt.timedelta(days=1)).isoformat()
+
+    fs = SubmissionFilter(
+        data={"updated_since": since}, queryset=Submission.all_objects.all()
+    )
+
+    with scopes_disabled():
+        assert list(fs.qs) == [recent]
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+import datetime as dt
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.utils.timezone import now
+from django_scopes import scopes_disabled
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from pretalx.api.pagination import UpdatedCursorPagination
+from pretalx.submission.models import Submission
+from tests.factories import SubmissionFactory
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+rf = APIRequestFactory()
+
+
+def _page(params, queryset):
+    paginator = UpdatedCursorPagination()
+    request = Request(rf.get("/api/submissions/", params))
+    page = paginator.paginate_queryset(queryset, request)
+    response = paginator.get_paginated_response([obj.pk for obj in page])
+    cursor = None
+    if next_link := response.data["next"]:
+        cursor = parse_qs(urlparse(next_link).query)["cursor"][0]
+    return response.data["results"], cursor
+
+
+def test_updated_cursor_pagination_pages_by_updated_and_pk(event):
+    submissions = SubmissionFactory.create_batch(5, event=event)
+    timestamp = now() - dt.timedelta(hours=1)
+    with scopes_disabled():
+        # Ties on updated are broken by pk, missing timestamps come first.
+        Submission.all_objects.filter(pk=submissions[0].pk).update(updated=None)
+        Submission.all_objects.filter(pk__in=[s.pk for s in submissions[1:4]]).update(
+            updated=timestamp
+        )
+        queryset = Submission.all_objects.all()
+
+        first, cursor = _page({"page_size": 2}, queryset)
+        second, cursor = _page({"page_size": 2, "cursor": cursor}, queryset)
+        third, cursor = _page({"page_size": 2, "cursor": cursor}, queryset)
+
+    assert first + second + third == [s.pk for s in submissions]
+    assert cursor is None
+
+
+def test_updated_cursor_pagination_returns_changed_objects_again(event):
+    submissions = SubmissionFactory.create_batch(3, event=event)
+    with scopes_disabled():
+        queryset = Submission.all_objects.all()
+        first, cursor = _page({"page_size": 2}, queryset)
+        submissions[0].title = "Changed"
+        submissions[0].save()
+        rest, cursor = _page({"page_size": 2, "cursor": cursor}, queryset)
+
+    assert first == [submissions[0].pk, submissions[1].pk]
+    assert rest == [submissions[2].pk, submissions[0].pk]
+    assert cursor is None
+
+
+@pytest.mark.parametrize("cursor", ("invalid", "dT1ub3BlJnA9MQ==", "dT0mcD14"))
+def test_updated_cursor_pagination_rejects_invalid_cursor(cursor):
+    with pytest.raises(NotFound):
+        _page({"cursor": cursor}, Submission.all_objects.none())
+
+
+@pytest.mark.parametrize(
+    ("page_size", "expected"),
+    (
+        ("2", 2),
+        ("0", UpdatedCursorPagination.page_size),
+        ("nope", UpdatedCursorPagination.page_size),
+        ("100000", UpdatedCursorPagination.max_page_size),
+    ),
+)
+def test_updated_cursor_pagination_page_size(page_size, expected):
+    request = Request(rf.get("/", {"page_size": page_size}))
+
+    assert UpdatedCursorPagination().get_page_size(request) == expected
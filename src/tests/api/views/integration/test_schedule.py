@@ -1,7 +1,10 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+import datetime as dt
+
 import pytest
+from django.utils.timezone import now
 from django_scopes import scope, scopes_disabled
 
 from pretalx.schedule.domain.release import freeze_schedule
@@ -438,6 +441,96 @@ def test_slot_list_orga_default_current_schedule(
     assert {r["id"] for r in data["results"]} == expected_ids
 
 
+def test_slot_list_orga_delta_sync_defaults_to_current_schedule(
+    client, orga_read_token, public_schedule_event
+):
+    event, _slot = public_schedule_event
+    with scopes_disabled():
+        expected_ids = set(event.current_schedule.talks.values_list("pk", flat=True))
+        assert event.wip_schedule.talks.exists()
+
+    response = client.get(
+        event.api_urls.slots,
+        {"updated_since": event.created.isoformat()},
+        follow=True,
+        headers={"Authorization": f"Token {orga_read_token.token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert {r["id"] for r in data["results"]} == expected_ids
+    assert data["deleted"] == []
+
+
+def test_slot_list_orga_delta_sync_lists_slots_that_left_current_schedule(
+    client, orga_read_token, public_schedule_event
+):
+    event, slot = public_schedule_event
+    with scopes_disabled():
+        since = event.current_schedule.published
+        dropped = event.current_schedule.talks.get(submission=slot.submission)
+        event.wip_schedule.talks.filter(submission=slot.submission).delete()
+        with scope(event=event):
+            freeze_schedule(event.wip_schedule, "v2", notify_speakers=False)
+
+    response = client.get(
+        event.api_urls.slots,
+        {"updated_since": since.isoformat()},
+        follow=True,
+        headers={"Authorization": f"Token {orga_read_token.token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert dropped.pk not in {r["id"] for r in data["results"]}
+    assert data["deleted"] == [dropped.pk]
+
+
+def test_slot_list_orga_delta_sync_returns_slots_released_since(
+    client, orga_read_token, public_schedule_event
+):
+    """Slots moved in the WIP schedule before a sync and released after it
+    replace the old slots in the next sync."""
+    event, slot = public_schedule_event
+    with scopes_disabled():
+        old_slot = event.current_schedule.talks.get(submission=slot.submission)
+        wip_slot = event.wip_schedule.talks.get(submission=slot.submission)
+        wip_slot.start = wip_slot.start + dt.timedelta(hours=1)
+        wip_slot.end = wip_slot.end + dt.timedelta(hours=1)
+        wip_slot.save()
+        since = now()
+        with scope(event=event):
+            freeze_schedule(event.wip_schedule, "v2", notify_speakers=False)
+
+    response = client.get(
+        event.api_urls.slots,
+        {"updated_since": since.isoformat()},
+        follow=True,
+        headers={"Authorization": f"Token {orga_read_token.token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["id"] for r in data["results"]] == [wip_slot.pk]
+    assert data["deleted"] == [old_slot.pk]
+
+
+def test_slot_list_public_delta_sync_lists_no_deletions(client, public_schedule_event):
+    event, slot = public_schedule_event
+    with scopes_disabled():
+        since = event.current_schedule.published
+        event.wip_schedule.talks.filter(submission=slot.submission).delete()
+        with scope(event=event):
+            freeze_schedule(event.wip_schedule, "v2", notify_speakers=False)
+
+    response = client.get(
+        event.api_urls.slots, {"updated_since": since.isoformat()}, follow=True
+    )
+
+    assert response.status_code == 200
+    assert "deleted" not in response.json()
+
+
 def test_slot_list_orga_filter_by_schedule(
     client, orga_read_token, public_schedule_event
 ):
@@ -459,6 +552,29 @@ def test_slot_list_orga_filter_by_schedule(
     assert slot.pk in [r["id"] for r in data["results"]]
 
 
+def test_slot_list_orga_filter_by_archived_schedule_includes_shared_slots(
+    client, orga_read_token, public_schedule_event
+):
+    event, slot = public_schedule_event
+    with scopes_disabled():
+        archived = event.current_schedule
+        with scope(event=event):
+            freeze_schedule(event.wip_schedule, "v2", notify_speakers=False)
+        shared = archived.version_talks.get(submission=slot.submission)
+        assert event.current_schedule.talks.filter(pk=shared.pk).exists()
+
+    response = client.get(
+        f"{event.api_urls.slots}?schedule={archived.pk}",
+        follow=True,
+        headers={"Authorization": f"Token {orga_read_token.token}"},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["id"] for r in results] == [shared.pk]
+    assert results[0]["schedule"] == archived.pk
+
+
 def test_slot_list_orga_filter_by_submission(
     client, orga_read_token, public_schedule_event
 ):
@@ -1,7 +1,10 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+import datetime as dt
+
 import pytest
+from django.utils.timezone import now
 from django_scopes import scope, scopes_disabled
 
 from pretalx.person.enums import SpeakerProfileOrigin
@@ -220,6 +223,32 @@ def test_speaker_list_orga(
     assert result["has_arrived"] is False
 
 
+def test_speaker_list_delta_sync(client, orga_read_token, event):
+    with scopes_disabled():
+        old, changed = SpeakerRoleFactory.create_batch(
+            2, submission__event=event, speaker__event=event
+        )
+        SpeakerProfile.objects.filter(pk=old.speaker.pk).update(
+            updated=now() - dt.timedelta(days=2)
+        )
+        deleted = SpeakerFactory(event=event)
+        deleted_code = deleted.code
+        deleted.delete()
+    since = (now() - dt.timedelta(days=1)).isoformat()
+
+    response = client.get(
+        event.api_urls.speakers,
+        {"updated_since": since},
+        follow=True,
+        headers={"Authorization": f"Token {orga_read_token.token}"},
+    )
+
+    assert response.status_code == 200
+    content = response.json()
+    assert [s["code"] for s in content["results"]] == [changed.speaker.code]
+    assert content["deleted"] == [deleted_code]
+
+
 def test_speaker_list_search_by_name(client, event):
     with scopes_disabled():
         role1 = SpeakerRoleFactory(
@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+import datetime as dt
+
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.utils import timezone
@@ -10,6 +12,8 @@
 from pretalx.person.enums import SpeakerProfileOrigin
 from pretalx.person.models import SpeakerProfile
 from pretalx.person.models.auth_token import ENDPOINTS
+from pretalx.schedule.domain.release import freeze_schedule
+from pretalx.submission.domain.submission import delete_submission
 from pretalx.submission.models import (
     Resource,
     Submission,
@@ -97,7 +101,7 @@ def test_submission_list_orga_sees_all_submissions(
             item_count, submission__event=event, speaker__event=event
         )
 
-    with django_assert_num_queries(20):
+    with django_assert_num_queries(19):
         response = client.get(
             event.api_urls.submissions,
             follow=True,
@@ -147,6 +151,97 @@ def test_submission_list_orga_filter_by_state(
     assert content["results"][0]["code"] == rejected.code
 
 
+def test_submission_list_delta_sync(client, event, orga_user_token):
+    with scopes_disabled():
+        old, changed, deleted = SubmissionFactory.create_batch(3, event=event)
+        Submission.all_objects.filter(pk__in=[old.pk, changed.pk]).update(
+            updated=timezone.now() - dt.timedelta(days=2)
+        )
+        changed.title = "Changed"
+        changed.save()
+        new = SubmissionFactory(event=event)
+        deleted_code = deleted.code
+        delete_submission(deleted)
+    since = (timezone.now() - dt.timedelta(days=1)).isoformat()
+    headers = {"Authorization": f"Token {orga_user_token.token}"}
+
+    response = client.get(
+        event.api_urls.submissions,
+        {"updated_since": since, "page_size": 1},
+        follow=True,
+        headers=headers,
+    )
+    content = response.json()
+
+    assert response.status_code == 200
+    assert "count" not in content
+    assert [s["code"] for s in content["results"]] == [changed.code]
+    assert content["deleted"] == [deleted_code]
+
+    response = client.get(content["next"], follow=True, headers=headers)
+    content = response.json()
+
+    assert [s["code"] for s in content["results"]] == [new.code]
+    assert content["next"] is None
+    assert "deleted" not in content
+
+
+def test_submission_list_delta_sync_hides_deletions_from_anonymous_users(
+    client, public_event_with_schedule, published_talk_slot
+):
+    event = public_event_with_schedule
+    with scopes_disabled():
+        delete_submission(SubmissionFactory(event=event))
+
+    response = client.get(
+        event.api_urls.submissions,
+        {"updated_since": event.created.isoformat()},
+        follow=True,
+    )
+    content = response.json()
+
+    assert response.status_code == 200
+    assert [s["code"] for s in content["results"]] == [
+        published_talk_slot.submission.code
+    ]
+    assert "deleted" not in content
+
+
+@pytest.mark.parametrize("release_count", (1, 5))
+def test_submission_list_slot_queries_do_not_scale_with_releases(
+    client, published_talk_slot, release_count, django_assert_num_queries
+):
+    """Every release copies all slots, so only the current schedule's slots
+    may be loaded."""
+    event = published_talk_slot.submission.event
+    with scopes_disabled():
+        for version in range(2, release_count + 1):
+            freeze_schedule(event.wip_schedule, f"v{version}", notify_speakers=False)
+        current_schedule = event.current_schedule
+        expected = set(
+            current_schedule.talks.filter(
+                submission=published_talk_slot.submission
+            ).values_list("pk", flat=True)
+        )
+
+    with django_assert_num_queries(11) as queries:
+        response = client.get(
+            event.api_urls.submissions, {"expand": "slots"}, follow=True
+        )
+
+    assert response.status_code == 200
+    result = response.json()["results"][0]
+    assert {slot["id"] for slot in result["slots"]} == expected
+    slot_queries = [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith('SELECT "schedule_talkslot"."id"')
+    ]
+    assert slot_queries
+    schedule_filter = f'"schedule_talkslot"."schedule_id" = {current_schedule.pk}'
+    assert all(schedule_filter in sql for sql in slot_queries)
+
+
 @pytest.mark.parametrize("casing", ("upper", "lower"))
 def test_submission_retrieve_by_code(
     client, event, orga_user_token, submission, casing
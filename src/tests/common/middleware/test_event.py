@@ -237,7 +237,7 @@ def test_call_annotates_has_cfp_submissions_for_speaker(state):
     request = _cfp_request(event, speaker.user)
     _make_middleware()(request)
 
-    assert request.event.has_cfp_submissions is True
+    assert bool(request.event.has_cfp_submissions) is True
 
 
 @pytest.mark.django_db
@@ -249,7 +249,7 @@ def test_call_annotates_has_cfp_submissions_false_for_non_speaker():
     request = _cfp_request(event, UserFactory())
     _make_middleware()(request)
 
-    assert request.event.has_cfp_submissions is False
+    assert bool(request.event.has_cfp_submissions) is False
 
 
 @pytest.mark.django_db
@@ -276,6 +276,22 @@ def test_call_does_not_annotate_has_cfp_submissions_on_orga_path():
     assert not hasattr(request.event, "has_cfp_submissions")
 
 
+@pytest.mark.django_db
+@pytest.mark.usefixtures("locmem_cache")
+def test_call_looks_up_user_values_lazily_from_cached_event(django_assert_num_queries):
+    event = EventFactory()
+    speaker = SpeakerFactory(event=event, name="Jane")
+    SpeakerRoleFactory(submission=SubmissionFactory(event=event), speaker=speaker)
+    _make_middleware()(_cfp_request(event, speaker.user))
+
+    request = _cfp_request(event, speaker.user)
+    with django_assert_num_queries(0):
+        _make_middleware()(request)
+    with django_assert_num_queries(1):
+        assert str(request.event.request_speaker_name) == "Jane"
+        assert bool(request.event.has_cfp_submissions) is True
+
+
 @pytest.mark.django_db
 def test_call_sets_organiser_on_request(event):
     middleware = _make_middleware()
@@ -298,7 +314,7 @@ def test_call_uppercase_url_slug_resolves_event():
     _make_middleware()(request)
 
     assert request.event == event
-    assert request.event.has_cfp_submissions is False
+    assert bool(request.event.has_cfp_submissions) is False
 
 
 @pytest.mark.django_db
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django_scopes import scopes_disabled
+
+from pretalx.common.domain.queries.deletion import deleted_objects_since
+from pretalx.common.models import DeletedObject
+from pretalx.common.models.deletion import unrecorded_deletions
+from pretalx.event.domain.event import shred_event
+from pretalx.person.models import SpeakerProfile
+from pretalx.schedule.models import TalkSlot
+from pretalx.submission.domain.submission import delete_submission
+from pretalx.submission.models import Answer, Review, Submission
+from tests.factories import (
+    AnswerFactory,
+    ReviewFactory,
+    ScheduleFactory,
+    SpeakerFactory,
+    SubmissionFactory,
+    TalkSlotFactory,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+def _deleted(event, model):
+    with scopes_disabled():
+        return list(
+            deleted_objects_since(event, model, event.created).values_list(
+                "object_id", "code"
+            )
+        )
+
+
+def test_deleting_submission_records_it_and_its_dependants(event):
+    submission = SubmissionFactory(event=event)
+    slot = TalkSlotFactory(
+        submission=submission, schedule=ScheduleFactory(event=event, version="v1")
+    )
+    TalkSlotFactory(submission=submission, schedule=event.wip_schedule)
+    review = ReviewFactory(submission=submission)
+    answer = AnswerFactory(submission=submission, question__event=event)
+    expected = {
+        Submission: [(submission.pk, submission.code)],
+        TalkSlot: [(slot.pk, None)],
+        Review: [(review.pk, None)],
+        Answer: [(answer.pk, None)],
+    }
+
+    with scopes_disabled():
+        delete_submission(submission)
+
+    assert {model: _deleted(event, model) for model in expected} == expected
+
+
+def test_deleting_speaker_records_code(event):
+    speaker = SpeakerFactory(event=event)
+    expected = [(speaker.pk, speaker.code)]
+
+    with scopes_disabled():
+        speaker.delete()
+
+    assert _deleted(event, SpeakerProfile) == expected
+
+
+def test_unrecorded_deletions_skip_records(event):
+    submission = SubmissionFactory(event=event)
+
+    with scopes_disabled(), unrecorded_deletions():
+        submission.delete()
+
+    assert _deleted(event, Submission) == []
+
+
+def test_shred_event_records_no_deletions(event):
+    SubmissionFactory(event=event)
+    TalkSlotFactory(submission__event=event, schedule=event.wip_schedule)
+
+    with scopes_disabled():
+        shred_event(event)
+
+        assert not DeletedObject.objects.exists()
+
+
+def test_deleting_wip_slot_records_nothing(event):
+    slot = TalkSlotFactory(submission__event=event, schedule=event.wip_schedule)
+
+    with scopes_disabled():
+        TalkSlot.objects.get(pk=slot.pk).delete()
+
+    assert _deleted(event, TalkSlot) == []
+
+
+@pytest.mark.parametrize("count", (1, 5))
+def test_unrecorded_slot_deletions_do_not_query_per_slot(event, count):
+    schedule = ScheduleFactory(event=event, version="v1")
+    TalkSlotFactory.create_batch(count, submission__event=event, schedule=schedule)
+
+    with (
+        scopes_disabled(),
+        unrecorded_deletions(),
+        CaptureQueriesContext(connection) as context,
+    ):
+        TalkSlot.objects.filter(schedule=schedule).delete()
+
+    assert not TalkSlot.objects.filter(schedule=schedule).exists()
+    assert len(context.captured_queries) == 2
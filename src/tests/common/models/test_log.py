@@ -2,12 +2,13 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 import pytest
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.urls import reverse
 from django.utils.html import escape
 from django_scopes import scopes_disabled
 
 from pretalx.common.log import LOG_NAMES
-from pretalx.common.models.log import ActivityLog
+from pretalx.common.models.log import ActivityLog, buffered_activity_logs
 from pretalx.submission.models import Submission
 from tests.factories import (
     ActivityLogFactory,
@@ -268,3 +269,74 @@ def test_activitylog_ordering():
     logs = list(log1.event.log_entries.all())
 
     assert logs == [log2, log1]
+
+
+def test_buffered_activity_logs_writes_entries_at_block_exit(django_assert_num_queries):
+    submissions = SubmissionFactory.create_batch(3)
+    ContentType.objects.get_for_model(Submission)
+
+    with buffered_activity_logs():
+        with django_assert_num_queries(0):
+            logs = [
+                submission.log_action("pretalx.submission.accept")
+                for submission in submissions
+            ]
+        with buffered_activity_logs():
+            submissions[0].log_action("pretalx.submission.confirm")
+        assert not ActivityLog.objects.filter(
+            action_type__startswith="pretalx.submission"
+        ).exists()
+
+    assert all(log.pk for log in logs)
+    with scopes_disabled():
+        assert (
+            ActivityLog.objects.filter(action_type="pretalx.submission.accept").count()
+            == 3
+        )
+        assert ActivityLog.objects.filter(
+            action_type="pretalx.submission.confirm", object_id=submissions[0].pk
+        ).exists()
+
+
+def test_buffered_activity_logs_keeps_entries_of_deleted_objects():
+    submission = SubmissionFactory()
+    submission_pk = submission.pk
+
+    with buffered_activity_logs():
+        submission.log_action("pretalx.submission.deleted")
+        submission.delete()
+
+    with scopes_disabled():
+        log = ActivityLog.objects.get(action_type="pretalx.submission.deleted")
+    assert log.object_id == submission_pk
+    assert log.content_object is None
+
+
+def test_buffered_activity_logs_writes_entries_on_error_outside_transaction():
+    submission = SubmissionFactory()
+
+    def accept():
+        with buffered_activity_logs():
+            submission.log_action("pretalx.submission.accept")
+            raise RuntimeError("failed after logging")
+
+    with pytest.raises(RuntimeError, match="failed after logging"):
+        accept()
+
+    with scopes_disabled():
+        assert ActivityLog.objects.filter(
+            action_type="pretalx.submission.accept"
+        ).exists()
+
+
+def test_buffered_activity_logs_skips_entries_on_rollback():
+    submission = SubmissionFactory()
+
+    with transaction.atomic(), buffered_activity_logs():
+        submission.log_action("pretalx.submission.accept")
+        transaction.set_rollback(True)
+
+    with scopes_disabled():
+        assert not ActivityLog.objects.filter(
+            action_type="pretalx.submission.accept"
+        ).exists()
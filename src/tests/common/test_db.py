@@ -1,12 +1,12 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from django.db import connection
 from django.utils import translation
 
-from pretalx.common.db import Median, Translate
+from pretalx.common.db import Median, Translate, TrigramIndex
 from pretalx.submission.models import Review, Submission
 from tests.factories import ReviewFactory, SubmissionFactory
 
@@ -79,3 +79,110 @@ def test_translate_transform_unsupported_vendor_raises():
         mock_conn.vendor = "mysql"
         with pytest.raises(NotImplementedError, match="mysql"):
             Translate(lhs)
+
+
+def _schema_editor(vendor, fetched=()):
+    schema_editor = MagicMock()
+    schema_editor.connection.vendor = vendor
+    schema_editor.connection.pg_version = 160000
+    schema_editor.quote_name = lambda name: f'"{name}"'
+    cursor = schema_editor.connection.cursor.return_value.__enter__.return_value
+    cursor.fetchone.side_effect = list(fetched)
+    return schema_editor
+
+
+def test_trigram_index_creates_expression_indexes_concurrently_on_postgresql():
+    # pg_trgm is installed, and no invalid indexes are left behind.
+    schema_editor = _schema_editor("postgresql", fetched=[(1,), None, None])
+
+    TrigramIndex("person_user", ("name", "email")).create(None, schema_editor)
+
+    statements = [call.args[0] for call in schema_editor.execute.call_args_list]
+    assert statements == [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        (
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS "person_user_name_trgm" '
+            'ON "person_user" USING gin ((UPPER("name"::text)) gin_trgm_ops)'
+        ),
+        (
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS "person_user_email_trgm" '
+            'ON "person_user" USING gin ((UPPER("email"::text)) gin_trgm_ops)'
+        ),
+    ]
+
+
+def test_trigram_index_rebuilds_invalid_index():
+    schema_editor = _schema_editor("postgresql", fetched=[(1,), (1,)])
+
+    TrigramIndex("person_user", ("name",)).create(None, schema_editor)
+
+    statements = [call.args[0] for call in schema_editor.execute.call_args_list]
+    assert statements[1:] == [
+        'DROP INDEX CONCURRENTLY IF EXISTS "person_user_name_trgm"',
+        (
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS "person_user_name_trgm" '
+            'ON "person_user" USING gin ((UPPER("name"::text)) gin_trgm_ops)'
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("fetched", "pg_version", "expected"),
+    (
+        ([None, (True,)], 160000, True),
+        ([None, (False,), (True,)], 160000, True),
+        ([None, (False,), (False,)], 160000, False),
+        ([None, (False,)], 120000, False),
+        ([None, None], 160000, False),
+    ),
+    ids=[
+        "superuser",
+        "trusted",
+        "no-create-privilege",
+        "untrusted-before-pg13",
+        "unavailable",
+    ],
+)
+def test_trigram_index_checks_extension_privileges(fetched, pg_version, expected):
+    schema_editor = _schema_editor("postgresql", fetched=fetched)
+    schema_editor.connection.pg_version = pg_version
+
+    assert (
+        TrigramIndex("person_user", ("name",))._can_use_extension(schema_editor)
+        is expected
+    )
+
+
+def test_trigram_index_skips_indexes_without_extension(caplog):
+    schema_editor = _schema_editor("postgresql", fetched=[None, (False,), (False,)])
+
+    TrigramIndex("person_user", ("name",)).create(None, schema_editor)
+
+    schema_editor.execute.assert_not_called()
+    assert "pg_trgm" in caplog.text
+
+
+def test_trigram_index_drops_indexes_on_postgresql():
+    schema_editor = _schema_editor("postgresql")
+
+    TrigramIndex("person_user", ("name",)).drop(None, schema_editor)
+
+    schema_editor.execute.assert_called_once_with(
+        'DROP INDEX CONCURRENTLY IF EXISTS "person_user_name_trgm"'
+    )
+
+
+def test_trigram_index_is_noop_on_other_databases():
+    schema_editor = _schema_editor("sqlite")
+    index = TrigramIndex("person_user", ("name",))
+
+    index.create(None, schema_editor)
+    index.drop(None, schema_editor)
+
+    schema_editor.execute.assert_not_called()
+
+
+def test_trigram_index_operation_is_reversible():
+    operation = TrigramIndex("person_user", ("name",)).operation()
+
+    assert operation.reversible
@@ -3,10 +3,11 @@
 from urllib.parse import quote
 
 import pytest
-from django.http import HttpResponse, HttpResponseNotModified
+from django.http import HttpResponse, HttpResponseNotModified, StreamingHttpResponse
 from django.urls import resolve
 from django.utils.timezone import now
-from django_scopes import scope
+from django.utils.translation import get_language
+from django_scopes import get_scope, scope
 
 from pretalx.common.exporter import (
     BaseExporter,
@@ -15,6 +16,8 @@
     get_schedule_exporter_content,
     get_schedule_exporters,
     is_visible,
+    render_csv,
+    stream_csv,
 )
 from pretalx.common.signals import register_data_exporters
 from tests.factories import ScheduleFactory
@@ -144,6 +147,15 @@ def get_csv_data(self, request, **kwargs):
     assert "André Researcher’s Guide" in decoded
 
 
+def test_stream_csv_yields_render_csv_line_by_line():
+    rows = [{"name": "Alice", "note": "two\nlines"}, {"name": "=Bob", "note": ""}]
+
+    lines = list(stream_csv(fieldnames=["name", "note"], rows=iter(rows)))
+
+    assert len(lines) == 3
+    assert "".join(lines) == render_csv(fieldnames=["name", "note"], rows=rows)
+
+
 class PublicExporter(BaseExporter):
     identifier = "test-public"
     verbose_name = "Test Public"
@@ -248,6 +260,22 @@ def is_public(self, request, **kwargs):
         return bool(self.schedule and self.schedule.version)
 
 
+class StreamingExporter(BaseExporter):
+    identifier = "test-streaming"
+    verbose_name = "Streaming"
+    public = True
+    filename_identifier = "test-streaming"
+    extension = "json"
+    content_type = "application/json"
+    icon = "fa-code"
+    streaming = True
+
+    def stream_data(self, request, **kwargs):
+        yield "["
+        yield f'"{get_scope()["event"].slug}", "{get_language()}"'
+        yield "]"
+
+
 class XmlExporter(BaseExporter):
     identifier = "test-xml"
     verbose_name = "Test XML"
@@ -712,3 +740,29 @@ def handler(signal, sender, **kwargs):
     result = get_schedule_exporter_content(request, "test-public", schedule)
 
     assert isinstance(result, HttpResponse)
+
+
+@pytest.mark.django_db
+def test_get_schedule_exporter_content_streams_in_event_scope(
+    event, register_signal_handler
+):
+    user = make_orga_user(event, can_change_submissions=True)
+
+    def handler(signal, sender, **kwargs):
+        return StreamingExporter
+
+    register_signal_handler(register_data_exporters, handler)
+    request = _make_schedule_request(
+        event, user=user, query_params={"lang": event.locale}
+    )
+
+    result = get_schedule_exporter_content(
+        request, "test-streaming", event.wip_schedule
+    )
+
+    assert isinstance(result, StreamingHttpResponse)
+    assert "ETag" not in result
+    assert "Content-Disposition" not in result
+    assert b"".join(result.streaming_content) == (
+        f'["{event.slug}", "{event.locale}"]'.encode()
+    )
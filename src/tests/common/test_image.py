@@ -22,6 +22,7 @@
     load_img,
     process_image,
     queue_thumbnail_regeneration,
+    queue_thumbnail_regenerations,
     validate_image,
 )
 from tests.factories import EventFactory, ProfilePictureFactory, UserFactory
@@ -369,11 +370,14 @@ def test_get_thumbnail_falls_back_to_source_and_queues_regeneration(
 
 
 @pytest.mark.django_db
-def test_get_thumbnail_returns_existing(make_image):
+def test_get_thumbnail_returns_existing(make_image, monkeypatch):
     user = UserFactory()
     pic = ProfilePictureFactory(
         user=user, avatar=make_image(), avatar_thumbnail=make_image("thumb.png")
     )
+    monkeypatch.setattr(
+        type(pic.avatar_thumbnail.storage), "exists", pytest.fail, raising=False
+    )
 
     result = get_thumbnail(pic.avatar, "default")
 
@@ -454,6 +458,53 @@ def test_queue_thumbnail_regeneration_deduplicates_in_flight(make_image, monkeyp
     assert len(calls) == 1
 
 
+@pytest.mark.django_db
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+def test_queue_thumbnail_regenerations_queues_each_image_once(make_image, monkeypatch):
+    cache.clear()
+    locked, first, second = (
+        ProfilePictureFactory(user=UserFactory(), avatar=make_image()) for _ in range(3)
+    )
+    calls = []
+    monkeypatch.setattr(
+        "pretalx.common.tasks.task_generate_thumbnails.apply_async",
+        lambda **kw: calls.append(kw["kwargs"]["pk"]),
+    )
+    queue_thumbnail_regeneration(locked.avatar)
+    calls.clear()
+
+    queue_thumbnail_regenerations(
+        [locked.avatar, first.avatar, second.avatar, first.avatar]
+    )
+
+    assert calls == [first.pk, second.pk]
+
+
+@pytest.mark.django_db
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+def test_queue_thumbnail_regenerations_respects_concurrent_lock(
+    make_image, monkeypatch
+):
+    cache.clear()
+    pic = ProfilePictureFactory(user=UserFactory(), avatar=make_image())
+    calls = []
+    monkeypatch.setattr(
+        "pretalx.common.tasks.task_generate_thumbnails.apply_async",
+        lambda **kw: calls.append(kw),
+    )
+    queue_thumbnail_regeneration(pic.avatar)
+    calls.clear()
+    monkeypatch.setattr("pretalx.common.image.cache.get_many", lambda keys: {})
+
+    queue_thumbnail_regenerations([pic.avatar])
+
+    assert calls == []
+
+
 @pytest.mark.django_db
 def test_queue_thumbnail_regeneration_skips_unsaved_instance(monkeypatch):
     calls = []
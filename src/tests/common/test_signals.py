@@ -1,5 +1,9 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+import gc
+import time
+from unittest.mock import patch
+
 import pytest
 from django.core.cache import cache
 
@@ -370,3 +374,184 @@ def task():
         f"pretalx_periodic_{task.__module__}.{task.__wrapped__.__name__}_running"
     )
     assert cache.get(key_running) is None
+
+
+@pytest.mark.django_db
+def test_event_plugin_signal_reuses_dispatch_table(register_signal_handler):
+    signal = EventPluginSignal()
+    event = EventFactory()
+    other_event = EventFactory(plugins=event.plugins)
+    handler = _make_handler()
+    register_signal_handler(signal, handler)
+
+    signal.send(event)
+    with patch.object(
+        EventPluginSignal, "_is_active", side_effect=AssertionError
+    ) as is_active:
+        signal.send(other_event)
+
+    is_active.assert_not_called()
+    assert handler.received == [event, other_event]
+
+
+@pytest.mark.django_db
+def test_event_plugin_signal_dispatch_table_follows_plugins(settings):
+    signal = EventPluginSignal()
+    settings.CORE_MODULES = []
+    handler = _make_handler()
+    handler.__module__ = "tests.dummy_app.signals"
+    signal.connect(handler, weak=False)
+    try:
+        event = EventFactory(plugins="")
+        signal.send(event)
+        event.plugins = "tests.dummy_app"
+        signal.send(event)
+    finally:
+        signal.disconnect(handler)
+
+    assert handler.received == [event]
+
+
+@pytest.mark.django_db
+def test_event_plugin_signal_connect_clears_dispatch_table(register_signal_handler):
+    signal = EventPluginSignal()
+    event = EventFactory()
+    first = _make_handler()
+    second = _make_handler()
+    register_signal_handler(signal, first)
+    signal.send(event)
+
+    register_signal_handler(signal, second)
+    signal.send(event)
+
+    assert first.received == [event, event]
+    assert second.received == [event]
+
+
+@pytest.mark.django_db
+def test_event_plugin_signal_core_modules_change_clears_dispatch_table(
+    register_signal_handler, settings
+):
+    signal = EventPluginSignal()
+    event = EventFactory(plugins="")
+    handler = _make_handler()
+    register_signal_handler(signal, handler)
+    signal.send(event)
+
+    settings.CORE_MODULES = []
+    signal.send(event)
+
+    assert handler.received == [event]
+
+
+@pytest.mark.django_db
+def test_event_plugin_signal_skips_dead_receivers(register_signal_handler):
+    signal = EventPluginSignal()
+    event = EventFactory()
+
+    class Handler:
+        def handle(self, signal, sender, **kwargs):  # pragma: no cover -- never called
+            return "ok"
+
+    handler = Handler()
+    signal.connect(handler.handle)
+    register_signal_handler(signal, _make_handler())
+    Handler.handle.__module__ = "tests._test_plugin"
+    signal.send(event)
+
+    del handler
+    gc.collect()
+
+    assert [response for _receiver, response in signal.send(event)] == ["ok"]
+
+
+@pytest.mark.django_db
+def test_event_plugin_signal_calls_in_connection_order_and_sorts_responses(
+    register_signal_handler,
+):
+    signal = EventPluginSignal()
+    event = EventFactory()
+    calls = []
+
+    def make_handler(name):
+        def handler(signal, sender, **kwargs):
+            calls.append(name)
+            return name
+
+        handler.__name__ = name
+        return handler
+
+    for name in ("second", "first"):
+        register_signal_handler(signal, make_handler(name))
+
+    responses = signal.send(event)
+    robust_responses = signal.send_robust(event)
+
+    assert calls == ["second", "first", "second", "first"]
+    assert [response for _receiver, response in responses] == ["first", "second"]
+    assert [response for _receiver, response in robust_responses] == ["first", "second"]
+
+
+@pytest.mark.django_db
+def test_event_plugin_signal_sender_specific_receivers(register_signal_handler):
+    signal = EventPluginSignal()
+    event = EventFactory()
+    other_event = EventFactory(plugins=event.plugins)
+    handler = _make_handler()
+    handler.__module__ = "tests._test_plugin"
+    register_signal_handler(signal, _make_handler())
+    signal.connect(handler, sender=event)
+
+    signal.send(event)
+    signal.send(other_event)
+    signal.disconnect(handler, sender=event)
+
+    assert handler.received == [event]
+
+
+@pytest.mark.django_db
+def test_event_plugin_signal_skips_async_receivers(register_signal_handler):
+    signal = EventPluginSignal()
+    event = EventFactory()
+
+    async def handler(signal, sender, **kwargs):  # pragma: no cover -- never called
+        return "async"
+
+    register_signal_handler(signal, handler)
+
+    assert signal.send(event) == []
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.parametrize("method", ("send", "send_robust"))
+@pytest.mark.parametrize("receiver_count", (10, 100))
+def test_event_plugin_signal_dispatch_benchmark(receiver_count, method, settings):
+    signal = EventPluginSignal()
+    settings.CORE_MODULES = ["tests._test_plugin"]
+    handlers = []
+    for index in range(receiver_count):
+        handler = _make_handler()
+        # Half of the receivers belong to core modules, half to the plugin.
+        handler.__module__ = (
+            "tests._test_plugin" if index % 2 else f"tests.dummy_app.plugin_{index}"
+        )
+        handler.__name__ = f"handler_{index}"
+        signal.connect(handler, weak=False)
+        handlers.append(handler)
+    event = EventFactory(plugins="tests.dummy_app")
+    send = getattr(signal, method)
+    try:
+        started = time.process_time()
+        for _ in range(1000):
+            responses = send(event)
+        elapsed = time.process_time() - started
+    finally:
+        for handler in handlers:
+            signal.disconnect(handler)
+
+    assert len(responses) == receiver_count
+    # Checking each receiver's module and sorting the responses on every
+    # send took about 0.26 seconds for 1000 sends to 100 receivers, and
+    # about 0.04 seconds with dispatch tables, both without coverage.
+    assert elapsed < 0.2 + receiver_count / 100
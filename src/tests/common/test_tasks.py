@@ -1,12 +1,14 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 from django.core.files.storage import default_storage
 from django_scopes import scope
 
 from pretalx.common.tasks import (
+    progress_callback,
     task_cleanup_file,
     task_generate_thumbnails,
     task_process_image,
@@ -233,3 +235,17 @@ def test_task_cleanup_file_oserror_during_deletion(make_image):
     finally:
         parent_dir.chmod(original_mode)
         default_storage.delete(stored_name)
+
+
+def test_progress_callback_reports_percentage_changes_only():
+    task = MagicMock()
+
+    for current in range(1, 1001):
+        progress_callback(task, current, 1000)
+
+    assert task.update_state.call_count == 100
+    assert task.update_state.call_args.kwargs["meta"] == {
+        "value": 100,
+        "current": 1000,
+        "total": 1000,
+    }
@@ -6,7 +6,11 @@
 from django.core import mail as djmail
 from django.utils.timezone import now
 
-from pretalx.event.domain.lifecycle import send_lifecycle_notifications
+from pretalx.event.domain.lifecycle import (
+    lifecycle_notifications_due,
+    send_lifecycle_notifications,
+)
+from pretalx.event.models import Event
 from tests.factories import (
     EventFactory,
     ScheduleFactory,
@@ -143,3 +147,55 @@ def test_send_lifecycle_notifications_no_event_over_mail_when_event_too_old():
     assert len(djmail.outbox) == 0
     event = refresh(event)
     assert not event.settings.sent_mail_event_over
+
+
+def _is_due(event):
+    return (
+        Event.objects.filter(pk=event.pk).filter(lifecycle_notifications_due()).exists()
+    )
+
+
+@pytest.mark.parametrize(
+    ("deadline", "expected"),
+    (
+        (dt.timedelta(hours=-1), True),
+        (dt.timedelta(days=-2), False),
+        (dt.timedelta(days=1), False),
+    ),
+)
+def test_lifecycle_notifications_due_for_cfp_closed(deadline, expected):
+    event = EventFactory(
+        cfp__deadline=now() + deadline,
+        date_from=(now() + dt.timedelta(days=30)).date(),
+        date_to=(now() + dt.timedelta(days=31)).date(),
+    )
+
+    assert _is_due(event) is expected
+
+
+@pytest.mark.parametrize(
+    ("date_to", "expected"), ((-1, True), (-3, True), (-5, False), (0, False))
+)
+def test_lifecycle_notifications_due_for_event_over(date_to, expected):
+    event = EventFactory(
+        cfp__deadline=None,
+        date_from=(now() + dt.timedelta(days=date_to - 1)).date(),
+        date_to=(now() + dt.timedelta(days=date_to)).date(),
+    )
+
+    assert _is_due(event) is expected
+
+
+def test_lifecycle_notifications_not_due_once_sent():
+    event = EventFactory(
+        cfp__deadline=now() - dt.timedelta(hours=1),
+        date_from=(now() - dt.timedelta(days=3)).date(),
+        date_to=(now() - dt.timedelta(days=1)).date(),
+    )
+    event.settings.sent_mail_cfp_closed = True
+
+    assert _is_due(event)
+
+    event.settings.sent_mail_event_over = True
+
+    assert not _is_due(event)
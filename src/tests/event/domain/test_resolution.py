@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django_scopes import scopes_disabled
+
+from pretalx.event.domain.resolution import (
+    EVENT_RESOLUTION_TIMEOUT,
+    invalidate_event_resolution,
+    resolve_custom_domain,
+    resolve_event,
+)
+from pretalx.schedule.domain.release import freeze_schedule
+from tests.factories import EventExtraLinkFactory, EventFactory
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.django_db,
+    pytest.mark.usefixtures("locmem_cache"),
+]
+
+
+def test_resolve_event_caches_snapshot(django_assert_num_queries):
+    event = EventFactory()
+    EventExtraLinkFactory(event=event)
+    resolve_event(event.slug)
+
+    with django_assert_num_queries(0):
+        first = resolve_event(event.slug.upper())
+        second = resolve_event(event.slug)
+        links = list(first.extra_links.all())
+        organiser = first.organiser
+        cfp = first.cfp
+
+    assert first == second == event
+    assert first is not second
+    assert len(links) == 1
+    assert organiser == event.organiser
+    assert cfp == event.cfp
+
+
+def test_resolve_event_unknown_slug_returns_none():
+    assert resolve_event("nonexistent") is None
+    assert cache.get("event_resolution_nonexistent_generation") is None
+
+
+def test_resolve_event_generations_expire():
+    event = EventFactory()
+    cache.delete(f"event_resolution_{event.slug.lower()}_generation")
+
+    with (
+        patch(
+            "pretalx.event.domain.resolution.cache.get_or_set", wraps=cache.get_or_set
+        ) as get_or_set,
+        patch("pretalx.event.domain.resolution.cache.set", wraps=cache.set) as set_,
+    ):
+        resolve_event(event.slug)
+        invalidate_event_resolution(event.slug)
+
+    assert get_or_set.call_args.kwargs["timeout"] == EVENT_RESOLUTION_TIMEOUT
+    assert set_.call_args.args[2] == EVENT_RESOLUTION_TIMEOUT
+
+
+def test_resolve_event_reloads_without_generation(django_assert_num_queries):
+    event = EventFactory()
+    resolve_event(event.slug)
+    cache.delete(f"event_resolution_{event.slug.lower()}_generation")
+    with scopes_disabled():
+        event.__class__.objects.filter(pk=event.pk).update(name="Changed")
+
+    assert str(resolve_event(event.slug).name) == "Changed"
+
+
+def test_resolve_event_uses_local_snapshot(django_assert_num_queries):
+    event = EventFactory()
+    resolve_event(event.slug)
+    cache.delete(f"event_resolution_{event.slug.lower()}")
+
+    with django_assert_num_queries(0):
+        assert resolve_event(event.slug) == event
+
+
+def test_resolve_event_uses_shared_snapshot(django_assert_num_queries):
+    event = EventFactory()
+    resolve_event(event.slug)
+
+    with (
+        patch("pretalx.event.domain.resolution._local_snapshots", {}),
+        django_assert_num_queries(0),
+    ):
+        assert resolve_event(event.slug) == event
+
+
+def test_resolve_event_ignores_snapshot_of_older_generation():
+    event = EventFactory()
+    resolve_event(event.slug)
+    key = f"event_resolution_{event.slug.lower()}"
+    snapshot = cache.get(key)
+    invalidate_event_resolution(event.slug)
+    # A snapshot of data read before the invalidation is written late.
+    cache.set(key, snapshot)
+
+    with scopes_disabled():
+        event.__class__.objects.filter(pk=event.pk).update(name="Changed")
+
+    assert str(resolve_event(event.slug).name) == "Changed"
+
+
+def test_resolve_event_is_invalidated_on_event_save(django_capture_on_commit_callbacks):
+    event = EventFactory()
+    resolve_event(event.slug)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        event.name = "Changed"
+        event.save()
+
+    assert str(resolve_event(event.slug).name) == "Changed"
+
+
+def test_resolve_event_is_invalidated_on_slug_change(
+    django_capture_on_commit_callbacks,
+):
+    event = EventFactory(slug="oldslug")
+    resolve_event("oldslug")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        event.slug = "newslug"
+        event.save()
+
+    assert resolve_event("oldslug") is None
+    assert resolve_event("newslug") == event
+
+
+def test_resolve_event_is_invalidated_on_extra_link_and_organiser_save():
+    event = EventFactory()
+    resolve_event(event.slug)
+    EventExtraLinkFactory(event=event)
+
+    assert len(resolve_event(event.slug).extra_links.all()) == 1
+
+    event.organiser.name = "New organiser"
+    event.organiser.save()
+
+    assert str(resolve_event(event.slug).organiser.name) == "New organiser"
+
+
+def test_resolve_event_is_invalidated_on_schedule_release():
+    event = EventFactory()
+    assert resolve_event(event.slug)._current_schedule_pk is None
+
+    with scopes_disabled():
+        schedule, _ = freeze_schedule(event.wip_schedule, "v1", notify_speakers=False)
+
+    assert resolve_event(event.slug).current_schedule == schedule
+
+
+def test_resolve_custom_domain_caches_result(django_assert_num_queries):
+    event = EventFactory(custom_domain="https://custom.example.com", is_public=True)
+
+    assert resolve_custom_domain("https", "custom.example.com") == (
+        True,
+        event.urls.base.full(),
+    )
+    with django_assert_num_queries(0):
+        resolve_custom_domain("https", "custom.example.com")
+    assert resolve_custom_domain("https", "other.example.com") == (False, None)
+
+    event.is_public = False
+    event.save()
+
+    assert resolve_custom_domain("https", "custom.example.com") == (True, None)
+
+
+def test_raw_saves_do_not_invalidate_event_resolution():
+    event = EventFactory()
+    resolve_event(event.slug)
+
+    with patch(
+        "pretalx.event.domain.resolution.invalidate_event_resolution"
+    ) as invalidate:
+        event.save_base(raw=True)
+        event.organiser.save_base(raw=True)
+        event.cfp.save_base(raw=True)
+
+    invalidate.assert_not_called()
@@ -1,15 +1,26 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 import datetime as dt
+from unittest.mock import patch
 
 import pytest
 from django.core import mail as djmail
 from django.utils.timezone import now
-from django_scopes import scope
+from django_scopes import scope, scopes_disabled
 
+from pretalx.common.models import DeletedObject
 from pretalx.common.models.file import CachedFile
-from pretalx.event.receivers import clean_cached_files, periodic_event_services
-from tests.factories import CachedFileFactory, EventFactory, ReviewPhaseFactory
+from pretalx.event.receivers import (
+    clean_cached_files,
+    clean_deleted_objects,
+    periodic_event_services,
+)
+from tests.factories import (
+    CachedFileFactory,
+    EventFactory,
+    ReviewPhaseFactory,
+    SubmissionFactory,
+)
 
 pytestmark = [pytest.mark.unit, pytest.mark.django_db]
 
@@ -44,6 +55,21 @@ def test_periodic_event_services_skips_old_events():
     assert len(djmail.outbox) == 0
 
 
+def test_periodic_event_services_only_dispatches_due_events(django_assert_num_queries):
+    due = EventFactory(cfp__deadline=now() - dt.timedelta(hours=1))
+    EventFactory(cfp__deadline=now() + dt.timedelta(days=1))
+
+    with (
+        patch(
+            "pretalx.event.tasks.task_periodic_event_services.apply_async"
+        ) as apply_async,
+        django_assert_num_queries(1),
+    ):
+        periodic_event_services(sender=None)
+
+    apply_async.assert_called_once_with(args=(due.slug,), ignore_result=True)
+
+
 def test_clean_cached_files_deletes_only_expired():
     expired = CachedFileFactory(expires=now() - dt.timedelta(hours=1))
     not_expired = CachedFileFactory(expires=now() + dt.timedelta(hours=1))
@@ -52,3 +78,17 @@ def test_clean_cached_files_deletes_only_expired():
 
     assert not CachedFile.objects.filter(pk=expired.pk).exists()
     assert CachedFile.objects.filter(pk=not_expired.pk).exists()
+
+
+def test_clean_deleted_objects_deletes_only_expired(event):
+    with scopes_disabled():
+        SubmissionFactory(event=event).delete()
+        SubmissionFactory(event=event).delete()
+        expired, recent = DeletedObject.objects.order_by("pk")
+        DeletedObject.objects.filter(pk=expired.pk).update(
+            deleted=now() - dt.timedelta(days=31)
+        )
+
+        clean_deleted_objects(sender=None)
+
+        assert list(DeletedObject.objects.all()) == [recent]
@@ -5,9 +5,10 @@
 import pytest
 from django.core import mail as djmail
 from django.utils.timezone import now
+from django_scopes import scopes_disabled
 
 from pretalx.event.tasks import task_periodic_event_services
-from tests.factories import EventFactory
+from tests.factories import EventFactory, ReviewPhaseFactory
 from tests.utils import refresh
 
 pytestmark = [pytest.mark.unit, pytest.mark.django_db]
@@ -26,3 +27,16 @@ def test_task_periodic_event_services_delegates_to_domain():
     event = refresh(event)
     assert len(djmail.outbox) == 1
     assert event.settings.sent_mail_cfp_closed
+
+
+def test_task_periodic_event_services_updates_review_phase(event):
+    with scopes_disabled():
+        event.review_phases.all().delete()
+        phase = ReviewPhaseFactory(
+            event=event, start=now() - dt.timedelta(days=1), is_active=False
+        )
+
+    task_periodic_event_services(event.slug)
+
+    phase.refresh_from_db()
+    assert phase.is_active
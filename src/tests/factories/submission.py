@@ -1,10 +1,13 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 import factory
+from django.db.models import F
 from django_scopes import scopes_disabled
 
+from pretalx.submission.enums import AttendeeSignupStates
 from pretalx.submission.models import (
     AttendeeSignup,
+    AttendeeSignupCount,
     Feedback,
     Review,
     ReviewScore,
@@ -279,4 +282,12 @@ class Meta:
     @classmethod
     def _create(cls, model_class, *args, **kwargs):
         with scopes_disabled():
-            return super()._create(model_class, *args, **kwargs)
+            signup = super()._create(model_class, *args, **kwargs)
+        if signup.state == AttendeeSignupStates.CONFIRMED:
+            # Signups are normally created by the signup domain functions,
+            # which keep the counter of confirmed signups up to date.
+            AttendeeSignupCount.objects.get_or_create(submission=signup.submission)
+            AttendeeSignupCount.objects.filter(submission=signup.submission).update(
+                count=F("count") + 1
+            )
+        return signup
@@ -132,6 +132,14 @@ def test_get_mail_context_includes_event_placeholders(event):
     assert context["event_slug"] == event.slug
 
 
+@pytest.mark.django_db
+def test_get_mail_context_resolves_only_given_identifiers(event):
+    with scope(event=event):
+        context = get_mail_context(event=event, identifiers={"event_name", "unknown"})
+
+    assert context == {"event_name": event.name}
+
+
 @pytest.mark.django_db
 def test_get_mail_context_includes_user_placeholders(event):
     user = UserFactory(name="Jane Doe", email="jane@example.org")
@@ -4,6 +4,8 @@
 
 import pytest
 from django.core import mail as djmail
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import now
 from django_scopes import scope, scopes_disabled
 
@@ -90,7 +92,7 @@ def test_send_outbox_mails_handles_send_failure(monkeypatch):
     def broken_send(*args, **kwargs):
         raise RuntimeError("SMTP exploded")
 
-    monkeypatch.setattr("pretalx.mail.domain.queue.send_draft", broken_send)
+    monkeypatch.setattr("pretalx.mail.domain.send._claim_draft", broken_send)
 
     with scope(event=event):
         result = send_outbox_mails(event=event, mail_pks=[mail.pk])
@@ -372,3 +374,24 @@ def test_bulk_create_drafts_drops_unreachable_speaker(event):
         assert mails == []
         assert render_failures == 0
         assert event.queued_mails.count() == 0
+
+
+def test_bulk_create_drafts_query_count_does_not_grow_with_recipients(event):
+    template = MailTemplateFactory(event=event, subject="Hi", text="Body")
+
+    def count_queries(speaker_count):
+        with scope(event=event):
+            recipients = [
+                {"speaker_id": SpeakerFactory(event=event).pk}
+                for _ in range(speaker_count)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                mails, _ = bulk_create_drafts(template, recipients)
+        assert len(mails) == speaker_count
+        return len(queries)
+
+    count_queries(1)  # warm up per-event caches
+    assert count_queries(2) == count_queries(10)
+    with scope(event=event):
+        mail = event.queued_mails.order_by("pk").last()
+        assert mail.to_speakers.count() == 1
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 import re
+from unittest.mock import patch
 
 import pytest
 from django.core import mail as djmail
@@ -9,6 +10,7 @@
 
 from pretalx.common.exceptions import SendMailException
 from pretalx.common.text.formatting import FormattedString
+from pretalx.mail.domain.context import get_mail_context
 from pretalx.mail.domain.queue import save_draft
 from pretalx.mail.domain.render import (
     assert_rendered,
@@ -58,6 +60,20 @@ def test_render_returns_unsaved_mail_with_no_recipient(event):
     assert mail.pk is None
 
 
+def test_render_resolves_only_used_placeholders(event):
+    template = MailTemplateFactory(
+        event=event, subject="{event_name}", text="{event_slug} {event_name}"
+    )
+
+    with patch(
+        "pretalx.mail.domain.render.get_mail_context", wraps=get_mail_context
+    ) as context_mock:
+        mail = render_template_to_mail(template)
+
+    assert context_mock.call_args.kwargs["identifiers"] == {"event_name", "event_slug"}
+    assert mail.subject == str(event.name)
+
+
 def test_save_draft_sets_to_address(event):
     template = MailTemplateFactory(event=event, subject="Hi", text="Body")
     mail = render_template_to_mail(template)
@@ -21,6 +21,7 @@
 from pretalx.mail.domain.send import (
     get_send_mail_exceptions,
     send_draft,
+    send_drafts,
     send_system_mail,
     send_transient,
 )
@@ -680,3 +681,77 @@ def test_deliver_persisted_skips_speaker_without_email(event):
 
     assert len(djmail.outbox) == 1
     assert djmail.outbox[0].to == [reachable.user.email]
+
+
+def test_send_drafts_dispatches_chunks(event, monkeypatch):
+    monkeypatch.setattr("pretalx.mail.domain.send.MAIL_BATCH_SIZE", 2)
+    mails = [QueuedMailFactory(event=event, to=f"{i}@pretalx.org") for i in range(3)]
+    progress = MagicMock()
+
+    with patch.object(mail_tasks.task_send_drafts, "apply_async") as dispatch_mock:
+        send_drafts(mails, progress=progress)
+
+    assert [call.kwargs["args"] for call in dispatch_mock.call_args_list] == [
+        [[mails[0].pk, mails[1].pk]],
+        [[mails[2].pk]],
+    ]
+    assert progress.call_count == 3
+    for mail in mails:
+        mail.refresh_from_db()
+        assert mail.state == QueuedMailStates.SENDING
+
+
+def test_send_drafts_delivers_mails(event):
+    mails = [QueuedMailFactory(event=event, to=f"{i}@pretalx.org") for i in range(3)]
+    djmail.outbox = []
+
+    send_drafts(mails)
+
+    assert len(djmail.outbox) == 3
+    for mail in mails:
+        mail.refresh_from_db()
+        assert mail.state == QueuedMailStates.SENT
+
+
+def test_send_drafts_skips_mails_that_were_sent_already(event, caplog):
+    sent = QueuedMailFactory(
+        event=event, to="a@pretalx.org", state=QueuedMailStates.SENT
+    )
+    draft = QueuedMailFactory(event=event, to="b@pretalx.org")
+    djmail.outbox = []
+
+    with caplog.at_level("ERROR", logger="pretalx.mail.domain.send"):
+        send_drafts([sent, draft])
+
+    assert "Failed to send mail" in caplog.text
+    assert len(djmail.outbox) == 1
+
+
+def test_send_drafts_skips_mails_sent_by_pre_send_signal(
+    event, register_signal_handler
+):
+    def mark_as_sent(signal, sender, mail, **kwargs):
+        mail.sent = tz_now()
+
+    register_signal_handler(queuedmail_pre_send, mark_as_sent)
+    mail = QueuedMailFactory(event=event, to="test@pretalx.org")
+
+    with patch.object(mail_tasks.task_send_drafts, "apply_async") as dispatch_mock:
+        send_drafts([mail])
+
+    dispatch_mock.assert_not_called()
+    mail.refresh_from_db()
+    assert mail.state == QueuedMailStates.SENT
+
+
+def test_send_drafts_broker_failure_marks_failed(event):
+    mail = QueuedMailFactory(event=event, to="test@pretalx.org")
+
+    with patch.object(
+        mail_tasks.task_send_drafts, "apply_async", side_effect=OSError("broker down")
+    ):
+        send_drafts([mail])
+
+    mail.refresh_from_db()
+    assert mail.state == QueuedMailStates.DRAFT
+    assert "broker down" in mail.error_data["error"]
@@ -1,11 +1,21 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
+import smtplib
+import socketserver
+import threading
+from unittest.mock import MagicMock, patch
+
 import pytest
+from django.test import override_settings
 from django_scopes import scopes_disabled
 
 from pretalx.common.exceptions import SendMailException
-from pretalx.mail.domain.smtp import deliver_persisted, mail_backend_for_event
+from pretalx.mail.domain.smtp import (
+    deliver_persisted,
+    deliver_persisted_batch,
+    mail_backend_for_event,
+)
 from pretalx.mail.smtp import CustomSMTPBackend
 from tests.factories import QueuedMailFactory, SpeakerFactory
 
@@ -49,3 +59,147 @@ def test_deliver_persisted_without_reachable_recipients_raises(event):
 
     with scopes_disabled(), pytest.raises(SendMailException):
         deliver_persisted(mail)
+
+
+class StandInSMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough of an SMTP server to accept mails and count connections."""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.server.connections += 1
+        self.reply("220 localhost ESMTP")
+        while line := self.rfile.readline():
+            command = line.decode().strip().upper()
+            if command.startswith("EHLO"):
+                self.reply("250 localhost")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.server.messages += 1
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), StandInSMTPHandler)
+    server.daemon_threads = True
+    server.connections = server.messages = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with override_settings(
+        EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+        EMAIL_HOST="127.0.0.1",
+        EMAIL_PORT=server.server_address[1],
+        EMAIL_USE_TLS=False,
+        EMAIL_USE_SSL=False,
+        EMAIL_HOST_USER="",
+        EMAIL_HOST_PASSWORD="",
+    ):
+        yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_deliver_persisted_batch_reuses_one_connection(event, smtp_server):
+    mails = [QueuedMailFactory(event=event, to=f"{i}@pretalx.org") for i in range(5)]
+
+    with scopes_disabled():
+        results = list(deliver_persisted_batch(mails))
+
+    assert results == [(mail, None) for mail in mails]
+    assert smtp_server.messages == 5
+    assert smtp_server.connections == 1
+
+
+def test_deliver_persisted_opens_one_connection_per_mail(event, smtp_server):
+    mails = [QueuedMailFactory(event=event, to=f"{i}@pretalx.org") for i in range(5)]
+
+    with scopes_disabled():
+        for mail in mails:
+            deliver_persisted(mail)
+
+    assert smtp_server.messages == 5
+    assert smtp_server.connections == 5
+
+
+def _fake_backend(send_side_effect=None):
+    backend = MagicMock()
+    backend.send_messages.side_effect = send_side_effect
+    return backend
+
+
+def test_deliver_persisted_batch_reconnects_after_disconnect(event):
+    backend = _fake_backend([smtplib.SMTPServerDisconnected("idle"), 1, 1])
+    mails = [QueuedMailFactory(event=event, to=f"{i}@pretalx.org") for i in range(2)]
+
+    with (
+        scopes_disabled(),
+        patch("pretalx.mail.domain.smtp.get_connection", return_value=backend),
+    ):
+        results = list(deliver_persisted_batch(mails))
+
+    assert results == [(mail, None) for mail in mails]
+    assert backend.send_messages.call_count == 3
+    assert backend.close.call_count == 2
+
+
+def test_deliver_persisted_batch_continues_after_failure(event):
+    error = smtplib.SMTPRecipientsRefused({})
+    backend = _fake_backend([error, 1])
+    backend.close.side_effect = [smtplib.SMTPServerDisconnected("gone"), None]
+    mails = [QueuedMailFactory(event=event, to=f"{i}@pretalx.org") for i in range(2)]
+
+    with (
+        scopes_disabled(),
+        patch("pretalx.mail.domain.smtp.get_connection", return_value=backend),
+    ):
+        results = list(deliver_persisted_batch(mails))
+
+    assert results == [(mails[0], error), (mails[1], None)]
+    assert backend.open.call_count == 2
+
+
+def test_deliver_persisted_batch_yields_backend_errors_per_mail(event):
+    other_event = QueuedMailFactory(to="other@pretalx.org")
+    mails = [QueuedMailFactory(event=event, to=f"{i}@pretalx.org") for i in range(2)]
+    error = ValueError("bad smtp settings")
+    backend = _fake_backend()
+
+    def backend_for_event(mail_event):
+        if mail_event == event:
+            raise error
+        return backend
+
+    with (
+        scopes_disabled(),
+        patch(
+            "pretalx.mail.domain.smtp.mail_backend_for_event",
+            side_effect=backend_for_event,
+        ),
+    ):
+        results = list(deliver_persisted_batch([*mails, other_event]))
+
+    assert results == [(mails[0], error), (mails[1], error), (other_event, None)]
+    backend.send_messages.assert_called_once()
+
+
+def test_deliver_persisted_batch_without_event():
+    mail = QueuedMailFactory(event=None, to="admin@pretalx.org")
+    backend = _fake_backend()
+
+    with (
+        scopes_disabled(),
+        patch("pretalx.mail.domain.smtp.get_connection", return_value=backend),
+    ):
+        results = list(deliver_persisted_batch([mail]))
+
+    assert results == [(mail, None)]
+    backend.send_messages.assert_called_once()
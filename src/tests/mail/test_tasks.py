@@ -21,6 +21,7 @@
 from pretalx.mail.tasks import (
     task_create_mails_for_template,
     task_send_draft,
+    task_send_drafts,
     task_send_outbox_mails,
     task_send_transient,
 )
@@ -308,11 +309,12 @@ def test_create_mails_for_template_skip_queue_dispatches_each_mail(event):
         "skip_queue": True,
     }
 
-    with patch("pretalx.mail.domain.send.send_draft") as dispatch_mock:
+    with patch("pretalx.mail.domain.send.send_drafts") as dispatch_mock:
         result = task_create_mails_for_template.apply(kwargs=task_data).result
 
     assert result == {"count": 1, "render_failures": 0, "skip_queue": True}
     dispatch_mock.assert_called_once()
+    assert len(dispatch_mock.call_args.args[0]) == 1
 
 
 def test_create_mails_for_template_skip_queue_logs_dispatch_failures(event, caplog):
@@ -326,10 +328,10 @@ def test_create_mails_for_template_skip_queue_logs_dispatch_failures(event, capl
 
     with (
         patch(
-            "pretalx.mail.domain.send.send_draft",
+            "pretalx.mail.domain.send._claim_draft",
             side_effect=RuntimeError("SMTP exploded"),
         ),
-        caplog.at_level("ERROR", logger="pretalx.mail.tasks"),
+        caplog.at_level("ERROR", logger="pretalx.mail.domain.send"),
     ):
         result = task_create_mails_for_template.apply(kwargs=task_data).result
 
@@ -337,3 +339,62 @@ def test_create_mails_for_template_skip_queue_logs_dispatch_failures(event, capl
     assert "Failed to send mail" in caplog.text
     with scopes_disabled():
         assert QueuedMail.objects.filter(template_id=template.pk).count() == 1
+
+
+def test_task_send_drafts_marks_mails_sent(event):
+    mails = [
+        QueuedMailFactory(
+            event=event, to=f"{i}@pretalx.org", state=QueuedMailStates.SENDING
+        )
+        for i in range(3)
+    ]
+    draft = QueuedMailFactory(event=event, to="draft@pretalx.org")
+    djmail.outbox = []
+
+    task_send_drafts([mail.pk for mail in mails] + [draft.pk])
+
+    assert len(djmail.outbox) == 3
+    for mail in mails:
+        mail.refresh_from_db()
+        assert mail.state == QueuedMailStates.SENT
+    draft.refresh_from_db()
+    assert draft.state == QueuedMailStates.DRAFT
+
+
+def test_task_send_drafts_marks_failing_mail_failed(event):
+    broken = QueuedMailFactory(event=event, to=None, state=QueuedMailStates.SENDING)
+    working = QueuedMailFactory(
+        event=event, to="ok@pretalx.org", state=QueuedMailStates.SENDING
+    )
+    djmail.outbox = []
+
+    task_send_drafts([broken.pk, working.pk])
+
+    broken.refresh_from_db()
+    working.refresh_from_db()
+    assert broken.state == QueuedMailStates.DRAFT
+    assert broken.error_data["type"] == "SendMailException"
+    assert working.state == QueuedMailStates.SENT
+    assert len(djmail.outbox) == 1
+
+
+def test_task_send_drafts_hands_retryable_errors_to_task_send_draft(event):
+    mail = QueuedMailFactory(
+        event=event, to="retry@pretalx.org", state=QueuedMailStates.SENDING
+    )
+    error = SMTPResponseException(421, "Try again later")
+
+    with (
+        patch(
+            "pretalx.mail.domain.smtp.deliver_persisted_batch",
+            return_value=[(mail, error)],
+        ),
+        patch.object(task_send_draft, "apply_async") as dispatch_mock,
+    ):
+        task_send_drafts([mail.pk])
+
+    dispatch_mock.assert_called_once_with(
+        args=[mail.pk], countdown=1, ignore_result=True
+    )
+    mail.refresh_from_db()
+    assert mail.state == QueuedMailStates.SENDING
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 import json
 from operator import attrgetter
+from types import SimpleNamespace
 
 import pytest
 
@@ -241,7 +242,7 @@ def test_review_export_form_export_data_json():
     response = form.export_data()
 
     assert response["Content-Type"] == "application/json; charset=utf-8"
-    data = json.loads(response.content)
+    data = json.loads(b"".join(response.streaming_content))
     assert len(data) >= 1
 
 
@@ -683,7 +684,7 @@ def test_schedule_export_form_get_data():
         data={"export_format": "json", "target": ["all"], "title": True},
     )
     form.is_valid()
-    data = form.get_data(form.get_queryset(), ["title"], [])
+    data = list(form.get_data(form.get_queryset(), ["title"], []))
 
     assert len(data) == 1
     assert data[0]["ID"] == sub.code
@@ -697,19 +698,58 @@ def test_schedule_export_form_get_data_with_questions():
     question = QuestionFactory(event=event, target=QuestionTarget.SUBMISSION)
     answer = AnswerFactory(question=question, submission=sub)
     form = ScheduleExportForm(event=event, user=user)
-    data = form.get_data(form.event.submissions.all(), [], [question])
+    data = list(form.get_data(form.event.submissions.all(), [], [question]))
 
     assert len(data) == 1
     assert data[0][str(question.question)] == answer.answer_string
 
 
+def test_schedule_export_form_get_data_fetches_answers_per_chunk(
+    django_assert_num_queries, monkeypatch
+):
+    event = EventFactory()
+    user = make_orga_user(event)
+    question = QuestionFactory(event=event, target=QuestionTarget.SUBMISSION)
+    submissions = SubmissionFactory.create_batch(5, event=event)
+    for submission in submissions:
+        AnswerFactory(question=question, submission=submission)
+    form = ScheduleExportForm(event=event, user=user)
+    monkeypatch.setattr("pretalx.orga.forms.export.EXPORT_CHUNK_SIZE", 2)
+    queryset = event.submissions.all().order_by("code")
+
+    # One query for the submissions, and two for answers and their options
+    # per chunk of two submissions.
+    with django_assert_num_queries(7):
+        data = list(form.get_data(queryset, [], [question]))
+
+    assert [row["ID"] for row in data] == sorted(sub.code for sub in submissions)
+    assert all(row[str(question.question)] for row in data)
+
+
+def test_schedule_export_form_get_data_uses_overridden_get_answer():
+    class PluginExportForm(ScheduleExportForm):
+        def get_answer(self, question, obj):
+            answer = super().get_answer(question, obj)
+            return SimpleNamespace(answer_string=f"{answer.answer_string}!")
+
+    event = EventFactory()
+    user = make_orga_user(event)
+    sub = SubmissionFactory(event=event)
+    question = QuestionFactory(event=event, target=QuestionTarget.SUBMISSION)
+    answer = AnswerFactory(question=question, submission=sub)
+    form = PluginExportForm(event=event, user=user)
+    data = list(form.get_data(form.event.submissions.all(), [], [question]))
+
+    assert data[0][str(question.question)] == f"{answer.answer_string}!"
+
+
 def test_schedule_export_form_get_data_without_answer():
     event = EventFactory()
     user = make_orga_user(event)
     SubmissionFactory(event=event)
     question = QuestionFactory(event=event, target=QuestionTarget.SUBMISSION)
     form = ScheduleExportForm(event=event, user=user)
-    data = form.get_data(form.event.submissions.all(), [], [question])
+    data = list(form.get_data(form.event.submissions.all(), [], [question]))
 
     assert data[0][str(question.question)] is None
 
@@ -746,11 +786,27 @@ def test_schedule_export_form_export_data_json():
 
     assert response["Content-Type"] == "application/json; charset=utf-8"
     assert f"{event.slug}_sessions.json" in response["Content-Disposition"]
-    data = json.loads(response.content)
+    data = json.loads(b"".join(response.streaming_content))
     assert len(data) == 1
     assert data[0]["ID"] == sub.code
 
 
+def test_schedule_export_form_json_export_matches_indented_dump():
+    event = EventFactory()
+    user = make_orga_user(event)
+    SubmissionFactory.create_batch(2, event=event)
+    form = ScheduleExportForm(
+        event=event,
+        user=user,
+        data={"export_format": "json", "target": ["all"], "title": True},
+    )
+    form.is_valid()
+    response = form.export_data()
+
+    content = b"".join(response.streaming_content).decode()
+    assert content == json.dumps(json.loads(content), indent=2)
+
+
 def test_schedule_export_form_export_data_csv():
     event = EventFactory()
     user = make_orga_user(event)
@@ -770,7 +826,7 @@ def test_schedule_export_form_export_data_csv():
 
     assert response["Content-Type"] == "text/plain; charset=utf-8"
     assert f"{event.slug}_sessions.csv" in response["Content-Disposition"]
-    content = response.content.decode()
+    content = b"".join(response.streaming_content).decode()
     assert "ID" in content
 
 
@@ -794,7 +850,7 @@ def test_schedule_export_form_csv_export_joins_lists_with_delimiter():
     form.is_valid()
     response = form.export_data()
 
-    content = response.content.decode()
+    content = b"".join(response.streaming_content).decode()
     assert ", " in content
 
 
@@ -819,8 +875,9 @@ def test_schedule_export_form_csv_export_starts_with_utf8_bom():
     form.is_valid()
     response = form.export_data()
 
-    assert response.content.startswith(b"\xef\xbb\xbf")
-    content = response.content.decode("utf-8-sig")
+    raw_content = b"".join(response.streaming_content)
+    assert raw_content.startswith(b"\xef\xbb\xbf")
+    content = raw_content.decode("utf-8-sig")
     assert "Beyond “Big” Data: Building Infrastructure for “Thick” Data" in content
     assert "A Researcher’s Guide – André" in content
     # And a sanity check that the bytes do contain proper UTF-8 sequences,
@@ -847,7 +904,7 @@ def test_schedule_export_form_export_data_with_question():
     form.is_valid()
     response = form.export_data()
 
-    data = json.loads(response.content)
+    data = json.loads(b"".join(response.streaming_content))
     assert data[0][str(question.question)] == answer.answer_string
 
 
@@ -15,6 +15,7 @@
 from pretalx.common.models.file import CachedFile
 from pretalx.event.models import Event
 from pretalx.mail.models import QueuedMail
+from pretalx.schedule.domain.artifacts import get_export_data_version
 from pretalx.submission.models import Question, QuestionTarget
 from pretalx.submission.models.question import QuestionRequired, QuestionVariant
 from tests.factories import (
@@ -1537,6 +1538,24 @@ def test_track_list_query_count(client, event, django_assert_num_queries, item_c
         assert str(t.name) in content
 
 
+@pytest.mark.usefixtures("locmem_cache")
+def test_track_reorder_changes_export_data_version(client, public_event_with_schedule):
+    event = public_event_with_schedule
+    user = make_orga_user(
+        event, can_change_event_settings=True, can_change_submissions=True
+    )
+    with scopes_disabled():
+        first, second = TrackFactory.create_batch(2, event=event)
+        version = get_export_data_version(event.current_schedule)
+    client.force_login(user)
+
+    response = client.post(event.cfp.urls.tracks, {"order": f"{second.pk},{first.pk}"})
+
+    assert response.status_code == 200
+    with scopes_disabled():
+        assert get_export_data_version(event.current_schedule) != version
+
+
 def test_track_detail_accessible(client, event, track):
     user = make_orga_user(
         event, can_change_event_settings=True, can_change_submissions=True
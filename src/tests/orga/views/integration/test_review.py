@@ -937,7 +937,7 @@ def test_review_export_post_json(client, event):
     )
 
     assert response.status_code == 200
-    assert review.text in response.content.decode()
+    assert review.text in b"".join(response.streaming_content).decode()
 
 
 def test_bulk_review_htmx_post_creates_review(client, event):
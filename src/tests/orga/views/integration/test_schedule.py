@@ -8,9 +8,12 @@
 from django.contrib.messages import constants as message_constants
 from django.contrib.messages import get_messages
 from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_scopes import scopes_disabled
 
 from pretalx.common.models.file import CachedFile
+from pretalx.common.text.phrases import phrases
 from pretalx.event.models import Event
 from pretalx.mail.domain.template import mail_template_by_role
 from pretalx.mail.enums import MailTemplateRoles
@@ -67,6 +70,29 @@ def test_schedule_release_creates_new_schedule(client, talk_slot):
         assert Schedule.objects.filter(event=event, version="v1.0").exists()
 
 
+def test_schedule_release_generates_notifications_in_background(client, talk_slot):
+    event = talk_slot.submission.event
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+        speaker = talk_slot.submission.speakers.get()
+    client.force_login(user)
+
+    response = client.post(
+        event.orga_urls.release_schedule,
+        data={"version": "v1.0", "notify_speakers": "on"},
+        follow=True,
+    )
+
+    assert response.status_code == 200
+    assert response.redirect_chain[-1][0] == event.orga_urls.schedule
+    messages = [str(message) for message in get_messages(response.wsgi_request)]
+    assert messages[-1] == str(phrases.orga.mails_in_outbox.format(count=1))
+    with scopes_disabled():
+        mail = event.queued_mails.get()
+        assert list(mail.to_speakers.all()) == [speaker]
+        assert mail.attachments[0]["content_type"] == "text/calendar"
+
+
 def test_schedule_release_rejects_duplicate_version(client, talk_slot):
     event = talk_slot.submission.event
     with scopes_disabled():
@@ -311,6 +337,16 @@ def test_schedule_resend_mails_with_released_schedule(client, published_talk_slo
         assert mail.submissions.count() == 1
 
 
+def test_schedule_resend_mails_rejects_get_without_task(client, event):
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+    client.force_login(user)
+
+    response = client.get(event.orga_urls.schedule + "resend_mails")
+
+    assert response.status_code == 405
+
+
 def test_schedule_resend_mails_without_released_schedule(client, event):
     with scopes_disabled():
         user = make_orga_user(event, can_change_submissions=True)
@@ -802,6 +838,29 @@ def test_room_list_renders_dragsort_wiring(client, event):
     assert f'dragsort-id="{room.pk}"' in content
 
 
+@pytest.mark.usefixtures("locmem_cache")
+def test_room_reorder_changes_export_etag(client, public_event_with_schedule):
+    event = public_event_with_schedule
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_event_settings=True)
+        first = event.rooms.get()
+        second = RoomFactory(event=event)
+    client.force_login(user)
+    etag = client.get(event.urls.frab_json)["ETag"]
+
+    response = client.post(
+        event.orga_urls.room_settings, {"order": f"{second.pk},{first.pk}"}
+    )
+
+    assert response.status_code == 200
+    with scopes_disabled():
+        first.refresh_from_db()
+        assert first.position == 1
+    new_response = client.get(event.urls.frab_json, headers={"if-none-match": etag})
+    assert new_response.status_code == 200
+    assert new_response["ETag"] != etag
+
+
 def test_room_create(client, event):
     with scopes_disabled():
         user = make_orga_user(event, can_change_event_settings=True)
@@ -1096,6 +1155,256 @@ def test_talk_update_patch_into_unusable_room_rejected(client, talk_slot, room_p
     assert talk_slot.room == original_room
 
 
+def _bulk_schedule(event, count):
+    room = RoomFactory(event=event)
+    slots = []
+    for _ in range(count):
+        submission = SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED)
+        submission.speakers.add(SpeakerFactory(event=event))
+        slots.append(
+            TalkSlotFactory(
+                submission=submission, schedule=event.wip_schedule, room=room
+            )
+        )
+    return room, slots
+
+
+def _post_bulk(client, event, talks):
+    return client.post(
+        f"{event.orga_urls.talks_api}bulk/",
+        data=json.dumps({"talks": talks}),
+        content_type="application/json",
+    )
+
+
+def test_talk_bulk_update_moves_slots_and_returns_warnings(client, event):
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+        room, slots = _bulk_schedule(event, 3)
+    client.force_login(user)
+    start = event.datetime_from
+
+    response = _post_bulk(
+        client,
+        event,
+        [
+            {"id": slots[0].pk, "start": start.isoformat(), "room": room.pk},
+            {"id": slots[1].pk, "start": start.isoformat()},
+            {"id": slots[2].pk},
+        ],
+    )
+
+    assert response.status_code == 200
+    results = {result["id"]: result for result in response.json()["results"]}
+    assert set(results) == {slot.pk for slot in slots}
+    assert {warning["type"] for warning in results[slots[0].pk]["warnings"]} == {
+        "room_overlap"
+    }
+    assert results[slots[2].pk]["start"] is None
+    assert results[slots[2].pk]["warnings"] == []
+    with scopes_disabled():
+        for slot in slots:
+            slot.refresh_from_db()
+    assert slots[0].start == slots[1].start == start
+    assert slots[1].room == room
+    assert slots[2].start is slots[2].room is None
+
+
+def test_talk_bulk_update_accepts_string_ids(client, event):
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+        room, slots = _bulk_schedule(event, 1)
+    client.force_login(user)
+    start = event.datetime_from
+
+    response = _post_bulk(
+        client,
+        event,
+        [{"id": str(slots[0].pk), "start": start.isoformat(), "room": str(room.pk)}],
+    )
+
+    assert response.status_code == 200
+    assert [result["id"] for result in response.json()["results"]] == [slots[0].pk]
+    with scopes_disabled():
+        slots[0].refresh_from_db()
+    assert slots[0].start == start
+
+
+def test_talk_bulk_update_query_count_does_not_grow(client, event):
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+        _, slots = _bulk_schedule(event, 6)
+    client.force_login(user)
+    start = event.datetime_from
+
+    def move(count):
+        with CaptureQueriesContext(connection) as context:
+            response = _post_bulk(
+                client,
+                event,
+                [
+                    {
+                        "id": slot.pk,
+                        "start": (start + dt.timedelta(hours=index)).isoformat(),
+                    }
+                    for index, slot in enumerate(slots[:count])
+                ],
+            )
+        assert response.status_code == 200
+        return len(context.captured_queries)
+
+    move(1)
+
+    assert move(6) == move(2)
+
+
+@pytest.mark.parametrize(
+    "talks",
+    (
+        None,
+        ["not a dict"],
+        [{"id": 999999}],
+        [{"id": "not a number"}],
+        [{"id": None, "start": "2026-01-01T10:00:00+00:00"}],
+        [{"id": True}],
+        [{"id": 1.5}],
+        [{"id": ["1"]}],
+        [{"start": "2026-01-01T10:00:00+00:00", "room": "not a number"}],
+        [{"start": "2026-01-01T10:00:00+00:00", "room": {"id": 1}}],
+        [{"start": "not a date"}],
+        [{"start": "2026-01-01T10:00:00+00:00", "room": 123456}],
+        [{"start": "2026-01-01T10:00:00+00:00", "duration": "long"}],
+    ),
+)
+def test_talk_bulk_update_rejects_invalid_data(client, talk_slot, talks):
+    """Entries without an ID apply to ``talk_slot``. A valid move comes
+    first, and must be rolled back along with the invalid one."""
+    event = talk_slot.submission.event
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+        original = (talk_slot.start, talk_slot.room)
+        other_slot = TalkSlotFactory(
+            submission=SubmissionFactory(event=event), schedule=talk_slot.schedule
+        )
+    new_start = event.datetime_from + dt.timedelta(hours=5)
+    client.force_login(user)
+    if talks is not None:
+        talks = [
+            {"id": other_slot.pk, "start": new_start.isoformat()},
+            *(
+                {"id": talk_slot.pk, **talk} if isinstance(talk, dict) else talk
+                for talk in talks
+            ),
+        ]
+
+    response = _post_bulk(client, event, talks)
+
+    assert response.status_code == 400
+    assert response.json()["error"]
+    with scopes_disabled():
+        talk_slot.refresh_from_db()
+        other_slot.refresh_from_db()
+    assert (talk_slot.start, talk_slot.room) == original
+    assert other_slot.start != new_start
+
+
+def test_talk_bulk_update_requires_permission(client, talk_slot):
+    event = talk_slot.submission.event
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=False)
+    client.force_login(user)
+
+    response = _post_bulk(client, event, [{"id": talk_slot.pk}])
+
+    assert response.status_code == 404
+    with scopes_disabled():
+        talk_slot.refresh_from_db()
+    assert talk_slot.start is not None
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_talk_feed_returns_changes_after_cursor(
+    client, talk_slot, django_capture_on_commit_callbacks
+):
+    event = talk_slot.submission.event
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+    client.force_login(user)
+    cursor = client.get(event.orga_urls.talks_api).json()["cursor"]
+    with django_capture_on_commit_callbacks(execute=True):
+        _post_bulk(client, event, [{"id": talk_slot.pk}])
+
+    response = client.get(f"{event.orga_urls.talks_api}feed/?cursor={cursor}")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "cursor": cursor + 1,
+        "reset": False,
+        "changed": [talk_slot.pk],
+        "deleted": [],
+    }
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_talk_feed_is_empty_without_changes(client, talk_slot):
+    event = talk_slot.submission.event
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+    client.force_login(user)
+    cursor = client.get(event.orga_urls.talks_api).json()["cursor"]
+
+    response = client.get(f"{event.orga_urls.talks_api}feed/?cursor={cursor}")
+
+    assert response.status_code == 204
+    assert response.content == b""
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_talk_feed_follows_requested_version(
+    client, published_talk_slot, django_capture_on_commit_callbacks
+):
+    event = published_talk_slot.submission.event
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+        wip_slot = event.wip_schedule.talks.get(
+            submission=published_talk_slot.submission
+        )
+    client.force_login(user)
+    url = f"{event.orga_urls.talks_api}?version=v1"
+    cursor = client.get(url).json()["cursor"]
+    with django_capture_on_commit_callbacks(execute=True):
+        _post_bulk(client, event, [{"id": wip_slot.pk}])
+
+    response = client.get(
+        f"{event.orga_urls.talks_api}feed/?version=v1&cursor={cursor}"
+    )
+
+    assert response.status_code == 204
+
+
+@pytest.mark.parametrize("cursor", ("", "?cursor=latest"))
+def test_talk_feed_rejects_invalid_cursor(client, talk_slot, cursor):
+    event = talk_slot.submission.event
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+    client.force_login(user)
+
+    response = client.get(f"{event.orga_urls.talks_api}feed/{cursor}")
+
+    assert response.status_code == 400
+
+
+def test_talk_feed_requires_permission(client, talk_slot):
+    event = talk_slot.submission.event
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=False)
+    client.force_login(user)
+
+    response = client.get(f"{event.orga_urls.talks_api}feed/")
+
+    assert response.status_code == 404
+
+
 def test_schedule_availabilities_excludes_hidden_rooms(client, event):
     with scopes_disabled():
         user = make_orga_user(event, can_change_submissions=True)
@@ -1137,12 +1446,12 @@ def test_schedule_export_csv(client, event):
 
     assert response.status_code == 200
     # CSV exports start with a UTF-8 BOM so Excel detects the encoding.
-    content = response.content.decode("utf-8-sig")
-    assert content == (
+    content = b"".join(response.streaming_content)
+    assert content.decode("utf-8-sig") == (
         f"ID,Proposal title,Speaker IDs,Dietary needs\r\n"
         f"{submission.code},{submission.title},{speaker.code},Vegan\r\n"
     )
-    assert response.content.startswith(b"\xef\xbb\xbf")
+    assert content.startswith(b"\xef\xbb\xbf")
 
 
 def test_schedule_export_json(client, event):
@@ -1169,7 +1478,7 @@ def test_schedule_export_json(client, event):
     )
 
     assert response.status_code == 200
-    data = json.loads(response.content.decode())
+    data = json.loads(b"".join(response.streaming_content))
     assert data == [
         {
             "ID": submission.code,
@@ -971,8 +971,9 @@ def test_speaker_export_csv(client, event, talk_slot):
         f"{speaker.code},{speaker.get_display_name()},{submission.code},{answer_string}\r\n"
     )
     # CSV exports start with a UTF-8 BOM so Excel detects the encoding.
-    assert response.content.decode("utf-8-sig") == expected
-    assert response.content.startswith(b"\xef\xbb\xbf")
+    content = b"".join(response.streaming_content)
+    assert content.decode("utf-8-sig") == expected
+    assert content.startswith(b"\xef\xbb\xbf")
 
 
 def test_speaker_export_json(client, event, talk_slot):
@@ -1004,7 +1005,7 @@ def test_speaker_export_json(client, event, talk_slot):
     )
 
     assert response.status_code == 200
-    assert json.loads(response.content.decode()) == [
+    assert json.loads(b"".join(response.streaming_content)) == [
         {
             "ID": speaker.code,
             "Name": speaker.get_display_name(),
@@ -3,6 +3,7 @@
 import pytest
 from django_scopes import scopes_disabled
 
+from pretalx.submission.models import SubmissionSearchDocument
 from tests.factories import (
     EventFactory,
     OrganiserFactory,
@@ -382,6 +383,28 @@ def test_nav_typeahead_submission_by_code(client, event):
     assert submission.title in submission_results[0]["name"]
 
 
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    (("abcd", ["Prefix"]), ("CDEF", []), ("bulk", ["Bulk created"])),
+)
+def test_nav_typeahead_submission_code_matches_prefix_only(
+    client, event, query, expected
+):
+    with scopes_disabled():
+        user = make_orga_user(event, can_change_submissions=True)
+        SubmissionFactory(event=event, code="ABCDEF", title="Prefix")
+        bulk = SubmissionFactory(event=event, code="XYZABC", title="Bulk created")
+        SubmissionSearchDocument.objects.filter(submission=bulk).delete()
+    client.force_login(user)
+
+    response = client.get(f"/orga/nav/typeahead/?query={query}")
+
+    results = response.json()["results"]
+    names = [r["name"] for r in results if r["type"] == "submission"]
+    assert len(names) == len(expected)
+    assert all(title in name for title, name in zip(expected, names, strict=True))
+
+
 @pytest.mark.parametrize("item_count", (1, 3))
 def test_nav_typeahead_query_count_no_query(
     client, event, item_count, django_assert_num_queries
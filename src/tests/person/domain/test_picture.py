@@ -2,8 +2,9 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 
 import pytest
+from django.conf import settings
 
-from pretalx.person.domain.picture import assign_avatar, set_avatar
+from pretalx.person.domain.picture import assign_avatar, get_avatar_urls, set_avatar
 from tests.factories import ProfilePictureFactory, SpeakerFactory, UserFactory
 
 pytestmark = [pytest.mark.unit, pytest.mark.django_db]
@@ -128,3 +129,44 @@ def test_assign_avatar_does_not_override_user_picture(make_image, event):
     assert user.profile_picture == existing_pic
     speaker.refresh_from_db()
     assert speaker.profile_picture == new_pic
+
+
+@pytest.mark.parametrize("custom_domain", (None, "https://talks.example.org"))
+def test_get_avatar_urls_match_get_avatar_url(make_image, event, custom_domain):
+    event.custom_domain = custom_domain
+    with_thumbnails = ProfilePictureFactory(
+        avatar=make_image(),
+        avatar_thumbnail=make_image("thumb.png"),
+        avatar_thumbnail_tiny=make_image("tiny.png"),
+    )
+    without_avatar = ProfilePictureFactory(avatar=None)
+
+    urls = get_avatar_urls([with_thumbnails, without_avatar], event=event)
+
+    assert urls == {
+        with_thumbnails.pk: {
+            size: with_thumbnails.get_avatar_url(event=event, thumbnail=size)
+            for size in (None, "default", "tiny")
+        }
+    }
+    assert urls[with_thumbnails.pk]["tiny"].startswith(
+        custom_domain or settings.SITE_URL
+    )
+
+
+def test_get_avatar_urls_queues_missing_thumbnails_once(make_image, monkeypatch):
+    first = ProfilePictureFactory(avatar=make_image())
+    second = ProfilePictureFactory(
+        avatar=make_image(), avatar_thumbnail=make_image("thumb.png")
+    )
+    batches = []
+    monkeypatch.setattr(
+        "pretalx.person.domain.picture.queue_thumbnail_regenerations", batches.append
+    )
+
+    urls = get_avatar_urls([first, second])
+
+    assert batches == [[first.avatar, second.avatar]]
+    assert urls[first.pk]["default"] == urls[first.pk][None]
+    assert urls[second.pk]["tiny"] == urls[second.pk][None]
+    assert urls[second.pk]["default"] != urls[second.pk][None]
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+import datetime as dt
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils.timezone import now
+
+from pretalx.schedule.models import TalkSlot
+from tests.factories import (
+    EventFactory,
+    RoomFactory,
+    ScheduleFactory,
+    SubmissionFactory,
+    TalkSlotFactory,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+def _release_twice(event):
+    submission = SubmissionFactory(event=event)
+    room = RoomFactory(event=event)
+    for index, version in enumerate(("v1", "v2")):
+        schedule = ScheduleFactory(
+            event=event,
+            version=version,
+            published=now() - dt.timedelta(hours=2 - index),
+        )
+        TalkSlotFactory(
+            schedule=schedule,
+            submission=submission,
+            room=room,
+            start=event.datetime_from,
+            end=event.datetime_from + dt.timedelta(hours=1),
+        )
+    return submission
+
+
+def test_compact_schedules_command_shares_slots(event):
+    submission = _release_twice(event)
+    out = StringIO()
+
+    call_command("compact_schedules", event=event.slug, stdout=out)
+
+    assert out.getvalue() == f"{event.slug}: shared 1 slots\n"
+    assert TalkSlot.objects.filter(submission=submission).count() == 1
+
+
+def test_compact_schedules_command_handles_all_events(event):
+    _release_twice(event)
+    _release_twice(EventFactory())
+    out = StringIO()
+
+    call_command("compact_schedules", stdout=out)
+    call_command("compact_schedules", stdout=out)
+
+    assert out.getvalue().count("shared 1 slots") == 2
+
+
+def test_compact_schedules_command_rejects_unknown_event():
+    with pytest.raises(CommandError, match="Could not find event"):
+        call_command("compact_schedules", event="nope")
@@ -0,0 +1,492 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+import datetime as dt
+import gzip
+import hashlib
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import brotli
+import pytest
+from django.http import HttpResponseNotModified
+from django.urls import resolve
+from django_scopes import scope
+
+from pretalx.common.exporter import get_schedule_exporter_content
+from pretalx.event.domain.event import move_full_event
+from pretalx.schedule.domain.artifacts import (
+    ARTIFACT_BROTLI_QUALITY,
+    build_export_artifacts,
+    get_artifact_content,
+    get_artifact_encoding,
+    get_artifact_etag,
+    get_export_artifact,
+    get_export_data_version,
+    render_export_artifact,
+)
+from pretalx.schedule.interfaces.exporters import (
+    FavedICalExporter,
+    FrabJsonExporter,
+    FrabXmlExporter,
+)
+from pretalx.schedule.receivers import build_export_artifacts_on_release
+from pretalx.schedule.tasks import task_build_export_artifacts
+from pretalx.submission.domain.submission import (
+    add_speaker,
+    remove_speaker,
+    reorder_speakers,
+)
+from tests.factories import (
+    ProfilePictureFactory,
+    ResourceFactory,
+    RoomFactory,
+    SpeakerFactory,
+    TrackFactory,
+)
+from tests.utils import make_request
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_export_data_version_is_stable(public_event_with_schedule):
+    event = public_event_with_schedule
+    with scope(event=event):
+        schedule = event.current_schedule
+
+        assert get_export_data_version(schedule) == get_export_data_version(schedule)
+
+
+def test_get_export_data_version_changes_on_talk_edit(published_talk_slot):
+    submission = published_talk_slot.submission
+    event = submission.event
+    with scope(event=event):
+        schedule = event.current_schedule
+        before = get_export_data_version(schedule)
+
+        submission.title = "A new title"
+        submission.save()
+
+        assert get_export_data_version(schedule) != before
+
+
+def test_get_export_data_version_changes_on_speaker_edit(published_talk_slot):
+    event = published_talk_slot.submission.event
+    speaker = published_talk_slot.submission.speakers.first()
+    with scope(event=event):
+        schedule = event.current_schedule
+        before = get_export_data_version(schedule)
+
+        speaker.biography = "New biography"
+        speaker.save()
+
+        assert get_export_data_version(schedule) != before
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_export_data_version_changes_on_deleting_older_rows(published_talk_slot):
+    event = published_talk_slot.submission.event
+    room = RoomFactory(event=event)
+    RoomFactory(event=event)
+    with scope(event=event):
+        schedule = event.current_schedule
+        before = get_export_data_version(schedule)
+
+        room.delete()
+
+        assert get_export_data_version(schedule) != before
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_export_data_version_changes_on_speaker_changes(published_talk_slot):
+    submission = published_talk_slot.submission
+    event = submission.event
+    speaker = SpeakerFactory(event=event)
+    with scope(event=event):
+        schedule = event.current_schedule
+        versions = [get_export_data_version(schedule)]
+
+        add_speaker(submission, speaker)
+        versions.append(get_export_data_version(schedule))
+        reorder_speakers(
+            submission,
+            role_ids=[
+                str(pk)
+                for pk in submission.speaker_roles.order_by("-position").values_list(
+                    "pk", flat=True
+                )
+            ],
+        )
+        versions.append(get_export_data_version(schedule))
+        remove_speaker(submission, speaker)
+        versions.append(get_export_data_version(schedule))
+
+    assert len(set(versions)) == 4
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_export_data_version_changes_on_user_name_change(published_talk_slot):
+    event = published_talk_slot.submission.event
+    with scope(event=event):
+        speaker = published_talk_slot.submission.speakers.first()
+        speaker.name = None
+        speaker.save()
+        schedule = event.current_schedule
+        before = get_export_data_version(schedule)
+
+        speaker.user.last_login = speaker.user.created
+        speaker.user.save(update_fields=["last_login"])
+        assert get_export_data_version(schedule) == before
+
+        speaker.user.name = "A new name"
+        speaker.user.save()
+
+        assert get_export_data_version(schedule) != before
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_export_data_version_runs_no_queries(
+    published_talk_slot, django_assert_num_queries
+):
+    event = published_talk_slot.submission.event
+    with scope(event=event):
+        schedule = event.current_schedule
+        get_export_data_version(schedule)
+
+        with django_assert_num_queries(0):
+            get_export_data_version(schedule)
+
+
+def _edit_track(slot):
+    track = TrackFactory(event=slot.submission.event)
+    track.name = "A new track name"
+    track.save()
+
+
+def _edit_released_slot(slot):
+    slot = slot.submission.event.current_schedule.talks.get(pk=slot.pk)
+    slot.description = "A new description"
+    slot.save()
+
+
+def _add_resource(slot):
+    ResourceFactory(submission=slot.submission)
+
+
+def _delete_profile_picture(slot):
+    speaker = slot.submission.speakers.first()
+    speaker.profile_picture = ProfilePictureFactory(user=speaker.user)
+    speaker.save(update_fields=["profile_picture"])
+    before = get_export_data_version(slot.submission.event.current_schedule)
+    speaker.profile_picture.delete()
+    return before
+
+
+def _move_full_event(slot):
+    event = slot.submission.event
+    move_full_event(event, event.date_from + dt.timedelta(days=7))
+
+
+@pytest.mark.usefixtures("locmem_cache")
+@pytest.mark.parametrize(
+    "change",
+    (
+        _edit_track,
+        _edit_released_slot,
+        _add_resource,
+        _delete_profile_picture,
+        _move_full_event,
+    ),
+)
+def test_get_export_data_version_changes_on_data_change(published_talk_slot, change):
+    event = published_talk_slot.submission.event
+    with scope(event=event):
+        schedule = event.current_schedule
+        before = get_export_data_version(schedule)
+
+        before = change(published_talk_slot) or before
+
+        assert get_export_data_version(schedule) != before
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_export_data_version_ignores_wip_slot_changes(published_talk_slot):
+    event = published_talk_slot.submission.event
+    with scope(event=event):
+        schedule = event.current_schedule
+        before = get_export_data_version(schedule)
+
+        slot = event.wip_schedule.talks.get(submission=published_talk_slot.submission)
+        slot.description = "A new description"
+        slot.save()
+
+        assert get_export_data_version(schedule) == before
+
+
+def test_render_export_artifact_compresses_content(public_event_with_schedule):
+    event = public_event_with_schedule
+    with scope(event=event):
+        exporter = FrabJsonExporter(event.current_schedule)
+        _, _, data = exporter.render(request=None)
+
+        artifact = render_export_artifact(exporter, "version")
+
+    assert artifact["data_version"] == "version"
+    assert artifact["content_type"] == "application/json"
+    assert "content" not in artifact
+    assert gzip.decompress(artifact["gzip"]) == data.encode()
+    assert brotli.decompress(artifact["br"]) == data.encode()
+    assert json.loads(data)["schedule"]["version"] == "v1"
+
+
+def test_render_export_artifact_uses_brotli_quality(public_event_with_schedule):
+    event = public_event_with_schedule
+    with (
+        scope(event=event),
+        patch(
+            "pretalx.schedule.domain.artifacts.brotli.Compressor",
+            wraps=brotli.Compressor,
+        ) as compressor_mock,
+    ):
+        exporter = FrabJsonExporter(event.current_schedule)
+        render_export_artifact(exporter, "version")
+        render_export_artifact(exporter, "version", brotli_quality=11)
+
+    assert [call.kwargs["quality"] for call in compressor_mock.call_args_list] == [
+        ARTIFACT_BROTLI_QUALITY,
+        11,
+    ]
+
+
+def test_render_export_artifact_compresses_streamed_chunks_as_they_come():
+    chunks = ["<schedule>", "<day>ä</day>" * 100, "</schedule>"]
+    compressed = []
+
+    class Compressor(brotli.Compressor):
+        def process(self, data):
+            compressed.append(data)
+            return super().process(data)
+
+    def stream_data(request):
+        for index, chunk in enumerate(chunks):
+            # Every chunk is compressed before the next one is rendered.
+            assert len(compressed) == index
+            yield chunk
+
+    exporter = SimpleNamespace(
+        streaming=True,
+        filename="schedule.xml",
+        content_type="text/xml",
+        stream_data=stream_data,
+    )
+    with patch("pretalx.schedule.domain.artifacts.brotli.Compressor", Compressor):
+        artifact = render_export_artifact(exporter, "version")
+
+    content = "".join(chunks).encode()
+    assert brotli.decompress(artifact["br"]) == content
+    assert gzip.decompress(artifact["gzip"]) == content
+    assert artifact["etag"] == hashlib.sha1(content).hexdigest()  # noqa: S324 -- test
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_export_artifact_renders_once(public_event_with_schedule):
+    event = public_event_with_schedule
+    with scope(event=event):
+        schedule = event.current_schedule
+        first = get_export_artifact(FrabXmlExporter(schedule), "en")
+
+        with patch(
+            "pretalx.schedule.domain.artifacts.render_export_artifact"
+        ) as render_mock:
+            second = get_export_artifact(FrabXmlExporter(schedule), "en")
+
+    render_mock.assert_not_called()
+    assert second == first
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_export_artifact_rerenders_after_data_change(published_talk_slot):
+    submission = published_talk_slot.submission
+    event = submission.event
+    with scope(event=event):
+        schedule = event.current_schedule
+        get_export_artifact(FrabXmlExporter(schedule), "en")
+        submission.title = "Changed title"
+        submission.save()
+
+        artifact = get_export_artifact(FrabXmlExporter(schedule), "en")
+
+    assert b"Changed title" in gzip.decompress(artifact["gzip"])
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    (
+        (None, None),
+        ("", None),
+        ("gzip, deflate", "gzip"),
+        ("gzip, deflate, br", "br"),
+        ("BR;q=1.0", "br"),
+        ("br;q=0, gzip", "gzip"),
+        ("br; q=0.0, gzip;q=0", None),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;q=invalid, gzip", "gzip"),
+        ("identity", None),
+    ),
+)
+def test_get_artifact_encoding_negotiates_encoding(accept_encoding, expected):
+    artifact = {"gzip": gzip.compress(b"plain"), "br": b"brotli", "etag": "abc"}
+
+    encoding = get_artifact_encoding(accept_encoding)
+
+    assert encoding == expected
+    assert get_artifact_content(artifact, encoding) == (
+        artifact[expected] if expected else b"plain"
+    )
+    assert get_artifact_etag(artifact, encoding) == (
+        f"abc-{expected}" if expected else "abc"
+    )
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_build_export_artifacts_builds_cacheable_exporters(public_event_with_schedule):
+    event = public_event_with_schedule
+    event.locales = ["en", "de"]
+    event.save()
+    with scope(event=event):
+        built = build_export_artifacts(event.current_schedule)
+
+    identifiers = {identifier for identifier, _ in built}
+    assert identifiers == {
+        "schedule.xml",
+        "schedule.xcal",
+        "schedule.json",
+        "schedule.ics",
+    }
+    assert {locale for _, locale in built} == {"en", "de"}
+    assert FavedICalExporter.identifier not in identifiers
+
+
+def test_build_export_artifacts_skips_wip_schedule(event):
+    with scope(event=event):
+        assert build_export_artifacts(event.wip_schedule) == []
+
+
+def test_build_export_artifacts_logs_failing_exporter(public_event_with_schedule):
+    event = public_event_with_schedule
+    with (
+        scope(event=event),
+        patch(
+            "pretalx.schedule.domain.artifacts.render_export_artifact",
+            side_effect=ValueError,
+        ),
+        patch("pretalx.schedule.domain.artifacts.logger") as logger_mock,
+    ):
+        built = build_export_artifacts(event.current_schedule)
+
+    assert built == []
+    assert logger_mock.exception.call_count == 4
+
+
+def test_task_build_export_artifacts(public_event_with_schedule):
+    event = public_event_with_schedule
+    with scope(event=event):
+        schedule_id = event.current_schedule.pk
+
+    built = task_build_export_artifacts(schedule_id=schedule_id)
+
+    assert ("schedule.json", event.locale) in built
+
+
+def test_task_build_export_artifacts_missing_schedule():
+    assert task_build_export_artifacts(schedule_id=0) is None
+
+
+def test_build_export_artifacts_on_release_runs_after_commit(
+    public_event_with_schedule, django_capture_on_commit_callbacks
+):
+    event = public_event_with_schedule
+    with scope(event=event):
+        schedule = event.current_schedule
+    with (
+        patch(
+            "pretalx.schedule.tasks.task_build_export_artifacts.apply_async"
+        ) as task_mock,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        build_export_artifacts_on_release(sender=event, schedule=schedule)
+
+    task_mock.assert_called_once_with(
+        kwargs={"schedule_id": schedule.pk}, ignore_result=True
+    )
+
+
+def _export_request(event, headers=None):
+    return make_request(
+        event,
+        path=f"/{event.slug}/schedule/export/schedule.json",
+        headers=headers,
+        resolver_match=resolve(f"/{event.slug}/schedule/"),
+    )
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_schedule_exporter_content_serves_compressed_artifact(
+    public_event_with_schedule,
+):
+    event = public_event_with_schedule
+    with scope(event=event):
+        schedule = event.current_schedule
+        plain = get_schedule_exporter_content(
+            _export_request(event), "schedule.json", schedule
+        )
+        compressed = get_schedule_exporter_content(
+            _export_request(event, headers={"Accept-Encoding": "gzip, br"}),
+            "schedule.json",
+            schedule,
+        )
+
+    assert "Content-Encoding" not in plain
+    assert compressed["Content-Encoding"] == "br"
+    assert compressed["Vary"] == "Accept-Encoding"
+    assert compressed["ETag"] != plain["ETag"]
+    assert brotli.decompress(compressed.content) == plain.content
+    assert compressed["Access-Control-Allow-Origin"] == "*"
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_schedule_exporter_content_artifact_etag_match(public_event_with_schedule):
+    event = public_event_with_schedule
+    with scope(event=event):
+        schedule = event.current_schedule
+        response = get_schedule_exporter_content(
+            _export_request(event), "schedule.xml", schedule
+        )
+        request = _export_request(event, headers={"If-None-Match": response["ETag"]})
+
+        result = get_schedule_exporter_content(request, "schedule.xml", schedule)
+
+    assert isinstance(result, HttpResponseNotModified)
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_schedule_exporter_content_artifact_etag_depends_on_encoding(
+    public_event_with_schedule,
+):
+    event = public_event_with_schedule
+    with scope(event=event):
+        schedule = event.current_schedule
+        response = get_schedule_exporter_content(
+            _export_request(event), "schedule.xml", schedule
+        )
+        request = _export_request(
+            event,
+            headers={"If-None-Match": response["ETag"], "Accept-Encoding": "gzip"},
+        )
+
+        result = get_schedule_exporter_content(request, "schedule.xml", schedule)
+
+    assert result.status_code == 200
+    assert result["Content-Encoding"] == "gzip"
+    assert result["ETag"] != response["ETag"]
@@ -6,6 +6,7 @@
 from django.utils.timezone import now
 
 from pretalx.schedule.domain.changelog import build_changelog
+from pretalx.schedule.domain.release import share_unchanged_event_slots
 from pretalx.submission.models import SubmissionStates
 from tests.factories import (
     RoomFactory,
@@ -140,6 +141,32 @@ def test_build_changelog_limit_returns_newest_schedules(event):
     assert len(result[-1].previous_schedule.scheduled_talks) == 1
 
 
+def test_build_changelog_includes_shared_slots(event):
+    submission = SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED)
+    room = RoomFactory(event=event)
+    for index, version in enumerate(("v1", "v2", "v3", "v4")):
+        schedule = ScheduleFactory(
+            event=event,
+            version=version,
+            published=now() - dt.timedelta(hours=10 - index),
+        )
+        TalkSlotFactory(
+            schedule=schedule,
+            submission=submission,
+            room=room,
+            start=event.datetime_from,
+            end=event.datetime_from + dt.timedelta(hours=1),
+        )
+    assert share_unchanged_event_slots(event) == 3
+
+    result = build_changelog(event, limit=2)
+
+    assert [schedule.version for schedule in result] == ["v4", "v3"]
+    for schedule in (*result, result[-1].previous_schedule):
+        assert [slot.schedule for slot in schedule.scheduled_talks] == [schedule]
+    assert result[0].changes["count"] == 0
+
+
 def _release_v1_v2_with_move_new_and_canceled(event):
     sub_a = SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED)
     sub_b = SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED)
@@ -2,19 +2,27 @@
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 import datetime as dt
 import json
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 from django.utils.timezone import now
 from django_scopes import scope
 
 from pretalx.schedule.domain.changes import (
+    SCHEDULE_CHANGES_MAX_DELAY,
+    SCHEDULE_CHANGES_QUIET_PERIOD,
     _deserialize_changes,
     _get_boolean_changes,
     _serialize_changes,
     calculate_schedule_changes,
     get_cached_schedule_changes,
+    get_unreleased_schedule_changes_delay,
     has_unreleased_schedule_changes,
     invalidate_cached_schedule_changes,
+    queue_unreleased_schedule_changes_update,
+    reset_unreleased_schedule_changes_update,
     update_unreleased_schedule_changes,
 )
 from pretalx.submission.models import SubmissionStates
@@ -25,6 +33,7 @@
     SubmissionFactory,
     TalkSlotFactory,
 )
+from tests.utils import CountingNamespace
 
 pytestmark = [pytest.mark.unit, pytest.mark.django_db]
 
@@ -864,6 +873,80 @@ def test_has_unreleased_schedule_changes_calculates_when_not_cached(event):
         assert event.cache.get("has_unreleased_schedule_changes") is False
 
 
+def _synthetic_schedule_pair(slot_count, room_count=20, make_slot=SimpleNamespace):
+    """A released schedule and its successor, moved by one day as a whole.
+    Every tenth session is dropped from the successor, and as many new
+    sessions are added. Slots are built by ``make_slot``."""
+    base = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+    rooms = [SimpleNamespace(pk=pk, speaker_info="") for pk in range(room_count)]
+
+    def build_slot(submission, position, day=0):
+        room = rooms[position % room_count]
+        start = (
+            base
+            + dt.timedelta(days=day)
+            + dt.timedelta(minutes=30 * (position // room_count))
+        )
+        return make_slot(
+            submission=submission,
+            room=room,
+            room_id=room.pk,
+            start=start,
+            local_start=start,
+        )
+
+    old_slots = [build_slot(f"S{pk}", pk) for pk in range(slot_count)]
+    new_slots = [
+        build_slot(f"S{pk}" if pk % 10 else f"N{pk}", pk, day=1)
+        for pk in range(slot_count)
+    ]
+    return SimpleNamespace(
+        previous_schedule=SimpleNamespace(scheduled_talks=old_slots),
+        scheduled_talks=new_slots,
+    )
+
+
+def _assert_schedule_pair_changes(result, slot_count):
+    replaced = slot_count // 10
+    assert len(result["new_talks"]) == replaced
+    assert len(result["canceled_talks"]) == replaced
+    assert len(result["moved_talks"]) == slot_count - replaced
+    assert result["count"] == slot_count + replaced
+    assert all(
+        move["new_start"] - move["old_start"] == dt.timedelta(days=1)
+        for move in result["moved_talks"]
+    )
+
+
+@pytest.mark.parametrize("slot_count", (100, 1000, 10000))
+def test_calculate_schedule_changes_reads_each_slot_a_few_times(slot_count):
+    schedule = _synthetic_schedule_pair(slot_count, make_slot=CountingNamespace)
+
+    CountingNamespace.reads = 0
+    result = calculate_schedule_changes(schedule)
+    reads = CountingNamespace.reads
+
+    _assert_schedule_pair_changes(result, slot_count)
+    # Each slot of both schedules is read a handful of times, while scanning
+    # all slots for each moved session would read slot_count² slots.
+    assert reads < 10 * 2 * slot_count
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("slot_count", (100, 1000, 10000))
+def test_calculate_schedule_changes_benchmark(slot_count):
+    schedule = _synthetic_schedule_pair(slot_count)
+
+    started = time.process_time()
+    result = calculate_schedule_changes(schedule)
+    elapsed = time.process_time() - started
+
+    _assert_schedule_pair_changes(result, slot_count)
+    # Scanning all slots for each moved session took about 25 seconds for
+    # 10,000 slots.
+    assert elapsed < 1 + slot_count / 20000
+
+
 @pytest.mark.usefixtures("locmem_cache")
 def test_update_unreleased_schedule_changes_with_value(event):
     with scope(event=event):
@@ -880,3 +963,66 @@ def test_update_unreleased_schedule_changes_recalculates_when_none(event):
         update_unreleased_schedule_changes(event, None)
 
         assert event.cache.get("has_unreleased_schedule_changes") is False
+
+
+def _queue_update_at(event, timestamp):
+    with (
+        patch("pretalx.schedule.domain.changes.time.time", return_value=timestamp),
+        patch(
+            "pretalx.schedule.domain.changes.task_update_unreleased_schedule_changes.apply_async"
+        ) as task_mock,
+    ):
+        queue_unreleased_schedule_changes_update(event)
+    return task_mock
+
+
+def _delay_at(event, timestamp):
+    with patch("pretalx.schedule.domain.changes.time.time", return_value=timestamp):
+        return get_unreleased_schedule_changes_delay(event)
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_queue_unreleased_schedule_changes_update_coalesces_burst(event):
+    first = _queue_update_at(event, 1000)
+    second = _queue_update_at(event, 1001)
+
+    first.assert_called_once_with(
+        kwargs={"event": event.slug},
+        countdown=SCHEDULE_CHANGES_QUIET_PERIOD,
+        ignore_result=True,
+    )
+    second.assert_not_called()
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_unreleased_schedule_changes_delay_waits_for_quiet_period(event):
+    _queue_update_at(event, 1000)
+    _queue_update_at(event, 1003)
+
+    assert _delay_at(event, 1004) == SCHEDULE_CHANGES_QUIET_PERIOD - 1
+    assert _delay_at(event, 1003 + SCHEDULE_CHANGES_QUIET_PERIOD) == 0
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_unreleased_schedule_changes_delay_is_bounded(event):
+    for timestamp in range(1000, 1000 + SCHEDULE_CHANGES_MAX_DELAY):
+        _queue_update_at(event, timestamp)
+
+    assert _delay_at(event, 1000 + SCHEDULE_CHANGES_MAX_DELAY - 1) == 1
+    assert _delay_at(event, 1000 + SCHEDULE_CHANGES_MAX_DELAY) == 0
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_unreleased_schedule_changes_delay_without_pending_edits(event):
+    assert get_unreleased_schedule_changes_delay(event) == 0
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_reset_unreleased_schedule_changes_update_starts_new_burst(event):
+    _queue_update_at(event, 1000)
+
+    reset_unreleased_schedule_changes_update(event)
+    task_mock = _queue_update_at(event, 1001)
+
+    task_mock.assert_called_once()
+    assert _delay_at(event, 1001) == SCHEDULE_CHANGES_QUIET_PERIOD
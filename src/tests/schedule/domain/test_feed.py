@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+import pytest
+from django.core.cache import cache
+
+from pretalx.schedule.domain.feed import (
+    get_feed_cursor,
+    get_slot_changes,
+    publish_slot_changes,
+)
+from pretalx.schedule.domain.release import freeze_schedule, unfreeze_schedule
+from pretalx.schedule.domain.slot import (
+    SlotMove,
+    create_slot,
+    delete_slot,
+    move_slot,
+    move_slots,
+    unschedule_slot,
+)
+from tests.factories import RoomFactory, SubmissionFactory, TalkSlotFactory
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+def _publish(capture, schedule, **kwargs):
+    with capture(execute=True):
+        publish_slot_changes(schedule.pk, **kwargs)
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_slot_changes_merges_entries(event, django_capture_on_commit_callbacks):
+    schedule = event.wip_schedule
+    _publish(django_capture_on_commit_callbacks, schedule, changed=[1, 2])
+    _publish(django_capture_on_commit_callbacks, schedule, changed=[3], deleted=[2])
+
+    assert get_feed_cursor(schedule) == 2
+    assert get_slot_changes(schedule, 0) == (
+        2,
+        {"reset": False, "changed": [1, 3], "deleted": [2]},
+    )
+    assert get_slot_changes(schedule, 1) == (
+        2,
+        {"reset": False, "changed": [3], "deleted": [2]},
+    )
+    assert get_slot_changes(schedule, 2) == (2, None)
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_publish_slot_changes_waits_for_commit(
+    event, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks() as callbacks:
+        publish_slot_changes(event.wip_schedule.pk, changed=[1])
+
+        assert get_feed_cursor(event.wip_schedule) == 0
+
+    assert len(callbacks) == 1
+
+
+def test_publish_slot_changes_without_cache(event, django_capture_on_commit_callbacks):
+    _publish(django_capture_on_commit_callbacks, event.wip_schedule, changed=[1])
+
+    assert get_feed_cursor(event.wip_schedule) == 0
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_slot_changes_resets_on_missing_entries(
+    event, django_capture_on_commit_callbacks
+):
+    schedule = event.wip_schedule
+    _publish(django_capture_on_commit_callbacks, schedule, changed=[1])
+    _publish(django_capture_on_commit_callbacks, schedule, changed=[2])
+    cache.delete(f"schedule_{schedule.pk}_feed_1")
+
+    assert get_slot_changes(schedule, 0) == (
+        2,
+        {"reset": True, "changed": [2], "deleted": []},
+    )
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_slot_changes_resets_on_lost_feed(event):
+    assert get_slot_changes(event.wip_schedule, 5) == (
+        0,
+        {"reset": True, "changed": [], "deleted": []},
+    )
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_slot_functions_publish_changes(event, django_capture_on_commit_callbacks):
+    schedule = event.wip_schedule
+    room = RoomFactory(event=event)
+    talk = TalkSlotFactory(
+        submission=SubmissionFactory(event=event), schedule=schedule, room=room
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        slot = create_slot(schedule=schedule, room=room, start=event.datetime_from)
+        slot_pk = slot.pk
+        move_slot(talk, event.datetime_from, room=room)
+        move_slots(schedule, [SlotMove(talk)])
+        unschedule_slot(talk)
+        delete_slot(slot)
+
+    assert get_slot_changes(schedule, 0) == (
+        5,
+        {"reset": False, "changed": [talk.pk], "deleted": [slot_pk]},
+    )
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_freeze_schedule_resets_old_wip_feed(event, django_capture_on_commit_callbacks):
+    schedule = event.wip_schedule
+
+    with django_capture_on_commit_callbacks(execute=True):
+        freeze_schedule(schedule, "v1", notify_speakers=False)
+
+    _cursor, changes = get_slot_changes(schedule, 0)
+    assert changes["reset"] is True
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_slot_saves_outside_slot_functions_publish_changes(
+    event, django_capture_on_commit_callbacks
+):
+    schedule = event.wip_schedule
+    talk = TalkSlotFactory(submission=SubmissionFactory(event=event), schedule=schedule)
+    cursor = get_feed_cursor(schedule)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        talk.room = RoomFactory(event=event)
+        talk.save()
+
+    assert get_slot_changes(schedule, cursor) == (
+        cursor + 1,
+        {"reset": False, "changed": [talk.pk], "deleted": []},
+    )
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_unfreeze_schedule_resets_old_wip_feed(
+    event, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        schedule, wip_schedule = freeze_schedule(
+            event.wip_schedule, "v1", notify_speakers=False
+        )
+    cursor = get_feed_cursor(wip_schedule)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        unfreeze_schedule(schedule)
+
+    _cursor, changes = get_slot_changes(wip_schedule, cursor)
+    assert changes["reset"] is True
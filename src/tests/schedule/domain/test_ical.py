@@ -1,19 +1,34 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+import datetime as dt
+import re
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import icalendar
 import pytest
 from django_scopes import scope
 
 from pretalx.schedule.domain.ical import (
     build_slot_vevent,
+    get_calendar,
     get_slot_ical,
-    get_slots_ical,
     get_speaker_ical,
     get_submission_ical,
+    get_vtimezone,
+    render_slot_ical,
+    render_slots_ical,
     serialize_calendar,
 )
 from pretalx.schedule.models.slot import TalkSlot
-from tests.factories import TalkSlotFactory
+from tests.factories import (
+    EventFactory,
+    RoomFactory,
+    SpeakerFactory,
+    SubmissionFactory,
+    TalkSlotFactory,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -44,38 +59,40 @@ def test_build_slot_vevent_appends_vevent():
     assert vevent.end == slot.local_end
 
 
+def _icalendar_slots_ical(event, slots, prodid_suffix=None):
+    """Serialise *slots* through icalendar objects, as a reference for
+    :func:`render_slots_ical`."""
+    prodid = event.slug
+    if prodid_suffix:
+        prodid = f"{prodid}//{prodid_suffix}"
+    cal = get_calendar(event, prodid)
+    for slot in slots:
+        build_slot_vevent(slot, cal)
+    return serialize_calendar(cal)
+
+
 @pytest.mark.django_db
-def test_get_slots_ical_with_slot(event, talk_slot):
+def test_render_slots_ical_with_slot(event, talk_slot):
     with scope(event=event):
         slots = event.wip_schedule.talks.filter(pk=talk_slot.pk)
-        cal = get_slots_ical(event, slots)
+        cal = icalendar.Calendar.from_ical(render_slots_ical(event, slots))
 
-    result = serialize_calendar(cal)
-    assert "BEGIN:VCALENDAR" in result
-    assert "BEGIN:VEVENT" in result
     assert event.slug in cal["prodid"]
+    assert len(cal.events) == 1
+    assert cal.events[0]["url"] == talk_slot.submission.urls.public.full()
 
 
 @pytest.mark.django_db
-def test_get_slots_ical_prodid_with_suffix(event, talk_slot):
+def test_render_slots_ical_prodid_with_suffix(event, talk_slot):
     with scope(event=event):
         slots = event.wip_schedule.talks.filter(pk=talk_slot.pk)
-        cal = get_slots_ical(event, slots, prodid_suffix="faved")
+        cal = icalendar.Calendar.from_ical(
+            render_slots_ical(event, slots, prodid_suffix="faved")
+        )
 
     assert cal["prodid"].endswith("//faved")
 
 
-@pytest.mark.django_db
-def test_get_slots_ical_empty_slots(event):
-    with scope(event=event):
-        slots = event.wip_schedule.talks.none()
-        cal = get_slots_ical(event, slots)
-
-    result = serialize_calendar(cal)
-    assert "BEGIN:VCALENDAR" in result
-    assert "BEGIN:VEVENT" not in result
-
-
 @pytest.mark.django_db
 def test_get_slot_ical_uses_iana_tzid():
     slot = TalkSlotFactory(submission__event__timezone="Europe/London")
@@ -116,7 +133,7 @@ def test_get_slot_ical(event, talk_slot):
 @pytest.mark.django_db
 def test_get_speaker_ical(event, talk_slot):
     speaker = talk_slot.submission.speakers.first()
-    cal = get_speaker_ical(event, speaker)
+    cal = icalendar.Calendar.from_ical(get_speaker_ical(event, speaker))
 
     assert f"speaker//{speaker.code}" in cal["prodid"]
 
@@ -125,9 +142,12 @@ def test_get_speaker_ical(event, talk_slot):
 def test_get_submission_ical(event, talk_slot):
     with scope(event=event):
         slots = event.wip_schedule.talks.filter(pk=talk_slot.pk)
-        cal = get_submission_ical(talk_slot.submission, slots)
+        cal = icalendar.Calendar.from_ical(
+            get_submission_ical(talk_slot.submission, slots)
+        )
 
     assert f"talk//{talk_slot.submission.code}" in cal["prodid"]
+    assert len(cal.events) == 1
 
 
 @pytest.mark.django_db
@@ -145,3 +165,149 @@ def test_build_slot_vevent_strips_control_characters():
     assert "\x9b" not in serialized
     assert "Talktitle" in cal.events[0]["summary"]
     assert "Abstractwith control" in cal.events[0]["description"]
+
+
+def _without_dtstamp(calendar):
+    return re.sub(r"DTSTAMP:\d{8}T\d{6}Z\r\n", "", calendar)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "timezone", ("Europe/Berlin", "UTC", "America/Los_Angeles", "Asia/Kolkata")
+)
+def test_render_slots_ical_matches_icalendar_output(timezone):
+    event = EventFactory(timezone=timezone)
+    room = RoomFactory(event=event, name="Großer Saal, links; \\hinten\x1b")
+    speaker = SpeakerFactory(event=event, name="Jürgen Ünicode-Müller")
+    texts = (
+        ("Short", "Line one\nline two\r\nline three"),
+        ("A \x9bvery long title, with; several \\N special characters " * 3, None),
+        ("Emoji 🎉 and accents éèê " * 4, "ÄÖÜ" * 40),
+    )
+    with scope(event=event):
+        for index, (title, abstract) in enumerate(texts):
+            submission = SubmissionFactory(event=event, title=title, abstract=abstract)
+            submission.speakers.add(speaker)
+            start = event.datetime_from + dt.timedelta(hours=index)
+            TalkSlotFactory(
+                submission=submission,
+                room=room,
+                start=start,
+                end=start + dt.timedelta(minutes=30),
+            )
+        TalkSlotFactory(
+            submission=None,
+            schedule=event.wip_schedule,
+            room=room,
+            start=event.datetime_from,
+            end=event.datetime_from + dt.timedelta(minutes=30),
+        )
+        slots = event.wip_schedule.talks.all().order_by("start")
+
+        expected = _icalendar_slots_ical(event, slots, "faved")
+        result = render_slots_ical(event, slots, "faved")
+
+    assert _without_dtstamp(result) == _without_dtstamp(expected)
+    assert result.count("DTSTAMP:") == 3
+    assert ("BEGIN:VTIMEZONE" in result) is (timezone != "UTC")
+
+
+@pytest.mark.django_db
+def test_render_slots_ical_without_slots(event):
+    with scope(event=event):
+        slots = event.wip_schedule.talks.none()
+
+        result = render_slots_ical(event, slots)
+
+        assert result == _icalendar_slots_ical(event, slots)
+        assert "BEGIN:VEVENT" not in result
+
+
+@pytest.mark.django_db
+def test_render_slot_ical_matches_icalendar_output(event, talk_slot):
+    with scope(event=event):
+        expected = serialize_calendar(get_slot_ical(talk_slot))
+        result = render_slot_ical(talk_slot)
+
+    assert _without_dtstamp(result) == _without_dtstamp(expected)
+    assert f"//{talk_slot.submission.code}\r\n" in result
+
+
+def test_get_vtimezone_returns_empty_string_for_unknown_timezone():
+    assert (
+        get_vtimezone("Not/A_Timezone", dt.date(2025, 1, 1), dt.date(2027, 1, 1)) == ""
+    )
+
+
+def _synthetic_slots(event, slot_count):
+    base = event.datetime_from
+    room = SimpleNamespace(name="Main Hall")
+    slots = []
+    for index in range(slot_count):
+        start = base + dt.timedelta(minutes=30 * index)
+        end = start + dt.timedelta(minutes=25)
+        code = f"C{index:06}"
+        submission = SimpleNamespace(
+            event=event,
+            code=code,
+            title=f"Talk number {index}, with a reasonably long title",
+            display_speaker_names="Jane Doe, John Doe",
+            abstract="An abstract; spanning\nseveral lines, " * 5,
+            urls=SimpleNamespace(
+                public=SimpleNamespace(
+                    full=lambda code=code: f"{event.urls.base.full()}talk/{code}/"
+                )
+            ),
+        )
+        slots.append(
+            SimpleNamespace(
+                start=start,
+                local_start=start.astimezone(event.tz),
+                local_end=end.astimezone(event.tz),
+                room=room,
+                submission=submission,
+                event=event,
+                id_suffix="",
+            )
+        )
+    return slots
+
+
+@pytest.mark.django_db
+def test_render_slots_ical_builds_no_icalendar_objects_per_slot():
+    event = EventFactory(timezone="Europe/Berlin")
+    slots = _synthetic_slots(event, 1000)
+    expected = _icalendar_slots_ical(event, slots)
+    get_vtimezone.cache_clear()
+
+    with (
+        patch("icalendar.Event") as vevent,
+        patch.object(
+            icalendar.Timezone, "from_tzid", wraps=icalendar.Timezone.from_tzid
+        ) as from_tzid,
+    ):
+        result = render_slots_ical(event, slots)
+        render_slots_ical(event, slots)
+
+    assert _without_dtstamp(result) == _without_dtstamp(expected)
+    vevent.assert_not_called()
+    # Timezone data is generated once and then reused across calendars.
+    assert from_tzid.call_count == 1
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+@pytest.mark.parametrize("slot_count", (100, 1000, 5000))
+def test_render_slots_ical_benchmark(slot_count):
+    event = EventFactory(timezone="Europe/Berlin")
+    slots = _synthetic_slots(event, slot_count)
+
+    started = time.process_time()
+    expected = _icalendar_slots_ical(event, slots)
+    reference_elapsed = time.process_time() - started
+    started = time.process_time()
+    result = render_slots_ical(event, slots)
+    elapsed = time.process_time() - started
+
+    assert _without_dtstamp(result) == _without_dtstamp(expected)
+    assert elapsed < reference_elapsed / 3
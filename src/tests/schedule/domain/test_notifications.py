@@ -3,6 +3,8 @@
 import datetime as dt
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django_scopes import scope
 from i18nfield.strings import LazyI18nString
 
@@ -188,7 +190,7 @@ def test_schedule_speakers_concerned_create(event):
 
         assert len(v1.speakers_concerned) == 1
         assert speaker in v1.speakers_concerned
-        assert v1.speakers_concerned[speaker]["create"].count() == 1
+        assert len(v1.speakers_concerned[speaker]["create"]) == 1
 
 
 def test_schedule_speakers_concerned_update(event):
@@ -344,3 +346,50 @@ def test_schedule_generate_notifications_skips_unreachable_speaker(event):
 
         assert mails == []
         assert event.queued_mails.count() == 0
+
+
+def test_schedule_generate_notifications_query_count_does_not_grow_with_speakers(event):
+    room = RoomFactory(event=event)
+
+    def count_queries(speaker_count):
+        with scope(event=event):
+            for _ in range(speaker_count):
+                submission = SubmissionFactory(
+                    event=event, state=SubmissionStates.CONFIRMED
+                )
+                submission.speakers.add(SpeakerFactory(event=event))
+                TalkSlotFactory(submission=submission, room=room)
+            schedule, _ = freeze_schedule(
+                event.wip_schedule, f"v{speaker_count}", notify_speakers=False
+            )
+            # Only the first release notifies all speakers of all their talks.
+            schedule.changes["action"] = "create"
+            with CaptureQueriesContext(connection) as queries:
+                mails = generate_notifications(schedule)
+        assert len(mails) == event.submissions.count()
+        return len(queries)
+
+    count_queries(1)  # warm up per-event caches
+    assert count_queries(2) == count_queries(5)
+
+
+def test_schedule_generate_notifications_shares_attachments_and_reports_progress(event):
+    room = RoomFactory(event=event)
+    speakers = SpeakerFactory.create_batch(2, event=event)
+    submission = SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED)
+    submission.speakers.add(*speakers)
+    TalkSlotFactory(submission=submission, room=room)
+    progress_calls = []
+    with scope(event=event):
+        v1, _ = freeze_schedule(event.wip_schedule, "v1", notify_speakers=False)
+
+        mails = generate_notifications(
+            v1, progress=lambda current, total: progress_calls.append((current, total))
+        )
+
+        assert progress_calls == [(1, 2), (2, 2)]
+        assert len(mails) == 2
+        assert mails[0].attachments == mails[1].attachments
+        assert submission.title in mails[0].attachments[0]["content"]
+        assert {mail.to_speakers.get() for mail in mails} == set(speakers)
+        assert all(mail.submissions.get() == submission for mail in mails)
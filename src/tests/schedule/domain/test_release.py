@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 import datetime as dt
+import time
 
 import pytest
 from django.db.utils import IntegrityError
@@ -12,8 +13,11 @@
     apply_signup_capacity_defaults,
     freeze_schedule,
     guess_schedule_version,
+    share_unchanged_event_slots,
+    share_unchanged_slots,
     unfreeze_schedule,
 )
+from pretalx.schedule.models import TalkSlot
 from pretalx.schedule.models.slot import SlotType
 from pretalx.schedule.signals import schedule_release
 from pretalx.submission.models import SubmissionStates
@@ -429,3 +433,176 @@ def test_apply_signup_capacity_defaults_includes_invisible_scheduled_slots(
 
     submission.refresh_from_db()
     assert submission.attendee_signup_capacity == 120
+
+
+def _release_two_talks():
+    """Releases two sessions as v1, then moves the second one and releases v2."""
+    event = EventFactory()
+    room = RoomFactory(event=event)
+    start = event.datetime_from
+    for offset in (0, 2):
+        TalkSlotFactory(
+            submission=SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED),
+            room=room,
+            start=start + dt.timedelta(hours=offset),
+            end=start + dt.timedelta(hours=offset + 1),
+        )
+    with scope(event=event):
+        v1, wip = freeze_schedule(event.wip_schedule, "v1", notify_speakers=False)
+        moved = wip.talks.order_by("start").last()
+        moved.start += dt.timedelta(hours=2)
+        moved.end += dt.timedelta(hours=2)
+        moved.save()
+        v2, _ = freeze_schedule(wip, "v2", notify_speakers=False)
+    return event, v1, v2, moved.submission
+
+
+def test_freeze_schedule_shares_unchanged_slots():
+    event, v1, v2, moved_submission = _release_two_talks()
+
+    with scope(event=event):
+        v1_slots = {slot.submission_id: slot for slot in v1.version_talks.all()}
+        v2_slots = {slot.submission_id: slot for slot in v2.version_talks.all()}
+        stored = TalkSlot.objects.filter(schedule__event=event).exclude(
+            schedule=event.wip_schedule
+        )
+
+        assert len(v1_slots) == len(v2_slots) == 2
+        assert stored.count() == 3
+        unchanged_id = next(pk for pk in v1_slots if pk != moved_submission.pk)
+        assert v1_slots[unchanged_id].pk == v2_slots[unchanged_id].pk
+        assert v1_slots[unchanged_id].schedule == v1
+        assert v2_slots[unchanged_id].schedule == v2
+        assert v1_slots[moved_submission.pk].pk != v2_slots[moved_submission.pk].pk
+        assert v1_slots[moved_submission.pk].start < v2_slots[moved_submission.pk].start
+        assert event.wip_schedule.talks.count() == 2
+
+
+def test_freeze_schedule_shared_slots_keep_changes_and_exports():
+    event, v1, v2, moved_submission = _release_two_talks()
+
+    with scope(event=event):
+        assert v1.changes["action"] == "create"
+        assert v2.changes["count"] == 1
+        assert [talk["submission"] for talk in v2.changes["moved_talks"]] == [
+            moved_submission
+        ]
+        assert len(v1.scheduled_talks) == len(v2.scheduled_talks) == 2
+        assert {slot.schedule for slot in v1.scheduled_talks} == {v1}
+
+
+def test_freeze_schedule_does_not_share_changed_visibility():
+    event, v1, v2, moved_submission = _release_two_talks()
+
+    with scope(event=event):
+        wip = event.wip_schedule
+        moved_submission.state = SubmissionStates.CANCELED
+        moved_submission.save()
+        v3, _ = freeze_schedule(wip, "v3", notify_speakers=False)
+
+        assert v3.version_talks.filter(is_visible=True).count() == 1
+        assert v2.version_talks.filter(is_visible=True).count() == 2
+
+
+def test_unfreeze_schedule_copies_shared_slots():
+    event, v1, v2, _ = _release_two_talks()
+
+    with scope(event=event):
+        _, new_wip = unfreeze_schedule(v1)
+
+        assert new_wip.talks.count() == 2
+        assert not new_wip.talks.filter(first_schedule__isnull=False).exists()
+        assert v1.version_talks.count() == v2.version_talks.count() == 2
+
+
+def test_share_unchanged_slots_rejects_later_previous_schedule():
+    event, v1, v2, _ = _release_two_talks()
+
+    with scope(event=event):
+        assert share_unchanged_slots(v1, v2) == 0
+        assert share_unchanged_slots(v1, None) == 0
+
+
+def test_share_unchanged_event_slots_compacts_existing_releases():
+    submission = SubmissionFactory(state=SubmissionStates.CONFIRMED)
+    event = submission.event
+    other = SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED)
+    room = RoomFactory(event=event)
+    start = event.datetime_from
+    published = start - dt.timedelta(days=10)
+    schedules = [
+        ScheduleFactory(
+            event=event, version=f"v{i}", published=published + dt.timedelta(days=i)
+        )
+        for i in range(3)
+    ]
+    for i, schedule in enumerate(schedules):
+        TalkSlotFactory(
+            schedule=schedule,
+            submission=submission,
+            room=room,
+            start=start,
+            end=start + dt.timedelta(hours=1),
+            is_visible=True,
+        )
+        TalkSlotFactory(
+            schedule=schedule,
+            submission=other,
+            room=room,
+            start=start + dt.timedelta(hours=i + 1),
+            end=start + dt.timedelta(hours=i + 2),
+            is_visible=True,
+        )
+
+    with scope(event=event):
+        assert share_unchanged_event_slots(event) == 2
+        assert share_unchanged_event_slots(event) == 0
+
+        assert TalkSlot.objects.filter(submission=submission).count() == 1
+        assert TalkSlot.objects.filter(submission=other).count() == 3
+        for i, schedule in enumerate(schedules):
+            slots = {slot.submission: slot for slot in schedule.version_talks.all()}
+            assert slots[submission].start == start
+            assert slots[other].start == start + dt.timedelta(hours=i + 1)
+            assert slots[other].schedule == schedule
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("release_count", (10, 50))
+def test_freeze_schedule_storage_benchmark(release_count):
+    talk_count = 100
+    event = EventFactory()
+    room = RoomFactory(event=event)
+    start = event.datetime_from
+    submissions = SubmissionFactory.create_batch(
+        talk_count, event=event, state=SubmissionStates.CONFIRMED
+    )
+    TalkSlot.objects.bulk_create(
+        TalkSlot(
+            schedule=event.wip_schedule,
+            submission=submission,
+            room=room,
+            start=start + dt.timedelta(minutes=30 * position),
+            end=start + dt.timedelta(minutes=30 * position + 25),
+        )
+        for position, submission in enumerate(submissions)
+    )
+
+    started = time.process_time()
+    with scope(event=event):
+        for release in range(release_count):
+            wip = event.wip_schedule
+            moved = wip.talks.get(submission=submissions[release % talk_count])
+            moved.end += dt.timedelta(minutes=1)
+            moved.save()
+            freeze_schedule(wip, f"v{release}", notify_speakers=False)
+    elapsed = time.process_time() - started
+
+    with scope(event=event):
+        released = TalkSlot.objects.filter(schedule__event=event).exclude(
+            schedule=event.wip_schedule
+        )
+        # Copying every session on release stored talk_count slots per release.
+        assert released.count() == talk_count + release_count - 1
+        assert event.current_schedule.talks.count() == talk_count
+    assert elapsed < release_count * 0.5
@@ -3,14 +3,19 @@
 import datetime as dt
 
 import pytest
+from i18nfield.strings import LazyI18nString
 
 from pretalx.schedule.domain.slot import (
     DEFAULT_SLOT_MINUTES,
+    SlotMove,
     copy_slot,
     create_slot,
+    delete_slot,
     move_slot,
+    move_slots,
     unschedule_slot,
 )
+from pretalx.schedule.models import TalkSlot
 from tests.factories import (
     RoomFactory,
     ScheduleFactory,
@@ -109,6 +114,62 @@ def test_move_slot_explicit_end_wins_over_duration(event):
     assert slot.end == new_end
 
 
+def test_move_slots_moves_and_unschedules(event):
+    room = RoomFactory(event=event)
+    talk = TalkSlotFactory(
+        submission=SubmissionFactory(event=event, duration=45),
+        schedule=event.wip_schedule,
+    )
+    unscheduled = TalkSlotFactory(
+        submission=SubmissionFactory(event=event), schedule=event.wip_schedule
+    )
+    blocker = TalkSlotFactory(
+        submission=None, schedule=event.wip_schedule, room=room, start=None, end=None
+    )
+    start = event.datetime_from
+
+    move_slots(
+        event.wip_schedule,
+        [
+            SlotMove(talk, start=start, room=room),
+            SlotMove(unscheduled),
+            SlotMove(
+                blocker, start=start, duration=90, description=LazyI18nString("Lunch")
+            ),
+        ],
+    )
+
+    for slot in (talk, unscheduled, blocker):
+        slot.refresh_from_db()
+    assert (talk.start, talk.end, talk.room) == (
+        start,
+        start + dt.timedelta(minutes=45),
+        room,
+    )
+    assert (unscheduled.start, unscheduled.end, unscheduled.room) == (None, None, None)
+    assert blocker.end == start + dt.timedelta(minutes=90)
+    assert str(blocker.description) == "Lunch"
+    assert talk.updated == unscheduled.updated == blocker.updated
+
+
+def test_move_slots_keeps_submission_slot_description(event):
+    slot = TalkSlotFactory(
+        submission=SubmissionFactory(event=event), schedule=event.wip_schedule
+    )
+
+    move_slots(
+        event.wip_schedule,
+        [
+            SlotMove(
+                slot, start=event.datetime_from, description=LazyI18nString("Ignored")
+            )
+        ],
+    )
+
+    slot.refresh_from_db()
+    assert not slot.description
+
+
 def test_move_slot_assigns_room(event):
     room = RoomFactory(event=event)
     submission = SubmissionFactory(event=event)
@@ -162,6 +223,17 @@ def test_unschedule_slot_clears_fields(event):
     assert slot.room is None
 
 
+def test_delete_slot(event):
+    slot = TalkSlotFactory(
+        submission=None, schedule=event.wip_schedule, room=RoomFactory(event=event)
+    )
+    slot_pk = slot.pk
+
+    delete_slot(slot)
+
+    assert not TalkSlot.objects.filter(pk=slot_pk).exists()
+
+
 def test_copy_slot():
     slot = TalkSlotFactory()
     new_schedule = ScheduleFactory(event=slot.schedule.event)
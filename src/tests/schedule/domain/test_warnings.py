@@ -1,17 +1,37 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 import datetime as dt
+import math
+import random
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 from django.utils.timezone import now as tz_now
 from django_scopes import scope
 
+from pretalx.event.domain.event import move_full_event
 from pretalx.schedule.domain.release import freeze_schedule
+from pretalx.schedule.domain.slot import (
+    SlotMove,
+    create_slot,
+    delete_slot,
+    move_slot,
+    move_slots,
+    unschedule_slot,
+)
 from pretalx.schedule.domain.warnings import (
+    _compute_overlap_maps,
+    _overlapping_pks,
+    build_overlap_index,
     compute_signup_warnings,
     get_all_talk_warnings,
+    get_overlap_index,
+    get_overlap_maps,
     get_talk_warnings,
     overbooked_slots_for_room,
+    update_overlap_index,
 )
 from pretalx.schedule.models import TalkSlot
 from pretalx.schedule.models.slot import SlotType
@@ -26,6 +46,7 @@
     TalkSlotFactory,
     TrackFactory,
 )
+from tests.utils import CountingNamespace
 
 pytestmark = [pytest.mark.unit, pytest.mark.django_db]
 
@@ -1032,3 +1053,394 @@ def test_overbooked_slots_for_room_ignores_unscheduled_slots():
 
     with scope(event=event):
         assert list(overbooked_slots_for_room(room)) == []
+
+
+def _pairwise_overlapping_pks(entries, subset_pks):
+    result = set()
+    for pk_a, start_a, end_a in entries:
+        for pk_b, start_b, end_b in entries:
+            if pk_a != pk_b and start_a < end_b and start_b < end_a:
+                result.add(pk_a)
+    if subset_pks is not None:
+        result &= subset_pks
+    return result
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("use_subset", (False, True))
+def test_overlapping_pks_matches_pairwise_scan(seed, use_subset):
+    rng = random.Random(seed)
+    base = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+    entries = []
+    for pk in range(60):
+        start = rng.randrange(0, 600, 5)
+        entries.append(
+            (
+                pk,
+                base + dt.timedelta(minutes=start),
+                base + dt.timedelta(minutes=start + rng.randrange(5, 90, 5)),
+            )
+        )
+    subset_pks = set(rng.sample(range(60), 15)) if use_subset else None
+
+    assert _overlapping_pks(entries, subset_pks) == _pairwise_overlapping_pks(
+        entries, subset_pks
+    )
+
+
+@pytest.mark.parametrize(
+    ("entries", "expected"),
+    (
+        ([], set()),
+        ([(1, 0, 10)], set()),
+        ([(1, 0, 10), (2, 10, 20)], set()),
+        ([(1, 0, 100), (2, 10, 20), (3, 30, 40)], {1, 2, 3}),
+        ([(1, 0, 10), (2, 5, 100), (3, 50, 60), (4, 100, 110)], {1, 2, 3}),
+        ([(1, 0, 10), (2, 0, 10)], {1, 2}),
+    ),
+    ids=["empty", "single", "adjacent", "enclosing", "chained", "identical"],
+)
+def test_overlapping_pks_edge_cases(entries, expected):
+    assert _overlapping_pks(entries, None) == expected
+
+
+class _Minutes(CountingNamespace):
+    """A point in time in minutes, which is read on every comparison."""
+
+    def __lt__(self, other):
+        return self.minutes < other.minutes
+
+    def __le__(self, other):
+        return self.minutes <= other.minutes
+
+    def __gt__(self, other):
+        return self.minutes > other.minutes
+
+    def __ge__(self, other):
+        return self.minutes >= other.minutes
+
+
+def _synthetic_schedule(slot_count, room_count=10, make_time=_Minutes):
+    """Back-to-back 30 minute slots per room in random order, with every
+    seventh slot running over into the next one, and every speaker giving
+    talks in two rooms at the same time once. Times are passed to
+    ``make_time`` as minutes."""
+    talks = []
+    expected_room = set()
+    for pk in range(slot_count):
+        room, position = pk % room_count, pk // room_count
+        start = 30 * position
+        end = start + (45 if position % 7 == 0 else 30)
+        if position % 7 == 0 and pk + room_count < slot_count:
+            expected_room.update((pk, pk + room_count))
+        speaker = SimpleNamespace(pk=pk // 2)
+        talks.append(
+            SimpleNamespace(
+                pk=pk,
+                start=make_time(minutes=start),
+                end=make_time(minutes=end),
+                room_id=room,
+                submission_id=pk + 1,
+                submission=SimpleNamespace(sorted_speakers=[speaker]),
+            )
+        )
+    random.Random(slot_count).shuffle(talks)
+    return talks, expected_room
+
+
+@pytest.mark.parametrize("slot_count", (100, 1000, 10000, 20000))
+def test_compute_overlap_maps_compares_linearithmically(slot_count):
+    talks, expected_room = _synthetic_schedule(slot_count)
+
+    CountingNamespace.reads = 0
+    room_overlap_ids, speaker_overlaps_by_talk = _compute_overlap_maps(talks)
+    # Every comparison reads the minutes of both times.
+    comparisons = CountingNamespace.reads / 2
+    subset_pks = {talk.pk for talk in talks[::50]}
+    subset_room_ids, _ = _compute_overlap_maps(talks, subset_pks=subset_pks)
+
+    assert room_overlap_ids == expected_room
+    assert subset_room_ids == expected_room & subset_pks
+    # Pairs of slots 2n and 2n+1 share a speaker and run in parallel rooms.
+    assert set(speaker_overlaps_by_talk) == set(range(slot_count - slot_count % 2))
+    # Comparing all slots of a room pairwise takes slot_count² / 20
+    # comparisons, sorting and sweeping takes O(slot_count log slot_count).
+    assert comparisons < 2 * slot_count * math.log2(slot_count)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("slot_count", (100, 1000, 5000, 20000))
+def test_compute_overlap_maps_benchmark(slot_count):
+    base = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+    talks, expected_room = _synthetic_schedule(
+        slot_count, make_time=lambda minutes: base + dt.timedelta(minutes=minutes)
+    )
+
+    started = time.process_time()
+    room_overlap_ids, _ = _compute_overlap_maps(talks)
+    elapsed = time.process_time() - started
+
+    assert room_overlap_ids == expected_room
+    # The previous pairwise scan took about four seconds for 20,000 slots.
+    assert elapsed < 1 + slot_count / 20000
+
+
+def _overlap_schedule(event):
+    room = RoomFactory(event=event)
+    other_room = RoomFactory(event=event)
+    speaker = SpeakerFactory(event=event)
+    start = event.datetime_from
+    slots = []
+    for index, slot_room in enumerate((room, room, other_room)):
+        submission = SubmissionFactory(event=event)
+        submission.speakers.add(speaker)
+        slots.append(
+            TalkSlotFactory(
+                submission=submission,
+                schedule=event.wip_schedule,
+                room=slot_room,
+                start=start + dt.timedelta(hours=2 * index),
+                end=start + dt.timedelta(hours=2 * index + 1),
+            )
+        )
+    return room, other_room, speaker, slots
+
+
+def test_build_overlap_index_buckets_rooms_and_speakers(event):
+    room, other_room, speaker, slots = _overlap_schedule(event)
+    unscheduled = TalkSlotFactory(
+        submission=None, schedule=event.wip_schedule, room=None, start=None, end=None
+    )
+
+    with scope(event=event):
+        index = build_overlap_index(event.wip_schedule)
+
+    assert set(index["slots"]) == {slot.pk for slot in slots}
+    assert unscheduled.pk not in index["slots"]
+    assert set(index["rooms"][room.pk]) == {slots[0].pk, slots[1].pk}
+    assert set(index["rooms"][other_room.pk]) == {slots[2].pk}
+    assert set(index["speakers"][speaker.pk]) == {slot.pk for slot in slots}
+
+
+def test_build_overlap_index_falls_back_to_submission_duration(event):
+    room = RoomFactory(event=event)
+    submission = SubmissionFactory(event=event, duration=45)
+    slot = TalkSlotFactory(
+        submission=submission,
+        schedule=event.wip_schedule,
+        room=room,
+        start=event.datetime_from,
+        end=None,
+    )
+
+    with scope(event=event):
+        index = build_overlap_index(event.wip_schedule)
+
+    assert index["rooms"][room.pk][slot.pk] == (
+        slot.start,
+        slot.start + dt.timedelta(minutes=45),
+    )
+
+
+@pytest.mark.parametrize("use_subset", (False, True))
+def test_get_overlap_maps_matches_compute_overlap_maps(event, use_subset):
+    _, _, _, slots = _overlap_schedule(event)
+    with scope(event=event):
+        move_slot(slots[1], slots[0].start + dt.timedelta(minutes=30))
+        move_slot(slots[2], slots[0].start + dt.timedelta(minutes=15))
+        schedule = event.wip_schedule
+        subset_pks = {slots[2].pk} if use_subset else None
+        expected = _compute_overlap_maps(
+            schedule.talks.select_related(
+                "submission", "submission__submission_type"
+            ).with_sorted_speakers(),
+            subset_pks=subset_pks,
+        )
+
+        result = get_overlap_maps(schedule, subset_pks=subset_pks)
+
+    assert result == expected
+
+
+def _index_data(index):
+    return {key: index[key] for key in ("slots", "rooms", "speakers")}
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_overlap_index_is_cached(event, django_assert_num_queries):
+    _overlap_schedule(event)
+    with scope(event=event):
+        schedule = event.wip_schedule
+        first = get_overlap_index(schedule)
+
+        with django_assert_num_queries(0):
+            second = get_overlap_index(schedule)
+
+    assert second == first
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_slot_changes_patch_overlap_index_without_rebuild(
+    event, django_capture_on_commit_callbacks
+):
+    room, other_room, speaker, slots = _overlap_schedule(event)
+    with scope(event=event):
+        schedule = event.wip_schedule
+        get_overlap_index(schedule)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            move_slot(slots[2], slots[0].start, room=room)
+            unschedule_slot(slots[1])
+            blocker = create_slot(
+                schedule=schedule,
+                room=other_room,
+                start=slots[0].start,
+                slot_type="blocker",
+            )
+        with patch(
+            "pretalx.schedule.domain.warnings.build_overlap_index"
+        ) as build_mock:
+            index = get_overlap_index(schedule)
+            room_overlap_ids, speaker_overlaps = get_overlap_maps(
+                schedule, subset_pks={slots[2].pk}
+            )
+        build_mock.assert_not_called()
+
+        assert _index_data(index) == _index_data(build_overlap_index(schedule))
+        assert set(index["rooms"][other_room.pk]) == {blocker.pk}
+        assert room_overlap_ids == {slots[2].pk}
+        assert speaker_overlaps == {slots[2].pk: {speaker.pk}}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            delete_slot(blocker)
+        with patch(
+            "pretalx.schedule.domain.warnings.build_overlap_index"
+        ) as build_mock:
+            index = get_overlap_index(schedule)
+        build_mock.assert_not_called()
+
+    assert not index["rooms"].get(other_room.pk)
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_direct_slot_saves_patch_overlap_index(
+    event, django_capture_on_commit_callbacks
+):
+    room, _, _, slots = _overlap_schedule(event)
+    with scope(event=event):
+        schedule = event.wip_schedule
+        get_overlap_index(schedule)
+
+        slots[2].room = room
+        with django_capture_on_commit_callbacks(execute=True):
+            slots[2].save()
+        with patch(
+            "pretalx.schedule.domain.warnings.build_overlap_index"
+        ) as build_mock:
+            index = get_overlap_index(schedule)
+        build_mock.assert_not_called()
+
+    assert slots[2].pk in index["rooms"][room.pk]
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_get_overlap_index_rebuilds_after_speaker_changes(event):
+    _, _, _, slots = _overlap_schedule(event)
+    other_speaker = SpeakerFactory(event=event)
+    with scope(event=event):
+        schedule = event.wip_schedule
+        get_overlap_index(schedule)
+
+        slots[2].submission.speakers.add(other_speaker)
+        index = get_overlap_index(schedule)
+        assert slots[2].pk in index["speakers"][other_speaker.pk]
+
+        slots[2].submission.speakers.remove(other_speaker)
+        index = get_overlap_index(schedule)
+
+    assert not index["speakers"].get(other_speaker.pk)
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_overlap_index_patch_skips_missing_previous_version(
+    event, django_capture_on_commit_callbacks
+):
+    """A writer whose predecessor has not stored its index yet must not
+    store an index that lacks the predecessor's change."""
+    room, _, _, slots = _overlap_schedule(event)
+    with scope(event=event):
+        schedule = event.wip_schedule
+        get_overlap_index(schedule)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            move_slot(slots[1], slots[0].start, room=room)
+        with django_capture_on_commit_callbacks() as other_callbacks:
+            move_slot(slots[2], slots[0].start, room=room)
+        # The first writer bumps the version but is interrupted before it
+        # stores its patched index.
+        with patch("pretalx.schedule.domain.warnings.cache.set"):
+            for callback in callbacks:
+                callback()
+        for callback in other_callbacks:
+            callback()
+
+        index = get_overlap_index(schedule)
+
+    assert set(index["rooms"][room.pk]) == {slot.pk for slot in slots}
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_move_slots_patch_overlap_index_without_rebuild(
+    event, django_capture_on_commit_callbacks
+):
+    room, _, speaker, slots = _overlap_schedule(event)
+    with scope(event=event):
+        schedule = event.wip_schedule
+        get_overlap_index(schedule)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            move_slots(
+                schedule,
+                [
+                    SlotMove(slots[1], start=slots[0].start, room=room),
+                    SlotMove(slots[2], start=slots[0].start, room=room),
+                ],
+            )
+        with patch(
+            "pretalx.schedule.domain.warnings.build_overlap_index"
+        ) as build_mock:
+            index = get_overlap_index(schedule)
+        build_mock.assert_not_called()
+        rebuilt = build_overlap_index(schedule)
+
+        assert index["slots"] == rebuilt["slots"]
+        assert set(index["rooms"][room.pk]) == {slot.pk for slot in slots}
+        assert set(index["speakers"][speaker.pk]) == {slot.pk for slot in slots}
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_move_full_event_rebuilds_overlap_index(event):
+    room, _, _, slots = _overlap_schedule(event)
+    with scope(event=event):
+        schedule = event.wip_schedule
+        get_overlap_index(schedule)
+
+        move_full_event(event, event.date_from + dt.timedelta(days=7))
+        index = get_overlap_index(schedule)
+
+    slots[0].refresh_from_db()
+    assert index["rooms"][room.pk][slots[0].pk][0] == slots[0].start
+
+
+def test_update_overlap_index_without_cached_index(
+    event, django_capture_on_commit_callbacks
+):
+    _, _, _, slots = _overlap_schedule(event)
+
+    with scope(event=event):
+        with django_capture_on_commit_callbacks(execute=True):
+            update_overlap_index(slots[0])
+
+        assert _index_data(get_overlap_index(event.wip_schedule)) == _index_data(
+            build_overlap_index(event.wip_schedule)
+        )
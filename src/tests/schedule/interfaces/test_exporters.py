@@ -502,3 +502,98 @@ def test_frab_json_exporter_strips_control_characters(event, talk_slot):
     assert "Room" in rooms
     assert rooms["Room"][0]["title"] == "Talk[31mtitle"
     assert rooms["Room"][0]["track"] == "Track"
+
+
+def _build_multi_day_schedule(event):
+    rooms = [
+        RoomFactory(event=event, name="Roo\x9bm", position=1),
+        RoomFactory(event=event, name="Hall", position=0),
+    ]
+    track = TrackFactory(event=event, name="Tra\x1bck")
+    for day in range(2):
+        for index, room in enumerate(rooms):
+            for hour in range(2):
+                start = event.datetime_from + dt.timedelta(days=day, hours=hour + index)
+                TalkSlotFactory(
+                    submission=SubmissionFactory(
+                        event=event, title=f"Talk\x1b {day}/{hour}", track=track
+                    ),
+                    room=room,
+                    is_visible=True,
+                    start=start,
+                    end=start + dt.timedelta(minutes=45),
+                )
+    return event.wip_schedule
+
+
+@pytest.mark.parametrize("exporter_class", (FrabJsonExporter, FrabXmlExporter))
+def test_frab_exporter_stream_data_matches_get_data(exporter_class):
+    event = EventFactory(date_to=EventFactory.build().date_from + dt.timedelta(days=2))
+    with scope(event=event):
+        schedule = _build_multi_day_schedule(event)
+        expected = exporter_class(schedule, with_accepted=True).get_data()
+
+        chunks = list(exporter_class(schedule, with_accepted=True).stream_data())
+
+    assert len(chunks) > 3
+    assert "".join(chunks) == expected
+    assert "Talk 1/1" in expected
+
+
+@pytest.mark.parametrize("exporter_class", (FrabJsonExporter, FrabXmlExporter))
+def test_frab_exporter_stream_data_matches_get_data_without_talks(
+    event, exporter_class
+):
+    with scope(event=event):
+        expected = exporter_class(event.wip_schedule).get_data()
+
+        result = "".join(exporter_class(event.wip_schedule).stream_data())
+
+    assert result == expected
+
+
+@pytest.mark.parametrize("exporter_class", (FrabJsonExporter, FrabXmlExporter))
+def test_frab_exporter_stream_data_matches_get_data_with_same_room_names(
+    event, exporter_class
+):
+    for position in range(2):
+        room = RoomFactory(event=event, name="Hall", position=position)
+        start = event.datetime_from + dt.timedelta(hours=position)
+        TalkSlotFactory(
+            submission=SubmissionFactory(event=event, title=f"Talk {position}"),
+            room=room,
+            is_visible=True,
+            start=start,
+            end=start + dt.timedelta(minutes=45),
+        )
+    with scope(event=event):
+        expected = exporter_class(event.wip_schedule, with_accepted=True).get_data()
+
+        result = "".join(
+            exporter_class(event.wip_schedule, with_accepted=True).stream_data()
+        )
+
+    assert result == expected
+    assert "Talk 0" in expected
+    assert "Talk 1" in expected
+
+
+def test_frab_json_exporter_merges_rooms_with_same_name(event):
+    rooms = [RoomFactory(event=event, name="Hall", position=i) for i in range(2)]
+    for position, room in enumerate(rooms):
+        start = event.datetime_from + dt.timedelta(hours=position)
+        TalkSlotFactory(
+            submission=SubmissionFactory(event=event),
+            room=room,
+            is_visible=True,
+            start=start,
+            end=start + dt.timedelta(minutes=45),
+        )
+    with scope(event=event):
+        exporter = FrabJsonExporter(event.wip_schedule, with_accepted=True)
+        day = next(iter(exporter.data))
+        parsed = json.loads(exporter.get_data())
+
+    assert [room["id"] for room in day["rooms"]] == [rooms[0].pk]
+    assert len(day["rooms"][0]["talks"]) == 2
+    assert len(parsed["schedule"]["conference"]["days"][0]["rooms"]["Hall"]) == 2
@@ -165,6 +165,35 @@ def test_schedule_blockers(event):
     assert result == [blocker]
 
 
+def test_schedule_talks_is_a_reverse_relation(event):
+    submission = SubmissionFactory(event=event)
+    with scope(event=event):
+        schedule = event.wip_schedule
+        slot = schedule.talks.create(submission=submission)
+
+        assert list(Schedule.objects.filter(talks__submission=submission)) == [schedule]
+        [prefetched] = Schedule.objects.filter(pk=schedule.pk).prefetch_related("talks")
+        assert list(prefetched.talks.all()) == [slot]
+
+
+def test_schedule_version_talks_orders_versions_by_release(event):
+    # Imported schedules can have pks that do not follow their release order.
+    newer = ScheduleFactory(event=event, version="v2")
+    older = ScheduleFactory(
+        event=event, version="v1", published=newer.published - dt.timedelta(days=1)
+    )
+    shared = TalkSlotFactory(
+        submission=SubmissionFactory(event=event), schedule=newer, first_schedule=older
+    )
+    changed = TalkSlotFactory(submission=SubmissionFactory(event=event), schedule=older)
+
+    with scope(event=event):
+        assert set(older.version_talks) == {shared, changed}
+        assert list(older.talks.all()) == [changed]
+        assert list(newer.version_talks) == [shared]
+        assert {slot.schedule for slot in older.version_talks} == {older}
+
+
 def test_schedule_slots_returns_submissions(event):
     submission = SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED)
     room = RoomFactory(event=event)
@@ -1,10 +1,27 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+from unittest.mock import patch
+
 import pytest
+from django_scopes import scope
 
 from pretalx.event.models import Event
-from pretalx.schedule.domain.changes import has_unreleased_schedule_changes
-from pretalx.schedule.tasks import task_update_unreleased_schedule_changes
+from pretalx.schedule.domain.changes import (
+    has_unreleased_schedule_changes,
+    queue_unreleased_schedule_changes_update,
+)
+from pretalx.schedule.domain.release import freeze_schedule
+from pretalx.schedule.tasks import (
+    task_generate_notifications,
+    task_update_unreleased_schedule_changes,
+)
+from pretalx.submission.models import SubmissionStates
+from tests.factories import (
+    RoomFactory,
+    SpeakerFactory,
+    SubmissionFactory,
+    TalkSlotFactory,
+)
 
 pytestmark = [pytest.mark.unit, pytest.mark.django_db]
 
@@ -20,3 +37,49 @@ def test_task_update_unreleased_schedule_changes_sets_cache(event, value, expect
 def test_task_update_unreleased_schedule_changes_nonexistent_event():
     with pytest.raises(Event.DoesNotExist):
         task_update_unreleased_schedule_changes(event="nonexistent-slug")
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_task_update_unreleased_schedule_changes_waits_for_quiet_period(event):
+    event.cache.set("has_unreleased_schedule_changes", True)
+    with patch(
+        "pretalx.schedule.tasks.task_update_unreleased_schedule_changes.apply_async"
+    ) as task_mock:
+        queue_unreleased_schedule_changes_update(event)
+        task_update_unreleased_schedule_changes(event=event.slug)
+
+    assert task_mock.call_count == 2
+    assert task_mock.call_args.kwargs["kwargs"] == {"event": event.slug}
+    assert 0 < task_mock.call_args.kwargs["countdown"] <= 5
+    assert event.cache.get("has_unreleased_schedule_changes") is True
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_task_update_unreleased_schedule_changes_runs_eagerly(event):
+    event.cache.set("has_unreleased_schedule_changes", True)
+
+    queue_unreleased_schedule_changes_update(event)
+
+    assert event.cache.get("has_unreleased_schedule_changes") is False
+    # The burst is closed, so the next edit queues a new recomputation.
+    with patch(
+        "pretalx.schedule.tasks.task_update_unreleased_schedule_changes.apply_async"
+    ) as task_mock:
+        queue_unreleased_schedule_changes_update(event)
+    task_mock.assert_called_once()
+
+
+def test_task_generate_notifications_saves_drafts(event):
+    submission = SubmissionFactory(event=event, state=SubmissionStates.CONFIRMED)
+    submission.speakers.add(SpeakerFactory(event=event))
+    TalkSlotFactory(submission=submission, room=RoomFactory(event=event))
+    with scope(event=event):
+        schedule, _ = freeze_schedule(event.wip_schedule, "v1", notify_speakers=False)
+
+    result = task_generate_notifications.apply(
+        kwargs={"schedule_id": schedule.pk}
+    ).get()
+
+    assert result == {"count": 1}
+    with scope(event=event):
+        assert event.queued_mails.get().submissions.get() == submission
@@ -18,6 +18,7 @@
     has_featured_submissions,
     information_for_user,
     reviewable_submissions_for_user,
+    schedule_slots_prefetch,
     search_submissions,
     signed_up_submissions_for_user,
     sorted_speakers_prefetch,
@@ -28,7 +29,11 @@
     unreviewed_submissions_for_user,
 )
 from pretalx.submission.enums import AttendeeSignupStates, SubmissionContext
-from pretalx.submission.models import Submission, SubmissionStates
+from pretalx.submission.models import (
+    Submission,
+    SubmissionSearchDocument,
+    SubmissionStates,
+)
 from tests.factories import (
     AttendeeProfileFactory,
     AttendeeSignupFactory,
@@ -595,6 +600,27 @@ def test_search_submissions_empty_query_returns_unchanged():
     assert result == {sub}
 
 
+@pytest.mark.parametrize(
+    ("can_view_speakers", "query", "found"),
+    ((True, "bulk", True), (True, "XYZ", True), (False, "bulk", False)),
+)
+def test_search_submissions_falls_back_without_search_document(
+    can_view_speakers, query, found
+):
+    event = EventFactory()
+    sub = SubmissionFactory(event=event, title="Bulk created", code="XYZABC")
+    SubmissionSearchDocument.objects.filter(submission=sub).delete()
+
+    with scope(event=event):
+        result = set(
+            search_submissions(
+                event.submissions.all(), query, can_view_speakers=can_view_speakers
+            )
+        )
+
+    assert result == ({sub} if found else set())
+
+
 def test_search_submissions_anonymised_finds_redacted_value():
     event = EventFactory()
     redacted = SubmissionFactory(
@@ -744,6 +770,44 @@ def test_sorted_speakers_prefetch_with_prefix(django_assert_num_queries):
     assert result == [second, first]
 
 
+@pytest.mark.parametrize(
+    ("visible_only", "expected"), ((False, {"visible", "hidden"}), (True, {"visible"}))
+)
+def test_schedule_slots_prefetch_loads_only_slots_of_schedule(visible_only, expected):
+    submission = SubmissionFactory(state=SubmissionStates.CONFIRMED)
+    old = ScheduleFactory(event=submission.event, version="v1")
+    current = ScheduleFactory(event=submission.event, version="v2")
+    TalkSlotFactory(submission=submission, schedule=old, is_visible=True)
+    slots = {
+        "visible": TalkSlotFactory(
+            submission=submission, schedule=current, is_visible=True
+        ),
+        "hidden": TalkSlotFactory(
+            submission=submission, schedule=current, is_visible=False
+        ),
+    }
+
+    with scope(event=submission.event):
+        sub = Submission.objects.prefetch_related(
+            schedule_slots_prefetch(current, visible_only=visible_only)
+        ).get(pk=submission.pk)
+
+    assert set(sub.slots.all()) == {slots[key] for key in expected}
+
+
+def test_schedule_slots_prefetch_without_schedule_loads_nothing(
+    django_assert_num_queries,
+):
+    submission = SubmissionFactory(state=SubmissionStates.CONFIRMED)
+    TalkSlotFactory(submission=submission, is_visible=True)
+
+    with scope(event=submission.event):
+        qs = Submission.objects.prefetch_related(schedule_slots_prefetch(None))
+        with django_assert_num_queries(1):
+            sub = qs.get(pk=submission.pk)
+            assert list(sub.slots.all()) == []
+
+
 def test_submission_queryset_with_sorted_speakers_uses_prefetch(
     django_assert_num_queries,
 ):
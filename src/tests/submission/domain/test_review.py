@@ -6,7 +6,7 @@
 import pytest
 from django.core.exceptions import ValidationError
 from django.utils.timezone import now as tz_now
-from django_scopes import scope
+from django_scopes import scope, scopes_disabled
 
 from pretalx.common.models import ActivityLog
 from pretalx.submission.domain.review import (
@@ -14,6 +14,7 @@
     create_or_update_review,
     recalculate_event_scores,
     recalculate_submission_scores,
+    review_phase_update_due,
     update_review_phase,
     update_review_score,
     validate_review_phases,
@@ -25,6 +26,7 @@
     ReviewScoreCategoryFactory,
     ReviewScoreFactory,
     SubmissionFactory,
+    TrackFactory,
     UserFactory,
 )
 from tests.utils import refresh
@@ -162,6 +164,80 @@ def test_recalculate_submission_scores():
     assert review.score == Decimal("4.0")
 
 
+def _event_with_scored_reviews(review_count):
+    """Reviews across two tracks and no track, with one category limited
+    to the first track, one inactive category and one for all tracks."""
+    event = EventFactory()
+    track, other_track = TrackFactory(event=event), TrackFactory(event=event)
+    general = ReviewScoreCategoryFactory(event=event, weight=Decimal("1.5"))
+    limited = ReviewScoreCategoryFactory(event=event, weight=Decimal("2.0"))
+    limited.limit_tracks.add(track)
+    inactive = ReviewScoreCategoryFactory(event=event, active=False)
+    scores = [
+        ReviewScoreFactory(category=category, value=Decimal(value))
+        for category, value in ((general, "2.5"), (limited, 3), (inactive, 7))
+    ]
+    reviews = []
+    for index in range(review_count):
+        submission = SubmissionFactory(
+            event=event, track=(track, other_track, None)[index % 3]
+        )
+        review = ReviewFactory(submission=submission, score=Decimal(99))
+        review.scores.add(*scores[: index % 4])
+        reviews.append(review)
+    return event, reviews
+
+
+def test_recalculate_event_scores_matches_update_review_score():
+    event, reviews = _event_with_scored_reviews(12)
+
+    with scope(event=event):
+        changed = recalculate_event_scores(event)
+        bulk_scores = [refresh(review).score for review in reviews]
+        for review in reviews:
+            update_review_score(review)
+
+    assert changed == 12
+    assert bulk_scores == [refresh(review).score for review in reviews]
+    assert Decimal("9.75") in bulk_scores
+    assert None in bulk_scores
+
+
+def test_recalculate_event_scores_skips_unchanged_reviews():
+    event, reviews = _event_with_scored_reviews(4)
+
+    with scope(event=event):
+        recalculate_event_scores(event)
+        updated = [refresh(review).updated for review in reviews]
+
+        assert recalculate_event_scores(event) == 0
+
+    assert [refresh(review).updated for review in reviews] == updated
+
+
+def test_recalculate_event_scores_query_count_does_not_grow_with_reviews(
+    django_assert_max_num_queries,
+):
+    event, _ = _event_with_scored_reviews(30)
+
+    # Categories, tracks, reviews, one aggregate per configuration and
+    # one update.
+    with scope(event=event), django_assert_max_num_queries(7):
+        recalculate_event_scores(event)
+
+
+def test_recalculate_event_scores_reports_progress():
+    event, _ = _event_with_scored_reviews(3)
+    calls = []
+
+    with scope(event=event):
+        recalculate_event_scores(
+            event, progress=lambda current, total: calls.append((current, total))
+        )
+
+    assert calls == [(1, 2), (2, 2)]
+
+
 def test_activate_review_phase_deactivates_all_others():
     event = EventFactory()
     phase1 = ReviewPhaseFactory(event=event, is_active=True)
@@ -376,3 +452,51 @@ def test_update_review_phase_deactivates_future_phase(event):
         assert result is None
         future_phase.refresh_from_db()
         assert not future_phase.is_active
+
+
+@pytest.mark.parametrize(
+    ("phases", "expected"),
+    (
+        ((), False),
+        (((-1, 30, True),), False),
+        (((-10, -3, True),), True),
+        (((1, 30, True),), True),
+        (((-10, -3, False), (-1, None, False)), True),
+        (((-10, -3, False), (1, 30, False)), False),
+        (((-1, 30, True), (-1, None, False)), False),
+    ),
+    ids=(
+        "no_phases",
+        "active_current",
+        "active_expired",
+        "active_future",
+        "inactive_current",
+        "none_current",
+        "active_current_and_other_current",
+    ),
+)
+def test_review_phase_update_due_matches_update_review_phase(event, phases, expected):
+    with scope(event=event):
+        event.review_phases.all().delete()
+        for start, end, is_active in phases:
+            ReviewPhaseFactory(
+                event=event,
+                start=tz_now() + dt.timedelta(days=start),
+                end=tz_now() + dt.timedelta(days=end) if end is not None else None,
+                is_active=is_active,
+            )
+
+    with scopes_disabled():
+        due = (
+            type(event)
+            .objects.filter(pk=event.pk)
+            .filter(review_phase_update_due())
+            .exists()
+        )
+        event = refresh(event)
+        active = event.active_review_phase
+        with scope(event=event):
+            updated = update_review_phase(event)
+
+    assert due is expected
+    assert (updated != active) is expected
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from django_scopes import scopes_disabled
+
+from pretalx.submission.domain.search import (
+    get_search_document_values,
+    get_speaker_names,
+    update_search_documents,
+)
+from pretalx.submission.models import Submission, SubmissionSearchDocument
+from tests.factories import SpeakerRoleFactory, SubmissionFactory
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+def _submission(**kwargs):
+    values = {
+        "code": "ABCDEF",
+        "title": "Title",
+        "description": "Description",
+        "abstract": "",
+        "notes": None,
+        "internal_notes": "Internal",
+        "anonymised": None,
+    }
+    values.update(kwargs)
+    return SimpleNamespace(**values)
+
+
+def test_get_search_document_values():
+    values = get_search_document_values(_submission(), ["Jane", "Jane Doe"])
+
+    assert values == {
+        "text": "ABCDEF\nTitle",
+        "anonymised_text": "ABCDEF\nTitle",
+        "speakers": "Jane\nJane Doe",
+        "content": "Description\nInternal",
+        "anonymised_content": "Description\nInternal",
+    }
+
+
+def test_get_search_document_values_uses_redacted_fields():
+    submission = _submission(
+        anonymised={
+            "_anonymised": True,
+            "title": "Redacted title",
+            "description": "Redacted description",
+            "internal_notes": "Never anonymised",
+        }
+    )
+
+    values = get_search_document_values(submission)
+
+    assert values["anonymised_text"] == "ABCDEF\nRedacted title"
+    assert values["anonymised_content"] == "Redacted description\nInternal"
+    assert values["text"] == "ABCDEF\nTitle"
+    assert values["speakers"] == ""
+
+
+def test_get_search_document_values_ignores_unfinished_anonymisation():
+    submission = _submission(anonymised={"title": "Draft redaction"})
+
+    values = get_search_document_values(submission)
+
+    assert values["anonymised_text"] == "ABCDEF\nTitle"
+
+
+def test_get_speaker_names():
+    role = SpeakerRoleFactory(speaker__name="Profile name", speaker__user__name="User")
+    SpeakerRoleFactory()
+
+    with scopes_disabled():
+        names = get_speaker_names([role.submission_id])
+
+    assert names == {role.submission_id: ["Profile name", "User"]}
+
+
+def test_update_search_documents_repairs_missing_documents():
+    first = SubmissionFactory(title="First")
+    second = SubmissionFactory(title="Second")
+    SubmissionSearchDocument.objects.all().delete()
+
+    with patch("pretalx.submission.domain.search.SEARCH_INDEX_BATCH_SIZE", 1):
+        updated = update_search_documents(
+            Submission.all_objects.filter(pk__in=[first.pk, second.pk]).order_by("pk")
+        )
+
+    assert updated == 2
+    assert SubmissionSearchDocument.objects.get(submission=first).text == (
+        f"{first.code}\nFirst"
+    )
+    assert SubmissionSearchDocument.objects.get(submission=second).text == (
+        f"{second.code}\nSecond"
+    )
+
+
+def test_update_search_documents_overwrites_stale_documents():
+    submission = SubmissionFactory(title="Old")
+    with scopes_disabled():
+        Submission.all_objects.filter(pk=submission.pk).update(title="New")
+        submission.refresh_from_db()
+
+    update_search_documents([submission])
+
+    assert SubmissionSearchDocument.objects.get(submission=submission).text == (
+        f"{submission.code}\nNew"
+    )
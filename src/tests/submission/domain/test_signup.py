@@ -1,8 +1,11 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+import threading
+
 import pytest
 from django.contrib.auth.models import AnonymousUser
-from django_scopes import scope
+from django.db import connection
+from django_scopes import scope, scopes_disabled
 
 from pretalx.common.exceptions import SubmissionError
 from pretalx.schedule.domain.release import freeze_schedule
@@ -13,9 +16,16 @@
     email_domain_allowed,
     get_confirmed_signup_for_user,
     get_signup_for_user,
+    reconcile_signup_counts,
 )
 from pretalx.submission.enums import AttendeeSignupStates
-from pretalx.submission.models import AttendeeSignup, SubmissionStates
+from pretalx.submission.models import (
+    AttendeeSignup,
+    AttendeeSignupCount,
+    Submission,
+    SubmissionStates,
+)
+from pretalx.submission.receivers import reconcile_signup_counts_periodically
 from tests.factories import (
     AttendeeProfileFactory,
     AttendeeSignupFactory,
@@ -353,3 +363,160 @@ def test_cancel_signup_sets_state_and_logs():
             .count()
             == 1
         )
+
+
+def _signup_count(submission):
+    counter = AttendeeSignupCount.objects.filter(submission=submission).first()
+    return counter.count if counter else 0
+
+
+def test_create_and_cancel_signup_maintain_signup_count():
+    event, sub_type = _signup_event()
+    submission = _make_submission(event, sub_type)
+    user = UserFactory()
+
+    with scope(event=event):
+        create_signup(submission, user=user)
+        create_signup(submission, user=user)
+        assert _signup_count(submission) == 1
+
+        cancel_signup(submission, user=user)
+        cancel_signup(submission, user=user)
+        assert _signup_count(submission) == 0
+
+        create_signup(submission, user=user)
+        assert _signup_count(submission) == 1
+
+
+def test_create_signup_when_full_leaves_no_signup():
+    event, sub_type = _signup_event()
+    submission = _make_submission(event, sub_type, capacity=1)
+    AttendeeSignupFactory(submission=submission)
+    user = UserFactory()
+
+    with scope(event=event), pytest.raises(SubmissionError):
+        create_signup(submission, user=user)
+
+    assert not AttendeeSignup.objects.filter(attendee__user=user).exists()
+    assert _signup_count(submission) == 1
+
+
+def test_create_signup_uses_signup_count_for_capacity():
+    event, sub_type = _signup_event()
+    submission = _make_submission(event, sub_type, capacity=1)
+    AttendeeSignupCount.objects.update_or_create(
+        submission=submission, defaults={"count": 1}
+    )
+
+    with scope(event=event), pytest.raises(SubmissionError):
+        create_signup(submission, user=UserFactory())
+
+
+def test_saving_stale_submission_keeps_signup_count():
+    event, sub_type = _signup_event()
+    submission = _make_submission(event, sub_type)
+
+    with scope(event=event):
+        create_signup(submission, user=UserFactory())
+        submission.title = "Changed"
+        submission.save()
+
+    assert _signup_count(submission) == 1
+
+
+def test_deleting_confirmed_signup_releases_seat():
+    submission = SubmissionFactory()
+    confirmed = AttendeeSignupFactory(submission=submission)
+    cancelled = AttendeeSignupFactory(
+        submission=submission, state=AttendeeSignupStates.CANCELED
+    )
+    assert _signup_count(submission) == 1
+
+    with scopes_disabled():
+        cancelled.delete()
+        assert _signup_count(submission) == 1
+        confirmed.attendee.delete()
+
+    assert _signup_count(submission) == 0
+
+
+def test_reconcile_signup_counts_fixes_drift():
+    submission = SubmissionFactory()
+    other = SubmissionFactory(event=submission.event)
+    AttendeeSignupFactory.create_batch(2, submission=submission)
+    AttendeeSignupFactory(submission=other)
+    AttendeeSignupCount.objects.update_or_create(
+        submission=submission, defaults={"count": 7}
+    )
+
+    with scopes_disabled():
+        assert reconcile_signup_counts(Submission.all_objects.all()) == 1
+        assert reconcile_signup_counts(Submission.all_objects.all()) == 0
+
+    assert _signup_count(submission) == 2
+    assert _signup_count(other) == 1
+
+
+def test_reconcile_signup_counts_creates_missing_counters():
+    submission = SubmissionFactory()
+    AttendeeSignupFactory(submission=submission)
+    AttendeeSignupCount.objects.filter(submission=submission).delete()
+
+    with scopes_disabled():
+        assert reconcile_signup_counts(Submission.all_objects.all()) == 1
+
+    assert _signup_count(submission) == 1
+
+
+@pytest.mark.usefixtures("locmem_cache")
+def test_periodic_task_reconciles_signup_counts():
+    submission = SubmissionFactory()
+    AttendeeSignupFactory(submission=submission)
+    AttendeeSignupCount.objects.update_or_create(
+        submission=submission, defaults={"count": 0}
+    )
+
+    reconcile_signup_counts_periodically(sender=None)
+
+    assert _signup_count(submission) == 1
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="SQLite serialises all writes, so there is no contention to test.",
+)
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_signups_never_exceed_capacity():
+    event, sub_type = _signup_event()
+    submission = _make_submission(event, sub_type, capacity=5)
+    users = UserFactory.create_batch(30)
+    barrier = threading.Barrier(len(users))
+    results = []
+
+    def signup(user):
+        try:
+            barrier.wait()
+            with scope(event=event):
+                create_signup(Submission.all_objects.get(pk=submission.pk), user=user)
+            results.append(True)
+        except SubmissionError:
+            results.append(False)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=signup, args=(user,)) for user in users]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 5
+    assert _signup_count(submission) == 5
+    with scopes_disabled():
+        assert (
+            AttendeeSignup.objects.filter(
+                submission=submission, state=AttendeeSignupStates.CONFIRMED
+            ).count()
+            == 5
+        )
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026-present Tobias Kunze
+# SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
+import pytest
+from django_scopes import scopes_disabled
+
+from pretalx.submission.models import Submission, SubmissionSearchDocument
+from pretalx.submission.receivers import (
+    update_role_search_document,
+    update_speaker_search_documents,
+    update_submission_search_document,
+    update_user_search_documents,
+)
+from tests.factories import (
+    SpeakerFactory,
+    SpeakerRoleFactory,
+    SubmissionFactory,
+    UserFactory,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.django_db]
+
+
+def _document(submission):
+    return SubmissionSearchDocument.objects.get(submission=submission)
+
+
+def test_search_document_created_with_submission():
+    submission = SubmissionFactory(title="Needle", internal_notes="Notes")
+
+    document = _document(submission)
+
+    assert document.text == f"{submission.code}\nNeedle"
+    assert document.content == "Notes"
+
+
+def test_search_document_follows_anonymisation():
+    submission = SubmissionFactory(title="Original")
+
+    submission.anonymised = {"_anonymised": True, "title": "Redacted"}
+    submission.save(update_fields=["anonymised"])
+
+    assert _document(submission).anonymised_text == f"{submission.code}\nRedacted"
+
+
+def test_search_document_skips_unrelated_updates():
+    submission = SubmissionFactory(title="Original")
+    with scopes_disabled():
+        Submission.all_objects.filter(pk=submission.pk).update(title="Changed")
+
+    submission.save(update_fields=["state"])
+
+    assert _document(submission).text == f"{submission.code}\nOriginal"
+
+
+def test_search_document_follows_speaker_role():
+    role = SpeakerRoleFactory(speaker__name="Profile", speaker__user__name="Account")
+
+    assert _document(role.submission).speakers == "Profile\nAccount"
+
+
+def test_search_document_follows_speaker_rename():
+    role = SpeakerRoleFactory(speaker__name="Before")
+
+    role.speaker.name = "After"
+    role.speaker.save(update_fields=["name"])
+
+    assert _document(role.submission).speakers.startswith("After\n")
+
+
+def test_search_document_follows_user_rename():
+    role = SpeakerRoleFactory(speaker__user__name="Before")
+
+    role.speaker.user.name = "After"
+    role.speaker.user.save()
+
+    assert "After" in _document(role.submission).speakers.split("\n")
+
+
+def test_search_document_follows_speakers_add():
+    submission = SubmissionFactory()
+    speaker = SpeakerFactory(event=submission.event, name="Added")
+
+    with scopes_disabled():
+        submission.speakers.add(speaker)
+
+    assert _document(submission).speakers.startswith("Added\n")
+
+
+def test_search_document_follows_reverse_speakers_add():
+    submission = SubmissionFactory()
+    speaker = SpeakerFactory(event=submission.event, name="Added")
+
+    with scopes_disabled():
+        speaker.submissions.add(submission)
+
+    assert _document(submission).speakers.startswith("Added\n")
+
+
+def test_search_document_follows_speakers_remove(django_capture_on_commit_callbacks):
+    role = SpeakerRoleFactory(speaker__name="Removed")
+
+    with scopes_disabled(), django_capture_on_commit_callbacks(execute=True):
+        role.submission.speakers.remove(role.speaker)
+
+    assert _document(role.submission).speakers == ""
+
+
+def test_search_document_deleted_with_submission(django_capture_on_commit_callbacks):
+    role = SpeakerRoleFactory()
+
+    with scopes_disabled(), django_capture_on_commit_callbacks(execute=True):
+        role.submission.delete()
+
+    assert not SubmissionSearchDocument.objects.exists()
+
+
+def test_search_document_receivers_skip_raw_and_created_saves():
+    role = SpeakerRoleFactory(speaker__name="Indexed")
+    SubmissionSearchDocument.objects.all().delete()
+    speaker, user = role.speaker, role.speaker.user
+
+    update_submission_search_document(Submission, role.submission, raw=True)
+    update_speaker_search_documents(type(speaker), speaker, raw=True)
+    update_speaker_search_documents(type(speaker), speaker, created=True)
+    update_speaker_search_documents(type(speaker), speaker, update_fields={"code"})
+    update_user_search_documents(type(user), user, raw=True)
+    update_user_search_documents(type(user), UserFactory(), created=True)
+    update_role_search_document(type(role), role, raw=True)
+
+    assert not SubmissionSearchDocument.objects.exists()
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2026-present Tobias Kunze
 # SPDX-License-Identifier: AGPL-3.0-only WITH LicenseRef-Pretalx-AGPL-3.0-Terms
 import datetime as dt
+from types import SimpleNamespace
 
 from django.contrib.auth.models import AnonymousUser
 from django.http import QueryDict
@@ -27,6 +28,19 @@ class SimpleSession(dict):
     modified = False
 
 
+class CountingNamespace(SimpleNamespace):
+    """A namespace that counts how often the attributes of all its instances
+    are read, so that tests can check how code scales without timing it.
+    Reset ``CountingNamespace.reads`` before counting."""
+
+    reads = 0
+
+    def __getattribute__(self, name):
+        if not name.startswith("__"):
+            CountingNamespace.reads += 1
+        return super().__getattribute__(name)
+
+
 def query_dict(params=None):
     query = QueryDict(mutable=True)
     for key, value in (params or {}).items():